@@ -155,14 +155,16 @@ def extractenvironments(output_json_path, project, asset, task, app, envgroup):
               multiple=True)
 @click.option("-g", "--gui", is_flag=True,
               help="Show Publish UI", default=False)
-def publish(paths, targets, gui):
+@click.option("--profile", "profile_path", default=None,
+              help="Store publish report with profile to json file")
+def publish(paths, targets, gui, profile_path):
     """Start CLI publishing.
 
     Publish collects json from paths provided as an argument.
     More than one path is allowed.
     """
 
-    PypeCommands.publish(list(paths), targets, gui)
+    PypeCommands.publish(list(paths), targets, gui, profile_path)
 
 
 @main.command()
@@ -413,9 +415,27 @@ def repack_version(directory):
 @click.option(
     "--dirpath", help="Directory where package is stored", default=None
 )
-def pack_project(project, dirpath):
+@click.option(
+    "--workers", type=int, default=None,
+    help="Number of volumes written in parallel"
+)
+@click.option(
+    "--store-only", is_flag=True, default=False,
+    help="Store files without compression"
+)
+@click.option(
+    "--resume", is_flag=True, default=False,
+    help="Continue interrupted packing of the project"
+)
+@click.option(
+    "--base-package", default=None,
+    help="Previous package, only changed files are packed"
+)
+def pack_project(project, dirpath, workers, store_only, resume, base_package):
     """Create a package of project with all files and database dump."""
-    PypeCommands().pack_project(project, dirpath)
+    PypeCommands().pack_project(
+        project, dirpath, workers, store_only, resume, base_package
+    )
 
 
 @main.command()
@@ -423,9 +443,49 @@ def pack_project(project, dirpath):
 @click.option(
     "--root", help="Replace root which was stored in project", default=None
 )
-def unpack_project(zipfile, root):
+@click.option(
+    "--workers", type=int, default=None,
+    help="Number of volumes extracted in parallel"
+)
+def unpack_project(zipfile, root, workers):
     """Create a package of project with all files and database dump."""
-    PypeCommands().unpack_project(zipfile, root)
+    PypeCommands().unpack_project(zipfile, root, workers)
+
+
+@main.command()
+@click.option(
+    "--project", help="Project name (all projects if not set)", default=None
+)
+@click.option(
+    "--skip-last-versions", is_flag=True, default=False,
+    help="Do not rebuild last versions projection of subsets"
+)
+def migrate_database(project, skip_last_versions):
+    """Create database indexes and rebuild maintained projections.
+
+    Last versions projection is used by 'get_last_versions' when environment
+    variable 'OPENPYPE_LAST_VERSION_INDEX' is set to '1'.
+    """
+    PypeCommands().migrate_database(project, not skip_last_versions)
+
+
+@main.command()
+@click.argument("action", type=click.Choice(["warm", "info", "clear"]))
+@click.option(
+    "--project", "projects", multiple=True,
+    help="Project name (can be used multiple times)"
+)
+@click.option(
+    "--all-versions", is_flag=True, default=False,
+    help="Clear snapshots of all OpenPype versions"
+)
+def settings_cache(action, projects, all_versions):
+    """Warm, inspect or clear on-disk snapshots of settings.
+
+    Snapshots are used when environment variable 'OPENPYPE_SETTINGS_CACHE'
+    is set to '1'.
+    """
+    PypeCommands().settings_cache(action, list(projects), all_versions)
 
 
 @main.command()
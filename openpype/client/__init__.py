@@ -36,6 +36,8 @@ from .entities import (
     get_representations,
     get_representation_parents,
     get_representations_parents,
+    get_representations_with_parents,
+    get_versions_with_parents,
     get_archived_representations,
 
     get_thumbnail,
@@ -45,12 +47,27 @@ from .entities import (
     get_workfile_info,
 )
 
+from .entity_cache import (
+    enable_entity_cache,
+    disable_entity_cache,
+    is_entity_cache_enabled,
+    invalidate_entity_cache,
+    get_entity_cache_stats,
+)
+
 from .entity_links import (
     get_linked_asset_ids,
     get_linked_assets,
     get_linked_representation_id,
 )
 
+from .representation_files import (
+    get_representation_files,
+    expand_representation_files,
+)
+
+from .migrations import update_last_versions
+
 from .operations import (
     create_project,
 )
@@ -92,6 +109,8 @@ __all__ = (
     "get_representations",
     "get_representation_parents",
     "get_representations_parents",
+    "get_representations_with_parents",
+    "get_versions_with_parents",
     "get_archived_representations",
 
     "get_thumbnail",
@@ -100,9 +119,20 @@ __all__ = (
 
     "get_workfile_info",
 
+    "enable_entity_cache",
+    "disable_entity_cache",
+    "is_entity_cache_enabled",
+    "invalidate_entity_cache",
+    "get_entity_cache_stats",
+
     "get_linked_asset_ids",
     "get_linked_assets",
     "get_linked_representation_id",
 
+    "get_representation_files",
+    "expand_representation_files",
+
+    "update_last_versions",
+
     "create_project",
 )
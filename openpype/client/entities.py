@@ -6,13 +6,21 @@ that has project name as a context (e.g. on 'ProjectEntity'?).
 + We will need more specific functions doing wery specific queires really fast.
 """
 
+import os
 import re
 import collections
 
 import six
 from bson.objectid import ObjectId
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
 
 from .mongo import get_project_database, get_project_connection
+from .entity_cache import cached_entity_query
+from .representation_files import (
+    ExpandedRepresentationsCursor,
+    expand_representation_files,
+)
 
 PatternType = type(re.compile(""))
 
@@ -80,6 +88,7 @@ def get_projects(active=True, inactive=False, fields=None):
             yield project_doc
 
 
+@cached_entity_query
 def get_project(project_name, active=True, inactive=True, fields=None):
     # Skip if both are disabled
     if not active and not inactive:
@@ -123,6 +132,7 @@ def get_whole_project(project_name):
     return conn.find({})
 
 
+@cached_entity_query
 def get_asset_by_id(project_name, asset_id, fields=None):
     """Receive asset data by it's id.
 
@@ -146,6 +156,7 @@ def get_asset_by_id(project_name, asset_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query
 def get_asset_by_name(project_name, asset_name, fields=None):
     """Receive asset data by it's name.
 
@@ -355,6 +366,7 @@ def get_asset_ids_with_subsets(project_name, asset_ids=None):
     return asset_ids_with_subsets
 
 
+@cached_entity_query
 def get_subset_by_id(project_name, subset_id, fields=None):
     """Single subset entity data by it's id.
 
@@ -378,6 +390,7 @@ def get_subset_by_id(project_name, subset_id, fields=None):
     return conn.find_one(query_filters, _prepare_fields(fields))
 
 
+@cached_entity_query
 def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
     """Single subset entity data by it's name and it's version id.
 
@@ -519,6 +532,7 @@ def get_subset_families(project_name, subset_ids=None):
     return set()
 
 
+@cached_entity_query
 def get_version_by_id(project_name, version_id, fields=None):
     """Single version entity data by it's id.
 
@@ -545,6 +559,7 @@ def get_version_by_id(project_name, version_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query
 def get_version_by_name(project_name, version, subset_id, fields=None):
     """Single version entity data by it's name and subset id.
 
@@ -698,6 +713,7 @@ def get_versions(
     )
 
 
+@cached_entity_query
 def get_hero_version_by_subset_id(project_name, subset_id, fields=None):
     """Hero version by subset id.
 
@@ -729,6 +745,7 @@ def get_hero_version_by_subset_id(project_name, subset_id, fields=None):
     return None
 
 
+@cached_entity_query
 def get_hero_version_by_id(project_name, version_id, fields=None):
     """Hero version by it's id.
 
@@ -822,6 +839,7 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query
 def get_last_versions(project_name, subset_ids, fields=None):
     """Latest versions for entered subset_ids.
 
@@ -858,31 +876,64 @@ def get_last_versions(project_name, subset_ids, fields=None):
                 fields_s.remove(field)
         limit_query = len(fields_s) == 0
 
-    group_item = {
-        "_id": "$parent",
-        "_version_id": {"$last": "$_id"}
-    }
-    # Add name if name is needed (only for limit query)
-    if name_needed:
-        group_item["name"] = {"$last": "$name"}
-
-    aggregation_pipeline = [
-        # Find all versions of those subsets
-        {"$match": {
-            "type": "version",
-            "parent": {"$in": subset_ids}
-        }},
-        # Sorting versions all together
-        {"$sort": {"name": 1}},
-        # Group them by "parent", but only take the last
-        {"$group": group_item}
-    ]
-
     conn = get_project_connection(project_name)
-    aggregate_result = conn.aggregate(aggregation_pipeline)
+    # Items with '_id' of subset, '_version_id' and 'name' of last version
+    last_version_items = []
+    if os.environ.get("OPENPYPE_LAST_VERSION_INDEX") == "1":
+        # Use last version projection stored on subsets
+        #   - subsets without the projection are resolved with aggregation
+        subset_docs = conn.find(
+            {
+                "type": "subset",
+                "_id": {"$in": subset_ids},
+                "last_version": {"$exists": True}
+            },
+            {"last_version": True}
+        )
+        # Projection is maintained by 'update_last_versions' on commit of
+        #   operations and by migration of project
+        indexed_subset_ids = set()
+        for subset_doc in subset_docs:
+            last_version = subset_doc["last_version"]
+            indexed_subset_ids.add(subset_doc["_id"])
+            last_version_items.append({
+                "_id": subset_doc["_id"],
+                "_version_id": last_version["_id"],
+                "name": last_version["name"]
+            })
+
+        # Subsets without projection use aggregation
+        subset_ids = [
+            subset_id
+            for subset_id in subset_ids
+            if subset_id not in indexed_subset_ids
+        ]
+
+    if subset_ids:
+        group_item = {
+            "_id": "$parent",
+            "_version_id": {"$last": "$_id"}
+        }
+        # Add name if name is needed (only for limit query)
+        if name_needed:
+            group_item["name"] = {"$last": "$name"}
+
+        aggregation_pipeline = [
+            # Find all versions of those subsets
+            {"$match": {
+                "type": "version",
+                "parent": {"$in": subset_ids}
+            }},
+            # Sorting versions all together
+            {"$sort": {"name": 1}},
+            # Group them by "parent", but only take the last
+            {"$group": group_item}
+        ]
+        last_version_items.extend(conn.aggregate(aggregation_pipeline))
+
     if limit_query:
         output = {}
-        for item in aggregate_result:
+        for item in last_version_items:
             subset_id = item["_id"]
             item_data = {"_id": item["_version_id"], "parent": subset_id}
             if name_needed:
@@ -892,8 +943,10 @@ def get_last_versions(project_name, subset_ids, fields=None):
 
     version_ids = [
         doc["_version_id"]
-        for doc in aggregate_result
+        for doc in last_version_items
     ]
+    if not version_ids:
+        return {}
 
     fields = _prepare_fields(fields, ["parent"])
 
@@ -971,6 +1024,7 @@ def get_last_version_by_subset_name(
     )
 
 
+@cached_entity_query
 def get_representation_by_id(project_name, representation_id, fields=None):
     """Representation entity data by it's id.
 
@@ -998,9 +1052,12 @@ def get_representation_by_id(project_name, representation_id, fields=None):
 
     conn = get_project_connection(project_name)
 
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return expand_representation_files(
+        conn.find_one(query_filter, _prepare_fields(fields))
+    )
 
 
+@cached_entity_query
 def get_representation_by_name(
     project_name, representation_name, version_id, fields=None
 ):
@@ -1030,7 +1087,9 @@ def get_representation_by_name(
     }
 
     conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return expand_representation_files(
+        conn.find_one(query_filter, _prepare_fields(fields))
+    )
 
 
 def _flatten_dict(data):
@@ -1171,7 +1230,10 @@ def _get_representations(
 
     conn = get_project_connection(project_name)
 
-    return conn.find(query_filter, _prepare_fields(fields))
+    # Compact sequence files are expanded when documents are received
+    return ExpandedRepresentationsCursor(
+        conn.find(query_filter, _prepare_fields(fields))
+    )
 
 
 def get_representations(
@@ -1267,6 +1329,230 @@ def get_archived_representations(
     )
 
 
+# Parent lookups as (local field, output key, allowed types of parent)
+_VERSION_PARENT_LOOKUPS = (
+    ("parent", "_subset", ("subset", )),
+    ("_subset.parent", "_asset", ("asset", )),
+    ("version_id", "_source_version", ("version", )),
+)
+_REPRESENTATION_PARENT_LOOKUPS = (
+    ("parent", "_version", ("version", "hero_version")),
+    ("_version.parent", "_subset", ("subset", )),
+    ("_subset.parent", "_asset", ("asset", )),
+    ("_version.version_id", "_source_version", ("version", )),
+)
+# Output key of lookup by key in returned dictionaries
+_PARENT_KEYS_MAPPING = {
+    "_version": "version",
+    "_subset": "subset",
+    "_asset": "asset",
+    "_source_version": "source_version",
+}
+
+
+def _get_nested_value(doc, field):
+    value = doc
+    for key in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _resolve_parents_in_memory(project_name, docs, lookups, projection=None):
+    """Fallback of '$lookup' aggregation stages.
+
+    Used when database does not support '$lookup' or is not real MongoDB
+    (e.g. mongomock-like local stand-in). Each lookup is a single query
+    for all documents.
+    """
+
+    conn = get_project_connection(project_name)
+    for local_field, output_key, _ in lookups:
+        parent_ids = set()
+        for doc in docs:
+            parent_id = _get_nested_value(doc, local_field)
+            if parent_id is not None:
+                parent_ids.add(parent_id)
+
+        parents_by_id = {}
+        if parent_ids:
+            parents_by_id = {
+                parent_doc["_id"]: parent_doc
+                for parent_doc in conn.find(
+                    {"_id": {"$in": list(parent_ids)}}, projection
+                )
+            }
+
+        for doc in docs:
+            parent_id = _get_nested_value(doc, local_field)
+            parent_doc = parents_by_id.get(parent_id)
+            if parent_doc is not None:
+                doc[output_key] = parent_doc
+    return docs
+
+
+def _aggregate_with_parents(project_name, query_filter, lookups, fields=None):
+    """Query documents with their parents using single aggregation.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        query_filter (Dict[str, Any]): Filter of queried documents.
+        lookups (Iterable[Tuple[str, str, Tuple[str]]]): Parent lookups
+            defined by local field, output key and allowed parent types.
+        fields (Optional[Iterable[str]]): Fields of documents and their
+            parents that should be returned. All fields are returned if
+            'None' is passed.
+
+    Returns:
+        List[Dict[str, Any]]: Documents with parents stored under
+            output keys. Output keys are removed from documents.
+    """
+
+    pipeline = [{"$match": query_filter}]
+    for local_field, output_key, _ in lookups:
+        pipeline.append({"$lookup": {
+            "from": project_name,
+            "localField": local_field,
+            "foreignField": "_id",
+            "as": output_key
+        }})
+        pipeline.append({"$unwind": {
+            "path": "$" + output_key,
+            "preserveNullAndEmptyArrays": True
+        }})
+
+    # Type and fields used to look up parents are needed to resolve parents
+    projection = _prepare_fields(fields, ["type"] + [
+        local_field.split(".")[-1]
+        for local_field, _, _ in lookups
+    ])
+    if projection:
+        parents_projection = {}
+        for _, output_key, _ in lookups:
+            for key in projection:
+                parents_projection["{}.{}".format(output_key, key)] = True
+        parents_projection.update(projection)
+        pipeline.append({"$project": parents_projection})
+
+    conn = get_project_connection(project_name)
+    docs = None
+    # Local stand-ins of MongoDB (e.g. mongomock) don't have efficient
+    #   implementation of '$lookup' or don't support it at all
+    if isinstance(conn, Collection):
+        try:
+            docs = list(conn.aggregate(pipeline))
+        except OperationFailure:
+            pass
+
+    if docs is None:
+        docs = _resolve_parents_in_memory(
+            project_name,
+            list(conn.find(query_filter, projection)),
+            lookups,
+            projection
+        )
+
+    output = []
+    for doc in docs:
+        item = {}
+        found_keys = set()
+        for local_field, output_key, parent_types in lookups:
+            parent_doc = doc.pop(output_key, None)
+            # Parents of unexpected types (e.g. archived) are ignored
+            if parent_doc and parent_doc.get("type") not in parent_types:
+                parent_doc = None
+
+            # Parent of ignored parent is ignored too
+            source_key = local_field.split(".")[0]
+            if source_key in _PARENT_KEYS_MAPPING:
+                if source_key not in found_keys:
+                    parent_doc = None
+
+            if parent_doc is not None:
+                found_keys.add(output_key)
+            item[_PARENT_KEYS_MAPPING[output_key]] = parent_doc
+        output.append((doc, item))
+    return output
+
+
+def get_versions_with_parents(project_name, version_ids, fields=None):
+    """Versions with their subset and asset documents using single query.
+
+    Hero versions have also their source version document available under
+    'source_version' key.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        version_ids (Iterable[Union[str, ObjectId]]): Version or hero version
+            ids.
+        fields (Optional[Iterable[str]]): Fields of versions and their
+            parents that should be returned. All fields are returned if
+            'None' is passed.
+
+    Returns:
+        Dict[ObjectId, Dict[str, Union[Dict[str, Any], None]]]: Documents
+            under 'version', 'subset', 'asset' and 'source_version' keys by
+            version id. Parents that were not found are 'None'.
+    """
+
+    version_ids = convert_ids(version_ids)
+    if not version_ids:
+        return {}
+
+    query_filter = {
+        "type": {"$in": ["version", "hero_version"]},
+        "_id": {"$in": version_ids}
+    }
+    output = {}
+    for version_doc, parents in _aggregate_with_parents(
+        project_name, query_filter, _VERSION_PARENT_LOOKUPS, fields
+    ):
+        parents["version"] = version_doc
+        output[version_doc["_id"]] = parents
+    return output
+
+
+def get_representations_with_parents(
+    project_name, representation_ids, fields=None
+):
+    """Representations with all parent documents using single query.
+
+    Hero versions have also their source version document available under
+    'source_version' key.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        representation_ids (Iterable[Union[str, ObjectId]]): Representation
+            ids.
+        fields (Optional[Iterable[str]]): Fields of representations and
+            their parents that should be returned. All fields are returned
+            if 'None' is passed.
+
+    Returns:
+        Dict[ObjectId, Dict[str, Union[Dict[str, Any], None]]]: Documents
+            under 'representation', 'version', 'subset', 'asset' and
+            'source_version' keys by representation id. Parents that were not
+            found are 'None'.
+    """
+
+    representation_ids = convert_ids(representation_ids)
+    if not representation_ids:
+        return {}
+
+    query_filter = {
+        "type": "representation",
+        "_id": {"$in": representation_ids}
+    }
+    output = {}
+    for repre_doc, parents in _aggregate_with_parents(
+        project_name, query_filter, _REPRESENTATION_PARENT_LOOKUPS, fields
+    ):
+        parents["representation"] = expand_representation_files(repre_doc)
+        output[repre_doc["_id"]] = parents
+    return output
+
+
 def get_representations_parents(project_name, representations):
     """Prepare parents of representation entities.
 
@@ -1283,10 +1569,6 @@ def get_representations_parents(project_name, representations):
     """
 
     repre_docs_by_version_id = collections.defaultdict(list)
-    version_docs_by_version_id = {}
-    version_docs_by_subset_id = collections.defaultdict(list)
-    subset_docs_by_subset_id = {}
-    subset_docs_by_asset_id = collections.defaultdict(list)
     output = {}
     for repre_doc in representations:
         repre_id = repre_doc["_id"]
@@ -1294,47 +1576,17 @@ def get_representations_parents(project_name, representations):
         output[repre_id] = (None, None, None, None)
         repre_docs_by_version_id[version_id].append(repre_doc)
 
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True
-    )
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
-        subset_id = version_doc["parent"]
-        version_docs_by_version_id[version_id] = version_doc
-        version_docs_by_subset_id[subset_id].append(version_doc)
-
-    subset_docs = get_subsets(
-        project_name, subset_ids=version_docs_by_subset_id.keys()
-    )
-    for subset_doc in subset_docs:
-        subset_id = subset_doc["_id"]
-        asset_id = subset_doc["parent"]
-        subset_docs_by_subset_id[subset_id] = subset_doc
-        subset_docs_by_asset_id[asset_id].append(subset_doc)
-
-    asset_docs = get_assets(
-        project_name, asset_ids=subset_docs_by_asset_id.keys()
+    parents_by_version_id = get_versions_with_parents(
+        project_name, repre_docs_by_version_id.keys()
     )
-    asset_docs_by_id = {
-        asset_doc["_id"]: asset_doc
-        for asset_doc in asset_docs
-    }
 
     project_doc = get_project(project_name)
 
     for version_id, repre_docs in repre_docs_by_version_id.items():
-        asset_doc = None
-        subset_doc = None
-        version_doc = version_docs_by_version_id.get(version_id)
-        if version_doc:
-            subset_id = version_doc["parent"]
-            subset_doc = subset_docs_by_subset_id.get(subset_id)
-            if subset_doc:
-                asset_id = subset_doc["parent"]
-                asset_doc = asset_docs_by_id.get(asset_id)
-
+        parents = parents_by_version_id.get(version_id) or {}
+        version_doc = parents.get("version")
+        subset_doc = parents.get("subset")
+        asset_doc = parents.get("asset")
         for repre_doc in repre_docs:
             repre_id = repre_doc["_id"]
             output[repre_id] = (
@@ -1423,6 +1675,7 @@ def get_thumbnails(project_name, thumbnail_ids, fields=None):
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query
 def get_thumbnail(project_name, thumbnail_id, fields=None):
     """Receive thumbnail entity data.
 
@@ -1444,6 +1697,7 @@ def get_thumbnail(project_name, thumbnail_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query
 def get_workfile_info(
     project_name, asset_id, task_name, filename, fields=None
 ):
@@ -0,0 +1,409 @@
+"""Opt-in process-wide read-through cache of project entities.
+
+Cache is disabled by default. It can be enabled with environment variable
+'OPENPYPE_ENTITY_CACHE' set to '1' or by calling 'enable_entity_cache'.
+
+Each project has it's own bounded LRU cache with time to live of items.
+Whole project cache is invalidated when any change happens in the project
+collection. Changes made with 'OperationsSession' in current process
+invalidate the cache directly, changes made by other processes are captured
+by MongoDB change stream. Change streams are available only on replica sets,
+so a polling watcher is used as fallback (e.g. for single local mongod).
+
+Polling fallback is able to detect only created and removed documents, in-place
+updates made by other processes are reflected after cache items expire.
+
+Only query functions returning single document, 'None' or dictionary are
+cached. Functions returning cursors are not because callers may rely on
+cursor behavior.
+"""
+
+import os
+import copy
+import time
+import logging
+import threading
+import collections
+
+import six
+from bson.objectid import ObjectId
+
+from .mongo import get_project_connection
+
+DEFAULT_MAX_SIZE = 2048
+DEFAULT_TTL = 300
+DEFAULT_POLL_INTERVAL = 10
+
+_NOT_SET = object()
+
+
+def _env_int(key, default):
+    value = os.environ.get(key)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _freeze_value(value):
+    """Convert function argument to hashable value usable in cache key."""
+
+    if isinstance(value, ObjectId):
+        return str(value)
+
+    if isinstance(value, dict):
+        return tuple(sorted(
+            (str(key), _freeze_value(item))
+            for key, item in value.items()
+        ))
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_freeze_value(item) for item in value]
+        # Order of filter values does not matter
+        return tuple(sorted(items, key=str))
+
+    if isinstance(value, six.string_types) or value is None:
+        return value
+
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class ProjectEntityCache(object):
+    """Bounded LRU cache with time to live for single project.
+
+    Args:
+        project_name (str): Name of project.
+        max_size (int): Maximum number of cached queries.
+        ttl (float): Time in seconds for which is cached item valid.
+    """
+
+    def __init__(self, project_name, max_size, ttl):
+        self._project_name = project_name
+        self._max_size = max_size
+        self._ttl = ttl
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    @property
+    def generation(self):
+        """Counter of invalidations used to skip storing of stale values."""
+
+        return self._generation
+
+    def get(self, key):
+        """Cached value for key.
+
+        Returns:
+            Any: Cached value or '_NOT_SET' if key is not cached or expired.
+        """
+
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                expire_time, value = item
+                if expire_time > time.time():
+                    # Move item to the end as most recently used
+                    self._items.pop(key)
+                    self._items[key] = item
+                    self.hits += 1
+                    return value
+                self._items.pop(key)
+            self.misses += 1
+        return _NOT_SET
+
+    def set(self, key, value, generation=None):
+        with self._lock:
+            # Cache was invalidated while value was queried
+            if generation is not None and generation != self._generation:
+                return
+            self._items.pop(key, None)
+            self._items[key] = (time.time() + self._ttl, value)
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._generation += 1
+            self.invalidations += 1
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "size": len(self._items),
+                "max_size": self._max_size,
+                "ttl": self._ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+class ProjectChangesWatcher(threading.Thread):
+    """Daemon thread invalidating project cache on changes from other writers.
+
+    Watcher is using MongoDB change stream when available. When change
+    streams are not supported by the server (standalone mongod) watcher
+    polls cheap fingerprint of the collection (documents count and last
+    created document id).
+
+    Args:
+        project_name (str): Name of project which is watched.
+        on_change (Callable[[str], None]): Callback called with project name
+            when a change was detected.
+        poll_interval (float): Interval of polling fallback in seconds.
+    """
+
+    log = logging.getLogger("ProjectChangesWatcher")
+
+    def __init__(self, project_name, on_change, poll_interval):
+        super(ProjectChangesWatcher, self).__init__()
+        self.daemon = True
+        self.name = "EntityCacheWatcher-{}".format(project_name)
+        self._project_name = project_name
+        self._on_change = on_change
+        self._poll_interval = poll_interval
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def run(self):
+        try:
+            self._watch_change_stream()
+            return
+        except Exception:
+            if self._stop_event.is_set():
+                return
+            self.log.debug((
+                "Change streams are not available for project \"{}\"."
+                " Using polling fallback."
+            ).format(self._project_name), exc_info=True)
+
+        # Anything could have changed in meantime
+        self._on_change(self._project_name)
+        try:
+            self._poll_changes()
+        except Exception:
+            self.log.warning((
+                "Watcher of project \"{}\" crashed. Cache will rely only"
+                " on time to live of items."
+            ).format(self._project_name), exc_info=True)
+
+    def _watch_change_stream(self):
+        collection = get_project_connection(self._project_name)
+        with collection.watch(max_await_time_ms=1000) as stream:
+            while not self._stop_event.is_set():
+                change = stream.try_next()
+                if change is not None:
+                    self._on_change(self._project_name)
+
+    def _get_fingerprint(self, collection):
+        last_doc = collection.find_one(
+            {}, {"_id": True}, sort=[("_id", -1)]
+        )
+        last_id = None
+        if last_doc:
+            last_id = last_doc["_id"]
+        return collection.estimated_document_count(), last_id
+
+    def _poll_changes(self):
+        collection = get_project_connection(self._project_name)
+        fingerprint = self._get_fingerprint(collection)
+        while not self._stop_event.wait(self._poll_interval):
+            new_fingerprint = self._get_fingerprint(collection)
+            if new_fingerprint != fingerprint:
+                fingerprint = new_fingerprint
+                self._on_change(self._project_name)
+
+
+class EntityCache(object):
+    """Process-wide registry of project entity caches.
+
+    Class is used as singleton, all attributes are on class level.
+    """
+
+    enabled = os.environ.get("OPENPYPE_ENTITY_CACHE") == "1"
+    max_size = _env_int("OPENPYPE_ENTITY_CACHE_SIZE", DEFAULT_MAX_SIZE)
+    ttl = _env_int("OPENPYPE_ENTITY_CACHE_TTL", DEFAULT_TTL)
+    watch_changes = os.environ.get("OPENPYPE_ENTITY_CACHE_WATCH") != "0"
+    poll_interval = _env_int(
+        "OPENPYPE_ENTITY_CACHE_POLL_INTERVAL", DEFAULT_POLL_INTERVAL
+    )
+
+    _caches = {}
+    _watchers = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_project_cache(cls, project_name):
+        project_cache = cls._caches.get(project_name)
+        if project_cache is not None:
+            return project_cache
+
+        with cls._lock:
+            project_cache = cls._caches.get(project_name)
+            if project_cache is None:
+                project_cache = ProjectEntityCache(
+                    project_name, cls.max_size, cls.ttl
+                )
+                cls._caches[project_name] = project_cache
+                if cls.watch_changes:
+                    watcher = ProjectChangesWatcher(
+                        project_name,
+                        cls.invalidate_project,
+                        cls.poll_interval
+                    )
+                    cls._watchers[project_name] = watcher
+                    watcher.start()
+        return project_cache
+
+    @classmethod
+    def invalidate_project(cls, project_name):
+        project_cache = cls._caches.get(project_name)
+        if project_cache is not None:
+            project_cache.clear()
+
+    @classmethod
+    def reset(cls, project_name=None):
+        """Remove caches and stop watchers.
+
+        Args:
+            project_name (Optional[str]): Reset only cache of passed project.
+                All caches are removed if 'None' is passed.
+        """
+
+        with cls._lock:
+            if project_name is None:
+                project_names = list(cls._caches.keys())
+            else:
+                project_names = [project_name]
+
+            for name in project_names:
+                cls._caches.pop(name, None)
+                watcher = cls._watchers.pop(name, None)
+                if watcher is not None:
+                    watcher.stop()
+
+    @classmethod
+    def get_stats(cls):
+        return {
+            project_name: project_cache.get_stats()
+            for project_name, project_cache in tuple(cls._caches.items())
+        }
+
+
+def enable_entity_cache(max_size=None, ttl=None, watch_changes=None):
+    """Enable process-wide entity cache.
+
+    Args:
+        max_size (Optional[int]): Maximum cached queries per project.
+        ttl (Optional[float]): Time to live of cached items in seconds.
+        watch_changes (Optional[bool]): Watch changes made by other processes.
+    """
+
+    reset = False
+    if max_size is not None and max_size != EntityCache.max_size:
+        EntityCache.max_size = max_size
+        reset = True
+
+    if ttl is not None and ttl != EntityCache.ttl:
+        EntityCache.ttl = ttl
+        reset = True
+
+    if (
+        watch_changes is not None
+        and watch_changes != EntityCache.watch_changes
+    ):
+        EntityCache.watch_changes = watch_changes
+        reset = True
+
+    if reset:
+        EntityCache.reset()
+    EntityCache.enabled = True
+
+
+def disable_entity_cache():
+    """Disable entity cache and drop all cached data."""
+
+    EntityCache.enabled = False
+    EntityCache.reset()
+
+
+def is_entity_cache_enabled():
+    return EntityCache.enabled
+
+
+def invalidate_entity_cache(project_name=None):
+    """Invalidate cached entities.
+
+    Args:
+        project_name (Optional[str]): Invalidate only passed project. All
+            projects are invalidated if 'None' is passed.
+    """
+
+    if project_name is not None:
+        EntityCache.invalidate_project(project_name)
+        return
+
+    for name in tuple(EntityCache._caches.keys()):
+        EntityCache.invalidate_project(name)
+
+
+def get_entity_cache_stats():
+    """Statistics of entity cache.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Hits, misses, evictions, invalidations and
+            current size of cache by project name.
+    """
+
+    return EntityCache.get_stats()
+
+
+def cached_entity_query(func):
+    """Decorator caching result of query function when cache is enabled.
+
+    Decorated function must have project name as first argument and must
+    return document, 'None' or dictionary of documents (not a cursor).
+    Returned values are copies so callers can modify them.
+    """
+
+    func_name = func.__name__
+
+    @six.wraps(func)
+    def wrapper(project_name, *args, **kwargs):
+        if not EntityCache.enabled or not project_name:
+            return func(project_name, *args, **kwargs)
+
+        key = (
+            func_name,
+            tuple(_freeze_value(arg) for arg in args),
+            _freeze_value(kwargs),
+        )
+        project_cache = EntityCache.get_project_cache(project_name)
+        value = project_cache.get(key)
+        if value is _NOT_SET:
+            generation = project_cache.generation
+            value = func(project_name, *args, **kwargs)
+            project_cache.set(key, value, generation)
+        return copy.deepcopy(value)
+    return wrapper
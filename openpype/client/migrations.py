@@ -0,0 +1,154 @@
+"""Database indexes and maintained projections of project collections.
+
+Last version of each subset is stored on subset document under
+'last_version' key ('{"_id": <version id>, "name": <version>}'). The
+projection is updated by 'OperationsSession' commits (and legacy integrator)
+and can be rebuilt with 'rebuild_last_versions'. Function 'get_last_versions'
+uses the projection only when 'OPENPYPE_LAST_VERSION_INDEX' environment
+variable is set to '1' so the projection should be rebuilt with
+'migrate_project_database' before it is enabled. Projection is not
+validated on read, writers creating versions without 'OperationsSession'
+must call 'update_last_versions'.
+"""
+
+import logging
+
+from pymongo import ASCENDING, UpdateOne
+
+from .mongo import get_project_connection
+from .entities import convert_ids, get_projects
+
+LAST_VERSION_KEY = "last_version"
+
+# Compound indexes used by queries in 'openpype.client.entities'
+PROJECT_INDEXES = (
+    # Children by parent (subsets, versions, representations) and sorting
+    #   of versions by name
+    [("type", ASCENDING), ("parent", ASCENDING), ("name", ASCENDING)],
+    # Entities by name (assets)
+    [("type", ASCENDING), ("name", ASCENDING)],
+    # Assets by visual parent
+    [("type", ASCENDING), ("data.visualParent", ASCENDING)],
+    # Incremental scan of representations by sync server
+    [("type", ASCENDING), ("files.sites.created_dt", ASCENDING)],
+    [("type", ASCENDING), ("files.sites.last_failed_dt", ASCENDING)],
+    [("type", ASCENDING), ("files.sites.modified_dt", ASCENDING)],
+)
+
+log = logging.getLogger(__name__)
+
+
+def create_project_indexes(project_name):
+    """Create compound indexes on project collection.
+
+    Indexes which already exist are skipped by MongoDB.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        List[str]: Names of indexes.
+    """
+
+    conn = get_project_connection(project_name)
+    return [
+        conn.create_index(index_keys)
+        for index_keys in PROJECT_INDEXES
+    ]
+
+
+def update_last_versions(project_name, subset_ids=None):
+    """Recalculate last version projection of subsets.
+
+    Args:
+        project_name (str): Name of project.
+        subset_ids (Iterable[Union[str, ObjectId]]): Subsets which should be
+            updated. All subsets in project are updated if 'None' is passed.
+
+    Returns:
+        int: Number of updated subsets.
+    """
+
+    subset_filter = {"type": "subset"}
+    version_filter = {"type": "version"}
+    if subset_ids is not None:
+        subset_ids = convert_ids(subset_ids)
+        if not subset_ids:
+            return 0
+        subset_filter["_id"] = {"$in": subset_ids}
+        version_filter["parent"] = {"$in": subset_ids}
+
+    conn = get_project_connection(project_name)
+    last_versions_by_subset_id = {
+        item["_id"]: {"_id": item["_version_id"], "name": item["name"]}
+        for item in conn.aggregate([
+            {"$match": version_filter},
+            {"$sort": {"name": 1}},
+            {"$group": {
+                "_id": "$parent",
+                "_version_id": {"$last": "$_id"},
+                "name": {"$last": "$name"}
+            }}
+        ])
+    }
+
+    bulk_writes = []
+    subset_docs = conn.find(
+        subset_filter, {"_id": True, LAST_VERSION_KEY: True}
+    )
+    for subset_doc in subset_docs:
+        subset_id = subset_doc["_id"]
+        current = subset_doc.get(LAST_VERSION_KEY)
+        last_version = last_versions_by_subset_id.get(subset_id)
+        if current == last_version:
+            continue
+
+        if last_version is None:
+            change = {"$unset": {LAST_VERSION_KEY: None}}
+        else:
+            change = {"$set": {LAST_VERSION_KEY: last_version}}
+        bulk_writes.append(UpdateOne({"_id": subset_id}, change))
+
+    if bulk_writes:
+        conn.bulk_write(bulk_writes)
+    return len(bulk_writes)
+
+
+def rebuild_last_versions(project_name):
+    """Rebuild last version projection of all subsets in project.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        int: Number of updated subsets.
+    """
+
+    return update_last_versions(project_name)
+
+
+def migrate_project_database(project_name=None, last_versions=True):
+    """Create indexes and rebuild maintained projections.
+
+    Args:
+        project_name (Optional[str]): Name of project. All projects are
+            migrated if 'None' is passed.
+        last_versions (bool): Rebuild last versions projection.
+    """
+
+    if project_name is None:
+        project_names = [
+            project_doc["name"]
+            for project_doc in get_projects(inactive=True, fields=["name"])
+        ]
+    else:
+        project_names = [project_name]
+
+    for name in project_names:
+        log.info("Creating indexes of project \"{}\"".format(name))
+        create_project_indexes(name)
+        if last_versions:
+            count = rebuild_last_versions(name)
+            log.info((
+                "Updated last versions of {} subsets in project \"{}\""
+            ).format(count, name))
@@ -2,8 +2,10 @@ import os
 import sys
 import time
 import logging
+import threading
 import pymongo
 import certifi
+from pymongo import monitoring
 
 if sys.version_info[0] == 2:
     from urlparse import urlparse, parse_qs
@@ -120,6 +122,41 @@ def validate_mongo_connection(mongo_uri):
     client.close()
 
 
+class _CommandCounter(monitoring.CommandListener):
+    """Count commands sent by OpenPype mongo clients.
+
+    Used by profilers to measure database load of a code block by difference
+    of counts before and after it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def started(self, event):
+        with self._lock:
+            self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+_COMMAND_COUNTER = _CommandCounter()
+
+
+def get_mongo_commands_count():
+    """Count of commands sent by OpenPype mongo clients in this process.
+
+    Returns:
+        int: Number of database commands (queries, writes, ...).
+    """
+
+    return _COMMAND_COUNTER.count
+
+
 class OpenPypeMongoConnection:
     """Singleton MongoDB connection.
 
@@ -169,7 +206,8 @@ class OpenPypeMongoConnection:
             timeout = int(os.environ.get("AVALON_TIMEOUT") or 1000)
 
         kwargs = {
-            "serverSelectionTimeoutMS": timeout
+            "serverSelectionTimeoutMS": timeout,
+            "event_listeners": [_COMMAND_COUNTER]
         }
         if should_add_certificate_path_to_mongo_url(mongo_url):
             kwargs["ssl_ca_certs"] = certifi.where()
@@ -1,6 +1,8 @@
 import re
+import sys
 import uuid
 import copy
+import logging
 import collections
 from abc import ABCMeta, abstractmethod, abstractproperty
 
@@ -9,7 +11,11 @@ from bson.objectid import ObjectId
 from pymongo import DeleteOne, InsertOne, UpdateOne
 
 from .mongo import get_project_connection
-from .entities import get_project
+from .entities import get_project, get_versions
+from .entity_cache import invalidate_entity_cache
+from .migrations import update_last_versions
+
+log = logging.getLogger(__name__)
 
 REMOVED_VALUE = object()
 
@@ -668,10 +674,85 @@ class OperationsSession(object):
                 if mongo_op is not None:
                     bulk_writes.append(mongo_op)
 
-            if bulk_writes:
-                collection = get_project_connection(project_name)
+            if not bulk_writes:
+                continue
+
+            subset_ids = set()
+            # Last versions can change only by operations of versions
+            if any(
+                operation.entity_type == "version"
+                for operation in operations
+            ):
+                subset_ids = self._get_subset_ids_with_changed_versions(
+                    project_name, operations
+                )
+            collection = get_project_connection(project_name)
+            try:
                 collection.bulk_write(bulk_writes)
 
+            except Exception:
+                exc_info = sys.exc_info()
+                # Even partially applied writes make cache invalid
+                invalidate_entity_cache(project_name)
+                # Partially applied writes may change last versions, failed
+                #   update of projection must not hide original error
+                if subset_ids:
+                    try:
+                        update_last_versions(project_name, subset_ids)
+                    except Exception:
+                        log.warning(
+                            "Failed to update last versions", exc_info=True
+                        )
+                six.reraise(*exc_info)
+
+            try:
+                if subset_ids:
+                    update_last_versions(project_name, subset_ids)
+            finally:
+                invalidate_entity_cache(project_name)
+
+    @staticmethod
+    def _get_subset_ids_with_changed_versions(project_name, operations):
+        """Subset ids where last version may change by passed operations.
+
+        Must be called before operations are commited to be able find parents
+        of deleted versions.
+
+        Returns:
+            Set[ObjectId]: Subset ids which have last version projection
+                out of date after operations are commited.
+        """
+
+        subset_ids = set()
+        version_ids = set()
+        for operation in operations:
+            if operation.entity_type != "version":
+                continue
+
+            if isinstance(operation, CreateOperation):
+                subset_id = operation.get("parent")
+                if subset_id is not None:
+                    subset_ids.add(subset_id)
+                continue
+
+            if isinstance(operation, UpdateOperation):
+                update_data = operation.update_data
+                if "name" not in update_data and "parent" not in update_data:
+                    continue
+                subset_id = update_data.get("parent")
+                if subset_id is not None and subset_id is not REMOVED_VALUE:
+                    subset_ids.add(subset_id)
+
+            version_ids.add(operation.entity_id)
+
+        if version_ids:
+            version_docs = get_versions(
+                project_name, version_ids=version_ids, fields=["parent"]
+            )
+            for version_doc in version_docs:
+                subset_ids.add(version_doc["parent"])
+        return subset_ids
+
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'CreateOperation'.
 
@@ -0,0 +1,253 @@
+"""Compact encoding of sequence files in representation documents.
+
+Representation document has item in 'files' for each published file. For
+long sequences can be the list replaced with single item describing whole
+sequence. Item contains 'sequence' key with head and tail of path, padding
+and ranges of frames. Per-frame data are stored as lists only if they
+differ between frames.
+
+Compact item also contains 'path' of first frame, total 'size', 'hash' of
+first frame and 'sites' of whole sequence so readers of first file or sites
+don't have to expand it.
+
+Example of compact item:
+    {
+        "_id": ObjectId(...),
+        "path": "{root[work]}/project/.../render.1001.exr",
+        "size": 123456789,
+        "hash": "render,1001,exr|1690000000,0|1234567",
+        "sites": [{"name": "studio", "created_dt": ...}],
+        "sequence": {
+            "head": "{root[work]}/project/.../render.",
+            "tail": ".exr",
+            "padding": 4,
+            "ranges": [[1001, 1100], [1102, 1200]],
+            "sizes": [1234567, ...],
+            "mtimes": [1690000000.0, ...],
+            "checksums": ["9f86d0...", ...]
+        }
+    }
+
+Expanded items of one sequence share '_id' and sites of the sequence so
+compact encoding should not be used with site sync which tracks sites of
+each file separately.
+"""
+
+import os
+import copy
+
+from bson.objectid import ObjectId
+
+SEQUENCE_KEY = "sequence"
+
+
+def is_compact_file_info(file_info):
+    return SEQUENCE_KEY in file_info
+
+
+def frames_to_ranges(frames):
+    """Convert frames to list of inclusive ranges.
+
+    Args:
+        frames (Iterable[int]): Frame numbers.
+
+    Returns:
+        List[List[int]]: Ranges of frames e.g. '[[1001, 1100], [1102, 1102]]'.
+    """
+
+    ranges = []
+    for frame in sorted(set(frames)):
+        if ranges and ranges[-1][1] + 1 == frame:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return ranges
+
+
+def ranges_to_frames(ranges):
+    frames = []
+    for start, end in ranges:
+        frames.extend(range(start, end + 1))
+    return frames
+
+
+def _format_frame_path(head, frame, padding, tail):
+    return "{}{:0{}d}{}".format(head, frame, padding, tail)
+
+
+def _source_hash(path, mtime, size):
+    # Same output as 'openpype.lib.source_hash' without reading the file
+    return "|".join(
+        [os.path.basename(path), str(mtime), str(size)]
+    ).replace(".", ",")
+
+
+def create_sequence_file_info(
+    head, tail, padding, frames, sizes, mtimes, sites, file_id=None,
+    checksums=None
+):
+    """Create compact file item of sequence.
+
+    Args:
+        head (str): Rootless path before frame number.
+        tail (str): Path after frame number.
+        padding (int): Padding of frame number.
+        frames (List[int]): Sorted frame numbers.
+        sizes (List[int]): Size of each frame.
+        mtimes (List[float]): Modification time of each frame.
+        sites (List[Dict[str, Any]]): Sites of sequence.
+        file_id (Optional[ObjectId]): Id of item.
+        checksums (Optional[List[str]]): Content checksum of each frame.
+
+    Returns:
+        Dict[str, Any]: Compact file item.
+    """
+
+    if not frames:
+        raise ValueError("Sequence must have at least one frame")
+
+    sequence = {
+        "head": head,
+        "tail": tail,
+        "padding": padding,
+        "ranges": frames_to_ranges(frames)
+    }
+    # Store per-frame values only when they differ
+    for key, values in (("size", sizes), ("mtime", mtimes)):
+        if len(set(values)) == 1:
+            sequence[key] = values[0]
+        else:
+            sequence[key + "s"] = list(values)
+
+    first_path = _format_frame_path(head, frames[0], padding, tail)
+    output = {
+        "_id": ObjectId(file_id) if file_id else ObjectId(),
+        "path": first_path,
+        "size": sum(sizes),
+        "hash": _source_hash(first_path, mtimes[0], sizes[0]),
+        "sites": sites,
+        SEQUENCE_KEY: sequence
+    }
+    if checksums:
+        sequence["checksums"] = list(checksums)
+        output["checksum"] = checksums[0]
+    return output
+
+
+def expand_file_info(file_info):
+    """Expand compact file item to item for each frame.
+
+    Args:
+        file_info (Dict[str, Any]): Item from 'files' of representation.
+
+    Returns:
+        List[Dict[str, Any]]: File items. Passed item is returned in list
+            if is not compact.
+    """
+
+    sequence = file_info.get(SEQUENCE_KEY)
+    if not sequence:
+        return [file_info]
+
+    frames = ranges_to_frames(sequence["ranges"])
+    sizes = sequence.get("sizes")
+    if sizes is None:
+        sizes = [sequence.get("size")] * len(frames)
+    mtimes = sequence.get("mtimes")
+    if mtimes is None:
+        mtimes = [sequence.get("mtime")] * len(frames)
+
+    checksums = sequence.get("checksums")
+
+    head = sequence["head"]
+    tail = sequence["tail"]
+    padding = sequence["padding"]
+    sites = file_info.get("sites") or []
+    output = []
+    for idx, frame in enumerate(frames):
+        path = _format_frame_path(head, frame, padding, tail)
+        item = {
+            "_id": file_info["_id"],
+            "path": path,
+            "size": sizes[idx],
+            "hash": _source_hash(path, mtimes[idx], sizes[idx]),
+            "sites": copy.deepcopy(sites)
+        }
+        if checksums:
+            item["checksum"] = checksums[idx]
+        output.append(item)
+    return output
+
+
+def get_representation_files(repre_doc):
+    """Files of representation with expanded compact sequence items.
+
+    Args:
+        repre_doc (Dict[str, Any]): Representation document.
+
+    Returns:
+        List[Dict[str, Any]]: File items of representation.
+    """
+
+    output = []
+    for file_info in repre_doc.get("files") or []:
+        output.extend(expand_file_info(file_info))
+    return output
+
+
+def expand_representation_files(repre_doc):
+    """Replace compact sequence items in representation document.
+
+    Args:
+        repre_doc (Union[Dict[str, Any], None]): Representation document.
+
+    Returns:
+        Union[Dict[str, Any], None]: Passed document.
+    """
+
+    if not repre_doc:
+        return repre_doc
+
+    files = repre_doc.get("files")
+    if files and any(is_compact_file_info(item) for item in files):
+        repre_doc["files"] = get_representation_files(repre_doc)
+    return repre_doc
+
+
+class ExpandedRepresentationsCursor(object):
+    """Cursor wrapper expanding compact files of representations.
+
+    Other attributes are passed to wrapped cursor so it can be used as
+    the cursor.
+    """
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, attr_name):
+        attr = getattr(self._cursor, attr_name)
+        if not callable(attr):
+            return attr
+
+        def wrapper(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            # Chained methods (e.g. 'sort', 'limit') return the cursor
+            if result is self._cursor:
+                return self
+            return result
+        return wrapper
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return expand_representation_files(next(self._cursor))
+
+    # Python 2 support
+    next = __next__
+
+    def __getitem__(self, index):
+        result = self._cursor[index]
+        if result is self._cursor:
+            return self
+        return expand_representation_files(result)
@@ -1,3 +1,5 @@
+import time
+
 from openpype.client import get_project, get_asset_by_name
 from openpype.lib import (
     PreLaunchHook,
@@ -40,8 +42,16 @@ class GlobalHostDataHook(PreLaunchHook):
             "log": self.log
         })
 
+        start = time.time()
         prepare_app_environments(temp_data, self.launch_context.env_group)
+        app_envs_time = time.time() - start
+
+        start = time.time()
         prepare_context_environments(temp_data)
+        self.log.debug((
+            "Application environments prepared in {:.3f}s,"
+            " context environments in {:.3f}s"
+        ).format(app_envs_time, time.time() - start))
 
         temp_data.pop("log")
 
@@ -1,4 +1,5 @@
 import os
+import time
 from datetime import datetime
 import collections
 import json
@@ -75,6 +76,16 @@ def get_webpublish_conn():
     return mongo_client[database_name]["webpublishes"]
 
 
+def get_webpublish_queue_conn():
+    """Get connection to OP 'webpublish_queue' collection.
+
+    Collection stores queue of publish jobs of webpublisher service.
+    """
+    mongo_client = OpenPypeMongoConnection.get_mongo_client()
+    database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+    return mongo_client[database_name]["webpublish_queue"]
+
+
 def start_webpublish_log(dbcon, batch_id, user):
     """Start new log record for 'batch_id'
 
@@ -94,9 +105,108 @@ def start_webpublish_log(dbcon, batch_id, user):
     }).inserted_id
 
 
+class PublishLogWriter(object):
+    """Buffer publish log records and write them to OP DB in batches.
+
+    Records are appended to 'log_lines' of batch document with
+    '$push'/'$each' when buffer is big enough or when flush interval passed.
+    Progress is written together with records, at most once per progress
+    interval. Full log is stored as string to 'log' key on finish, batch
+    status endpoint joins 'log_lines' to 'log' for running batches.
+
+    Args:
+        dbcon (pymongo.collection.Collection): Collection of batches.
+        _id (ObjectId): Id of batch document.
+        max_records (int): Flush when buffer has this number of records.
+        flush_interval (float): Flush buffered records after this time in
+            seconds.
+        progress_interval (float): Minimum time in seconds between progress
+            updates.
+    """
+
+    def __init__(
+        self,
+        dbcon,
+        _id,
+        max_records=200,
+        flush_interval=2.0,
+        progress_interval=0.5
+    ):
+        self._dbcon = dbcon
+        self._id = _id
+        self._max_records = max_records
+        self._flush_interval = flush_interval
+        self._progress_interval = progress_interval
+
+        self._lines = []
+        self._buffer = []
+        self._progress = None
+        self._last_flush = time.time()
+        self._last_progress = 0
+
+    @property
+    def lines(self):
+        return list(self._lines)
+
+    def add_lines(self, lines):
+        self._lines.extend(lines)
+        self._buffer.extend(lines)
+        if (
+            len(self._buffer) >= self._max_records
+            or time.time() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+
+    def set_progress(self, progress):
+        if progress == self._progress:
+            return
+        self._progress = progress
+        if time.time() - self._last_progress >= self._progress_interval:
+            self.flush()
+
+    def flush(self):
+        update_data = {}
+        if self._buffer:
+            update_data["$push"] = {"log_lines": {"$each": self._buffer}}
+            self._buffer = []
+
+        if self._progress is not None:
+            update_data["$set"] = {"progress": self._progress}
+            self._progress = None
+            self._last_progress = time.time()
+
+        self._last_flush = time.time()
+        if update_data:
+            self._dbcon.update_one({"_id": self._id}, update_data)
+
+    def finish(self, data, first_lines=None):
+        """Store full log with final data of batch.
+
+        Buffered records are not pushed, whole log is stored to 'log'.
+
+        Args:
+            data (Dict[str, Any]): Data set to batch document.
+            first_lines (Optional[List[str]]): Lines added before records,
+                e.g. error message.
+        """
+
+        lines = list(first_lines or []) + self._lines
+        self._buffer = []
+        self._progress = None
+        update_data = dict(data)
+        update_data["log"] = os.linesep.join(lines)
+        self._dbcon.update_one(
+            {"_id": self._id},
+            {"$set": update_data, "$unset": {"log_lines": ""}}
+        )
+
+
 def publish_and_log(dbcon, _id, log, close_plugin_name=None, batch_id=None):
     """Loops through all plugins, logs ok and fails into OP DB.
 
+    Log records are written in batches during publishing to 'log_lines',
+    complete log is stored to 'log' when publishing finishes.
+
         Args:
             dbcon (OpenPypeMongoConnection)
             _id (str) - id of current job in DB
@@ -114,43 +224,31 @@ def publish_and_log(dbcon, _id, log, close_plugin_name=None, batch_id=None):
     if isinstance(_id, str):
         _id = ObjectId(_id)
 
-    log_lines = []
-    processed = 0
-    log_every = 5
+    log_writer = PublishLogWriter(dbcon, _id)
     for result in pyblish.util.publish_iter():
-        for record in result["records"]:
-            log_lines.append("{}: {}".format(
-                result["plugin"].label, record.msg))
-        processed += 1
+        log_writer.add_lines([
+            "{}: {}".format(result["plugin"].label, record.msg)
+            for record in result["records"]
+        ])
 
         if result["error"]:
             log.error(error_format.format(**result))
-            log_lines = [error_format.format(**result)] + log_lines
-            dbcon.update_one(
-                {"_id": _id},
-                {"$set":
-                    {
-                        "finish_date": datetime.now(),
-                        "status": ERROR_STATUS,
-                        "log": os.linesep.join(log_lines)
-
-                    }}
+            log_writer.finish(
+                {
+                    "finish_date": datetime.now(),
+                    "status": ERROR_STATUS
+                },
+                first_lines=[error_format.format(**result)]
             )
             if close_plugin:  # close host app explicitly after error
                 context = pyblish.api.Context()
                 close_plugin().process(context)
             return
-        elif processed % log_every == 0:
-            # pyblish returns progress in 0.0 - 2.0
-            progress = min(round(result["progress"] / 2 * 100), 99)
-            dbcon.update_one(
-                {"_id": _id},
-                {"$set":
-                    {
-                        "progress": progress,
-                        "log": os.linesep.join(log_lines)
-                    }}
-            )
+
+        # pyblish returns progress in 0.0 - 2.0
+        log_writer.set_progress(
+            min(round(result["progress"] / 2 * 100), 99)
+        )
 
     # final update
     if batch_id:
@@ -165,18 +263,11 @@ def publish_and_log(dbcon, _id, log, close_plugin_name=None, batch_id=None):
             }
         )
 
-    dbcon.update_one(
-        {"_id": _id},
-        {
-            "$set":
-                {
-                    "finish_date": datetime.now(),
-                    "status": FINISHED_OK_STATUS,
-                    "progress": 100,
-                    "log": os.linesep.join(log_lines)
-                }
-        }
-    )
+    log_writer.finish({
+        "finish_date": datetime.now(),
+        "status": FINISHED_OK_STATUS,
+        "progress": 100
+    })
 
 
 def fail_batch(_id, dbcon, msg):
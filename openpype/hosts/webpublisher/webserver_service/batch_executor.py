@@ -0,0 +1,460 @@
+"""Execution of webpublisher batches on pool of publish workers.
+
+Publish jobs are stored in 'webpublish_queue' collection so queued jobs
+survive restart of the service. Jobs which were running when service
+stopped are queued again on start only if publish of batch did not start,
+otherwise are marked as failed (publish could be partially integrated).
+
+Jobs are processed by subprocesses launched from executor's event loop
+running in separate thread so requests of webserver are not blocked.
+Number of concurrent jobs is limited globally, per project and per host.
+"""
+
+import os
+import asyncio
+import datetime
+import threading
+import collections
+
+from openpype.lib import Logger
+from openpype_modules.webpublisher.lib import (
+    ERROR_STATUS,
+    IN_PROGRESS_STATUS,
+)
+
+QUEUED_JOB_STATUS = "queued"
+RUNNING_JOB_STATUS = "running"
+FINISHED_JOB_STATUS = "finished"
+FAILED_JOB_STATUS = "failed"
+
+# Finished jobs are removed from database after 7 days
+FINISHED_JOBS_TTL = 7 * 24 * 60 * 60
+# Finished jobs kept in memory for status requests
+FINISHED_JOBS_IN_MEMORY = 1000
+
+
+def _get_env_int(key, default):
+    value = os.environ.get(key)
+    if value:
+        try:
+            return max(int(value), 0)
+        except ValueError:
+            pass
+    return default
+
+
+def get_host_limits_from_env(default=None):
+    """Limits of concurrent jobs per host.
+
+    Value of 'OPENPYPE_WEBPUBLISH_HOST_LIMITS' environment variable is
+    expected in format 'photoshop=1,tvpaint=2'.
+
+    Returns:
+        Dict[str, int]: Limits by host name.
+    """
+
+    output = dict(default or {})
+    value = os.environ.get("OPENPYPE_WEBPUBLISH_HOST_LIMITS")
+    if not value:
+        return output
+
+    for item in value.split(","):
+        host_name, _, limit = item.partition("=")
+        host_name = host_name.strip()
+        try:
+            output[host_name] = max(int(limit), 0)
+        except ValueError:
+            continue
+    return output
+
+
+INTERRUPTED_JOB_MESSAGE = (
+    "Publish was interrupted by restart of webpublisher service."
+)
+
+
+class PublishJobQueue(object):
+    """Persistent queue of publish jobs stored in database.
+
+    Args:
+        dbcon (pymongo.collection.Collection): Collection of jobs.
+        publish_dbcon (Optional[pymongo.collection.Collection]): Collection
+            with publish logs of batches ('webpublishes'). Interrupted jobs
+            are never queued again if not passed.
+    """
+
+    def __init__(self, dbcon, publish_dbcon=None):
+        self._dbcon = dbcon
+        self._publish_dbcon = publish_dbcon
+
+    def prepare(self):
+        """Create indexes and resolve jobs interrupted by restart.
+
+        Interrupted job is queued again only if publish process did not
+        create publish log of the batch. Other interrupted jobs are marked
+        as failed because publish could already integrate some versions.
+        """
+
+        self._dbcon.create_index([("status", 1), ("created_dt", 1)])
+        self._dbcon.create_index(
+            "finished_dt", expireAfterSeconds=FINISHED_JOBS_TTL
+        )
+        for job in self._dbcon.find({"status": RUNNING_JOB_STATUS}):
+            if not self._publish_started(job):
+                self.update_job(
+                    job["_id"],
+                    {"status": QUEUED_JOB_STATUS, "started_dt": None}
+                )
+                continue
+
+            finished_dt = datetime.datetime.now()
+            self.update_job(job["_id"], {
+                "status": FAILED_JOB_STATUS,
+                "finished_dt": finished_dt,
+                "error": INTERRUPTED_JOB_MESSAGE
+            })
+            if self._publish_dbcon is not None:
+                self._publish_dbcon.update_many(
+                    self._get_publish_filter(job, IN_PROGRESS_STATUS),
+                    {"$set": {
+                        "status": ERROR_STATUS,
+                        "finish_date": finished_dt,
+                        "log": INTERRUPTED_JOB_MESSAGE
+                    }}
+                )
+
+    def _get_publish_filter(self, job, status=None):
+        publish_filter = {"batch_id": job["batch_id"]}
+        # Batch can have publish logs of previous publishes
+        if job.get("started_dt"):
+            publish_filter["start_date"] = {"$gte": job["started_dt"]}
+        if status:
+            publish_filter["status"] = status
+        return publish_filter
+
+    def _publish_started(self, job):
+        if self._publish_dbcon is None:
+            return True
+        publish_doc = self._publish_dbcon.find_one(
+            self._get_publish_filter(job), {"_id": True}
+        )
+        return publish_doc is not None
+
+    def get_queued_jobs(self):
+        return list(
+            self._dbcon.find({"status": QUEUED_JOB_STATUS})
+            .sort("created_dt", 1)
+        )
+
+    def add_job(self, args, batch_id, project_name, host_name, user):
+        job = {
+            "batch_id": batch_id,
+            "args": list(args),
+            "project_name": project_name,
+            "host_name": host_name,
+            "user": user,
+            "status": QUEUED_JOB_STATUS,
+            "created_dt": datetime.datetime.now(),
+            "started_dt": None,
+            "finished_dt": None,
+            "returncode": None,
+            "error": None
+        }
+        job["_id"] = self._dbcon.insert_one(dict(job)).inserted_id
+        return job
+
+    def update_job(self, job_id, data):
+        self._dbcon.update_one({"_id": job_id}, {"$set": data})
+
+
+class BatchExecutor(object):
+    """Run publish jobs on pool of workers.
+
+    Args:
+        job_queue (PublishJobQueue): Persistent queue of jobs.
+        max_workers (Optional[int]): Maximum number of concurrent jobs. Value
+            from 'OPENPYPE_WEBPUBLISH_WORKERS' is used if not passed.
+        max_project_workers (Optional[int]): Maximum number of concurrent
+            jobs of one project, '0' means no limit. Value from
+            'OPENPYPE_WEBPUBLISH_PROJECT_WORKERS' is used if not passed.
+        host_limits (Optional[Dict[str, int]]): Maximum number of
+            concurrent jobs by host name.
+    """
+
+    log = Logger.get_logger("BatchExecutor")
+    default_max_workers = 2
+    # Photoshop can run only one publish at a time
+    default_host_limits = {"photoshop": 1}
+
+    def __init__(
+        self,
+        job_queue,
+        max_workers=None,
+        max_project_workers=None,
+        host_limits=None
+    ):
+        if max_workers is None:
+            max_workers = _get_env_int(
+                "OPENPYPE_WEBPUBLISH_WORKERS", self.default_max_workers
+            )
+        if max_project_workers is None:
+            max_project_workers = _get_env_int(
+                "OPENPYPE_WEBPUBLISH_PROJECT_WORKERS", 0
+            )
+        if host_limits is None:
+            host_limits = get_host_limits_from_env(self.default_host_limits)
+
+        self._job_queue = job_queue
+        self._max_workers = max(max_workers, 1)
+        self._max_project_workers = max_project_workers
+        self._host_limits = host_limits
+
+        self._lock = threading.Lock()
+        self._queued = []
+        self._running = {}
+        self._finished = collections.OrderedDict()
+
+        self._loop = None
+        self._wake_event = None
+        self._thread = None
+        self._started = threading.Event()
+        self._stopped = False
+
+    def start(self):
+        """Start thread with event loop processing jobs."""
+
+        if self._thread is not None:
+            return
+
+        self._job_queue.prepare()
+        queued_jobs = self._job_queue.get_queued_jobs()
+        with self._lock:
+            self._queued.extend(queued_jobs)
+        if queued_jobs:
+            self.log.info(
+                "Loaded {} queued publish jobs".format(len(queued_jobs))
+            )
+
+        self._thread = threading.Thread(
+            target=self._run_loop, name="WebpublishBatchExecutor"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        self._started.wait()
+
+    def stop(self):
+        """Stop processing of jobs.
+
+        Queued jobs are not started, waits for running jobs to finish.
+        """
+
+        self._stopped = True
+        self._wake()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run_loop(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._wake_event = asyncio.Event()
+        self._started.set()
+        try:
+            self._loop.run_until_complete(self._process_queue())
+        finally:
+            self._loop.close()
+
+    def _wake(self):
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake_event.set)
+
+    def submit(self, args, batch_id, project_name, host_name, user=None):
+        """Add publish job to queue.
+
+        Args:
+            args (List[str]): Arguments of publish process.
+            batch_id (str): Id of published batch.
+            project_name (str): Name of project.
+            host_name (str): Name of host which process batch.
+            user (Optional[str]): User who published the batch.
+
+        Returns:
+            Dict[str, Any]: Job data.
+        """
+
+        job = self._job_queue.add_job(
+            args, batch_id, project_name, host_name, user
+        )
+        with self._lock:
+            self._queued.append(job)
+        self._wake()
+        return job
+
+    def _can_start(self, job, running_jobs):
+        project_name = job["project_name"]
+        if self._max_project_workers:
+            project_count = len([
+                running_job
+                for running_job in running_jobs
+                if running_job["project_name"] == project_name
+            ])
+            if project_count >= self._max_project_workers:
+                return False
+
+        host_limit = self._host_limits.get(job["host_name"])
+        if host_limit:
+            host_count = len([
+                running_job
+                for running_job in running_jobs
+                if running_job["host_name"] == job["host_name"]
+            ])
+            if host_count >= host_limit:
+                return False
+        return True
+
+    def _pop_startable_jobs(self):
+        output = []
+        with self._lock:
+            running_jobs = list(self._running.values())
+            for job in tuple(self._queued):
+                if len(running_jobs) >= self._max_workers:
+                    break
+                if not self._can_start(job, running_jobs):
+                    continue
+                self._queued.remove(job)
+                job["status"] = RUNNING_JOB_STATUS
+                job["started_dt"] = datetime.datetime.now()
+                self._running[job["_id"]] = job
+                running_jobs.append(job)
+                output.append(job)
+        return output
+
+    async def _process_queue(self):
+        loop = asyncio.get_event_loop()
+        tasks = set()
+        while not self._stopped:
+            for job in self._pop_startable_jobs():
+                tasks.add(loop.create_task(self._process_job(job)))
+
+            tasks = {task for task in tasks if not task.done()}
+            self._wake_event.clear()
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), 1.0)
+            except asyncio.TimeoutError:
+                pass
+
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def _process_job(self, job):
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            None,
+            self._job_queue.update_job,
+            job["_id"],
+            {"status": RUNNING_JOB_STATUS, "started_dt": job["started_dt"]}
+        )
+        self.log.info("Starting publish of batch {}".format(job["batch_id"]))
+        returncode = None
+        error = None
+        try:
+            process = await asyncio.create_subprocess_exec(*job["args"])
+            returncode = await process.wait()
+        except Exception as exc:
+            error = "Publish process failed to start: {}".format(exc)
+            self.log.warning(
+                "Publish of batch {} failed to start".format(job["batch_id"]),
+                exc_info=True
+            )
+
+        status = FINISHED_JOB_STATUS
+        if returncode != 0:
+            status = FAILED_JOB_STATUS
+        finished_dt = datetime.datetime.now()
+        self.log.info("Publish of batch {} {} ({}s)".format(
+            job["batch_id"],
+            status,
+            (finished_dt - job["started_dt"]).total_seconds()
+        ))
+
+        with self._lock:
+            self._running.pop(job["_id"], None)
+            job["status"] = status
+            job["finished_dt"] = finished_dt
+            job["returncode"] = returncode
+            job["error"] = error
+            self._finished[job["_id"]] = job
+            while len(self._finished) > FINISHED_JOBS_IN_MEMORY:
+                self._finished.popitem(last=False)
+
+        await loop.run_in_executor(
+            None,
+            self._job_queue.update_job,
+            job["_id"],
+            {
+                "status": status,
+                "finished_dt": finished_dt,
+                "returncode": returncode,
+                "error": error
+            }
+        )
+        self._wake_event.set()
+
+    def _job_info(self, job, queue_position=None):
+        return {
+            "batch_id": job["batch_id"],
+            "project_name": job["project_name"],
+            "host_name": job["host_name"],
+            "user": job["user"],
+            "status": job["status"],
+            "queue_position": queue_position,
+            "created_dt": job["created_dt"],
+            "started_dt": job["started_dt"],
+            "finished_dt": job["finished_dt"],
+            "returncode": job["returncode"],
+            "error": job.get("error")
+        }
+
+    def get_job_info(self, batch_id):
+        """Info about last job of batch from memory.
+
+        Returns:
+            Union[Dict[str, Any], None]: Job info or None if batch is not
+                known to executor.
+        """
+
+        with self._lock:
+            for idx, job in enumerate(self._queued):
+                if job["batch_id"] == batch_id:
+                    return self._job_info(job, idx)
+
+            for job in self._running.values():
+                if job["batch_id"] == batch_id:
+                    return self._job_info(job)
+
+            for job in reversed(self._finished.values()):
+                if job["batch_id"] == batch_id:
+                    return self._job_info(job)
+        return None
+
+    def get_status(self):
+        """Status of executor with queued and running jobs.
+
+        Returns:
+            Dict[str, Any]: Status data.
+        """
+
+        with self._lock:
+            return {
+                "max_workers": self._max_workers,
+                "max_project_workers": self._max_project_workers,
+                "host_limits": dict(self._host_limits),
+                "queued": [
+                    self._job_info(job, idx)
+                    for idx, job in enumerate(self._queued)
+                ],
+                "running": [
+                    self._job_info(job)
+                    for job in self._running.values()
+                ]
+            }
@@ -0,0 +1,343 @@
+"""Cache of project hierarchy trees served by webpublisher.
+
+Building of hierarchy requires query of all assets in project which is slow
+for big projects. Hierarchy is built once per project and kept as serialized
+JSON with ETag so unchanged hierarchy can be validated by clients without
+sending the tree again.
+
+Cached hierarchy is invalidated when project collection changes, changes are
+captured by 'ProjectChangesWatcher' (change stream or polling fallback).
+Polling can't detect in-place updates so cached hierarchy also expires after
+time to live ('OPENPYPE_WEBPUBLISH_HIERARCHY_TTL', 300 seconds by default).
+"""
+
+import os
+import json
+import time
+import hashlib
+import datetime
+import threading
+import collections
+
+from bson.objectid import ObjectId
+
+from openpype.client import get_project, get_assets
+from openpype.client.entity_cache import ProjectChangesWatcher
+from openpype.lib import Logger
+
+DEFAULT_TTL = 300
+DEFAULT_POLL_INTERVAL = 10
+
+
+def _get_env_int(key, default):
+    value = os.environ.get(key)
+    if value:
+        try:
+            return max(int(value), 0)
+        except ValueError:
+            pass
+    return default
+
+
+def _json_dump_handler(value):
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, set):
+        return list(value)
+    raise TypeError(value)
+
+
+def encode_node(node):
+    """Serialize node to JSON in same format as other webpublisher routes.
+
+    Returns:
+        bytes: Encoded JSON.
+    """
+
+    return json.dumps(
+        node,
+        indent=4,
+        default=_json_dump_handler
+    ).encode("utf-8")
+
+
+class Node(dict):
+    """Node element in context tree."""
+
+    def __init__(self, uid, node_type, name):
+        self._parent = None  # pointer to parent Node
+        self["type"] = node_type
+        self["name"] = name
+        self['id'] = uid  # keep reference to id #
+        self['children'] = []  # collection of pointers to child Nodes
+
+    @property
+    def parent(self):
+        return self._parent  # simply return the object at the _parent pointer
+
+    @parent.setter
+    def parent(self, node):
+        self._parent = node
+        # add this node to parent's list of children
+        node['children'].append(self)
+
+
+class TaskNode(Node):
+    """Special node type only for Tasks."""
+
+    def __init__(self, node_type, name):
+        self._parent = None
+        self["type"] = node_type
+        self["name"] = name
+        self["attributes"] = {}
+
+
+def build_hierarchy(project_name):
+    """Build context tree of project from assets.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        Tuple[Node, Dict[ObjectId, Node]]: Root node of project and asset
+            nodes by asset id.
+    """
+
+    query_projection = {
+        "_id": 1,
+        "data.tasks": 1,
+        "data.visualParent": 1,
+        "data.entityType": 1,
+        "name": 1,
+        "type": 1,
+    }
+
+    asset_docs = get_assets(project_name, fields=query_projection.keys())
+    asset_docs_by_id = {
+        asset_doc["_id"]: asset_doc
+        for asset_doc in asset_docs
+    }
+
+    asset_docs_by_parent_id = collections.defaultdict(list)
+    for asset_doc in asset_docs_by_id.values():
+        parent_id = asset_doc["data"].get("visualParent")
+        asset_docs_by_parent_id[parent_id].append(asset_doc)
+
+    assets = {}
+    for parent_id, children in asset_docs_by_parent_id.items():
+        for child in children:
+            node = assets.get(child["_id"])
+            if not node:
+                node = Node(child["_id"],
+                            child["data"].get("entityType", "Folder"),
+                            child["name"])
+                assets[child["_id"]] = node
+
+                tasks = child["data"].get("tasks", {})
+                for t_name, t_con in tasks.items():
+                    task_node = TaskNode("task", t_name)
+                    task_node["attributes"]["type"] = t_con.get("type")
+
+                    task_node.parent = node
+
+            parent_node = assets.get(parent_id)
+            if not parent_node:
+                asset_doc = asset_docs_by_id.get(parent_id)
+                if asset_doc:  # regular node
+                    parent_node = Node(parent_id,
+                                       asset_doc["data"].get("entityType",
+                                                             "Folder"),
+                                       asset_doc["name"])
+                else:  # root
+                    parent_node = Node(parent_id,
+                                       "project",
+                                       project_name)
+                assets[parent_id] = parent_node
+            node.parent = parent_node
+
+    roots = [x for x in assets.values() if x.parent is None]
+    if roots:
+        root = roots[0]
+    else:
+        # Project without assets
+        root = Node(None, "project", project_name)
+
+    nodes_by_id = {
+        asset_id: node
+        for asset_id, node in assets.items()
+        if asset_id in asset_docs_by_id
+    }
+    return root, nodes_by_id
+
+
+class CachedHierarchy(object):
+    """Built hierarchy of a project with serialized output.
+
+    Serialized subtrees are created on demand and kept with the hierarchy.
+    """
+
+    def __init__(self, project_name, root, nodes_by_id, expire_time):
+        self.project_name = project_name
+        self.expire_time = expire_time
+        self._root = root
+        self._nodes_by_id = nodes_by_id
+        self._nodes_by_name = {
+            node["name"]: node
+            for node in nodes_by_id.values()
+        }
+        self._encoded = {}
+        self._lock = threading.Lock()
+        self.body, self.etag = self._encode(None, root)
+
+    def _encode(self, key, node):
+        body = encode_node(node)
+        etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+        self._encoded[key] = (body, etag)
+        return body, etag
+
+    def get_subtree(self, asset_id_or_name):
+        """Serialized subtree of asset.
+
+        Args:
+            asset_id_or_name (str): Id or name of asset.
+
+        Returns:
+            Union[Tuple[bytes, str], None]: Body and ETag of subtree or None
+                if asset was not found.
+        """
+
+        with self._lock:
+            item = self._encoded.get(asset_id_or_name)
+            if item is not None:
+                return item
+
+            node = None
+            if ObjectId.is_valid(asset_id_or_name):
+                node = self._nodes_by_id.get(ObjectId(asset_id_or_name))
+            if node is None:
+                node = self._nodes_by_name.get(asset_id_or_name)
+            if node is None:
+                return None
+            return self._encode(asset_id_or_name, node)
+
+
+class HierarchyCache(object):
+    """Cache of built project hierarchies.
+
+    Args:
+        ttl (Optional[int]): Time to live of cached hierarchy in seconds.
+            Value from 'OPENPYPE_WEBPUBLISH_HIERARCHY_TTL' is used if not
+            passed.
+        watch_changes (bool): Invalidate hierarchy of project on changes
+            in project collection.
+    """
+
+    log = Logger.get_logger("HierarchyCache")
+
+    def __init__(self, ttl=None, watch_changes=True):
+        if ttl is None:
+            ttl = _get_env_int(
+                "OPENPYPE_WEBPUBLISH_HIERARCHY_TTL", DEFAULT_TTL
+            )
+        self._ttl = ttl
+        self._watch_changes = watch_changes
+        self._hierarchies = {}
+        self._generations = collections.defaultdict(int)
+        self._watchers = {}
+        self._lock = threading.Lock()
+        # Build hierarchy of project only once when requested concurrently
+        self._build_locks = collections.defaultdict(threading.Lock)
+
+    def invalidate(self, project_name=None):
+        """Invalidate cached hierarchy.
+
+        Args:
+            project_name (Optional[str]): Invalidate only passed project.
+                All projects are invalidated if 'None' is passed.
+        """
+
+        with self._lock:
+            if project_name is None:
+                project_names = list(self._hierarchies.keys())
+            else:
+                project_names = [project_name]
+
+            for name in project_names:
+                self._hierarchies.pop(name, None)
+                self._generations[name] += 1
+
+    def _start_watcher(self, project_name):
+        if not self._watch_changes or project_name in self._watchers:
+            return
+        watcher = ProjectChangesWatcher(
+            project_name,
+            self.invalidate,
+            _get_env_int(
+                "OPENPYPE_ENTITY_CACHE_POLL_INTERVAL", DEFAULT_POLL_INTERVAL
+            )
+        )
+        self._watchers[project_name] = watcher
+        watcher.start()
+
+    def stop(self):
+        """Stop watchers of project changes."""
+
+        with self._lock:
+            watchers = list(self._watchers.values())
+            self._watchers.clear()
+        for watcher in watchers:
+            watcher.stop()
+
+    def _get_valid(self, project_name):
+        hierarchy = self._hierarchies.get(project_name)
+        if hierarchy is not None and hierarchy.expire_time > time.time():
+            return hierarchy
+        return None
+
+    def get_hierarchy(self, project_name):
+        """Cached hierarchy of project, hierarchy is built if needed.
+
+        Args:
+            project_name (str): Name of project.
+
+        Returns:
+            Union[CachedHierarchy, None]: Hierarchy of project or None if
+                project does not exist.
+        """
+
+        with self._lock:
+            hierarchy = self._get_valid(project_name)
+            if hierarchy is not None:
+                return hierarchy
+
+        # Watchers and locks are created only for existing projects
+        if not get_project(project_name, fields=["_id"]):
+            return None
+
+        with self._lock:
+            build_lock = self._build_locks[project_name]
+
+        with build_lock:
+            with self._lock:
+                hierarchy = self._get_valid(project_name)
+                if hierarchy is not None:
+                    return hierarchy
+                self._start_watcher(project_name)
+                generation = self._generations[project_name]
+
+            start = time.time()
+            root, nodes_by_id = build_hierarchy(project_name)
+            hierarchy = CachedHierarchy(
+                project_name, root, nodes_by_id, time.time() + self._ttl
+            )
+            self.log.debug("Hierarchy of \"{}\" built in {:.3f}s".format(
+                project_name, time.time() - start
+            ))
+
+            with self._lock:
+                # Store only if project did not change during build
+                if generation == self._generations[project_name]:
+                    self._hierarchies[project_name] = hierarchy
+        return hierarchy
@@ -2,15 +2,11 @@
 import os
 import json
 import datetime
-import collections
-import subprocess
+import asyncio
 from bson.objectid import ObjectId
 from aiohttp.web_response import Response
 
-from openpype.client import (
-    get_projects,
-    get_assets,
-)
+from openpype.client import get_projects
 from openpype.lib import Logger
 from openpype.settings import get_project_settings
 from openpype_modules.webserver.base_routes import RestApiEndpoint
@@ -22,6 +18,12 @@ from openpype_modules.webpublisher.lib import (
     REPROCESS_STATUS
 )
 
+from .batch_executor import (
+    QUEUED_JOB_STATUS,
+    FAILED_JOB_STATUS,
+)
+from .hierarchy_cache import HierarchyCache
+
 log = Logger.get_logger("WebpublishRoutes")
 
 
@@ -64,21 +66,20 @@ class JsonApiResource:
 class RestApiResource(JsonApiResource):
     """Resource carrying needed info and Avalon DB connection for publish."""
     def __init__(self, server_manager, executable, upload_dir,
-                 studio_task_queue=None):
+                 batch_executor):
         self.server_manager = server_manager
         self.upload_dir = upload_dir
         self.executable = executable
-
-        if studio_task_queue is None:
-            studio_task_queue = collections.deque().dequeu
-        self.studio_task_queue = studio_task_queue
+        self.batch_executor = batch_executor
+        self.hierarchy_cache = HierarchyCache()
 
 
 class WebpublishRestApiResource(JsonApiResource):
     """Resource carrying OP DB connection for storing batch info into DB."""
 
-    def __init__(self):
+    def __init__(self, batch_executor=None):
         self.dbcon = get_webpublish_conn()
+        self.batch_executor = batch_executor
 
 
 class ProjectsEndpoint(ResourceRestApiEndpoint):
@@ -98,100 +99,83 @@ class ProjectsEndpoint(ResourceRestApiEndpoint):
         )
 
 
-class HiearchyEndpoint(ResourceRestApiEndpoint):
-    """Returns dictionary with context tree from assets."""
-    async def get(self, project_name) -> Response:
-        query_projection = {
-            "_id": 1,
-            "data.tasks": 1,
-            "data.visualParent": 1,
-            "data.entityType": 1,
-            "name": 1,
-            "type": 1,
-        }
+def _etag_matches(request, etag):
+    """Check if 'If-None-Match' header of request matches ETag."""
+
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    for value in if_none_match.split(","):
+        value = value.strip()
+        if value.startswith("W/"):
+            value = value[2:]
+        if value in ("*", etag):
+            return True
+    return False
+
+
+def _project_not_found_response(resource, project_name):
+    return Response(
+        status=404,
+        body=resource.encode({
+            "msg": "Project {} not found".format(project_name)
+        }),
+        content_type="application/json"
+    )
+
+
+def _cached_json_response(request, body, etag):
+    headers = {
+        "ETag": etag,
+        # Clients must always validate cached hierarchy
+        "Cache-Control": "no-cache"
+    }
+    if _etag_matches(request, etag):
+        return Response(status=304, headers=headers)
+
+    return Response(
+        status=200,
+        body=body,
+        headers=headers,
+        content_type="application/json"
+    )
 
-        asset_docs = get_assets(project_name, fields=query_projection.keys())
-        asset_docs_by_id = {
-            asset_doc["_id"]: asset_doc
-            for asset_doc in asset_docs
-        }
 
-        asset_docs_by_parent_id = collections.defaultdict(list)
-        for asset_doc in asset_docs_by_id.values():
-            parent_id = asset_doc["data"].get("visualParent")
-            asset_docs_by_parent_id[parent_id].append(asset_doc)
-
-        assets = collections.defaultdict(list)
-
-        for parent_id, children in asset_docs_by_parent_id.items():
-            for child in children:
-                node = assets.get(child["_id"])
-                if not node:
-                    node = Node(child["_id"],
-                                child["data"].get("entityType", "Folder"),
-                                child["name"])
-                    assets[child["_id"]] = node
-
-                    tasks = child["data"].get("tasks", {})
-                    for t_name, t_con in tasks.items():
-                        task_node = TaskNode("task", t_name)
-                        task_node["attributes"]["type"] = t_con.get("type")
-
-                        task_node.parent = node
-
-                parent_node = assets.get(parent_id)
-                if not parent_node:
-                    asset_doc = asset_docs_by_id.get(parent_id)
-                    if asset_doc:  # regular node
-                        parent_node = Node(parent_id,
-                                           asset_doc["data"].get("entityType",
-                                                                 "Folder"),
-                                           asset_doc["name"])
-                    else:  # root
-                        parent_node = Node(parent_id,
-                                           "project",
-                                           project_name)
-                    assets[parent_id] = parent_node
-                node.parent = parent_node
-
-        roots = [x for x in assets.values() if x.parent is None]
+class HiearchyEndpoint(ResourceRestApiEndpoint):
+    """Returns dictionary with context tree from assets.
 
-        return Response(
-            status=200,
-            body=self.resource.encode(roots[0]),
-            content_type="application/json"
+    Tree is cached, supports validation with 'If-None-Match' header.
+    """
+    async def get(self, project_name, request) -> Response:
+        loop = asyncio.get_event_loop()
+        hierarchy = await loop.run_in_executor(
+            None, self.resource.hierarchy_cache.get_hierarchy, project_name
         )
+        if hierarchy is None:
+            return _project_not_found_response(self.resource, project_name)
+        return _cached_json_response(request, hierarchy.body, hierarchy.etag)
 
 
-class Node(dict):
-    """Node element in context tree."""
-
-    def __init__(self, uid, node_type, name):
-        self._parent = None  # pointer to parent Node
-        self["type"] = node_type
-        self["name"] = name
-        self['id'] = uid  # keep reference to id #
-        self['children'] = []  # collection of pointers to child Nodes
-
-    @property
-    def parent(self):
-        return self._parent  # simply return the object at the _parent pointer
-
-    @parent.setter
-    def parent(self, node):
-        self._parent = node
-        # add this node to parent's list of children
-        node['children'].append(self)
-
-
-class TaskNode(Node):
-    """Special node type only for Tasks."""
-
-    def __init__(self, node_type, name):
-        self._parent = None
-        self["type"] = node_type
-        self["name"] = name
-        self["attributes"] = {}
+class HierarchySubtreeEndpoint(ResourceRestApiEndpoint):
+    """Returns context tree of single asset found by id or name."""
+    async def get(self, project_name, asset_id, request) -> Response:
+        loop = asyncio.get_event_loop()
+        hierarchy = await loop.run_in_executor(
+            None, self.resource.hierarchy_cache.get_hierarchy, project_name
+        )
+        if hierarchy is None:
+            return _project_not_found_response(self.resource, project_name)
+        subtree = hierarchy.get_subtree(asset_id)
+        if subtree is None:
+            return Response(
+                status=404,
+                body=self.resource.encode({
+                    "msg": "Asset {} not found".format(asset_id)
+                }),
+                content_type="application/json"
+            )
+        body, etag = subtree
+        return _cached_json_response(request, body, etag)
 
 
 class BatchPublishEndpoint(WebpublishApiEndpoint):
@@ -218,7 +202,8 @@ class BatchPublishEndpoint(WebpublishApiEndpoint):
                 "arguments": {
                     "targets": ["tvpaint_worker"]
                 },
-                "add_to_queue": False
+                # host used to limit concurrently running publishes
+                "host_name": "tvpaint"
             },
             # Photoshop filter
             {
@@ -232,9 +217,9 @@ class BatchPublishEndpoint(WebpublishApiEndpoint):
                     # - targets argument is not used in 'publishfromapp'
                     "targets": ["remotepublish"]
                 },
-                # does publish need to be handled by a queue, eg. only
-                # single process running concurrently?
-                "add_to_queue": True
+                # only single Photoshop publish can run concurrently, see
+                #   'BatchExecutor.default_host_limits'
+                "host_name": "photoshop"
             }
         ]
 
@@ -250,7 +235,7 @@ class BatchPublishEndpoint(WebpublishApiEndpoint):
             "targets": ["filespublish"]
         }
 
-        add_to_queue = False
+        host_name = "webpublisher"
         if content.get("studio_processing"):
             log.info("Post processing called for {}".format(batch_dir))
 
@@ -267,7 +252,7 @@ class BatchPublishEndpoint(WebpublishApiEndpoint):
                         add_args.update(
                             process_filter.get("arguments") or {}
                         )
-                        add_to_queue = process_filter["add_to_queue"]
+                        host_name = process_filter["host_name"]
                         break
 
         args = [
@@ -289,11 +274,18 @@ class BatchPublishEndpoint(WebpublishApiEndpoint):
                     args.append(value)
 
         log.info("args:: {}".format(args))
-        if add_to_queue:
-            log.debug("Adding to queue")
-            self.resource.studio_task_queue.append(args)
-        else:
-            subprocess.call(args)
+        # Publish is processed by worker pool of batch executor, database
+        #   write is not done in event loop
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            None,
+            self.resource.batch_executor.submit,
+            args,
+            content["batch"],
+            content["project_name"],
+            host_name,
+            content["user"]
+        )
 
         return Response(
             status=200,
@@ -318,7 +310,46 @@ class BatchStatusEndpoint(WebpublishApiEndpoint):
     """
 
     async def get(self, batch_id) -> Response:
-        output = self.dbcon.find_one({"batch_id": batch_id})
+        output = None
+        job_info = None
+        batch_executor = self.resource.batch_executor
+        if batch_executor is not None:
+            job_info = batch_executor.get_job_info(batch_id)
+            # Publish process did not create record in database yet
+            if job_info and job_info["status"] == QUEUED_JOB_STATUS:
+                output = {
+                    "batch_id": batch_id,
+                    "status": "queued",
+                    "progress": 0,
+                    "queue_position": job_info["queue_position"]
+                }
+
+        if output is None:
+            loop = asyncio.get_event_loop()
+            output = await loop.run_in_executor(
+                None, self.dbcon.find_one, {"batch_id": batch_id}
+            )
+
+        # Running publish writes log records to 'log_lines', full log is
+        #   stored to 'log' when publish finishes
+        if output and "log_lines" in output:
+            log_lines = output.pop("log_lines")
+            if "log" not in output:
+                output["log"] = os.linesep.join(log_lines)
+
+        # Publish process failed to start so it did not create record
+        if (
+            not output
+            and job_info
+            and job_info["status"] == FAILED_JOB_STATUS
+        ):
+            output = {
+                "batch_id": batch_id,
+                "status": ERROR_STATUS,
+                "progress": 0,
+                "returncode": job_info["returncode"],
+                "log": job_info["error"] or "Publish process failed"
+            }
 
         if output:
             status = 200
@@ -335,6 +366,21 @@ class BatchStatusEndpoint(WebpublishApiEndpoint):
         )
 
 
+class BatchQueueEndpoint(WebpublishApiEndpoint):
+    """Returns status of queue with queued and running publish jobs.
+
+    Uses 'WebpublishRestApiResource'.
+    """
+
+    async def get(self) -> Response:
+        output = self.resource.batch_executor.get_status()
+        return Response(
+            status=200,
+            body=self.resource.encode(output),
+            content_type="application/json"
+        )
+
+
 class UserReportEndpoint(WebpublishApiEndpoint):
     """Returns list of dict with batch info for user (email address).
 
@@ -342,8 +388,10 @@ class UserReportEndpoint(WebpublishApiEndpoint):
     """
 
     async def get(self, user) -> Response:
-        output = list(self.dbcon.find({"user": user},
-                                      projection={"log": False}))
+        output = list(self.dbcon.find(
+            {"user": user},
+            projection={"log": False, "log_lines": False}
+        ))
 
         if output:
             status = 200
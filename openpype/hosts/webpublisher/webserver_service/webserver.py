@@ -1,30 +1,36 @@
-import collections
 import time
 import os
 from datetime import datetime
 import requests
 import json
-import subprocess
 
 from openpype.client import OpenPypeMongoConnection
 from openpype.modules import ModulesManager
 from openpype.lib import Logger
 
 from openpype_modules.webpublisher.lib import (
+    get_webpublish_conn,
+    get_webpublish_queue_conn,
     ERROR_STATUS,
     REPROCESS_STATUS,
     SENT_REPROCESSING_STATUS
 )
 
+from .batch_executor import (
+    PublishJobQueue,
+    BatchExecutor
+)
 from .webpublish_routes import (
     RestApiResource,
     WebpublishRestApiResource,
     HiearchyEndpoint,
+    HierarchySubtreeEndpoint,
     ProjectsEndpoint,
     ConfiguredExtensionsEndpoint,
     BatchPublishEndpoint,
     BatchReprocessEndpoint,
     BatchStatusEndpoint,
+    BatchQueueEndpoint,
     TaskPublishEndpoint,
     UserReportEndpoint
 )
@@ -45,13 +51,18 @@ def run_webserver(executable, upload_dir, host=None, port=None):
 
     server_manager = webserver_module.create_new_server_manager(port, host)
     webserver_url = server_manager.url
-    # queue for remotepublishfromapp tasks
-    studio_task_queue = collections.deque()
+    # persistent queue of publish jobs processed by pool of workers
+    batch_executor = BatchExecutor(
+        PublishJobQueue(
+            get_webpublish_queue_conn(), get_webpublish_conn()
+        )
+    )
+    batch_executor.start()
 
     resource = RestApiResource(server_manager,
                                upload_dir=upload_dir,
                                executable=executable,
-                               studio_task_queue=studio_task_queue)
+                               batch_executor=batch_executor)
     projects_endpoint = ProjectsEndpoint(resource)
     server_manager.add_route(
         "GET",
@@ -66,6 +77,13 @@ def run_webserver(executable, upload_dir, host=None, port=None):
         hiearchy_endpoint.dispatch
     )
 
+    hierarchy_subtree_endpoint = HierarchySubtreeEndpoint(resource)
+    server_manager.add_route(
+        "GET",
+        "/api/hierarchy/{project_name}/{asset_id}",
+        hierarchy_subtree_endpoint.dispatch
+    )
+
     configured_ext_endpoint = ConfiguredExtensionsEndpoint(resource)
     server_manager.add_route(
         "GET",
@@ -89,7 +107,7 @@ def run_webserver(executable, upload_dir, host=None, port=None):
     )
 
     # reporting
-    webpublish_resource = WebpublishRestApiResource()
+    webpublish_resource = WebpublishRestApiResource(batch_executor)
     batch_status_endpoint = BatchStatusEndpoint(webpublish_resource)
     server_manager.add_route(
         "GET",
@@ -97,6 +115,13 @@ def run_webserver(executable, upload_dir, host=None, port=None):
         batch_status_endpoint.dispatch
     )
 
+    batch_queue_endpoint = BatchQueueEndpoint(webpublish_resource)
+    server_manager.add_route(
+        "GET",
+        "/api/webpublish/queue",
+        batch_queue_endpoint.dispatch
+    )
+
     user_status_endpoint = UserReportEndpoint(webpublish_resource)
     server_manager.add_route(
         "GET",
@@ -117,9 +142,6 @@ def run_webserver(executable, upload_dir, host=None, port=None):
         if time.time() - last_reprocessed > 20:
             reprocess_failed(upload_dir, webserver_url)
             last_reprocessed = time.time()
-        if studio_task_queue:
-            args = studio_task_queue.popleft()
-            subprocess.call(args)  # blocking call
 
         time.sleep(1.0)
 
@@ -102,6 +102,8 @@ from .profiles_filtering import (
     filter_profiles
 )
 
+from .thread_tools import run_in_threads
+
 from .transcoding import (
     get_transcode_temp_directory,
     should_convert_for_ffmpeg,
@@ -173,6 +175,7 @@ from .path_tools import (
     format_file_size,
     collect_frames,
     create_hard_link,
+    replace_file,
     version_up,
     get_version_from_path,
     get_last_version_from_path,
@@ -244,6 +247,8 @@ __all__ = [
     "classes_from_module",
     "import_module_from_dirpath",
 
+    "run_in_threads",
+
     "get_transcode_temp_directory",
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
@@ -304,6 +309,7 @@ __all__ = [
     "format_file_size",
     "collect_frames",
     "create_hard_link",
+    "replace_file",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
@@ -2,8 +2,11 @@ import os
 import sys
 import copy
 import json
+import time
+import hashlib
 import tempfile
 import platform
+import threading
 import collections
 import inspect
 import subprocess
@@ -880,6 +883,11 @@ class ApplicationLaunchContext:
             preparation to store objects usable in multiple places.
     """
 
+    # Hook classes loaded from directories by path, shared by all launches
+    #   in process. Directory is loaded again if its python files change.
+    _hook_classes_by_path = {}
+    _hook_classes_lock = threading.Lock()
+
     def __init__(self, application, executable, env_group=None, **data):
         from openpype.modules import ModulesManager
 
@@ -944,6 +952,8 @@ class ApplicationLaunchContext:
         self.postlaunch_hooks = None
 
         self.process = None
+        # Duration of launch phases in seconds
+        self.timings = []
 
     @property
     def env(self):
@@ -1058,6 +1068,50 @@ class ApplicationLaunchContext:
 
         return paths
 
+    @staticmethod
+    def _get_hooks_dir_signature(path):
+        signature = []
+        for filename in sorted(os.listdir(path)):
+            if filename.startswith("_") or not filename.endswith(".py"):
+                continue
+            full_path = os.path.join(path, filename)
+            if os.path.isfile(full_path):
+                signature.append((filename, os.path.getmtime(full_path)))
+        return tuple(signature)
+
+    @classmethod
+    def _get_hook_classes_from_path(cls, path):
+        """Pre and post launch hook classes defined in directory.
+
+        Python files in directory are imported only once per process unless
+        they were changed.
+
+        Returns:
+            Tuple[List[type], List[type]]: Prelaunch and postlaunch hook
+                classes.
+        """
+
+        signature = cls._get_hooks_dir_signature(path)
+        with cls._hook_classes_lock:
+            cached = cls._hook_classes_by_path.get(path)
+            if cached is not None and cached[0] == signature:
+                return list(cached[1]), list(cached[2])
+
+            pre_classes = []
+            post_classes = []
+            modules, _crashed = modules_from_path(path)
+            for _filepath, module in modules:
+                pre_classes.extend(
+                    classes_from_module(PreLaunchHook, module)
+                )
+                post_classes.extend(
+                    classes_from_module(PostLaunchHook, module)
+                )
+            cls._hook_classes_by_path[path] = (
+                signature, pre_classes, post_classes
+            )
+        return list(pre_classes), list(post_classes)
+
     def discover_launch_hooks(self, force=False):
         """Load and prepare launch hooks."""
         if (
@@ -1089,14 +1143,11 @@ class ApplicationLaunchContext:
                 )
                 continue
 
-            modules, _crashed = modules_from_path(path)
-            for _filepath, module in modules:
-                all_classes["pre"].extend(
-                    classes_from_module(PreLaunchHook, module)
-                )
-                all_classes["post"].extend(
-                    classes_from_module(PostLaunchHook, module)
-                )
+            pre_classes, post_classes = self._get_hook_classes_from_path(
+                path
+            )
+            all_classes["pre"].extend(pre_classes)
+            all_classes["post"].extend(post_classes)
 
         for launch_type, classes in all_classes.items():
             hooks_with_order = []
@@ -1225,15 +1276,21 @@ class ApplicationLaunchContext:
             self.log.warning("Application was already launched.")
             return
 
+        self.timings = []
+        launch_start = time.time()
+
         # Discover launch hooks
+        start = time.time()
         self.discover_launch_hooks()
+        self._add_timing("Discover launch hooks", start)
 
         # Execute prelaunch hooks
         for prelaunch_hook in self.prelaunch_hooks:
-            self.log.debug("Executing prelaunch hook: {}".format(
-                str(prelaunch_hook.__class__.__name__)
-            ))
+            hook_name = prelaunch_hook.__class__.__name__
+            self.log.debug("Executing prelaunch hook: {}".format(hook_name))
+            start = time.time()
             prelaunch_hook.execute()
+            self._add_timing("Prelaunch hook {}".format(hook_name), start)
 
         self.log.debug("All prelaunch hook executed. Starting new process.")
 
@@ -1252,16 +1309,18 @@ class ApplicationLaunchContext:
         self.launch_args = args
 
         # Run process
+        start = time.time()
         self.process = self._run_process()
+        self._add_timing("Start process", start)
 
         # Process post launch hooks
         for postlaunch_hook in self.postlaunch_hooks:
-            self.log.debug("Executing postlaunch hook: {}".format(
-                str(postlaunch_hook.__class__.__name__)
-            ))
+            hook_name = postlaunch_hook.__class__.__name__
+            self.log.debug("Executing postlaunch hook: {}".format(hook_name))
 
             # TODO how to handle errors?
             # - store to variable to let them accessible?
+            start = time.time()
             try:
                 postlaunch_hook.execute()
 
@@ -1270,11 +1329,31 @@ class ApplicationLaunchContext:
                     "After launch procedures were not successful.",
                     exc_info=True
                 )
+            self._add_timing("Postlaunch hook {}".format(hook_name), start)
 
+        self._add_timing("Total", launch_start)
         self.log.debug("Launch of {} finished.".format(self.app_name))
+        self.log.debug("Launch timings of {}:\n{}".format(
+            self.app_name, self.format_timings()
+        ))
 
         return self.process
 
+    def _add_timing(self, label, start):
+        self.timings.append((label, time.time() - start))
+
+    def format_timings(self):
+        """Duration of launch phases as readable string.
+
+        Returns:
+            str: Each phase with duration on separate line.
+        """
+
+        return "\n".join(
+            "- {}: {:.3f}s".format(label, duration)
+            for label, duration in self.timings
+        )
+
     @staticmethod
     def clear_launch_args(args):
         """Collect launch arguments to final order.
@@ -1418,6 +1497,86 @@ def get_app_environments_for_context(
     return data["env"]
 
 
+class LaunchEnvironmentCache(object):
+    """Cache of computed launch environments.
+
+    Computation of environments ('acre.compute', host implementation
+    environments) is done for each launch of application even if nothing
+    changed. Results are cached by hash of all inputs (environments from
+    settings, local environments and source environment), so change of
+    settings or of source environment creates new item.
+
+    Cache is kept in memory of process so it's reused by launches from
+    tray and launcher. Can be disabled with
+    'OPENPYPE_LAUNCH_ENV_CACHE_DISABLED' set to '1'.
+
+    Args:
+        max_size (int): Maximum number of cached environments.
+    """
+
+    def __init__(self, max_size=64):
+        self._max_size = max_size
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _get_key(key_data):
+        key_str = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha1(key_str.encode("utf-8")).hexdigest()
+
+    def get_or_compute(self, key_data, func):
+        """Cached result for key data or result of 'func'.
+
+        Args:
+            key_data (Any): JSON serializable data with all inputs of
+                'func'.
+            func (Callable[[], Any]): Function computing the value.
+
+        Returns:
+            Any: Copy of computed value.
+        """
+
+        if os.environ.get("OPENPYPE_LAUNCH_ENV_CACHE_DISABLED") == "1":
+            return func()
+
+        key = self._get_key(key_data)
+        with self._lock:
+            value = self._items.pop(key, None)
+            if value is not None:
+                self._items[key] = value
+                self.hits += 1
+                return copy.deepcopy(value)
+            self.misses += 1
+
+        value = func()
+        with self._lock:
+            self._items[key] = copy.deepcopy(value)
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_launch_env_cache = LaunchEnvironmentCache()
+
+
+def get_launch_environment_cache():
+    """Cache of computed environments used by application launch.
+
+    Returns:
+        LaunchEnvironmentCache: Shared cache.
+    """
+
+    return _launch_env_cache
+
+
 def _merge_env(env, current_env):
     """Modified function(merge) from acre module."""
     import acre
@@ -1544,46 +1703,64 @@ def prepare_app_environments(
         )
     )
 
-    env_values = {}
-    for _env_values in environments:
-        if not _env_values:
-            continue
-
-        # Choose right platform
-        tool_env = parse_environments(_env_values, env_group)
+    def _compute_env():
+        env_values = {}
+        for _env_values in environments:
+            if not _env_values:
+                continue
 
-        # Apply local environment variables
-        # - must happen between all values because they may be used during
-        #   merge
-        for key, value in filtered_local_envs.items():
-            if key in tool_env:
-                tool_env[key] = value
+            # Choose right platform
+            tool_env = parse_environments(_env_values, env_group)
 
-        # Merge dictionaries
-        env_values = _merge_env(tool_env, env_values)
+            # Apply local environment variables
+            # - must happen between all values because they may be used
+            #   during merge
+            for key, value in filtered_local_envs.items():
+                if key in tool_env:
+                    tool_env[key] = value
 
-    merged_env = _merge_env(env_values, source_env)
+            # Merge dictionaries
+            env_values = _merge_env(tool_env, env_values)
 
-    loaded_env = acre.compute(merged_env, cleanup=False)
+        merged_env = _merge_env(env_values, source_env)
 
-    final_env = None
-    # Add host specific environments
-    if app.host_name and implementation_envs:
-        host_module = modules_manager.get_host_module(app.host_name)
-        if not host_module:
-            module = __import__("openpype.hosts", fromlist=[app.host_name])
-            host_module = getattr(module, app.host_name, None)
-        add_implementation_envs = None
-        if host_module:
-            add_implementation_envs = getattr(
-                host_module, "add_implementation_envs", None
-            )
-        if add_implementation_envs:
-            # Function may only modify passed dict without returning value
-            final_env = add_implementation_envs(loaded_env, app)
+        loaded_env = acre.compute(merged_env, cleanup=False)
 
-    if final_env is None:
-        final_env = loaded_env
+        final_env = None
+        # Add host specific environments
+        if app.host_name and implementation_envs:
+            host_module = modules_manager.get_host_module(app.host_name)
+            if not host_module:
+                module = __import__(
+                    "openpype.hosts", fromlist=[app.host_name]
+                )
+                host_module = getattr(module, app.host_name, None)
+            add_implementation_envs = None
+            if host_module:
+                add_implementation_envs = getattr(
+                    host_module, "add_implementation_envs", None
+                )
+            if add_implementation_envs:
+                # Function may only modify passed dict without returning
+                #   value
+                final_env = add_implementation_envs(loaded_env, app)
+
+        if final_env is None:
+            final_env = loaded_env
+        return final_env
+
+    final_env = get_launch_environment_cache().get_or_compute(
+        [
+            "app",
+            app.full_name,
+            env_group,
+            implementation_envs,
+            environments,
+            filtered_local_envs,
+            source_env
+        ],
+        _compute_env
+    )
 
     keys_to_remove = set(source_env.keys()) - set(final_env.keys())
 
@@ -1624,9 +1801,9 @@ def apply_project_environments_value(
     env_value = project_settings["global"]["project_environments"]
     if env_value:
         parsed_value = parse_environments(env_value, env_group)
-        env.update(acre.compute(
-            _merge_env(parsed_value, env),
-            cleanup=False
+        env.update(get_launch_environment_cache().get_or_compute(
+            ["project", project_name, env_group, parsed_value, env],
+            lambda: acre.compute(_merge_env(parsed_value, env), cleanup=False)
         ))
     return env
 
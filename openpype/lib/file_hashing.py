@@ -0,0 +1,428 @@
+"""Hashing of file content with parallel processing and local cache.
+
+Hashes are cached in local SQLite database by path of file. Cached hash is
+used only if inode, size and modification time of the file did not change
+so files are not hashed again by each tool (integrator, sync server) which
+needs the hash.
+
+Location of cache database can be changed with 'OPENPYPE_HASH_CACHE_PATH'
+environment variable and cache can be disabled with
+'OPENPYPE_HASH_CACHE_DISABLED' set to '1'. Hashes which were not used for
+'OPENPYPE_HASH_CACHE_MAX_AGE' seconds (30 days by default) are removed when
+cache is used first time in process.
+"""
+
+import os
+import time
+import mmap
+import hashlib
+import logging
+import sqlite3
+import threading
+
+import appdirs
+
+from .thread_tools import run_in_threads
+
+# Files bigger than this are hashed from memory map
+MMAP_MIN_SIZE = 64 * 1024 * 1024
+READ_BUFFER_SIZE = 8 * 1024 * 1024
+# Hashes not used for this time (in seconds) are removed from cache
+DEFAULT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+
+def _get_env_int(key, default):
+    value = os.environ.get(key)
+    if value:
+        try:
+            return max(int(value), 1)
+        except ValueError:
+            pass
+    return default
+
+
+def _get_default_cache_path():
+    path = os.environ.get("OPENPYPE_HASH_CACHE_PATH")
+    if path:
+        return path
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"), "file_hashes.db"
+    )
+
+
+def hash_file_content(filepath, algorithm="sha256", file_size=None):
+    """Hash content of a file.
+
+    Big files are hashed from memory map, smaller files are read using
+    big buffer.
+
+    Args:
+        filepath (str): Path to file.
+        algorithm (str): Name of algorithm available in 'hashlib'.
+        file_size (Optional[int]): Size of file if is already known.
+
+    Returns:
+        str: Hex digest of file content.
+    """
+
+    hasher = hashlib.new(algorithm)
+    if file_size is None:
+        file_size = os.path.getsize(filepath)
+
+    with open(filepath, "rb") as stream:
+        if file_size >= MMAP_MIN_SIZE:
+            mapped = mmap.mmap(
+                stream.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            try:
+                hasher.update(mapped)
+            finally:
+                mapped.close()
+        else:
+            for chunk in iter(lambda: stream.read(READ_BUFFER_SIZE), b""):
+                hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class FileHashCache(object):
+    """Local SQLite store of file hashes.
+
+    Args:
+        path (str): Path to database file.
+    """
+
+    log = logging.getLogger("FileHashCache")
+
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = None
+
+    @property
+    def path(self):
+        return self._path
+
+    def _get_connection(self):
+        if self._connection is None:
+            dirpath = os.path.dirname(self._path)
+            if dirpath and not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+            connection = sqlite3.connect(
+                self._path, timeout=30, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                " path TEXT NOT NULL,"
+                " algorithm TEXT NOT NULL,"
+                " inode INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime REAL NOT NULL,"
+                " hash TEXT NOT NULL,"
+                " accessed REAL NOT NULL,"
+                " PRIMARY KEY (path, algorithm))"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get_hashes(self, algorithm, stats_by_path):
+        """Cached hashes of files which did not change.
+
+        Args:
+            algorithm (str): Hash algorithm.
+            stats_by_path (Dict[str, os.stat_result]): Current stat of files.
+
+        Returns:
+            Dict[str, str]: Hashes by path.
+        """
+
+        output = {}
+        if not stats_by_path:
+            return output
+
+        paths = list(stats_by_path.keys())
+        with self._lock:
+            connection = self._get_connection()
+            # Keep number of query parameters under SQLite limit
+            for idx in range(0, len(paths), 500):
+                chunk = paths[idx:idx + 500]
+                cursor = connection.execute(
+                    (
+                        "SELECT path, inode, size, mtime, hash FROM hashes"
+                        " WHERE algorithm = ? AND path IN ({})"
+                    ).format(", ".join("?" for _ in chunk)),
+                    [algorithm] + chunk
+                )
+                for path, inode, size, mtime, file_hash in cursor:
+                    stat = stats_by_path[path]
+                    if (
+                        inode == stat.st_ino
+                        and size == stat.st_size
+                        and mtime == stat.st_mtime
+                    ):
+                        output[path] = file_hash
+
+            # Mark used hashes so they're not pruned
+            hit_paths = list(output.keys())
+            now = time.time()
+            for idx in range(0, len(hit_paths), 500):
+                chunk = hit_paths[idx:idx + 500]
+                connection.execute(
+                    (
+                        "UPDATE hashes SET accessed = ?"
+                        " WHERE algorithm = ? AND path IN ({})"
+                    ).format(", ".join("?" for _ in chunk)),
+                    [now, algorithm] + chunk
+                )
+            if hit_paths:
+                connection.commit()
+        return output
+
+    def set_hashes(self, algorithm, items):
+        """Store hashes of files.
+
+        Args:
+            algorithm (str): Hash algorithm.
+            items (Iterable[Tuple[str, os.stat_result, str]]): Path, stat
+                and hash of files.
+        """
+
+        now = time.time()
+        rows = [
+            (
+                path, algorithm, stat.st_ino, stat.st_size, stat.st_mtime,
+                file_hash, now
+            )
+            for path, stat, file_hash in items
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            connection = self._get_connection()
+            connection.executemany(
+                "INSERT OR REPLACE INTO hashes"
+                " (path, algorithm, inode, size, mtime, hash, accessed)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            connection.commit()
+
+    def prune(self, max_age):
+        """Remove hashes which were not used for 'max_age' seconds."""
+
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(
+                "DELETE FROM hashes WHERE accessed < ?",
+                (time.time() - max_age, )
+            )
+            connection.commit()
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class FileHasher(object):
+    """Hash files in parallel with cached results.
+
+    Args:
+        algorithm (str): Name of algorithm available in 'hashlib'.
+        max_workers (Optional[int]): Number of threads hashing files. Value
+            is taken from 'OPENPYPE_HASH_WORKERS' environment variable if
+            not passed.
+        cache (Optional[FileHashCache]): Cache of hashes. Hashes are not
+            cached if not passed.
+    """
+
+    log = logging.getLogger("FileHasher")
+    default_max_workers = 4
+
+    def __init__(self, algorithm="sha256", max_workers=None, cache=None):
+        if max_workers is None:
+            max_workers = _get_env_int(
+                "OPENPYPE_HASH_WORKERS", self.default_max_workers
+            )
+        self._algorithm = algorithm
+        self._max_workers = max(max_workers, 1)
+        self._cache = cache
+        self._cache_hits = 0
+        self._hashed_files = 0
+        self._hashed_bytes = 0
+        self._metrics_lock = threading.Lock()
+
+    @property
+    def algorithm(self):
+        return self._algorithm
+
+    def _run_tasks(self, func, items):
+        """Run function for each item on pool of threads.
+
+        Returns:
+            List[Any]: Results of function in order of passed items.
+        """
+
+        return run_in_threads(func, items, self._max_workers, self.log)
+
+    def stat_files(self, paths):
+        """Stat of files queried in parallel.
+
+        Useful on network storages where each stat has high latency.
+
+        Args:
+            paths (Iterable[str]): Paths to files.
+
+        Returns:
+            Dict[str, os.stat_result]: Stat of files by path.
+        """
+
+        paths = list(paths)
+        return dict(zip(paths, self._run_tasks(os.stat, paths)))
+
+    def _hash_file(self, item):
+        path, stat = item
+        file_hash = hash_file_content(path, self._algorithm, stat.st_size)
+        with self._metrics_lock:
+            self._hashed_files += 1
+            self._hashed_bytes += stat.st_size
+        return file_hash
+
+    def hash_files(self, paths, stats_by_path=None):
+        """Hash content of files.
+
+        Args:
+            paths (Iterable[str]): Paths to files.
+            stats_by_path (Optional[Dict[str, os.stat_result]]): Already
+                known stat of files.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Info about file by path with keys
+                'size', 'mtime' and 'hash'.
+        """
+
+        paths = list(paths)
+        if stats_by_path is None:
+            stats_by_path = {}
+        missing_stats = [
+            path
+            for path in paths
+            if path not in stats_by_path
+        ]
+        if missing_stats:
+            stats_by_path = dict(stats_by_path)
+            stats_by_path.update(self.stat_files(missing_stats))
+
+        stats_by_path = {
+            path: stats_by_path[path]
+            for path in paths
+        }
+        hashes_by_path = {}
+        if self._cache is not None:
+            try:
+                hashes_by_path = self._cache.get_hashes(
+                    self._algorithm, stats_by_path
+                )
+            except (sqlite3.Error, OSError):
+                self.log.warning("Failed to read hash cache", exc_info=True)
+
+        with self._metrics_lock:
+            self._cache_hits += len(hashes_by_path)
+
+        items = [
+            (path, stat)
+            for path, stat in stats_by_path.items()
+            if path not in hashes_by_path
+        ]
+        # Start with biggest files to balance work of threads
+        items.sort(key=lambda item: item[1].st_size, reverse=True)
+        new_hashes = self._run_tasks(self._hash_file, items)
+        for item, file_hash in zip(items, new_hashes):
+            hashes_by_path[item[0]] = file_hash
+
+        if self._cache is not None and items:
+            try:
+                self._cache.set_hashes(
+                    self._algorithm,
+                    (
+                        (path, stat, file_hash)
+                        for (path, stat), file_hash in zip(items, new_hashes)
+                    )
+                )
+            except (sqlite3.Error, OSError):
+                self.log.warning("Failed to store hash cache", exc_info=True)
+
+        return {
+            path: {
+                "size": stats_by_path[path].st_size,
+                "mtime": stats_by_path[path].st_mtime,
+                "hash": hashes_by_path[path]
+            }
+            for path in paths
+        }
+
+    def hash_file(self, path):
+        """Hash content of single file.
+
+        Args:
+            path (str): Path to file.
+
+        Returns:
+            str: Hex digest of file content.
+        """
+
+        return self.hash_files([path])[path]["hash"]
+
+    def get_metrics(self):
+        with self._metrics_lock:
+            return {
+                "cache_hits": self._cache_hits,
+                "hashed_files": self._hashed_files,
+                "hashed_bytes": self._hashed_bytes
+            }
+
+
+_hashers = {}
+_hashers_lock = threading.Lock()
+_cache_pruned = False
+
+
+def _prune_cache(cache):
+    global _cache_pruned
+    if _cache_pruned:
+        return
+    _cache_pruned = True
+    max_age = _get_env_int(
+        "OPENPYPE_HASH_CACHE_MAX_AGE", DEFAULT_CACHE_MAX_AGE
+    )
+    try:
+        cache.prune(max_age)
+    except (sqlite3.Error, OSError):
+        logging.getLogger("FileHashCache").warning(
+            "Failed to prune hash cache", exc_info=True
+        )
+
+
+def get_file_hasher(algorithm="sha256"):
+    """Shared file hasher using local hash cache.
+
+    Args:
+        algorithm (str): Name of algorithm available in 'hashlib'.
+
+    Returns:
+        FileHasher: Hasher of files.
+    """
+
+    with _hashers_lock:
+        hasher = _hashers.get(algorithm)
+        if hasher is None:
+            cache = None
+            if os.environ.get("OPENPYPE_HASH_CACHE_DISABLED") != "1":
+                cache = FileHashCache(_get_default_cache_path())
+                _prune_cache(cache)
+            hasher = FileHasher(algorithm, cache=cache)
+            _hashers[algorithm] = hasher
+    return hasher
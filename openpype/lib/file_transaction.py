@@ -2,9 +2,12 @@ import os
 import logging
 import sys
 import errno
+import threading
 import six
 
 from openpype.lib import create_hard_link
+from openpype.lib.file_hashing import get_file_hasher
+from openpype.lib.thread_tools import run_in_threads
 
 # this is needed until speedcopy for linux is fixed
 if sys.platform == "win32":
@@ -12,6 +15,53 @@ if sys.platform == "win32":
 else:
     from shutil import copyfile
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Linux ioctl request to clone file content (reflink) - 'FICLONE'
+FICLONE = 0x40049409
+# Size of chunk copied with 'os.copy_file_range' between progress reports
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+# Errors meaning that the copy method is not supported for the files
+_UNSUPPORTED_ERRNOS = {
+    getattr(errno, name)
+    for name in (
+        "EXDEV",
+        "ENOSYS",
+        "EINVAL",
+        "ENOTTY",
+        "EOPNOTSUPP",
+        "ENOTSUP",
+        "EBADF",
+        "EPERM",
+    )
+    if hasattr(errno, name)
+}
+# Errors of clone meaning that reflink is not supported between the devices
+#   - other errors (e.g. 'EINVAL') may be caused by the single file
+_CLONE_UNSUPPORTED_ERRNOS = {
+    getattr(errno, name)
+    for name in (
+        "EXDEV",
+        "ENOTTY",
+        "EOPNOTSUPP",
+        "ENOTSUP",
+    )
+    if hasattr(errno, name)
+}
+
+
+def _get_env_int(key, default):
+    value = os.environ.get(key)
+    if value:
+        try:
+            return max(int(value), 1)
+        except ValueError:
+            pass
+    return default
+
 
 class FileTransaction(object):
     """File transaction with rollback options.
@@ -28,6 +78,11 @@ class FileTransaction(object):
     These steps try to ensure that we don't overwrite half of any existing
     files e.g. if they are currently in use.
 
+    Backups and transfers are processed on a bounded pool of threads. Number
+    of concurrent transfers into single destination volume can be limited
+    separately. Copies use reflink ('FICLONE') or 'os.copy_file_range' when
+    filesystem supports it and fallback to regular file copy.
+
     Note:
         A regular filesystem is *not* a transactional file system and even
         though this implementation tries to produce a 'safe copy' with a
@@ -39,16 +94,64 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (logging.Logger): Logger used for output.
+        max_workers (int): Maximum number of concurrent file operations. Value
+            is taken from 'OPENPYPE_TRANSFER_WORKERS' environment variable if
+            not passed. Use '1' for sequential processing.
+        max_volume_workers (int): Maximum number of concurrent transfers
+            into single destination volume. Value is taken from
+            'OPENPYPE_TRANSFER_VOLUME_WORKERS' environment variable if not
+            passed.
+        skip_identical (bool): Skip copy of files that already exist
+            in destination with same size and modification time. Copied files
+            get modification time of source file.
+        compare_hash (bool): Compare also content hash of files when
+            'skip_identical' is enabled.
+        progress_callback (Callable[[int, int], None]): Callback called with
+            transferred bytes and total bytes during processing.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None):
+    default_max_workers = 8
+    default_max_volume_workers = 4
+
+    # Bytes copied by all transactions (for profiling)
+    _copied_bytes_total = 0
+    _copied_bytes_lock = threading.Lock()
+
+    def __init__(
+        self,
+        log=None,
+        max_workers=None,
+        max_volume_workers=None,
+        skip_identical=False,
+        compare_hash=False,
+        progress_callback=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
+        if max_workers is None:
+            max_workers = _get_env_int(
+                "OPENPYPE_TRANSFER_WORKERS", self.default_max_workers
+            )
+
+        if max_volume_workers is None:
+            max_volume_workers = _get_env_int(
+                "OPENPYPE_TRANSFER_VOLUME_WORKERS",
+                self.default_max_volume_workers
+            )
+
         self.log = log
+        self._max_workers = max(max_workers, 1)
+        self._max_volume_workers = max(max_volume_workers, 1)
+        self._skip_identical = skip_identical
+        self._compare_hash = compare_hash
+        self._progress_callback = progress_callback
 
         # The transfer queue
         # todo: make this an actual FIFO queue?
@@ -57,9 +160,20 @@ class FileTransaction(object):
         # Destination file paths that a file was transferred to
         self._transferred = []
 
+        # Destination file paths that were skipped because were identical
+        self._skipped = []
+
         # Backup file location mapping to original locations
         self._backup_to_original = {}
 
+        self._lock = threading.Lock()
+        self._volume_semaphores = {}
+        # Pairs of source and destination device ids
+        self._clone_unsupported_devices = set()
+        self._copy_range_unsupported_devices = set()
+        self._total_bytes = 0
+        self._transferred_bytes = 0
+
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
 
@@ -91,40 +205,19 @@ class FileTransaction(object):
 
     def process(self):
         # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
-            self.log.debug("Checking file ... {} -> {}".format(src, dst))
-            path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
-                continue
-
-            # Backup original file
-            # todo: add timestamp or uuid to ensure unique
-            backup = dst + ".bak"
-            self._backup_to_original[backup] = dst
-            self.log.debug(
-                "Backup existing file: {} -> {}".format(dst, backup))
-            os.rename(dst, backup)
-
-        # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destionation are same files {} -> {}".format(
-                        src, dst))
-                continue
-
-            self._create_folder_for_file(dst)
+        items = list(self._transfers.items())
+        results = self._run_tasks(self._prepare_transfer, items)
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
+        transfer_items = []
+        self._total_bytes = 0
+        self._transferred_bytes = 0
+        for item, size in zip(items, results):
+            if size is not None:
+                transfer_items.append(item)
+                self._total_bytes += size
 
-            self._transferred.append(dst)
+        # Copy the files to transfer
+        self._run_tasks(self._transfer_file, transfer_items)
 
     def finalize(self):
         # Delete any backed up files
@@ -170,11 +263,235 @@ class FileTransaction(object):
         """Return the processed transfers destination paths"""
         return list(self._transferred)
 
+    @property
+    def skipped(self):
+        """Return destination paths skipped because files were identical"""
+        return list(self._skipped)
+
     @property
     def backups(self):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    def _run_tasks(self, func, items):
+        """Run function for each item on pool of threads.
+
+        Returns:
+            List[Any]: Results of function in order of passed items.
+        """
+
+        return run_in_threads(func, items, self._max_workers, self.log)
+
+    def _prepare_transfer(self, item):
+        """Backup existing destination file if needed.
+
+        Returns:
+            Union[int, None]: Size of source file in bytes or None if
+                transfer should be skipped.
+        """
+
+        dst, (src, opts) = item
+        self.log.debug("Checking file ... {} -> {}".format(src, dst))
+        if self._same_paths(src, dst):
+            self.log.debug(
+                "Source and destionation are same files {} -> {}".format(
+                    src, dst))
+            return None
+
+        src_size = os.path.getsize(src)
+        if not os.path.exists(dst):
+            return src_size
+
+        if (
+            self._skip_identical
+            and opts["mode"] == self.MODE_COPY
+            and self._is_identical(src, dst)
+        ):
+            self.log.debug(
+                "Destination is identical, skipping ... {} -> {}".format(
+                    src, dst))
+            with self._lock:
+                self._skipped.append(dst)
+            return None
+
+        # Backup original file
+        # todo: add timestamp or uuid to ensure unique
+        backup = dst + ".bak"
+        with self._lock:
+            self._backup_to_original[backup] = dst
+        self.log.debug(
+            "Backup existing file: {} -> {}".format(dst, backup))
+        os.rename(dst, backup)
+        return src_size
+
+    def _transfer_file(self, item):
+        dst, (src, opts) = item
+        self._create_folder_for_file(dst)
+
+        volume_id, semaphore = self._get_volume_semaphore(dst)
+        with semaphore:
+            if opts["mode"] == self.MODE_COPY:
+                self.log.debug("Copying file ... {} -> {}".format(src, dst))
+                self._copy_file(src, dst, volume_id)
+
+            elif opts["mode"] == self.MODE_HARDLINK:
+                self.log.debug("Hardlinking file ... {} -> {}".format(
+                    src, dst))
+                create_hard_link(src, dst)
+                self._add_progress(os.path.getsize(src), copied=False)
+
+        with self._lock:
+            self._transferred.append(dst)
+
+    def _copy_file(self, src, dst, volume_id):
+        devices = (os.stat(src).st_dev, volume_id)
+        copied = False
+        if devices not in self._clone_unsupported_devices:
+            copied = self._clone_file(src, dst, devices)
+            if copied:
+                self._add_progress(os.path.getsize(src))
+
+        if (
+            not copied
+            and devices not in self._copy_range_unsupported_devices
+        ):
+            copied = self._copy_file_range(src, dst)
+            if not copied:
+                with self._lock:
+                    self._copy_range_unsupported_devices.add(devices)
+
+        if not copied:
+            copyfile(src, dst)
+            self._add_progress(os.path.getsize(src))
+
+        if self._skip_identical:
+            # Keep modification time of source so next transfer can be skipped
+            src_stat = os.stat(src)
+            os.utime(dst, (src_stat.st_atime, src_stat.st_mtime))
+
+    def _clone_file(self, src, dst, devices):
+        """Create copy-on-write clone of file (reflink).
+
+        Clone is not tried again for the devices when error means that
+        reflink is not supported between them.
+
+        Args:
+            src (str): Source path.
+            dst (str): Destination path.
+            devices (Tuple[Any, Any]): Device ids of source and destination.
+
+        Returns:
+            bool: File was cloned.
+        """
+
+        if fcntl is None:
+            return False
+
+        with open(src, "rb") as src_stream:
+            with open(dst, "wb") as dst_stream:
+                try:
+                    fcntl.ioctl(
+                        dst_stream.fileno(), FICLONE, src_stream.fileno()
+                    )
+                except (IOError, OSError) as exc:
+                    if exc.errno in _CLONE_UNSUPPORTED_ERRNOS:
+                        with self._lock:
+                            self._clone_unsupported_devices.add(devices)
+                    return False
+        return True
+
+    def _copy_file_range(self, src, dst):
+        """Copy file content using 'os.copy_file_range' (in-kernel copy).
+
+        Returns:
+            bool: File was copied.
+        """
+
+        copy_file_range = getattr(os, "copy_file_range", None)
+        if copy_file_range is None:
+            return False
+
+        with open(src, "rb") as src_stream:
+            with open(dst, "wb") as dst_stream:
+                src_fd = src_stream.fileno()
+                dst_fd = dst_stream.fileno()
+                size = os.fstat(src_fd).st_size
+                offset = 0
+                while offset < size:
+                    try:
+                        copied = copy_file_range(
+                            src_fd, dst_fd, min(COPY_CHUNK_SIZE, size - offset)
+                        )
+                    except OSError as exc:
+                        if offset == 0 and exc.errno in _UNSUPPORTED_ERRNOS:
+                            return False
+                        raise
+
+                    if copied == 0:
+                        break
+                    offset += copied
+                    self._add_progress(copied)
+        return True
+
+    @classmethod
+    def get_copied_bytes_total(cls):
+        """Bytes copied by all file transactions in this process.
+
+        Hardlinked files are not counted. Used to measure how much data was
+        copied by a code block.
+
+        Returns:
+            int: Number of copied bytes.
+        """
+
+        return cls._copied_bytes_total
+
+    def _add_progress(self, size, copied=True):
+        if copied:
+            with FileTransaction._copied_bytes_lock:
+                FileTransaction._copied_bytes_total += size
+
+        if self._progress_callback is None:
+            return
+
+        with self._lock:
+            self._transferred_bytes += size
+            transferred_bytes = self._transferred_bytes
+        self._progress_callback(transferred_bytes, self._total_bytes)
+
+    def _get_volume_semaphore(self, path):
+        dirname = os.path.dirname(path)
+        volume_id = os.stat(dirname).st_dev
+        # Windows may not provide device id
+        if not volume_id:
+            volume_id = os.path.splitdrive(dirname)[0].lower()
+
+        with self._lock:
+            semaphore = self._volume_semaphores.get(volume_id)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(
+                    self._max_volume_workers
+                )
+                self._volume_semaphores[volume_id] = semaphore
+        return volume_id, semaphore
+
+    def _is_identical(self, src, dst):
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+        if src_stat.st_size != dst_stat.st_size:
+            return False
+
+        # Some filesystems store modification time with low precision
+        if abs(src_stat.st_mtime - dst_stat.st_mtime) >= 1:
+            return False
+
+        if self._compare_hash:
+            file_infos = get_file_hasher().hash_files(
+                [src, dst], {src: src_stat, dst: dst_stat}
+            )
+            return file_infos[src]["hash"] == file_infos[dst]["hash"]
+        return True
+
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
         try:
@@ -13,15 +13,18 @@ Best place for it is in ``repos/pype-config/environments/global.json``
 
 
 import datetime
+import errno
 import getpass
 import logging
 import os
+import re
 import platform
 import socket
 import sys
 import time
 import traceback
 import threading
+import collections
 import copy
 
 from openpype.client.mongo import (
@@ -31,16 +34,67 @@ from openpype.client.mongo import (
 )
 from . import Terminal
 
-try:
-    import log4mongo
-    from log4mongo.handlers import MongoHandler
-except ImportError:
-    log4mongo = None
-    MongoHandler = type("NOT_SET", (), {})
-
 # Check for `unicode` in builtins
 USE_UNICODE = hasattr(__builtins__, "unicode")
 
+# Spill files of processes, second item is for files being sent and third
+#   is id of process which claimed file of other process
+SPILL_FILENAME_REGEX = re.compile(
+    r"^openpype_logs_(\d+)\.jsonl(\.sending)?(?:\.(\d+)\.claimed)?$"
+)
+# Spill file of a process which state can't be checked is considered
+#   abandoned when it was not modified for this time (in seconds)
+ABANDONED_SPILL_AGE = 60 * 60
+
+
+def _is_process_running(pid):
+    """Check if process with pid is running.
+
+    Returns:
+        Union[bool, None]: Process is running, 'None' if it can't be
+            checked.
+    """
+
+    try:
+        import psutil
+        return psutil.pid_exists(pid)
+    except ImportError:
+        pass
+
+    if platform.system().lower() == "windows":
+        return None
+
+    try:
+        os.kill(pid, 0)
+    except OSError as exc:
+        # Process exists but belongs to other user
+        return exc.errno == errno.EPERM
+    return True
+
+
+def _read_spill_offset(offset_path):
+    """Offset in bytes of first document in spill file which was not sent.
+
+    Returns:
+        int: Offset stored in file or 0 if file does not exist.
+    """
+
+    try:
+        with open(offset_path, "r") as stream:
+            return int(stream.read().strip() or 0)
+    except (IOError, OSError, ValueError):
+        return 0
+
+
+def _remove_file(path):
+    """Remove file if it exists."""
+
+    try:
+        os.remove(path)
+    except OSError:
+        if os.path.exists(path):
+            raise
+
 
 class LogStreamHandler(logging.StreamHandler):
     """ StreamHandler class designed to handle utf errors in python 2.x hosts.
@@ -143,8 +197,8 @@ class LogFormatter(logging.Formatter):
 
 class MongoFormatter(logging.Formatter):
 
-    DEFAULT_PROPERTIES = logging.LogRecord(
-        '', '', '', '', '', '', '', '').__dict__.keys()
+    DEFAULT_PROPERTIES = frozenset(logging.LogRecord(
+        '', '', '', '', '', '', '', '').__dict__.keys())
 
     def format(self, record):
         """Formats LogRecord into python dictionary."""
@@ -161,7 +215,12 @@ class MongoFormatter(logging.Formatter):
             'method': record.funcName,
             'lineNumber': record.lineno
         }
-        document.update(Logger.get_process_data())
+        # Values of process data are immutable so copy of whole data for
+        #   each record is not needed
+        process_data = Logger.process_data
+        if process_data is None:
+            process_data = Logger.get_process_data()
+        document.update(process_data)
 
         # Standard document decorated with exception info
         if record.exc_info is not None:
@@ -174,13 +233,358 @@ class MongoFormatter(logging.Formatter):
         # Standard document decorated with extra contextual information
         if len(self.DEFAULT_PROPERTIES) != len(record.__dict__):
             contextual_extra = set(record.__dict__).difference(
-                set(self.DEFAULT_PROPERTIES))
+                self.DEFAULT_PROPERTIES)
             if contextual_extra:
                 for key in contextual_extra:
                     document[key] = record.__dict__[key]
         return document
 
 
+class BufferedMongoHandler(logging.Handler):
+    """Handler sending log records to mongo in batches from thread.
+
+    Records are formatted to documents in thread which logged them and
+    added to buffer. Background thread writes documents using 'insert_many'
+    when count of documents reaches 'batch_size' or when oldest document
+    waits more than 'flush_interval' seconds.
+
+    When buffer is full (e.g. database is slow or not available) are new
+    records written to spill file if spill directory is set, otherwise they
+    are dropped. Spilled documents are sent to database when writing is
+    successful again. Spill files left by processes which are not running
+    anymore are taken over on start. Handler is closed and remaining
+    documents are written on exit by 'logging.shutdown'.
+
+    Args:
+        get_collection (Callable[[], Collection]): Returns log collection.
+        batch_size (int): Count of documents written at once.
+        flush_interval (float): Maximum time in seconds for which is
+            document kept in buffer.
+        buffer_limit (int): Maximum count of documents in buffer.
+        spill_dir (Optional[str]): Directory where documents are stored
+            when buffer is full or when database is not available.
+    """
+
+    def __init__(
+        self,
+        get_collection,
+        batch_size=500,
+        flush_interval=1.0,
+        buffer_limit=10000,
+        spill_dir=None
+    ):
+        super(BufferedMongoHandler, self).__init__()
+        self._get_collection = get_collection
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer_limit = buffer_limit
+
+        self._spill_dir = spill_dir
+        self._spill_path = None
+        if spill_dir:
+            self._spill_path = os.path.join(
+                spill_dir, "openpype_logs_{}.jsonl".format(os.getpid())
+            )
+        self._spill_lock = threading.Lock()
+        self._spilled = 0
+
+        self._buffer = collections.deque()
+        self._buffer_cond = threading.Condition()
+        self._first_time = None
+        # Documents taken from buffer which are being written
+        self._writing = 0
+        self._closed = False
+
+        self.written = 0
+        self.dropped = 0
+        self.failed_writes = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="BufferedMongoHandler"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def pending(self):
+        return len(self._buffer)
+
+    def get_metrics(self):
+        return {
+            "pending": len(self._buffer),
+            "written": self.written,
+            "dropped": self.dropped,
+            "spilled": self._spilled,
+            "failed_writes": self.failed_writes
+        }
+
+    def emit(self, record):
+        if self._closed:
+            return
+
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._buffer_cond:
+            if len(self._buffer) < self.buffer_limit:
+                self._buffer.append(document)
+                if self._first_time is None:
+                    self._first_time = time.time()
+                if len(self._buffer) >= self.batch_size:
+                    self._buffer_cond.notify()
+                return
+
+        # Buffer is full
+        self._spill([document])
+
+    def _spill(self, documents):
+        if not self._spill_path:
+            self.dropped += len(documents)
+            return
+
+        from bson.json_util import dumps
+
+        try:
+            with self._spill_lock:
+                with open(self._spill_path, "a") as stream:
+                    for document in documents:
+                        stream.write(dumps(document) + "\n")
+                self._spilled += len(documents)
+
+        except Exception:
+            self.dropped += len(documents)
+
+    def _take_over_abandoned_spills(self):
+        """Move documents from spill files of dead processes to own file.
+
+        Spill file is claimed by rename first so only one process can take
+        it over. Documents are sent with own spilled documents. Claimed
+        file which could not be moved is left in place and taken over again
+        once the process which claimed it is not running.
+        """
+
+        if not self._spill_path or not os.path.isdir(self._spill_dir):
+            return
+
+        own_pid = os.getpid()
+        for filename in os.listdir(self._spill_dir):
+            match = SPILL_FILENAME_REGEX.match(filename)
+            if not match:
+                continue
+
+            writer_pid, sending, claimer_pid = match.groups()
+            if claimer_pid is None and int(writer_pid) == own_pid:
+                continue
+
+            source_filename = "openpype_logs_{}.jsonl{}".format(
+                writer_pid, sending or ""
+            )
+            # Offset of sent documents is stored for original filename
+            offset_path = os.path.join(
+                self._spill_dir, source_filename + ".offset"
+            )
+            path = os.path.join(self._spill_dir, filename)
+            claimed_path = os.path.join(
+                self._spill_dir,
+                "{}.{}.claimed".format(source_filename, own_pid)
+            )
+            owner_pid = int(claimer_pid or writer_pid)
+            try:
+                # File claimed by process with same id is left from
+                #   previous process
+                is_running = False
+                if owner_pid != own_pid:
+                    is_running = _is_process_running(owner_pid)
+                if is_running is None:
+                    is_running = (
+                        time.time() - os.path.getmtime(path)
+                        < ABANDONED_SPILL_AGE
+                    )
+                if is_running:
+                    continue
+
+                if path != claimed_path:
+                    os.rename(path, claimed_path)
+            except OSError:
+                # File was claimed by other process
+                continue
+
+            try:
+                with open(claimed_path, "rb") as src_stream:
+                    src_stream.seek(_read_spill_offset(offset_path))
+                    lines = [
+                        line.decode("utf-8").strip()
+                        for line in src_stream
+                    ]
+                lines = [line for line in lines if line]
+                with self._spill_lock:
+                    with open(self._spill_path, "a") as dst_stream:
+                        for line in lines:
+                            dst_stream.write(line + "\n")
+                    self._spilled += len(lines)
+                os.remove(claimed_path)
+                _remove_file(offset_path)
+            except Exception:
+                pass
+
+    def _resend_spilled(self):
+        """Send spilled documents to database.
+
+        Offset of the first document which was not sent is stored after
+        each written batch so documents are not sent again if writing
+        fails in the middle of the file.
+
+        Returns:
+            bool: Documents were sent.
+        """
+
+        if not self._spill_path:
+            return True
+
+        from bson.json_util import loads
+
+        # File with documents which failed to be sent last time
+        sending_path = self._spill_path + ".sending"
+        offset_path = sending_path + ".offset"
+        with self._spill_lock:
+            if not os.path.exists(sending_path):
+                if not os.path.exists(self._spill_path):
+                    return True
+                # Offset may be left if process crashed after file was sent
+                _remove_file(offset_path)
+                os.rename(self._spill_path, sending_path)
+                self._spilled = 0
+
+        batch = []
+        with open(sending_path, "rb") as stream:
+            stream.seek(_read_spill_offset(offset_path))
+            while True:
+                line = stream.readline()
+                if line.strip():
+                    batch.append(loads(line.decode("utf-8")))
+
+                if batch and (not line or len(batch) >= self.batch_size):
+                    if not self._write(batch, spill=False):
+                        return False
+                    batch = []
+                    with open(offset_path, "w") as offset_stream:
+                        offset_stream.write(str(stream.tell()))
+
+                if not line:
+                    break
+
+        os.remove(sending_path)
+        _remove_file(offset_path)
+        return True
+
+    def _is_flush_due(self):
+        if not self._buffer:
+            return False
+        if len(self._buffer) >= self.batch_size:
+            return True
+        return time.time() - self._first_time >= self.flush_interval
+
+    def _take_batch(self):
+        batch = []
+        while self._buffer and len(batch) < self.batch_size:
+            batch.append(self._buffer.popleft())
+        if self._buffer:
+            self._first_time = time.time()
+        else:
+            self._first_time = None
+        self._writing = len(batch)
+        return batch
+
+    def _write(self, documents, spill=True):
+        try:
+            self._get_collection().insert_many(documents, ordered=False)
+            self.written += len(documents)
+            return True
+
+        except Exception:
+            self.failed_writes += 1
+            if spill:
+                self._spill(documents)
+            return False
+
+    def _run(self):
+        try:
+            self._take_over_abandoned_spills()
+        except Exception:
+            pass
+
+        while True:
+            with self._buffer_cond:
+                while not self._closed and not self._is_flush_due():
+                    wait_time = self.flush_interval
+                    if self._first_time is not None:
+                        wait_time = max(
+                            self._first_time + self.flush_interval
+                            - time.time(),
+                            0.01
+                        )
+                    self._buffer_cond.wait(wait_time)
+
+                if self._closed:
+                    return
+                batch = self._take_batch()
+
+            try:
+                if self._write(batch) and self._spill_path:
+                    self._resend_spilled()
+            except Exception:
+                pass
+
+            with self._buffer_cond:
+                self._writing = 0
+                self._buffer_cond.notify_all()
+
+    def flush(self, timeout=5.0):
+        """Wait until buffered documents are written.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds.
+        """
+
+        end_time = time.time() + timeout
+        with self._buffer_cond:
+            if self._buffer:
+                # Force write of buffered documents
+                self._first_time = 0
+                self._buffer_cond.notify_all()
+
+            while (
+                (self._buffer or self._writing)
+                and not self._closed
+                and self._thread.is_alive()
+            ):
+                wait_time = end_time - time.time()
+                if wait_time <= 0:
+                    break
+                self._buffer_cond.wait(wait_time)
+
+    def close(self):
+        """Stop thread and write remaining documents."""
+
+        if self._closed:
+            return
+
+        with self._buffer_cond:
+            self._closed = True
+            self._buffer_cond.notify_all()
+        self._thread.join(5.0)
+
+        documents = list(self._buffer)
+        self._buffer.clear()
+        for idx in range(0, len(documents), self.batch_size):
+            self._write(documents[idx:idx + self.batch_size])
+
+        super(BufferedMongoHandler, self).close()
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -221,6 +625,9 @@ class Logger:
 
     # Data same for all record documents
     process_data = None
+    # Mongo handler shared by all loggers
+    _mongo_handler = None
+    _mongo_handler_lock = threading.Lock()
     # Cached process name or ability to set different process name
     _process_name = None
 
@@ -237,7 +644,7 @@ class Logger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, BufferedMongoHandler):
                 add_mongo_handler = False
             elif isinstance(handler, LogStreamHandler):
                 add_console_handler = False
@@ -277,6 +684,11 @@ class Logger:
             )
         return logger
 
+    @classmethod
+    def _get_log_collection(cls):
+        client = cls.get_log_mongo_connection()
+        return client[cls.log_database_name][cls.log_collection_name]
+
     @classmethod
     def _get_mongo_handler(cls):
         cls.bootstrap_mongo_log()
@@ -284,22 +696,15 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": MongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
-
-        return MongoHandler(**kwargs)
+        with cls._mongo_handler_lock:
+            if cls._mongo_handler is None:
+                handler = BufferedMongoHandler(
+                    cls._get_log_collection,
+                    spill_dir=os.environ.get("OPENPYPE_LOG_SPILL_DIR")
+                )
+                handler.setFormatter(MongoFormatter())
+                cls._mongo_handler = handler
+        return cls._mongo_handler
 
     @classmethod
     def _get_console_handler(cls):
@@ -329,9 +734,7 @@ class Logger:
         cls.log_mongo_url_components = get_default_components()
 
         # Define if should logging to mongo be used
-        use_mongo_logging = bool(log4mongo is not None)
-        if use_mongo_logging:
-            use_mongo_logging = os.environ.get("OPENPYPE_LOG_TO_SERVER") == "1"
+        use_mongo_logging = os.environ.get("OPENPYPE_LOG_TO_SERVER") == "1"
 
         # Set mongo id for process (ONLY ONCE)
         if use_mongo_logging and cls.mongo_process_id is None:
@@ -453,13 +856,7 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
-        client = log4mongo.handlers._connection
-        if not client:
-            client = cls.get_log_mongo_connection()
-            # Set the client inside log4mongo handlers to not create another
-            # mongo db connection.
-            log4mongo.handlers._connection = client
-
+        client = cls.get_log_mongo_connection()
         logdb = client[cls.log_database_name]
 
         collist = logdb.list_collection_names()
@@ -81,7 +81,16 @@ class TemplateUnsolved(Exception):
 
 
 class StringTemplate(object):
-    """String that can be formatted."""
+    """String that can be formatted.
+
+    Parsed parts of template are cached by template string so creation
+    of the same template multiple times does not parse it again.
+    """
+
+    # Parsed template parts by template string
+    _compiled_parts = {}
+    compiled_cache_size = 4096
+
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -89,6 +98,36 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        self._parts = self.get_compiled_parts(template)
+
+    @classmethod
+    def get_compiled_parts(cls, template):
+        """Parsed parts of template string.
+
+        Parts are shared between objects with the same template and must not
+        be modified.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            Tuple[Union[str, FormattingPart, OptionalPart]]: Template parts.
+        """
+
+        parts = cls._compiled_parts.get(template)
+        if parts is None:
+            parts = cls._parse_template(template)
+            if len(cls._compiled_parts) >= cls.compiled_cache_size:
+                cls._compiled_parts.clear()
+            cls._compiled_parts[template] = parts
+        return parts
+
+    @classmethod
+    def clear_compiled_cache(cls):
+        cls._compiled_parts.clear()
+
+    @classmethod
+    def _parse_template(cls, template):
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -119,7 +158,7 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return tuple(cls.find_optional_parts(new_parts))
 
     def __str__(self):
         return self.template
@@ -182,6 +221,28 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_many(self, data_list, strict=False):
+        """Fill template with each item of passed data.
+
+        Parsing of template is shared for all items which makes this faster
+        than creation of template object for each item (e.g. for each frame
+        of sequence).
+
+        Args:
+            data_list (Iterable[dict]): Data used to fill the template.
+            strict (bool): Validate that each result is solved.
+
+        Returns:
+            List[TemplateResult]: Results in order of passed data.
+
+        Raises:
+            TemplateUnsolved: Some template is not solved and 'strict'
+                is enabled.
+        """
+
+        format_method = self.format_strict if strict else self.format
+        return [format_method(data) for data in data_list]
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -689,6 +750,15 @@ class FormattingPart:
     """
     def __init__(self, template):
         self._template = template
+        # Pre-parse key so it is not parsed on each format
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
 
     @property
     def template(self):
@@ -718,17 +788,14 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -112,6 +112,26 @@ def create_hard_link(src_path, dst_path):
     )
 
 
+def replace_file(src_path, dst_path):
+    """Move file to destination and replace existing file.
+
+    Replace is atomic where 'os.replace' is available.
+
+    Args:
+        src_path (str): Full path to a file which is moved.
+        dst_path (str): Full path where file is moved to.
+    """
+
+    if hasattr(os, "replace"):
+        os.replace(src_path, dst_path)
+        return
+
+    # Python 2 'os.rename' can't overwrite existing file on windows
+    if os.path.exists(dst_path):
+        os.remove(dst_path)
+    os.rename(src_path, dst_path)
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
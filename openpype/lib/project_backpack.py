@@ -10,15 +10,32 @@ This gives ability to create project where a changes and tests can be done.
 
 Keep in mind that to be able create a package of project has few requirements.
 Possible requirement should be listed in 'pack_project' function.
+
+Package consists of main zip file and volumes. Main zip contains metadata,
+database documents stored as JSON lines in chunks and manifest of project
+files. Project files are stored in volumes (zip files next to main zip) which
+are written and extracted in parallel. Already compressed media are stored
+without compression.
+
+Packing can be resumed when was interrupted, volumes which were finished are
+not written again. Incremental package contains only files which changed
+since base package, unchanged files are extracted from volumes of base
+package which must be next to incremental package.
+
+Packages created with older version (single zip with all files) can be still
+unpacked.
 """
 import os
+import io
+import sys
 import json
 import platform
-import tempfile
 import shutil
 import datetime
+import threading
 
 import zipfile
+import six
 from bson.json_util import (
     loads,
     dumps,
@@ -29,11 +46,29 @@ from openpype.client import (
     get_whole_project,
 )
 from openpype.pipeline import AvalonMongoDB
+from openpype.lib.thread_tools import run_in_threads
 
 DOCUMENTS_FILE_NAME = "database"
 METADATA_FILE_NAME = "metadata"
+MANIFEST_FILE_NAME = "manifest"
 PROJECT_FILES_DIR = "project_files"
 
+PACKAGE_VERSION = 2
+# Number of documents in one JSON lines file of database dump
+DOCUMENTS_CHUNK_SIZE = 10000
+# Number of documents inserted to database at once
+INSERT_BATCH_SIZE = 1000
+# Maximum size of files in one volume
+DEFAULT_VOLUME_SIZE = 4 * 1024 * 1024 * 1024
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+# Files which are already compressed are stored without compression
+STORED_EXTENSIONS = {
+    ".exr", ".jpg", ".jpeg", ".png", ".gif", ".webp",
+    ".mov", ".mp4", ".m4v", ".mkv", ".avi", ".webm", ".mxf",
+    ".mp3", ".aac", ".ogg", ".flac",
+    ".zip", ".7z", ".rar", ".gz", ".bz2", ".xz", ".tgz",
+}
+
 
 def add_timestamp(filepath):
     """Add timestamp string to a file."""
@@ -43,7 +78,194 @@ def add_timestamp(filepath):
     return new_base + ext
 
 
-def pack_project(project_name, destination_dir=None):
+def get_backpack_workers():
+    """Number of threads used to write or extract volumes.
+
+    Value can be defined with 'OPENPYPE_BACKPACK_WORKERS' environment
+    variable.
+
+    Returns:
+        int: Number of workers.
+    """
+
+    value = os.environ.get("OPENPYPE_BACKPACK_WORKERS")
+    if value:
+        try:
+            return max(int(value), 1)
+        except ValueError:
+            pass
+    return min(os.cpu_count() or 1, 4)
+
+
+def _get_volume_name(package_path, index):
+    base, ext = os.path.splitext(os.path.basename(package_path))
+    return "{}.vol{:04d}{}".format(base, index, ext)
+
+
+def _get_journal_path(destination_dir, project_name):
+    return os.path.join(destination_dir, project_name + ".pack.json")
+
+
+def _get_files_plan_path(journal_path):
+    return os.path.splitext(journal_path)[0] + ".files.jsonl"
+
+
+def _write_files_plan(plan_path, file_items):
+    with open(plan_path, "w") as stream:
+        for item in file_items:
+            stream.write(json.dumps(item))
+            stream.write("\n")
+
+
+def _read_files_plan(plan_path):
+    with open(plan_path, "r") as stream:
+        return [
+            json.loads(line)
+            for line in stream
+            if line.strip()
+        ]
+
+
+def _save_journal(journal_path, journal):
+    tmp_path = journal_path + ".tmp"
+    with open(tmp_path, "w") as stream:
+        json.dump(journal, stream)
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+    os.rename(tmp_path, journal_path)
+
+
+def _read_manifest(package_path):
+    """Read manifest of files from main zip of package.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: File info by path relative to root.
+    """
+
+    output = {}
+    with zipfile.ZipFile(package_path, "r") as zip_stream:
+        with zip_stream.open(MANIFEST_FILE_NAME + ".jsonl", "r") as stream:
+            for line in io.TextIOWrapper(stream, encoding="utf-8"):
+                line = line.strip()
+                if line:
+                    item = json.loads(line)
+                    output[item["path"]] = item
+    return output
+
+
+def _collect_project_files(project_source_path, root_path):
+    """Collect files of project with size and modification time.
+
+    Returns:
+        List[Dict[str, Any]]: Info about files sorted by path.
+    """
+
+    output = []
+    for root, _, filenames in os.walk(project_source_path):
+        for filename in filenames:
+            filepath = os.path.join(root, filename)
+            stat = os.stat(filepath)
+            output.append({
+                "path": os.path.relpath(filepath, root_path).replace(
+                    "\\", "/"
+                ),
+                "size": stat.st_size,
+                "mtime": stat.st_mtime
+            })
+    output.sort(key=lambda item: item["path"])
+    return output
+
+
+def _split_to_volumes(file_items, volume_size):
+    """Split files to volumes by size.
+
+    Returns:
+        List[List[Dict[str, Any]]]: Files of each volume.
+    """
+
+    volumes = []
+    current = []
+    current_size = 0
+    for item in file_items:
+        if current and current_size + item["size"] > volume_size:
+            volumes.append(current)
+            current = []
+            current_size = 0
+        current.append(item)
+        current_size += item["size"]
+    if current:
+        volumes.append(current)
+    return volumes
+
+
+def _write_volume(volume_path, file_items, root_path, store_only):
+    """Write files to volume zip.
+
+    Volume is written to temporary path and renamed when finished so
+    incomplete volumes are never used.
+    """
+
+    tmp_path = volume_path + ".part"
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zip_stream:
+        for item in file_items:
+            relpath = item["path"]
+            ext = os.path.splitext(relpath)[-1].lower()
+            compress_type = zipfile.ZIP_DEFLATED
+            if store_only or ext in STORED_EXTENSIONS:
+                compress_type = zipfile.ZIP_STORED
+            zip_stream.write(
+                os.path.join(root_path, relpath),
+                "/".join((PROJECT_FILES_DIR, relpath)),
+                compress_type=compress_type
+            )
+
+    if os.path.exists(volume_path):
+        os.remove(volume_path)
+    os.rename(tmp_path, volume_path)
+
+
+def _write_documents(zip_stream, project_name, chunk_size):
+    """Stream documents of project to JSON lines files in zip.
+
+    Returns:
+        int: Number of written documents.
+    """
+
+    count = 0
+    stream = None
+    try:
+        for doc in get_whole_project(project_name):
+            if count % chunk_size == 0:
+                if stream is not None:
+                    stream.close()
+                stream = zip_stream.open(
+                    "{}/{:04d}.jsonl".format(
+                        DOCUMENTS_FILE_NAME, count // chunk_size
+                    ),
+                    "w"
+                )
+            stream.write(
+                dumps(doc, json_options=CANONICAL_JSON_OPTIONS).encode(
+                    "utf-8"
+                )
+            )
+            stream.write(b"\n")
+            count += 1
+    finally:
+        if stream is not None:
+            stream.close()
+    return count
+
+
+def pack_project(
+    project_name,
+    destination_dir=None,
+    workers=None,
+    store_only=False,
+    resume=False,
+    base_package=None,
+    volume_size=DEFAULT_VOLUME_SIZE
+):
     """Make a package of a project with mongo documents and files.
 
     This function has few restrictions:
@@ -55,6 +277,14 @@ def pack_project(project_name, destination_dir=None):
         project_name(str): Project that should be packaged.
         destination_dir(str): Optional path where zip will be stored. Project's
             root is used if not passed.
+        workers(int): Number of volumes written in parallel. Value from
+            'get_backpack_workers' is used if not passed.
+        store_only(bool): Store all files without compression.
+        resume(bool): Continue with interrupted packing of the project in
+            destination directory.
+        base_package(str): Path to previous package of the project. Only
+            files which changed since the package are stored.
+        volume_size(int): Maximum size of files in one volume in bytes.
     """
     print("Creating package of project \"{}\"".format(project_name))
     # Validate existence of project
@@ -93,66 +323,233 @@ def pack_project(project_name, destination_dir=None):
     if not os.path.exists(destination_dir):
         os.makedirs(destination_dir)
 
-    zip_path = os.path.join(destination_dir, project_name + ".zip")
-
+    if workers is None:
+        workers = get_backpack_workers()
+
+    journal_path = _get_journal_path(destination_dir, project_name)
+    plan_path = _get_files_plan_path(journal_path)
+    journal = None
+    if resume and os.path.exists(journal_path):
+        with open(journal_path, "r") as stream:
+            journal = json.load(stream)
+        print("Resuming packing into \"{}\"".format(journal["package"]))
+
+    if journal is None:
+        zip_path = os.path.join(destination_dir, project_name + ".zip")
+        # Rename already existing zip
+        if os.path.exists(zip_path):
+            dst_filepath = add_timestamp(zip_path)
+            os.rename(zip_path, dst_filepath)
+            if base_package and (
+                os.path.normpath(base_package) == os.path.normpath(zip_path)
+            ):
+                base_package = dst_filepath
+
+        base_manifest = {}
+        base_name = None
+        if base_package:
+            print("Creating incremental package based on \"{}\"".format(
+                base_package
+            ))
+            if os.path.dirname(os.path.abspath(base_package)) != (
+                os.path.abspath(destination_dir)
+            ):
+                raise ValueError(
+                    "Base package must be in destination directory"
+                )
+            base_manifest = _read_manifest(base_package)
+            base_name = os.path.basename(base_package)
+
+        print("Collecting project files")
+        file_items = []
+        changed_items = []
+        for item in _collect_project_files(project_source_path, root_path):
+            base_item = base_manifest.get(item["path"])
+            if (
+                base_item is not None
+                and base_item["size"] == item["size"]
+                and base_item["mtime"] == item["mtime"]
+            ):
+                item["volume"] = base_item["volume"]
+            else:
+                changed_items.append(item)
+            file_items.append(item)
+
+        # Volumes have unique names because volumes of older packages may
+        #   be used by incremental packages
+        volumes_base = add_timestamp(zip_path)
+        volumes = []
+        for idx, volume_items in enumerate(
+            _split_to_volumes(changed_items, volume_size)
+        ):
+            volume_name = _get_volume_name(volumes_base, idx)
+            for item in volume_items:
+                item["volume"] = volume_name
+            volumes.append(volume_name)
+
+        # Files are stored separately because journal is saved after each
+        #   finished volume
+        _write_files_plan(plan_path, file_items)
+        journal = {
+            "package": zip_path,
+            "base_package": base_name,
+            "volumes": volumes,
+            "finished_volumes": []
+        }
+        _save_journal(journal_path, journal)
+    else:
+        file_items = _read_files_plan(plan_path)
+
+    zip_path = journal["package"]
     print("Project will be packaged into \"{}\"".format(zip_path))
-    # Rename already existing zip
-    if os.path.exists(zip_path):
-        dst_filepath = add_timestamp(zip_path)
-        os.rename(zip_path, dst_filepath)
+
+    files_by_volume = {
+        volume_name: []
+        for volume_name in journal["volumes"]
+    }
+    for item in file_items:
+        if item["volume"] in files_by_volume:
+            files_by_volume[item["volume"]].append(item)
+
+    finished_volumes = set(journal["finished_volumes"])
+    journal_lock = threading.Lock()
+
+    def _pack_volume(volume_name):
+        volume_path = os.path.join(destination_dir, volume_name)
+        _write_volume(
+            volume_path, files_by_volume[volume_name], root_path, store_only
+        )
+        with journal_lock:
+            journal["finished_volumes"].append(volume_name)
+            _save_journal(journal_path, journal)
+            print("Volume {} finished ({}/{})".format(
+                volume_name,
+                len(journal["finished_volumes"]),
+                len(journal["volumes"])
+            ))
+
+    remaining_volumes = [
+        volume_name
+        for volume_name in journal["volumes"]
+        if not (
+            volume_name in finished_volumes
+            and os.path.exists(os.path.join(destination_dir, volume_name))
+        )
+    ]
+    print("Packing files into {} volumes with {} workers".format(
+        len(remaining_volumes), workers
+    ))
+    run_in_threads(_pack_volume, remaining_volumes, workers)
 
     # We can add more data
     metadata = {
         "project_name": project_name,
         "root": source_root,
-        "version": 1
+        "version": PACKAGE_VERSION,
+        "base_package": journal["base_package"],
+        "volumes": sorted({item["volume"] for item in file_items})
     }
-    # Create temp json file where metadata are stored
-    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as s:
-        temp_metadata_json = s.name
 
-    with open(temp_metadata_json, "w") as stream:
-        json.dump(metadata, stream)
+    print("Writing database documents and manifest")
+    tmp_zip_path = zip_path + ".part"
+    with zipfile.ZipFile(
+        tmp_zip_path, "w", zipfile.ZIP_DEFLATED
+    ) as zip_stream:
+        # Add database documents
+        docs_count = _write_documents(
+            zip_stream, project_name, DOCUMENTS_CHUNK_SIZE
+        )
+        metadata["documents_count"] = docs_count
+        with zip_stream.open(
+            MANIFEST_FILE_NAME + ".jsonl", "w", force_zip64=True
+        ) as stream:
+            for item in file_items:
+                stream.write(json.dumps(item).encode("utf-8"))
+                stream.write(b"\n")
+        # Add metadata file
+        zip_stream.writestr(
+            METADATA_FILE_NAME + ".json", json.dumps(metadata)
+        )
+    os.rename(tmp_zip_path, zip_path)
+
+    print("Cleaning up")
+    os.remove(journal_path)
+    os.remove(plan_path)
+
+    print("*** Packing finished ***")
+
+
+def _iter_documents(zip_stream, metadata):
+    """Iterate over documents stored in package."""
 
-    # Create temp json file where database documents are stored
-    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as s:
-        temp_docs_json = s.name
+    if metadata.get("version", 1) < PACKAGE_VERSION:
+        with zip_stream.open(DOCUMENTS_FILE_NAME + ".json", "r") as stream:
+            docs = loads(stream.read().decode("utf-8"))
+        for doc in docs:
+            yield doc
+        return
 
-    # Query all project documents and store them to temp json
-    docs = list(get_whole_project(project_name))
-    data = dumps(
-        docs, json_options=CANONICAL_JSON_OPTIONS
+    names = sorted(
+        name
+        for name in zip_stream.namelist()
+        if name.startswith(DOCUMENTS_FILE_NAME + "/")
     )
-    with open(temp_docs_json, "w") as stream:
-        stream.write(data)
+    for name in names:
+        with zip_stream.open(name, "r") as stream:
+            for line in io.TextIOWrapper(stream, encoding="utf-8"):
+                line = line.strip()
+                if line:
+                    yield loads(line)
 
-    print("Packing files into zip")
-    # Write all to zip file
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_stream:
-        # Add metadata file
-        zip_stream.write(temp_metadata_json, METADATA_FILE_NAME + ".json")
-        # Add database documents
-        zip_stream.write(temp_docs_json, DOCUMENTS_FILE_NAME + ".json")
-        # Add project files to zip
-        for root, _, filenames in os.walk(project_source_path):
-            for filename in filenames:
-                filepath = os.path.join(root, filename)
-                # TODO add one more folder
-                archive_name = os.path.join(
-                    PROJECT_FILES_DIR,
-                    os.path.relpath(filepath, root_path)
-                )
-                zip_stream.write(filepath, archive_name)
 
-    print("Cleaning up")
-    # Cleanup
-    os.remove(temp_docs_json)
-    os.remove(temp_metadata_json)
+def _extract_volume(volume_path, relpaths, root_path):
+    """Extract project files from volume directly to root.
 
-    print("*** Packing finished ***")
+    Args:
+        volume_path (str): Path to volume zip.
+        relpaths (Union[Set[str], None]): Paths of files relative to root
+            which should be extracted. All files are extracted if 'None'.
+        root_path (str): Root of project.
+    """
+
+    prefix = PROJECT_FILES_DIR + "/"
+    root_path = os.path.abspath(root_path)
+    extracted = set()
+    with zipfile.ZipFile(volume_path, "r") as zip_stream:
+        for zip_info in zip_stream.infolist():
+            name = zip_info.filename.replace("\\", "/")
+            if not name.startswith(prefix) or name.endswith("/"):
+                continue
+            relpath = name[len(prefix):]
+            if relpaths is not None and relpath not in relpaths:
+                continue
+
+            dst_path = os.path.abspath(os.path.join(root_path, relpath))
+            if not dst_path.startswith(root_path + os.sep):
+                raise ValueError(
+                    "Invalid path in package \"{}\"".format(name)
+                )
+            dst_dir = os.path.dirname(dst_path)
+            if not os.path.exists(dst_dir):
+                try:
+                    os.makedirs(dst_dir)
+                except OSError:
+                    # Directory may be created by other thread
+                    if not os.path.isdir(dst_dir):
+                        raise
+
+            with zip_stream.open(zip_info, "r") as src:
+                with open(dst_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+            extracted.add(relpath)
+
+    if relpaths is not None and len(extracted) != len(relpaths):
+        raise ValueError("Volume \"{}\" is missing {} files".format(
+            volume_path, len(relpaths - extracted)
+        ))
 
 
-def unpack_project(path_to_zip, new_root=None):
+def unpack_project(path_to_zip, new_root=None, workers=None):
     """Unpack project zip file to recreate project.
 
     Args:
@@ -160,43 +557,27 @@ def unpack_project(path_to_zip, new_root=None):
             function.
         new_root(str): Optional way how to set different root path for unpacked
             project.
+        workers(int): Number of volumes extracted in parallel. Value from
+            'get_backpack_workers' is used if not passed.
     """
     print("Unpacking project from zip {}".format(path_to_zip))
     if not os.path.exists(path_to_zip):
         print("Zip file does not exists: {}".format(path_to_zip))
         return
 
-    tmp_dir = tempfile.mkdtemp(prefix="unpack_")
-    print("Zip is extracted to temp: {}".format(tmp_dir))
-    with zipfile.ZipFile(path_to_zip, "r") as zip_stream:
-        zip_stream.extractall(tmp_dir)
-
-    metadata_json_path = os.path.join(tmp_dir, METADATA_FILE_NAME + ".json")
-    with open(metadata_json_path, "r") as stream:
-        metadata = json.load(stream)
+    if workers is None:
+        workers = get_backpack_workers()
 
-    docs_json_path = os.path.join(tmp_dir, DOCUMENTS_FILE_NAME + ".json")
-    with open(docs_json_path, "r") as stream:
-        content = stream.readlines()
-    docs = loads("".join(content))
+    package_dir = os.path.dirname(os.path.abspath(path_to_zip))
+    zip_stream = zipfile.ZipFile(path_to_zip, "r")
+    with zip_stream.open(METADATA_FILE_NAME + ".json", "r") as stream:
+        metadata = json.loads(stream.read().decode("utf-8"))
 
     low_platform = platform.system().lower()
     project_name = metadata["project_name"]
     source_root = metadata["root"]
     root_path = source_root[low_platform]
 
-    # Drop existing collection
-    dbcon = AvalonMongoDB()
-    database = dbcon.database
-    if project_name in database.list_collection_names():
-        database.drop_collection(project_name)
-        print("Removed existing project collection")
-
-    print("Creating project documents ({})".format(len(docs)))
-    # Create new collection with loaded docs
-    collection = database[project_name]
-    collection.insert_many(docs)
-
     # Skip change of root if is the same as the one stored in metadata
     if (
         new_root
@@ -208,24 +589,10 @@ def unpack_project(path_to_zip, new_root=None):
         print("Using different root path {}".format(new_root))
         root_path = new_root
 
-        project_doc = get_project(project_name)
-        roots = project_doc["config"]["roots"]
-        key = tuple(roots.keys())[0]
-        update_key = "config.roots.{}.{}".format(key, low_platform)
-        collection.update_one(
-            {"_id": project_doc["_id"]},
-            {"$set": {
-                update_key: new_root
-            }}
-        )
-
     # Make sure root path exists
     if not os.path.exists(root_path):
         os.makedirs(root_path)
 
-    src_project_files_dir = os.path.join(
-        tmp_dir, PROJECT_FILES_DIR, project_name
-    )
     dst_project_files_dir = os.path.normpath(
         os.path.join(root_path, project_name)
     )
@@ -236,13 +603,86 @@ def unpack_project(path_to_zip, new_root=None):
         ))
         os.rename(dst_project_files_dir, new_path)
 
-    print("Moving project files from temp \"{}\" -> \"{}\"".format(
-        src_project_files_dir, dst_project_files_dir
+    # Files are extracted in background while documents are inserted
+    if metadata.get("version", 1) < PACKAGE_VERSION:
+        volume_items = [(path_to_zip, None)]
+    else:
+        relpaths_by_volume = {}
+        for item in _read_manifest(path_to_zip).values():
+            relpaths_by_volume.setdefault(item["volume"], set()).add(
+                item["path"]
+            )
+        volume_items = []
+        for volume_name, relpaths in relpaths_by_volume.items():
+            volume_path = os.path.join(package_dir, volume_name)
+            if not os.path.exists(volume_path):
+                raise ValueError(
+                    "Volume \"{}\" of package was not found".format(
+                        volume_path
+                    )
+                )
+            volume_items.append((volume_path, relpaths))
+
+    print("Extracting files from {} volumes with {} workers".format(
+        len(volume_items), workers
     ))
-    shutil.move(src_project_files_dir, dst_project_files_dir)
+    extract_errors = []
+
+    def _extract_volumes():
+        try:
+            run_in_threads(
+                lambda item: _extract_volume(item[0], item[1], root_path),
+                volume_items,
+                workers
+            )
+        except Exception:
+            extract_errors.append(sys.exc_info())
+
+    extract_thread = threading.Thread(target=_extract_volumes)
+    extract_thread.daemon = True
+    extract_thread.start()
+
+    # Drop existing collection
+    dbcon = AvalonMongoDB()
+    database = dbcon.database
+    try:
+        if project_name in database.list_collection_names():
+            database.drop_collection(project_name)
+            print("Removed existing project collection")
+
+        print("Creating project documents")
+        # Create new collection with loaded docs
+        collection = database[project_name]
+        docs_count = 0
+        batch = []
+        for doc in _iter_documents(zip_stream, metadata):
+            batch.append(doc)
+            if len(batch) >= INSERT_BATCH_SIZE:
+                collection.insert_many(batch, ordered=False)
+                docs_count += len(batch)
+                batch = []
+        if batch:
+            collection.insert_many(batch, ordered=False)
+            docs_count += len(batch)
+        print("Created {} project documents".format(docs_count))
+
+        if new_root:
+            project_doc = get_project(project_name)
+            roots = project_doc["config"]["roots"]
+            key = tuple(roots.keys())[0]
+            update_key = "config.roots.{}.{}".format(key, low_platform)
+            collection.update_one(
+                {"_id": project_doc["_id"]},
+                {"$set": {
+                    update_key: new_root
+                }}
+            )
+    finally:
+        zip_stream.close()
+        extract_thread.join()
+        dbcon.uninstall()
+
+    if extract_errors:
+        six.reraise(*extract_errors[0])
 
-    # CLeanup
-    print("Cleaning up")
-    shutil.rmtree(tmp_dir)
-    dbcon.uninstall()
     print("*** Unpack finished ***")
@@ -0,0 +1,73 @@
+"""Helpers for running work on pool of threads."""
+
+import sys
+import threading
+
+import six
+from six.moves import queue
+
+
+def run_in_threads(func, items, workers, logger=None):
+    """Call function for each item on pool of threads.
+
+    Processing of items which did not start yet is cancelled on first error
+    and the error is re-raised once all running items finish. Items are
+    processed in current thread if only one worker would be used.
+
+    Args:
+        func (Callable[[Any], Any]): Function called with each item.
+        items (Iterable[Any]): Items to process.
+        workers (int): Maximum number of threads.
+        logger (Optional[logging.Logger]): Logger used to report count of
+            failed items if more than one failed.
+
+    Returns:
+        List[Any]: Results of function in order of passed items.
+    """
+
+    items = list(items)
+    results = [None] * len(items)
+    workers_count = min(workers, len(items))
+    if workers_count <= 1:
+        for idx, item in enumerate(items):
+            results[idx] = func(item)
+        return results
+
+    items_queue = queue.Queue()
+    for idx, item in enumerate(items):
+        items_queue.put((idx, item))
+
+    errors = []
+    errors_lock = threading.Lock()
+    failed = threading.Event()
+
+    def _worker():
+        while not failed.is_set():
+            try:
+                idx, item = items_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                results[idx] = func(item)
+            except Exception:
+                with errors_lock:
+                    errors.append(sys.exc_info())
+                failed.set()
+
+    threads = []
+    for _ in range(workers_count):
+        thread = threading.Thread(target=_worker)
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        if len(errors) > 1 and logger is not None:
+            logger.error("{} of {} items failed.".format(
+                len(errors), len(items)
+            ))
+        six.reraise(*errors[0])
+    return results
@@ -2,14 +2,24 @@ import os
 import re
 import logging
 import json
+import copy
+import atexit
+import shutil
+import hashlib
 import collections
+import time
 import tempfile
+import threading
 import subprocess
 import platform
+import multiprocessing
 
 import xml.etree.ElementTree
 
+import clique
+
 from .execute import run_subprocess
+from .thread_tools import run_in_threads
 from .vendor_bin_utils import (
     get_ffmpeg_tool_path,
     get_oiio_tools_path,
@@ -18,6 +28,10 @@ from .vendor_bin_utils import (
 
 # Max length of string that is supported by ffmpeg
 MAX_FFMPEG_STRING_LEN = 8196
+# Number of frames of sequence converted by one oiiotool process
+TRANSCODE_CHUNK_SIZE = 10
+# Number of probe results kept in memory
+PROBE_CACHE_SIZE = 256
 # Not allowed symbols in attributes for ffmpeg
 NOT_ALLOWED_FFMPEG_CHARS = ("\"", )
 
@@ -66,6 +80,170 @@ VIDEO_EXTENSIONS = {
 }
 
 
+class ProbeCache(object):
+    """Cache of ffprobe and oiiotool results of files.
+
+    Results are stored by probe type and path of file and are valid until
+    size or modification time of the file changes. Most recent results
+    are kept in memory. Results can be also stored on disk so they're shared
+    by processes of one publish (e.g. extractors on farm).
+
+    Args:
+        max_size (int): Maximum number of results in memory.
+        disk_dir (Optional[str]): Directory where results are stored on disk.
+    """
+
+    def __init__(self, max_size=PROBE_CACHE_SIZE, disk_dir=None):
+        self._max_size = max_size
+        self._disk_dir = disk_dir
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _get_file_key(filepath):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return (
+            os.path.normpath(os.path.abspath(filepath)),
+            stat.st_size,
+            stat.st_mtime
+        )
+
+    def _get_disk_path(self, key):
+        key_str = json.dumps(key)
+        filename = hashlib.sha1(key_str.encode("utf-8")).hexdigest()
+        return os.path.join(self._disk_dir, filename + ".json")
+
+    def _get_from_disk(self, key):
+        if not self._disk_dir:
+            return None
+        path = self._get_disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as stream:
+                return json.load(stream)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _store_to_disk(self, key, value):
+        if not self._disk_dir:
+            return
+        path = self._get_disk_path(key)
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            if not os.path.exists(self._disk_dir):
+                os.makedirs(self._disk_dir)
+            with open(tmp_path, "w") as stream:
+                json.dump(value, stream)
+            if os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp_path, path)
+        except (IOError, OSError, TypeError, ValueError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get_or_probe(self, probe_type, filepath, probe_func, *args):
+        """Cached result of probe or result of 'probe_func'.
+
+        Args:
+            probe_type (str): Type of probe (e.g. 'ffprobe').
+            filepath (str): Path to probed file.
+            probe_func (Callable[[], Any]): Function probing the file.
+            *args: Additional values which are part of cache key.
+
+        Returns:
+            Any: Copy of probe result.
+        """
+
+        file_key = self._get_file_key(filepath)
+        # File does not exist - let probe function handle it
+        if file_key is None:
+            return probe_func()
+
+        key = (probe_type, ) + file_key + tuple(args)
+        with self._lock:
+            value = self._items.pop(key, None)
+            if value is not None:
+                self._items[key] = value
+                self.hits += 1
+                return copy.deepcopy(value)
+
+        value = self._get_from_disk(key)
+        if value is None:
+            with self._lock:
+                self.misses += 1
+            value = probe_func()
+            self._store_to_disk(key, value)
+        else:
+            with self._lock:
+                self.hits += 1
+
+        with self._lock:
+            self._items[key] = value
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+        return copy.deepcopy(value)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+PROBE_DISK_CACHE_DIR_ENV = "OPENPYPE_PROBE_DISK_CACHE_DIR"
+
+_probe_cache = None
+_probe_cache_lock = threading.Lock()
+
+
+def _get_probe_disk_cache_dir():
+    disk_dir = os.environ.get(PROBE_DISK_CACHE_DIR_ENV)
+    if disk_dir:
+        return disk_dir
+
+    # Directory is created by first process which needs it and removed
+    #   when the process ends. Subprocesses inherit the path from
+    #   environment so they share results with the process.
+    disk_dir = get_transcode_temp_directory()
+    os.environ[PROBE_DISK_CACHE_DIR_ENV] = disk_dir
+    atexit.register(shutil.rmtree, disk_dir, True)
+    return disk_dir
+
+
+def get_probe_cache():
+    """Cache of ffprobe and oiiotool results used by transcoding functions.
+
+    Results are also stored to disk if 'OPENPYPE_PROBE_DISK_CACHE'
+    environment variable is set to '1'. Directory of disk cache is
+    transcoding temp directory created by first process using the cache
+    and removed when the process ends, subprocesses use the same directory
+    (path is stored to 'OPENPYPE_PROBE_DISK_CACHE_DIR').
+
+    Returns:
+        ProbeCache: Shared probe cache.
+    """
+
+    global _probe_cache
+    if _probe_cache is None:
+        with _probe_cache_lock:
+            if _probe_cache is None:
+                disk_dir = None
+                if os.environ.get("OPENPYPE_PROBE_DISK_CACHE") == "1":
+                    disk_dir = _get_probe_disk_cache_dir()
+                _probe_cache = ProbeCache(disk_dir=disk_dir)
+    return _probe_cache
+
+
+def _probe_cache_enabled():
+    return os.environ.get("OPENPYPE_PROBE_CACHE_DISABLED") != "1"
+
+
 def get_transcode_temp_directory():
     """Creates temporary folder for transcoding.
 
@@ -81,8 +259,21 @@ def get_transcode_temp_directory():
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Result is cached until the file
+    changes.
     """
+    if not _probe_cache_enabled():
+        return _get_oiio_info_for_input(filepath, logger, subimages)
+
+    return get_probe_cache().get_or_probe(
+        "oiio",
+        filepath,
+        lambda: _get_oiio_info_for_input(filepath, logger, subimages),
+        bool(subimages)
+    )
+
+
+def _get_oiio_info_for_input(filepath, logger=None, subimages=False):
     args = [
         get_oiio_tools_path(),
         "--info",
@@ -377,6 +568,243 @@ def get_convert_rgb_channels(channel_names):
     return output
 
 
+def get_oiio_info_for_sequence(input_paths, logger=None):
+    """Get information about sequence from one representative frame.
+
+    All frames of a sequence are expected to have same spec so only first
+    frame is probed. Middle and last frame are probed if first frame can't
+    be read (e.g. is corrupted).
+
+    Args:
+        input_paths (List[str]): Paths to files of a sequence.
+        logger (logging.Logger): Logger used for logging.
+
+    Returns:
+        Dict[str, Any]: Information about input.
+    """
+
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    last_idx = len(input_paths) - 1
+    sample_indexes = []
+    for idx in (0, last_idx // 2, last_idx):
+        if idx not in sample_indexes:
+            sample_indexes.append(idx)
+
+    error = None
+    for idx in sample_indexes:
+        input_path = input_paths[idx]
+        try:
+            return get_oiio_info_for_input(input_path, logger=logger)
+        except (ValueError, RuntimeError) as exc:
+            logger.warning(
+                "Failed to read info of \"{}\". {}".format(input_path, exc)
+            )
+            error = exc
+    raise error
+
+
+def get_transcode_workers():
+    """Number of concurrent transcoding processes.
+
+    Value can be defined with 'OPENPYPE_TRANSCODE_WORKERS' environment
+    variable, number of cpu cores is used otherwise.
+
+    Returns:
+        int: Number of workers.
+    """
+
+    value = os.environ.get("OPENPYPE_TRANSCODE_WORKERS")
+    if value:
+        try:
+            return max(int(value), 1)
+        except ValueError:
+            pass
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def split_frames_to_chunks(frames, chunk_size=TRANSCODE_CHUNK_SIZE):
+    """Split frames to chunks of consecutive frames.
+
+    Gaps in frames always start new chunk.
+
+    Args:
+        frames (Iterable[int]): Frame numbers.
+        chunk_size (int): Maximum number of frames in chunk.
+
+    Returns:
+        List[List[int]]: Chunks of frames.
+    """
+
+    chunks = []
+    chunk = []
+    for frame in sorted(frames):
+        if chunk and (
+            frame != chunk[-1] + 1
+            or len(chunk) >= chunk_size
+        ):
+            chunks.append(chunk)
+            chunk = []
+        chunk.append(frame)
+
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def get_oiio_sequence_path(head, tail, padding, frame_start, frame_end):
+    """Path to frame range of sequence in oiiotool syntax.
+
+    Example:
+        'render.1001-1010#.exr' for padding 4.
+
+    Args:
+        head (str): Part of path before frame.
+        tail (str): Part of path after frame.
+        padding (int): Padding of frame number.
+        frame_start (int): First frame.
+        frame_end (int): Last frame.
+
+    Returns:
+        str: Path of frame range.
+    """
+
+    # '#' is 4 digits padding, each '@' is 1 digit
+    if padding == 4:
+        frame_char = "#"
+    else:
+        frame_char = "@" * max(padding, 1)
+    return "{}{}-{}{}{}".format(
+        head, frame_start, frame_end, frame_char, tail
+    )
+
+
+class TranscodeScheduler(object):
+    """Run transcoding tasks on pool of concurrent workers.
+
+    Each task usually runs single process (oiiotool, ffmpeg) so tasks are
+    processed by threads. Processing of tasks which did not start yet is
+    cancelled on first error and the error is re-raised once all running
+    tasks finish.
+
+    Args:
+        max_workers (Optional[int]): Number of concurrent tasks. Value
+            from 'get_transcode_workers' is used if not passed.
+        logger (Optional[logging.Logger]): Logger used for logging.
+    """
+
+    def __init__(self, max_workers=None, logger=None):
+        if max_workers is None:
+            max_workers = get_transcode_workers()
+        if logger is None:
+            logger = logging.getLogger(self.__class__.__name__)
+        self._max_workers = max(max_workers, 1)
+        self._log = logger
+        self._tasks = []
+        self._timings = []
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    def add_task(self, func, args=None, kwargs=None, label=None, frames=1):
+        """Add task to process.
+
+        Args:
+            func (Callable): Function processing task.
+            args (Optional[Iterable[Any]]): Positional arguments of function.
+            kwargs (Optional[Dict[str, Any]]): Keyword arguments of function.
+            label (Optional[str]): Label of task used in timing report.
+            frames (int): Number of frames processed by task.
+        """
+
+        if label is None:
+            label = "Task {}".format(len(self._tasks) + 1)
+        self._tasks.append({
+            "func": func,
+            "args": tuple(args or ()),
+            "kwargs": dict(kwargs or {}),
+            "label": label,
+            "frames": frames
+        })
+
+    def add_subprocess(self, args, label=None, frames=1):
+        """Add subprocess to process.
+
+        Args:
+            args (List[str]): Arguments of subprocess.
+            label (Optional[str]): Label of task used in timing report.
+            frames (int): Number of frames processed by subprocess.
+        """
+
+        self.add_task(
+            run_subprocess,
+            args=(args, ),
+            kwargs={"logger": self._log},
+            label=label,
+            frames=frames
+        )
+
+    def _process_task(self, task):
+        start = time.time()
+        task["func"](*task["args"], **task["kwargs"])
+        timing = {
+            "label": task["label"],
+            "frames": task["frames"],
+            "duration": time.time() - start
+        }
+        with self._lock:
+            self._timings.append(timing)
+
+    def run(self):
+        """Process all added tasks and wait until they finish."""
+
+        tasks = self._tasks
+        self._tasks = []
+        if not tasks:
+            return
+
+        start = time.time()
+        workers_count = min(self._max_workers, len(tasks))
+        run_in_threads(self._process_task, tasks, workers_count, self._log)
+
+        self._log.debug(
+            "Processed {} transcoding tasks with {} workers in {:.2f}s".format(
+                len(tasks), workers_count, time.time() - start
+            )
+        )
+
+    def get_timings(self):
+        """Timing of processed tasks.
+
+        Returns:
+            List[Dict[str, Any]]: Label, number of frames and duration of
+                each processed task.
+        """
+
+        with self._lock:
+            return list(self._timings)
+
+    def format_timings(self):
+        lines = ["{:<50} {:>7} {:>10} {:>10}".format(
+            "Task", "Frames", "Time (s)", "Frame (s)"
+        )]
+        for timing in self.get_timings():
+            frames = max(timing["frames"], 1)
+            lines.append("{:<50} {:>7} {:>10.3f} {:>10.3f}".format(
+                timing["label"][-50:],
+                timing["frames"],
+                timing["duration"],
+                timing["duration"] / frames
+            ))
+        return "\n".join(lines)
+
+
 def should_convert_for_ffmpeg(src_filepath):
     """Find out if input should be converted for ffmpeg.
 
@@ -585,7 +1013,9 @@ def convert_for_ffmpeg(
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None,
+    chunk_size=TRANSCODE_CHUNK_SIZE
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -598,12 +1028,18 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Sequences are split to chunks of consecutive frames and each chunk is
+    converted by one oiiotool process. Chunks are converted concurrently.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of samy type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Number of concurrent oiiotool processes.
+            Value from 'get_transcode_workers' is used if not passed.
+        chunk_size (int): Maximum number of frames converted by one process.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -620,7 +1056,7 @@ def convert_input_paths_for_ffmpeg(
             " \".exr\" extension. Got \"{}\"."
         ).format(ext))
 
-    input_info = get_oiio_info_for_input(first_input_path, logger=logger)
+    input_info = get_oiio_info_for_sequence(input_paths, logger=logger)
 
     # Change compression only if source compression is "dwaa" or "dwab"
     #   - they're not supported in ffmpeg
@@ -654,7 +1090,69 @@ def convert_input_paths_for_ffmpeg(
         # - this option is crashing if used on multipart exrs
         input_arg += ":ch={}".format(input_channels_str)
 
-    for input_path in input_paths:
+    # Attributes are same for all inputs
+    erase_args = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containt unallowed symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            erase_args.extend(["--eraseattrib", attr_name])
+
+    # Split inputs to chunks of sequences and single files
+    # - each item is tuple of input path and number of frames
+    inputs = []
+    collections, remainders = clique.assemble(
+        input_paths,
+        patterns=[clique.PATTERNS["frames"]],
+        assume_padded_when_ambiguous=True
+    )
+    for collection in collections:
+        for chunk in split_frames_to_chunks(collection.indexes, chunk_size):
+            if len(chunk) == 1:
+                inputs.append((
+                    collection.format("{head}{padding}{tail}") % chunk[0],
+                    1
+                ))
+                continue
+            inputs.append((
+                get_oiio_sequence_path(
+                    collection.head,
+                    collection.tail,
+                    collection.padding,
+                    chunk[0],
+                    chunk[-1]
+                ),
+                len(chunk)
+            ))
+    for input_path in remainders:
+        inputs.append((input_path, 1))
+
+    scheduler = TranscodeScheduler(max_workers, logger=logger)
+    for input_path, frames_count in inputs:
         # Prepare subprocess arguments
         oiio_cmd = [
             get_oiio_tools_path(),
@@ -674,38 +1172,10 @@ def convert_input_paths_for_ffmpeg(
             # Use first subimage
             "--subimage", "0"
         ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containt unallowed symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        oiio_cmd.extend(erase_args)
 
         # Add last argument - path to output
+        # - frame range syntax of sequence chunk is kept in output path
         base_filename = os.path.basename(input_path)
         output_path = os.path.join(output_dir, base_filename)
         oiio_cmd.extend([
@@ -713,17 +1183,35 @@ def convert_input_paths_for_ffmpeg(
         ])
 
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+        scheduler.add_subprocess(
+            oiio_cmd, label=base_filename, frames=frames_count
+        )
+
+    scheduler.run()
+    logger.debug("Conversion timing:\n{}".format(scheduler.format_timings()))
 
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Result is cached until the file changes.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
     """
+    if not _probe_cache_enabled():
+        return _get_ffprobe_data(path_to_file, logger)
+
+    return get_probe_cache().get_or_probe(
+        "ffprobe",
+        path_to_file,
+        lambda: _get_ffprobe_data(path_to_file, logger)
+    )
+
+
+def _get_ffprobe_data(path_to_file, logger=None):
     if not logger:
         logger = logging.getLogger(__name__)
     logger.info(
@@ -783,6 +1271,43 @@ def get_ffprobe_streams(path_to_file, logger=None):
     return get_ffprobe_data(path_to_file, logger)["streams"]
 
 
+def probe_inputs(filepaths, probe_type="ffprobe", logger=None,
+                 max_workers=None):
+    """Probe multiple files concurrently.
+
+    Each file is probed at most once, cached results are used when
+    available.
+
+    Args:
+        filepaths (Iterable[str]): Paths to files.
+        probe_type (str): 'ffprobe' for 'get_ffprobe_data' or 'oiio' for
+            'get_oiio_info_for_input'.
+        logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Number of concurrent probe processes.
+
+    Returns:
+        Dict[str, Any]: Probe results by path.
+    """
+
+    if probe_type == "ffprobe":
+        probe_func = get_ffprobe_data
+    elif probe_type == "oiio":
+        probe_func = get_oiio_info_for_input
+    else:
+        raise ValueError("Unknown probe type \"{}\"".format(probe_type))
+
+    output = {}
+
+    def _probe(filepath):
+        output[filepath] = probe_func(filepath, logger=logger)
+
+    scheduler = TranscodeScheduler(max_workers, logger=logger)
+    for filepath in set(filepaths):
+        scheduler.add_task(_probe, args=(filepath, ), label=filepath)
+    scheduler.run()
+    return output
+
+
 def get_ffmpeg_format_args(ffprobe_data, source_ffmpeg_cmd=None):
     """Copy format from input metadata for output.
 
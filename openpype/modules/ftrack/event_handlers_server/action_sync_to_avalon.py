@@ -5,7 +5,10 @@ import json
 import ftrack_api
 
 from openpype_modules.ftrack.lib import ServerAction
-from openpype_modules.ftrack.lib.avalon_sync import SyncEntitiesFactory
+from openpype_modules.ftrack.lib.avalon_sync import (
+    SyncEntitiesFactory,
+    is_incremental_sync_enabled
+)
 
 
 class SyncToAvalonServer(ServerAction):
@@ -31,6 +34,15 @@ class SyncToAvalonServer(ServerAction):
     - action IS NOT creating this Custom attribute if doesn't exist
         - run 'Create Custom Attributes' action
         - or do it manually (Not recommended)
+
+    Incremental synchronization (environment variable
+    'OPENPYPE_FTRACK_INCREMENTAL_SYNC' set to '1'):
+        - only entities changed since last synchronization are synchronized
+        - changes are read from events stored by event server
+        - full synchronization is used when project was not synchronized
+          yet, when last synchronization is older than lifetime of stored
+          events, when event server (storer) was not running since last
+          synchronization or when project entity was changed
     """
     #: Action identifier.
     identifier = "sync.to.avalon.server"
@@ -128,7 +140,9 @@ class SyncToAvalonServer(ServerAction):
         self.show_message(event, "Synchronization - Preparing data", True)
 
         try:
-            output = self.entities_factory.launch_setup(project_name)
+            output = self.entities_factory.launch_setup(
+                project_name, incremental=is_incremental_sync_enabled()
+            )
             if output is not None:
                 return output
 
@@ -154,7 +168,11 @@ class SyncToAvalonServer(ServerAction):
             time_7 = time.time()
 
             self.log.debug(
-                "*** Synchronization finished ***"
+                "*** Synchronization finished ({}) ***".format(
+                    "incremental"
+                    if self.entities_factory.incremental
+                    else "full"
+                )
             )
             self.log.debug(
                 "preparation <{}>".format(time_1 - time_start)
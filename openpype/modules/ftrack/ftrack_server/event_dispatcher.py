@@ -0,0 +1,255 @@
+import time
+import zlib
+import threading
+import collections
+from queue import Queue, Empty
+
+from openpype.lib import Logger
+
+
+def get_callback_name(callback):
+    """Name of event handler used in metrics."""
+
+    handler = getattr(callback, "__self__", None)
+    if handler is not None:
+        return handler.__class__.__name__
+    return getattr(callback, "__name__", None) or str(callback)
+
+
+class HandlerMetrics(object):
+    """Timing of one event handler."""
+
+    def __init__(self):
+        self.count = 0
+        self.failed = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def add(self, duration, success):
+        self.count += 1
+        if not success:
+            self.failed += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+
+    def to_data(self):
+        avg_time = 0.0
+        if self.count:
+            avg_time = self.total_time / self.count
+        return {
+            "count": self.count,
+            "failed": self.failed,
+            "total_time": self.total_time,
+            "avg_time": avg_time,
+            "max_time": self.max_time
+        }
+
+
+class EventHandlerDispatcher(object):
+    """Run event handlers on pool of workers partitioned by key.
+
+    Each task has partition key and all tasks with the same key are
+    processed by the same worker in order in which were added. Tasks with
+    different keys can run concurrently.
+
+    Args:
+        workers (int): Number of workers (partitions).
+        worker_init (Optional[Callable[[], None]]): Called in each worker
+            thread before first task (e.g. to create thread session).
+        worker_deinit (Optional[Callable[[], None]]): Called in each worker
+            thread when worker stops.
+    """
+
+    log = Logger.get_logger("EventHandlerDispatcher")
+
+    def __init__(self, workers, worker_init=None, worker_deinit=None):
+        self._workers_count = max(workers, 1)
+        self._worker_init = worker_init
+        self._worker_deinit = worker_deinit
+        self._queues = []
+        self._threads = []
+        self._metrics = collections.defaultdict(HandlerMetrics)
+        self._metrics_lock = threading.Lock()
+        self._pending = 0
+        self._pending_cond = threading.Condition()
+        self._stopped = threading.Event()
+
+    @property
+    def workers(self):
+        return self._workers_count
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def start(self):
+        self._stopped.clear()
+        for idx in range(self._workers_count):
+            task_queue = Queue()
+            thread = threading.Thread(
+                target=self._worker,
+                args=(task_queue, ),
+                name="EventWorker-{}".format(idx)
+            )
+            thread.daemon = True
+            self._queues.append(task_queue)
+            self._threads.append(thread)
+            thread.start()
+
+    def stop(self, timeout=None):
+        """Stop workers after they finish already added tasks."""
+
+        self.join(timeout)
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._queues = []
+        self._threads = []
+
+    def join(self, timeout=None):
+        """Wait until all added tasks are processed.
+
+        Returns:
+            bool: All tasks were processed.
+        """
+
+        end_time = None
+        if timeout is not None:
+            end_time = time.time() + timeout
+
+        with self._pending_cond:
+            while self._pending:
+                wait_time = None
+                if end_time is not None:
+                    wait_time = end_time - time.time()
+                    if wait_time <= 0:
+                        return False
+                self._pending_cond.wait(wait_time)
+        return True
+
+    def get_worker_index(self, partition_key):
+        """Index of worker processing tasks of partition key."""
+
+        if self._workers_count < 2:
+            return 0
+        key = str(partition_key).encode("utf-8")
+        return zlib.crc32(key) % self._workers_count
+
+    def dispatch(self, partition_key, name, func, callback=None):
+        """Add task to worker of partition.
+
+        Args:
+            partition_key (str): Key of partition.
+            name (str): Name of handler for metrics.
+            func (Callable[[], Any]): Task to process.
+            callback (Optional[Callable[[bool], None]]): Called with success
+                of task when task is finished.
+        """
+
+        if not self._queues:
+            raise RuntimeError("Dispatcher is not started")
+
+        idx = self.get_worker_index(partition_key)
+        with self._pending_cond:
+            self._pending += 1
+        self._queues[idx].put((name, func, callback))
+
+    def dispatch_handler(self, name, func, callback=None):
+        """Add task of event handler.
+
+        All tasks of one handler are processed by the same worker in order
+        in which were added. Handlers keep state of currently processed
+        event on instance (e.g. project, queried entities, database
+        session) so one handler instance must not process events
+        concurrently. Different handlers run concurrently.
+
+        Args:
+            name (str): Name of handler.
+            func (Callable[[], Any]): Task to process.
+            callback (Optional[Callable[[bool], None]]): Called with success
+                of task when task is finished.
+        """
+
+        self.dispatch(name, name, func, callback)
+
+    def _worker(self, task_queue):
+        if self._worker_init is not None:
+            try:
+                self._worker_init()
+            except Exception:
+                self.log.warning(
+                    "Initialization of event worker failed", exc_info=True
+                )
+
+        try:
+            while not self._stopped.is_set():
+                try:
+                    name, func, callback = task_queue.get(timeout=0.2)
+                except Empty:
+                    continue
+                self._process_task(name, func, callback)
+
+        finally:
+            if self._worker_deinit is not None:
+                try:
+                    self._worker_deinit()
+                except Exception:
+                    self.log.debug(
+                        "Deinitialization of event worker failed",
+                        exc_info=True
+                    )
+
+    def _process_task(self, name, func, callback):
+        success = False
+        start = time.time()
+        try:
+            func()
+            success = True
+        except Exception:
+            self.log.warning(
+                "Event handler \"{}\" failed".format(name), exc_info=True
+            )
+
+        duration = time.time() - start
+        with self._metrics_lock:
+            self._metrics[name].add(duration, success)
+
+        try:
+            if callback is not None:
+                callback(success)
+        finally:
+            with self._pending_cond:
+                self._pending -= 1
+                self._pending_cond.notify_all()
+
+    def get_metrics(self):
+        """Timing metrics of handlers.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Metrics by handler name.
+        """
+
+        with self._metrics_lock:
+            return {
+                name: metrics.to_data()
+                for name, metrics in self._metrics.items()
+            }
+
+    def format_metrics(self):
+        lines = ["{:<40} {:>7} {:>6} {:>10} {:>10}".format(
+            "Handler", "Count", "Failed", "Avg (s)", "Max (s)"
+        )]
+        metrics_items = sorted(
+            self.get_metrics().items(),
+            key=lambda item: item[1]["total_time"],
+            reverse=True
+        )
+        for name, metrics in metrics_items:
+            lines.append("{:<40} {:>7} {:>6} {:>10.3f} {:>10.3f}".format(
+                name[:40],
+                metrics["count"],
+                metrics["failed"],
+                metrics["avg_time"],
+                metrics["max_time"]
+            ))
+        return "\n".join(lines)
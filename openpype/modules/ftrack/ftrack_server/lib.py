@@ -7,6 +7,8 @@ import threading
 import datetime
 import time
 import queue
+import copy
+import functools
 import collections
 import appdirs
 import socket
@@ -24,14 +26,52 @@ try:
     from weakref import WeakMethod
 except ImportError:
     from ftrack_api._weakref import WeakMethod
-from openpype_modules.ftrack.lib import get_ftrack_event_mongo_info
+from openpype_modules.ftrack.lib import (
+    get_ftrack_event_mongo_info,
+    FTRACK_EVENTS_LIFETIME,
+    TOPIC_STORER_STARTED,
+)
 
 from openpype.client import OpenPypeMongoConnection
 from openpype.lib import Logger
 
+from .event_dispatcher import (
+    EventHandlerDispatcher,
+    get_callback_name,
+)
+
 TOPIC_STATUS_SERVER = "openpype.event.server.status"
 TOPIC_STATUS_SERVER_RESULT = "openpype.event.server.status.result"
 
+_worker_state = threading.local()
+
+
+def get_worker_session():
+    """Session of event worker thread.
+
+    Returns:
+        Union[WorkerSession, None]: Session of current thread if is running
+            in event worker.
+    """
+
+    return getattr(_worker_state, "session", None)
+
+
+def get_event_workers_count():
+    """Number of workers processing event handlers in event processor.
+
+    Value is defined by 'OPENPYPE_FTRACK_EVENT_WORKERS' environment variable,
+    events are processed sequentially by default.
+    """
+
+    value = os.environ.get("OPENPYPE_FTRACK_EVENT_WORKERS")
+    if value:
+        try:
+            return max(int(value), 1)
+        except ValueError:
+            pass
+    return 1
+
 
 def get_host_ip():
     host_name = socket.gethostname()
@@ -97,7 +137,7 @@ class StorerEventHub(SocketBaseEventHub):
         code_name = self._code_name_mapping[code]
         if code_name == "connect":
             event = ftrack_api.event.base.Event(
-                topic="openpype.storer.started",
+                topic=TOPIC_STORER_STARTED,
                 data={},
                 source={
                     "id": self.id,
@@ -112,15 +152,58 @@ class StorerEventHub(SocketBaseEventHub):
 
 
 class ProcessEventHub(SocketBaseEventHub):
+    """Event hub processing events stored in mongo by event storer.
+
+    Stored events are received using change stream of events collection.
+    Change streams are available only on replica sets so hub falls back to
+    polling of the collection when they are not available (e.g. single
+    local mongod). Polling can be forced with environment variable
+    'OPENPYPE_FTRACK_EVENTS_POLLING' set to '1'.
+
+    Processed events are marked in database in batches. Removing of old
+    processed events is handled by TTL index of the collection or by timed
+    cleanup when index can't be created.
+    """
+
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
 
+    # Seconds between queries of not processed events in polling mode
+    poll_interval = 0.5
+    # Processed events are marked in database when count of them reaches
+    #   batch size or when oldest of them waits for max age seconds
+    ack_batch_size = 50
+    ack_max_age = 1.0
+    # Processed events older than lifetime are removed from database
+    processed_events_lifetime = FTRACK_EVENTS_LIFETIME
+    # Interval of cleanup when TTL index is not available
+    housekeeping_interval = 60 * 60
+    # Count of remembered queued events to avoid duplicated processing
+    recent_events_limit = 10000
+    ttl_index_name = "openpype_processed_events_ttl"
+    # Maximum number of handler tasks waiting for workers (per worker)
+    max_pending_tasks = 50
+    # Interval of logging of handlers metrics
+    metrics_log_interval = 10 * 60
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
 
+        self._pending_acks = []
+        self._first_ack_time = None
+        self._recent_events = collections.OrderedDict()
+        self._recent_events_lock = threading.Lock()
+        self._ttl_housekeeping = False
+        self._last_housekeeping = None
+        self._watcher_thread = None
+        self._watcher_stop = threading.Event()
+        self._dispatcher = None
+        self._completed_events = queue.Queue()
+        self._last_metrics_log = None
+
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
     def prepare_dbcon(self):
@@ -145,53 +228,469 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+    def prepare_indexes(self):
+        """Create indexes for queries of events and TTL index for cleanup."""
+
+        try:
+            self.dbcon.create_index([
+                ("pype_data.is_processed", pymongo.ASCENDING),
+                ("pype_data.stored", pymongo.ASCENDING)
+            ])
+        except pymongo.errors.PyMongoError:
+            self.pypelog.debug(
+                "Failed to create index of events", exc_info=True
+            )
+
+        try:
+            self.dbcon.create_index(
+                [("pype_data.stored", pymongo.ASCENDING)],
+                name=self.ttl_index_name,
+                expireAfterSeconds=self.processed_events_lifetime,
+                partialFilterExpression={"pype_data.is_processed": True}
+            )
+            self._ttl_housekeeping = True
+
+        except pymongo.errors.PyMongoError:
+            self._ttl_housekeeping = False
+            self.pypelog.info((
+                "Failed to create TTL index of events."
+                " Processed events are removed every {} seconds."
+            ).format(self.housekeeping_interval), exc_info=True)
+
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are received from Mongo DB change stream or loaded from
+        Mongo DB when queue is empty. Handled events are set as processed
+        in Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
-        while True:
-            try:
-                event = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
-            else:
+        self.prepare_indexes()
+        self.start_dispatcher()
+        self.start_events_watcher()
+        # Load events stored before watcher was started
+        self.load_events()
+        try:
+            while True:
+                self._ack_completed_events()
                 try:
+                    event = self._event_queue.get(timeout=0.1)
+                except queue.Empty:
+                    self._on_idle()
+                else:
+                    self._wait_for_workers()
                     self._handle(event)
 
                     mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
+                    # Events processed by workers are marked when all
+                    #   handlers finish
+                    if mongo_id is not None and self._dispatcher is None:
+                        self.add_ack(mongo_id)
+
+                    # Additional special processing of events.
+                    if event['topic'] == 'ftrack.meta.disconnected':
+                        break
+
+                if duration is not None:
+                    if (time.time() - started) > duration:
+                        break
+
+            self.stop_dispatcher()
+            self._ack_completed_events()
+            self.flush_acks()
+
+        except pymongo.errors.AutoReconnect:
+            self.pypelog.error((
+                "Mongo server \"{}\" is not responding, exiting."
+            ).format(os.environ["OPENPYPE_MONGO"]))
+            sys.exit(0)
+
+        finally:
+            self.stop_events_watcher()
+            self.stop_dispatcher()
+
+    def start_dispatcher(self):
+        """Start workers processing event handlers in parallel.
+
+        Handlers are processed in workers only if more than one worker is
+        set (see 'get_event_workers_count'). Each handler of an event is
+        processed separately. One handler processes events one by one in
+        order, because handlers keep state of processed event on instance,
+        different handlers run concurrently. Each worker has own ftrack
+        session.
+        """
+
+        workers = get_event_workers_count()
+        if workers < 2:
+            return
+
+        self._dispatcher = EventHandlerDispatcher(
+            workers,
+            worker_init=self._init_worker,
+            worker_deinit=self._deinit_worker
+        )
+        self._dispatcher.start()
+        self._last_metrics_log = time.time()
+        self.pypelog.info(
+            "Event handlers are processed by {} workers".format(workers)
+        )
+
+    def stop_dispatcher(self):
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            return
+        self._dispatcher = None
+        dispatcher.stop(timeout=60)
+        self.pypelog.info("Event handlers metrics:\n{}".format(
+            dispatcher.format_metrics()
+        ))
+
+    def get_metrics(self):
+        """Timing metrics of event handlers processed by workers."""
+
+        if self._dispatcher is None:
+            return {}
+        return self._dispatcher.get_metrics()
+
+    def _init_worker(self):
+        _worker_state.session = WorkerSession(
+            server_url=self.get_server_url(),
+            api_key=self._api_key,
+            api_user=self._api_user,
+            plugin_paths=[],
+            event_hub=self
+        )
+
+    def _deinit_worker(self):
+        session = get_worker_session()
+        _worker_state.session = None
+        if session is not None:
+            session.close()
+
+    def _wait_for_workers(self):
+        if self._dispatcher is None:
+            return
+
+        max_pending = self.max_pending_tasks * self._dispatcher.workers
+        while self._dispatcher.pending >= max_pending:
+            self._dispatcher.join(0.1)
+            self._ack_completed_events()
+
+    def _ack_completed_events(self):
+        while True:
+            try:
+                mongo_id = self._completed_events.get_nowait()
+            except queue.Empty:
+                break
+            self.add_ack(mongo_id)
+
+    def _get_interested_subscribers(self, event):
+        """Subscribers which would process event in 'EventHub._handle'."""
+
+        target_expression = None
+        target = event.get("target", None)
+        if target:
+            try:
+                target_expression = self._expression_parser.parse(target)
+            except Exception:
+                self.logger.exception(L(
+                    "Cannot handle event as failed to parse event target"
+                    " information: {0}", event
+                ))
+                return []
+
+        subscribers = []
+        for subscriber in sorted(
+            self._subscribers, key=lambda item: item.priority
+        ):
+            if target_expression is not None:
+                try:
+                    if not target_expression.match(subscriber.metadata):
                         continue
+                except Exception:
+                    self.logger.exception(L(
+                        "Error matching subscriber metadata against target"
+                        " expression: {0}", subscriber
+                    ))
+                    continue
+
+            if subscriber.interested_in(event):
+                subscribers.append(subscriber)
+        return subscribers
+
+    def _handle(self, event, synchronous=False):
+        """Process event handlers in workers when dispatcher is running.
+
+        Each handler receives own copy of event because handlers store
+        queried entities (of their session) to event data. Stopping of event
+        by handler is not supported in this mode.
+
+        Handlers of one event keep order by priority, e.g. synchronization
+        to avalon finishes before handlers which expect synchronized data.
+        Tasks of all handlers are added to dispatcher in order of events and
+        priority, each task waits until previous handler of the same event
+        finishes. Task waits only for task added earlier so workers can't
+        block each other.
+        """
+
+        if synchronous or self._dispatcher is None:
+            return super(ProcessEventHub, self)._handle(event, synchronous)
+
+        mongo_id = event["data"].get("_event_mongo_id")
+        subscribers = self._get_interested_subscribers(event)
+        if not subscribers:
+            if mongo_id is not None:
+                self._completed_events.put(mongo_id)
+            return []
+
+        remaining = {"count": len(subscribers)}
+        lock = threading.Lock()
+
+        def on_done(_success):
+            with lock:
+                remaining["count"] -= 1
+                finished = remaining["count"] == 0
+            if finished and mongo_id is not None:
+                self._completed_events.put(mongo_id)
+
+        previous_done = None
+        for subscriber in subscribers:
+            name = get_callback_name(subscriber.callback)
+            done = threading.Event()
+            self._dispatcher.dispatch_handler(
+                name,
+                functools.partial(
+                    self._process_subscriber,
+                    subscriber,
+                    copy.deepcopy(event),
+                    previous_done,
+                    done
+                ),
+                on_done
+            )
+            previous_done = done
+        return []
+
+    def _process_subscriber(
+        self, subscriber, event, previous_done=None, done=None
+    ):
+        # Wait for handler with lower priority processing the same event
+        if previous_done is not None:
+            previous_done.wait()
+        try:
+            self._call_subscriber(subscriber, event)
+        finally:
+            if done is not None:
+                done.set()
+
+    def _call_subscriber(self, subscriber, event):
+        response = subscriber.callback(event)
+        if response is not None:
+            try:
+                self.publish_reply(
+                    event, data=response, source=subscriber.metadata
+                )
+            except Exception:
+                self.logger.exception(L(
+                    "Error publishing response {0} from subscriber {1} "
+                    "for event {2}.", response, subscriber, event
+                ))
 
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
+    def _on_idle(self):
+        self.flush_acks()
+        self.run_housekeeping()
+        self._log_metrics()
+        if self.is_watching():
+            return
 
-                except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["OPENPYPE_MONGO"]))
-                    sys.exit(0)
-                # Additional special processing of events.
-                if event['topic'] == 'ftrack.meta.disconnected':
-                    break
+        if not self.load_events():
+            time.sleep(self.poll_interval)
 
-            if duration is not None:
-                if (time.time() - started) > duration:
-                    break
+    def add_ack(self, mongo_id):
+        """Mark event as processed, written to database in batches."""
 
-    def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
+        if self._first_ack_time is None:
+            self._first_ack_time = time.time()
+        self._pending_acks.append(mongo_id)
+        if (
+            len(self._pending_acks) >= self.ack_batch_size
+            or time.time() - self._first_ack_time >= self.ack_max_age
+        ):
+            self.flush_acks()
+
+    def flush_acks(self):
+        """Write pending processed events to database."""
+
+        if not self._pending_acks:
+            return
+
+        mongo_ids = self._pending_acks
+        self._pending_acks = []
+        self._first_ack_time = None
+        self.dbcon.update_many(
+            {"_id": {"$in": mongo_ids}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+
+    def run_housekeeping(self, force=False):
+        """Remove old processed events if TTL index is not available."""
+
+        if self._ttl_housekeeping and not force:
+            return
+
+        now = time.time()
+        if (
+            not force
+            and self._last_housekeeping is not None
+            and now - self._last_housekeeping < self.housekeeping_interval
+        ):
+            return
+
+        self._last_housekeeping = now
+        ago_date = datetime.datetime.utcnow() - datetime.timedelta(
+            seconds=self.processed_events_lifetime
+        )
         self.dbcon.delete_many({
             "pype_data.stored": {"$lte": ago_date},
             "pype_data.is_processed": True
         })
 
+    def _log_metrics(self):
+        if self._dispatcher is None:
+            return
+
+        now = time.time()
+        if now - self._last_metrics_log < self.metrics_log_interval:
+            return
+        self._last_metrics_log = now
+        self.pypelog.info("Event handlers metrics:\n{}".format(
+            self._dispatcher.format_metrics()
+        ))
+
+    def is_watching(self):
+        return (
+            self._watcher_thread is not None
+            and self._watcher_thread.is_alive()
+        )
+
+    def start_events_watcher(self):
+        """Start thread receiving stored events from change stream.
+
+        Returns:
+            bool: Watcher was started, polling is used otherwise.
+        """
+
+        if os.environ.get("OPENPYPE_FTRACK_EVENTS_POLLING") == "1":
+            return False
+
+        try:
+            stream = self._open_change_stream()
+        except pymongo.errors.PyMongoError:
+            self.pypelog.info(
+                "Change streams are not available, using polling of events."
+            )
+            return False
+
+        self._watcher_stop.clear()
+        self._watcher_thread = threading.Thread(
+            target=self._watch_events, args=(stream, )
+        )
+        self._watcher_thread.daemon = True
+        self._watcher_thread.start()
+        return True
+
+    def stop_events_watcher(self):
+        self._watcher_stop.set()
+        if self._watcher_thread is not None:
+            self._watcher_thread.join(5)
+            self._watcher_thread = None
+
+    def _open_change_stream(self, resume_token=None):
+        return self.dbcon.watch(
+            [{"$match": {"operationType": {"$in": ["insert", "replace"]}}}],
+            resume_after=resume_token,
+            max_await_time_ms=500
+        )
+
+    def _watch_events(self, stream):
+        resume_token = None
+        while not self._watcher_stop.is_set():
+            try:
+                if stream is None:
+                    stream = self._open_change_stream(resume_token)
+
+                while stream.alive and not self._watcher_stop.is_set():
+                    change = stream.try_next()
+                    if change is None:
+                        continue
+                    resume_token = stream.resume_token
+                    event_data = change.get("fullDocument")
+                    if (
+                        event_data
+                        and not event_data["pype_data"]["is_processed"]
+                    ):
+                        self._queue_event_data(event_data)
+
+            except pymongo.errors.OperationFailure:
+                # Stream can't be resumed, fallback to polling
+                self.pypelog.warning(
+                    "Change stream of events failed, using polling.",
+                    exc_info=True
+                )
+                return
+
+            except pymongo.errors.PyMongoError:
+                self.pypelog.warning(
+                    "Change stream of events disconnected, reconnecting.",
+                    exc_info=True
+                )
+                self._watcher_stop.wait(1)
+
+            finally:
+                if stream is not None:
+                    stream.close()
+                    stream = None
+
+    def _queue_event_data(self, event_data):
+        """Convert stored event data to event and add it to queue.
+
+        Returns:
+            bool: Event was added to queue.
+        """
+
+        # Same event can be received from change stream and from query
+        #   of not processed events, stored time changes when storer
+        #   stores the event again
+        key = (event_data["_id"], event_data["pype_data"]["stored"])
+        with self._recent_events_lock:
+            if key in self._recent_events:
+                return False
+            self._recent_events[key] = None
+            while len(self._recent_events) > self.recent_events_limit:
+                self._recent_events.popitem(last=False)
+
+        new_event_data = {
+            k: v for k, v in event_data.items()
+            if k not in ["_id", "pype_data"]
+        }
+        try:
+            event = ftrack_api.event.base.Event(**new_event_data)
+            event["data"]["_event_mongo_id"] = event_data["_id"]
+        except Exception:
+            self.logger.exception(L(
+                'Failed to convert payload into event: {0}',
+                event_data
+            ))
+            return False
+
+        self._event_queue.put(event)
+        return True
+
+    def load_events(self):
+        """Load not processed events sorted by stored date"""
+        # Processed events which are not written yet would be loaded again
+        self.flush_acks()
+
         not_processed_events = self.dbcon.find(
             {"pype_data.is_processed": False}
         ).sort(
@@ -200,21 +699,8 @@ class ProcessEventHub(SocketBaseEventHub):
 
         found = False
         for event_data in not_processed_events:
-            new_event_data = {
-                k: v for k, v in event_data.items()
-                if k not in ["_id", "pype_data"]
-            }
-            try:
-                event = ftrack_api.event.base.Event(**new_event_data)
-                event["data"]["_event_mongo_id"] = event_data["_id"]
-            except Exception:
-                self.logger.exception(L(
-                    'Failed to convert payload into event: {0}',
-                    event_data
-                ))
-                continue
-            found = True
-            self._event_queue.put(event)
+            if self._queue_event_data(event_data):
+                found = True
 
         return found
 
@@ -397,6 +883,35 @@ class CustomEventHubSession(ftrack_api.session.Session):
         )
 
 
+class WorkerSession(CustomEventHubSession):
+    """Session of event worker thread.
+
+    Event hub of processor session is passed with 'event_hub' keyword
+    argument and is used to publish events. The session never connects
+    or disconnects the event hub.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs["auto_connect_event_hub"] = False
+        super(WorkerSession, self).__init__(*args, **kwargs)
+
+    def _create_event_hub(self):
+        return self.kwargs["event_hub"]
+
+    def close(self):
+        """Close session without disconnecting of shared event hub."""
+
+        if self._closed:
+            return
+
+        self._closed = True
+        self.recorded_operations.clear()
+        self._local_cache.clear()
+        if self._request is not None:
+            self._request.close()
+            self._request = None
+
+
 class SocketSession(CustomEventHubSession):
     def _create_event_hub(self):
         self.sock = self.kwargs["sock"]
@@ -5,7 +5,9 @@ from .constants import (
     CUST_ATTR_TOOLS,
     CUST_ATTR_APPLICATIONS,
     CUST_ATTR_INTENT,
-    FPS_KEYS
+    FPS_KEYS,
+    FTRACK_EVENTS_LIFETIME,
+    TOPIC_STORER_STARTED,
 )
 from .settings import (
     get_ftrack_event_mongo_info
@@ -33,6 +35,8 @@ __all__ = (
     "CUST_ATTR_APPLICATIONS",
     "CUST_ATTR_INTENT",
     "FPS_KEYS",
+    "FTRACK_EVENTS_LIFETIME",
+    "TOPIC_STORER_STARTED",
 
     "get_ftrack_event_mongo_info",
 
@@ -1,12 +1,15 @@
+import os
 import re
 import json
 import collections
 import copy
 import numbers
+import datetime
 
 import six
 
 from openpype.client import (
+    OpenPypeMongoConnection,
     get_project,
     get_assets,
     get_archived_assets,
@@ -18,21 +21,36 @@ from openpype.client.operations import (
     CURRENT_ASSET_DOC_SCHEMA,
     CURRENT_PROJECT_SCHEMA,
     CURRENT_PROJECT_CONFIG_SCHEMA,
+    OperationsSession,
 )
 from openpype.settings import get_anatomy_settings
 from openpype.lib import ApplicationManager, Logger
 from openpype.pipeline import AvalonMongoDB, schema
 
-from .constants import CUST_ATTR_ID_KEY, FPS_KEYS
+from .constants import (
+    CUST_ATTR_ID_KEY,
+    FPS_KEYS,
+    FTRACK_EVENTS_LIFETIME,
+    TOPIC_STORER_STARTED,
+)
 from .custom_attributes import get_openpype_attr, query_custom_attributes
+from .settings import get_ftrack_event_mongo_info
 
 from bson.objectid import ObjectId
 from bson.errors import InvalidId
-from pymongo import UpdateOne, ReplaceOne
 import ftrack_api
 
 log = Logger.get_logger(__name__)
 
+SYNC_WATERMARK_KEY = "ftrackSyncWatermark"
+SYNC_WATERMARK_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+
+def is_incremental_sync_enabled():
+    """Synchronization actions sync only entities changed since last sync."""
+
+    return os.environ.get("OPENPYPE_FTRACK_INCREMENTAL_SYNC") == "1"
+
 
 class InvalidFpsValue(Exception):
     pass
@@ -403,6 +421,37 @@ class SyncEntitiesFactory:
         "select id, name, type_id, parent_id, link, description"
         " from TypedContext where project_id is \"{}\""
     )
+    # Queries used by incremental synchronization
+    entities_by_id_query = (
+        "select id, name, type_id, parent_id, link, description"
+        " from TypedContext where project_id is \"{}\" and id in ({})"
+    )
+    descendants_query = (
+        "select id, name, type_id, parent_id, link, description"
+        " from TypedContext where project_id is \"{}\""
+        " and ancestors any (id in ({}))"
+    )
+    entities_by_name_query = (
+        "select id, name, type_id, parent_id, link, description"
+        " from TypedContext where project_id is \"{}\""
+        " and object_type.is_leaf is false and name in ({})"
+    )
+    tasks_query = (
+        "select id, name, type_id, parent_id, link, description"
+        " from Task where project_id is \"{}\" and parent_id in ({})"
+    )
+    # Entities are received from server in pages of this size
+    entities_page_size = 1000
+    query_chunk_size = 200
+    # Processed events are removed from events collection after lifetime,
+    #   older synchronization can't rely on stored events
+    incremental_max_age = (
+        datetime.timedelta(seconds=FTRACK_EVENTS_LIFETIME)
+        - datetime.timedelta(days=1)
+    )
+    # Tolerance of time difference between event storer and this machine
+    watermark_overlap = datetime.timedelta(minutes=1)
+
     ignore_custom_attr_key = "avalon_ignore_sync"
     ignore_entity_types = ["milestone"]
 
@@ -414,19 +463,41 @@ class SyncEntitiesFactory:
         self._api_key = session.api_key
         self._api_user = session.api_user
 
-    def launch_setup(self, project_full_name):
-        try:
-            self.session.close()
-        except Exception:
-            pass
-
-        self.session = ftrack_api.Session(
+    def _create_session(self):
+        return ftrack_api.Session(
             server_url=self._server_url,
             api_key=self._api_key,
             api_user=self._api_user,
             auto_connect_event_hub=False
         )
 
+    def launch_setup(self, project_full_name, incremental=False):
+        """Query ftrack entities of project and prepare synchronization.
+
+        In incremental mode are queried only entities changed since last
+        successful synchronization (with their parents, children and
+        entities with the same name). Changes are collected from events
+        stored by event server. Full synchronization is used if project was
+        not synchronized yet, last synchronization is too old or project
+        entity itself was changed.
+
+        Args:
+            project_full_name (str): Full name of ftrack project.
+            incremental (bool): Synchronize only changed entities if
+                possible.
+        """
+
+        try:
+            self.session.close()
+        except Exception:
+            pass
+
+        self.session = self._create_session()
+        self.sync_started = datetime.datetime.utcnow()
+        self.incremental = False
+        self.incremental_ftrack_ids = set()
+        self.operations = OperationsSession()
+
         self.duplicates = {}
         self.failed_regex = {}
         self.tasks_failed_regex = collections.defaultdict(list)
@@ -534,16 +605,25 @@ class SyncEntitiesFactory:
             "tasks": {}
         })
 
-        # Find all entities in project
-        all_project_entities = self.session.query(
-            self.entities_query.format(ft_project_id)
-        ).all()
+        project_entities = None
+        if incremental:
+            project_entities = self.query_changed_entities(
+                ft_project_id, project_full_name
+            )
+
+        if project_entities is None:
+            # Find all entities in project
+            #   - iterate query result so entities are received in pages
+            project_entities = self.session.query(
+                self.entities_query.format(ft_project_id),
+                page_size=self.entities_page_size
+            )
         task_types = self.session.query("select id, name from Type").all()
         task_type_names_by_id = {
             task_type["id"]: task_type["name"]
             for task_type in task_types
         }
-        for entity in all_project_entities:
+        for entity in project_entities:
             parent_id = entity["parent_id"]
             entity_type = entity.entity_type
             entity_type_low = entity_type.lower()
@@ -579,6 +659,276 @@ class SyncEntitiesFactory:
         self.ft_project_id = ft_project_id
         self.entities_dict = entities_dict
 
+    def get_sync_watermark(self, project_name):
+        """Time of last successful synchronization of project.
+
+        Returns:
+            Union[datetime.datetime, None]: UTC time when last
+                synchronization started.
+        """
+
+        project_doc = get_project(
+            project_name,
+            fields=["data.{}".format(SYNC_WATERMARK_KEY)]
+        )
+        if not project_doc:
+            return None
+
+        value = project_doc.get("data", {}).get(SYNC_WATERMARK_KEY)
+        if not value:
+            return None
+        try:
+            return datetime.datetime.strptime(value, SYNC_WATERMARK_FORMAT)
+        except (TypeError, ValueError):
+            return None
+
+    def store_sync_watermark(self):
+        """Store start time of synchronization to avalon project."""
+
+        avalon_project_id = getattr(self, "avalon_project_id", None)
+        if not avalon_project_id:
+            return
+
+        self.operations.update_entity(
+            self.project_name,
+            "project",
+            avalon_project_id,
+            {
+                "data.{}".format(SYNC_WATERMARK_KEY): (
+                    self.sync_started.strftime(SYNC_WATERMARK_FORMAT)
+                )
+            }
+        )
+        self.operations.commit()
+
+    def _get_events_collection(self):
+        database_name, collection_name = get_ftrack_event_mongo_info()
+        mongo_client = OpenPypeMongoConnection.get_mongo_client()
+        return mongo_client[database_name][collection_name]
+
+    def are_changes_stored(self, since):
+        """Stored events contain all changes since passed time.
+
+        Event storer must be running whole time since passed time. Storer
+        stores event when it connects to ftrack server, so changes made
+        while storer (or event server) was not running are not stored if
+        there is such event after passed time. Events before passed time
+        must be stored too, otherwise events could be already removed.
+
+        Args:
+            since (datetime.datetime): UTC time from which are changes
+                needed.
+
+        Returns:
+            bool: All changes since passed time are stored.
+        """
+
+        collection = self._get_events_collection()
+        previous_event = collection.find_one(
+            {"pype_data.stored": {"$lte": since}},
+            {"_id": True}
+        )
+        if previous_event is None:
+            return False
+
+        restart_event = collection.find_one(
+            {
+                "topic": TOPIC_STORER_STARTED,
+                "pype_data.stored": {"$gt": since}
+            },
+            {"_id": True}
+        )
+        return restart_event is None
+
+    def get_changed_ftrack_ids(self, ft_project_id, since):
+        """Ids of ftrack entities changed since passed time.
+
+        Changes are collected from 'ftrack.update' events stored in mongo by
+        event server.
+
+        Args:
+            ft_project_id (str): Ftrack project id.
+            since (datetime.datetime): UTC time from which are changes
+                collected.
+
+        Returns:
+            Union[Tuple[Set[str], Set[str]], None]: Ids of changed entities
+                and ids of their parents. 'None' if project entity was
+                changed.
+        """
+
+        collection = self._get_events_collection()
+        events = collection.find(
+            {
+                "topic": "ftrack.update",
+                "pype_data.stored": {"$gt": since},
+                "$or": [
+                    {"data.entities.entityId": ft_project_id},
+                    {"data.entities.parents.entityId": ft_project_id}
+                ]
+            },
+            {"data.entities": True}
+        )
+
+        changed_ids = set()
+        parent_ids = set()
+        for event in events:
+            for ent_info in event.get("data", {}).get("entities") or []:
+                entity_type = ent_info.get("entityType")
+                if entity_type == "show":
+                    if ent_info.get("entityId") == ft_project_id:
+                        return None
+                    continue
+
+                # Other entity types (e.g. AssetVersion) are not synchronized
+                if entity_type != "task":
+                    continue
+
+                parents = ent_info.get("parents") or []
+                if not any(
+                    parent.get("entityId") == ft_project_id
+                    for parent in parents
+                ):
+                    continue
+
+                changed_ids.add(ent_info["entityId"])
+                for parent in parents:
+                    if parent.get("entityType") == "task":
+                        parent_ids.add(parent["entityId"])
+        return changed_ids, parent_ids
+
+    def _is_asset_entity(self, entity):
+        entity_type_low = entity.entity_type.lower()
+        return (
+            entity_type_low != "task"
+            and entity_type_low not in self.ignore_entity_types
+        )
+
+    def _query_entities_by_chunks(
+        self, query, ft_project_id, values, entities_by_id
+    ):
+        for chunk in create_chunks(values, self.query_chunk_size):
+            entities = self.session.query(
+                query.format(ft_project_id, join_query_keys(chunk)),
+                page_size=self.entities_page_size
+            )
+            for entity in entities:
+                entities_by_id[entity["id"]] = entity
+
+    def query_changed_entities(self, ft_project_id, project_name):
+        """Query ftrack entities affected by changes since last sync.
+
+        Queried are changed entities, their children (changes of name,
+        parent or hierarchical attributes affect them), entities with the
+        same names (to find duplicities), all parents and tasks of all
+        queried entities (tasks are stored on their parent).
+
+        Returns:
+            Union[List[ftrack_api.entity.base.Entity], None]: Entities to
+                synchronize or 'None' if full synchronization must happen.
+        """
+
+        watermark = self.get_sync_watermark(project_name)
+        if watermark is None:
+            self.log.info((
+                "Project \"{}\" was not synchronized yet."
+                " Running full synchronization."
+            ).format(project_name))
+            return None
+
+        if self.sync_started - watermark > self.incremental_max_age:
+            self.log.info((
+                "Last synchronization of project \"{}\" is older than {}."
+                " Running full synchronization."
+            ).format(project_name, self.incremental_max_age))
+            return None
+
+        since = watermark - self.watermark_overlap
+        if not self.are_changes_stored(since):
+            self.log.info((
+                "Changes of project \"{}\" since last synchronization are"
+                " not stored (event server was not running)."
+                " Running full synchronization."
+            ).format(project_name))
+            return None
+
+        changes = self.get_changed_ftrack_ids(ft_project_id, since)
+        if changes is None:
+            self.log.info((
+                "Project entity \"{}\" was changed."
+                " Running full synchronization."
+            ).format(project_name))
+            return None
+
+        changed_ids, parent_ids = changes
+        self.incremental = True
+        self.incremental_ftrack_ids = set(changed_ids)
+        self.log.debug((
+            "Incremental synchronization of {} changed entities since {}"
+        ).format(len(changed_ids), watermark))
+        if not changed_ids:
+            return []
+
+        entities_by_id = {}
+        self._query_entities_by_chunks(
+            self.entities_by_id_query,
+            ft_project_id,
+            changed_ids,
+            entities_by_id
+        )
+
+        asset_ids = [
+            entity_id
+            for entity_id, entity in entities_by_id.items()
+            if self._is_asset_entity(entity)
+        ]
+        self._query_entities_by_chunks(
+            self.descendants_query,
+            ft_project_id,
+            asset_ids,
+            entities_by_id
+        )
+        self.incremental_ftrack_ids |= set(entities_by_id.keys())
+
+        names = {
+            entity["name"]
+            for entity in entities_by_id.values()
+            if self._is_asset_entity(entity)
+        }
+        self._query_entities_by_chunks(
+            self.entities_by_name_query,
+            ft_project_id,
+            names,
+            entities_by_id
+        )
+
+        missing_parent_ids = set(parent_ids)
+        for entity in entities_by_id.values():
+            # First item is project and last is entity itself
+            for link in entity["link"][1:-1]:
+                missing_parent_ids.add(link["id"])
+        missing_parent_ids -= set(entities_by_id.keys())
+        missing_parent_ids.discard(ft_project_id)
+        self._query_entities_by_chunks(
+            self.entities_by_id_query,
+            ft_project_id,
+            missing_parent_ids,
+            entities_by_id
+        )
+
+        asset_ids = [
+            entity_id
+            for entity_id, entity in entities_by_id.items()
+            if self._is_asset_entity(entity)
+        ]
+        self._query_entities_by_chunks(
+            self.tasks_query,
+            ft_project_id,
+            asset_ids,
+            entities_by_id
+        )
+        return list(entities_by_id.values())
+
     @property
     def project_name(self):
         return self.entities_dict[self.ft_project_id]["name"]
@@ -737,7 +1087,14 @@ class SyncEntitiesFactory:
         """
         if self._subsets_by_parent_id is None:
             self._subsets_by_parent_id = collections.defaultdict(list)
-            for subset in get_subsets(self.project_name):
+            asset_ids = None
+            if self.incremental:
+                # Subsets of not queried assets would look like subsets
+                #   without parent asset
+                asset_ids = [
+                    entity["_id"] for entity in self.avalon_entities
+                ]
+            for subset in get_subsets(self.project_name, asset_ids=asset_ids):
                 self._subsets_by_parent_id[str(subset["parent"])].append(
                     subset
                 )
@@ -1429,7 +1786,10 @@ class SyncEntitiesFactory:
         self.dbcon.install()
         self.dbcon.Session["AVALON_PROJECT"] = ft_project_name
         avalon_project = get_project(ft_project_name)
-        avalon_entities = get_assets(ft_project_name)
+        if self.incremental:
+            avalon_entities = self._get_incremental_avalon_entities()
+        else:
+            avalon_entities = get_assets(ft_project_name)
         self.avalon_project = avalon_project
         self.avalon_entities = avalon_entities
 
@@ -1553,9 +1913,18 @@ class SyncEntitiesFactory:
         for mongo_id in self.avalon_ents_by_id:
             if mongo_id in avalon_ftrack_mapper:
                 continue
-            deleted_entities.append(mongo_id)
 
             av_ent = self.avalon_ents_by_id[mongo_id]
+            # Entities queried by name are not deleted in incremental mode
+            #   - only entities which were changed are known to be deleted
+            if (
+                self.incremental
+                and av_ent.get("data", {}).get("ftrackId")
+                not in self.incremental_ftrack_ids
+            ):
+                continue
+            deleted_entities.append(mongo_id)
+
             av_ent_path_items = list(av_ent["data"]["parents"])
             av_ent_path_items.append(av_ent["name"])
             self.log.debug("Deleted <{}>".format("/".join(av_ent_path_items)))
@@ -1575,6 +1944,44 @@ class SyncEntitiesFactory:
             len(deleted_entities)
         ))
 
+    def _get_incremental_avalon_entities(self):
+        """Avalon assets related to ftrack entities of incremental sync.
+
+        Assets are found by ftrack id, mongo id stored on ftrack entity and
+        by name, which are the ways how are ftrack entities matched to
+        assets.
+        """
+
+        ftrack_ids = set(self.incremental_ftrack_ids)
+        mongo_ids = set()
+        names = set()
+        for ftrack_id, entity_dict in self.entities_dict.items():
+            if ftrack_id == self.ft_project_id:
+                continue
+            ftrack_ids.add(ftrack_id)
+            if entity_dict["name"]:
+                names.add(entity_dict["name"])
+
+            mongo_id = entity_dict["avalon_attrs"].get(CUST_ATTR_ID_KEY)
+            if not mongo_id:
+                continue
+            try:
+                mongo_ids.add(ObjectId(mongo_id))
+            except InvalidId:
+                pass
+
+        if not ftrack_ids:
+            return []
+
+        filters = [
+            {"data.ftrackId": {"$in": list(ftrack_ids)}},
+            {"name": {"$in": list(names)}}
+        ]
+        if mongo_ids:
+            filters.append({"_id": {"$in": list(mongo_ids)}})
+
+        return list(self.dbcon.find({"type": "asset", "$or": filters}))
+
     def filter_with_children(self, ftrack_id):
         if ftrack_id not in self.entities_dict:
             return
@@ -1990,13 +2397,18 @@ class SyncEntitiesFactory:
 
         self.set_input_links()
 
-        unarchive_writes = []
         for item in self.unarchive_list:
             mongo_id = item["_id"]
-            unarchive_writes.append(ReplaceOne(
-                {"_id": mongo_id},
-                item
-            ))
+            self.operations.update_entity(
+                self.project_name,
+                "asset",
+                mongo_id,
+                {
+                    key: value
+                    for key, value in item.items()
+                    if key != "_id"
+                }
+            )
             av_ent_path_items = list(item["data"]["parents"])
             av_ent_path_items.append(item["name"])
             av_ent_path = "/".join(av_ent_path_items)
@@ -2005,11 +2417,13 @@ class SyncEntitiesFactory:
             )
             self.remove_from_archived(mongo_id)
 
-        if unarchive_writes:
-            self.dbcon.bulk_write(unarchive_writes)
+        for item in self.create_list:
+            self.operations.create_entity(
+                self.project_name, item["type"], item
+            )
 
-        if len(self.create_list) > 0:
-            self.dbcon.insert_many(self.create_list)
+        # Archivation, unarchivation and creation in one bulk write
+        self.operations.commit()
 
         self.session.commit()
 
@@ -2018,6 +2432,8 @@ class SyncEntitiesFactory:
         self.update_entities()
         self.session.commit()
 
+        self.store_sync_watermark()
+
     def create_avalon_entity(self, ftrack_id):
         if ftrack_id == self.ft_project_id:
             self.create_avalon_project()
@@ -2316,18 +2732,21 @@ class SyncEntitiesFactory:
         """
             Runs changes converted to "$set" queries in bulk.
         """
-        mongo_changes_bulk = []
         for mongo_id, changes in self.updates.items():
             mongo_id = ObjectId(mongo_id)
             is_project = mongo_id == self.avalon_project_id
             change_data = from_dict_to_set(changes, is_project)
+            if not change_data["$set"]:
+                continue
 
-            filter = {"_id": mongo_id}
-            mongo_changes_bulk.append(UpdateOne(filter, change_data))
-        if not mongo_changes_bulk:
-            # TODO LOG
-            return
-        self.dbcon.bulk_write(mongo_changes_bulk)
+            entity_type = "project" if is_project else "asset"
+            self.operations.update_entity(
+                self.project_name,
+                entity_type,
+                mongo_id,
+                change_data["$set"]
+            )
+        self.operations.commit()
 
     def reload_parents(self, hierarchy_changing_ids):
         parents_queue = collections.deque()
@@ -2597,8 +3016,14 @@ class SyncEntitiesFactory:
                 deleted_entity, ftrack_parent_id
             )
 
-        filter = {"_id": {"$in": delete_ids}, "type": "asset"}
-        self.dbcon.update_many(filter, {"$set": {"type": "archived_asset"}})
+        # Written with other changes in 'synchronize'
+        for mongo_id in delete_ids:
+            self.operations.update_entity(
+                self.project_name,
+                "asset",
+                mongo_id,
+                {"type": "archived_asset"}
+            )
 
     def create_ftrack_ent_from_avalon_ent(self, av_entity, parent_id):
         new_entity = None
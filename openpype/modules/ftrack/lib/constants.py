@@ -18,3 +18,9 @@ FPS_KEYS = {
     # For development purposes
     "fps_string"
 }
+
+# Processed events are removed from ftrack events collection after this
+#   time (in seconds)
+FTRACK_EVENTS_LIFETIME = 3 * 24 * 60 * 60
+# Topic of event stored when event storer connects to ftrack server
+TOPIC_STORER_STARTED = "openpype.storer.started"
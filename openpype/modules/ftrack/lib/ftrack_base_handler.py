@@ -149,7 +149,14 @@ class BaseHandler(object):
 
     @property
     def session(self):
-        '''Return current session.'''
+        '''Return current session.
+
+        Session of worker thread is used when handler is processed by event
+        server worker.
+        '''
+        worker_session = ftrack_server.lib.get_worker_session()
+        if worker_session is not None:
+            return worker_session
         return self._session
 
     def reset_session(self):
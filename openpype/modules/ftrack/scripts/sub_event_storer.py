@@ -15,7 +15,10 @@ from openpype_modules.ftrack.ftrack_server.lib import (
     TOPIC_STATUS_SERVER,
     TOPIC_STATUS_SERVER_RESULT
 )
-from openpype_modules.ftrack.lib import get_ftrack_event_mongo_info
+from openpype_modules.ftrack.lib import (
+    get_ftrack_event_mongo_info,
+    TOPIC_STORER_STARTED,
+)
 from openpype.lib import (
     Logger,
     get_openpype_version,
@@ -177,7 +180,9 @@ def register(session):
     '''Registers the event, subscribing the discover and launch topics.'''
     install_db()
     session.event_hub.subscribe("topic=*", launch)
-    session.event_hub.subscribe("topic=openpype.storer.started", trigger_sync)
+    session.event_hub.subscribe(
+        "topic={}".format(TOPIC_STORER_STARTED), trigger_sync
+    )
     session.event_hub.subscribe(
         "topic={}".format(TOPIC_STATUS_SERVER), send_status
     )
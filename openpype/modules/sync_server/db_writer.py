@@ -0,0 +1,161 @@
+import time
+import threading
+import collections
+
+from pymongo.errors import AutoReconnect
+
+from openpype.lib import Logger
+
+
+class SyncDbWriter(object):
+    """
+        Buffer of representation updates written as ordered bulk writes.
+
+        Sync server produces update for each processed file (result, error,
+        progress). Updates are accumulated per project and written when
+        count of updates reaches 'max_size' or when oldest update waits more
+        than 'max_age' seconds, so database load scales with batches, not
+        files. Writes are triggered by 'flush_if_due' or 'flush', adding of
+        update never writes to database.
+
+        Updates are only '$set'/'$unset' with values calculated on client
+        (e.g. 'tries') so whole batch can be written again on transient
+        errors.
+
+    Args:
+        get_collection (Callable[[str], Collection]): returns collection of
+            project
+        max_size (int): updates count which triggers write
+        max_age (float): seconds after which are updates written
+        retries (int): attempts to write batch on transient errors
+        retry_delay (float): seconds to wait before next attempt
+    """
+    log = Logger.get_logger("SyncDbWriter")
+
+    def __init__(self, get_collection, max_size=500, max_age=2.0,
+                 retries=3, retry_delay=0.5):
+        self._get_collection = get_collection
+        self.max_size = max_size
+        self.max_age = max_age
+        self.retries = retries
+        self.retry_delay = retry_delay
+
+        self._lock = threading.Lock()
+        # only one thread writes at a time to keep order of updates
+        self._flush_lock = threading.Lock()
+        self._operations = collections.OrderedDict()
+        self._count = 0
+        self._first_time = None
+
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+
+    @property
+    def pending(self):
+        return self._count
+
+    def add(self, project_name, operation):
+        """
+            Add update of project to buffer.
+
+            Update is only queued, batches are written by 'flush_if_due'
+            called periodically from other thread so caller running in event
+            loop is not blocked by database writes.
+
+        Args:
+            project_name (str): name of project
+            operation (UpdateOne): update of representation
+        """
+        with self._lock:
+            if project_name not in self._operations:
+                self._operations[project_name] = []
+            self._operations[project_name].append(operation)
+            self._count += 1
+            if self._first_time is None:
+                self._first_time = time.time()
+
+    def is_flush_due(self):
+        if not self._count:
+            return False
+        if self._count >= self.max_size:
+            return True
+        first_time = self._first_time
+        return (
+            first_time is not None
+            and time.time() - first_time >= self.max_age
+        )
+
+    def flush_if_due(self):
+        if self.is_flush_due():
+            self.flush()
+
+    def flush(self, project_name=None):
+        """
+            Write pending updates.
+
+        Args:
+            project_name (str): write only updates of project, all
+                updates are written if not passed
+        """
+        with self._flush_lock:
+            with self._lock:
+                if project_name is None:
+                    operations = self._operations
+                    self._operations = collections.OrderedDict()
+                else:
+                    operations = collections.OrderedDict()
+                    if project_name in self._operations:
+                        operations[project_name] = self._operations.pop(
+                            project_name
+                        )
+
+                self._count = sum(
+                    len(project_operations)
+                    for project_operations in self._operations.values()
+                )
+                if self._count:
+                    self._first_time = time.time()
+                else:
+                    self._first_time = None
+
+            for _project_name, project_operations in operations.items():
+                self._write(_project_name, project_operations)
+
+    def _write(self, project_name, operations):
+        for chunk_start in range(0, len(operations), self.max_size):
+            chunk = operations[chunk_start:chunk_start + self.max_size]
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    self._get_collection(project_name).bulk_write(
+                        chunk, ordered=True
+                    )
+                    self.written += len(chunk)
+                    self.batches += 1
+                    break
+
+                except AutoReconnect:
+                    if attempt >= self.retries:
+                        self.failed += len(chunk)
+                        self.log.warning((
+                            "Failed to write {} sync updates of {}"
+                        ).format(len(chunk), project_name), exc_info=True)
+                        break
+                    time.sleep(self.retry_delay * attempt)
+
+                except Exception:
+                    self.failed += len(chunk)
+                    self.log.warning((
+                        "Failed to write {} sync updates of {}"
+                    ).format(len(chunk), project_name), exc_info=True)
+                    break
+
+    def get_metrics(self):
+        return {
+            "pending": self._count,
+            "written": self.written,
+            "batches": self.batches,
+            "failed": self.failed
+        }
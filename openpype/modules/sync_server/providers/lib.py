@@ -13,7 +13,8 @@ class ProviderFactory:
     def __init__(self):
         self.providers = {}  # {'PROVIDER_LABEL: {cls, int},..}
 
-    def register_provider(self, provider, creator, batch_limit):
+    def register_provider(self, provider, creator, batch_limit,
+                          max_workers=3, rate_limit=None):
         """
             Provide all necessary information for one specific remote provider
         Args:
@@ -21,10 +22,16 @@ class ProviderFactory:
             creator (class): class implementing AbstractProvider
             batch_limit (int): number of files that could be processed in
                                     one loop (based on provider API quota)
+            max_workers (int): number of files synchronized in parallel
+                for one site of the provider
+            rate_limit (float): maximum number of started file transfers
+                per second for one site, 'None' means unlimited
         Returns:
             modifies self.providers and self.sites
         """
-        self.providers[provider] = (creator, batch_limit)
+        self.providers[provider] = (
+            creator, batch_limit, max_workers, rate_limit
+        )
 
     def get_provider(self, provider, project_name, site_name,
                      tree=None, presets=None):
@@ -67,6 +74,30 @@ class ProviderFactory:
         info = self._get_creator_info(provider)
         return info[1]
 
+    def get_provider_max_workers(self, provider):
+        """
+            Default number of files synchronized in parallel for one site
+            of 'provider'.
+        Args:
+            provider (string): 'gdrive','S3'
+        Returns:
+            (int)
+        """
+        info = self._get_creator_info(provider)
+        return info[2]
+
+    def get_provider_rate_limit(self, provider):
+        """
+            Default maximum of started file transfers per second for one
+            site of 'provider'.
+        Args:
+            provider (string): 'gdrive','S3'
+        Returns:
+            (float): or None if unlimited
+        """
+        info = self._get_creator_info(provider)
+        return info[3]
+
     def get_provider_configurable_items(self, provider):
         """
             Returns dict of modifiable properties for 'provider'.
@@ -88,17 +119,19 @@ class ProviderFactory:
 
     def _get_creator_info(self, provider):
         """
-            Collect all necessary info for provider. Currently only creator
-            class and batch limit.
+            Collect all necessary info for provider. Currently creator
+            class, batch limit, max workers and rate limit.
         Args:
             provider (string): 'gdrive' etc
         Returns:
-            (tuple): (creator, batch_limit)
+            (tuple): (creator, batch_limit, max_workers, rate_limit)
                 creator is class of a provider (ex: GDriveHandler)
                 batch_limit denotes how many files synced at single loop
                    its provided via 'register_provider' as its needed even
                    before provider class is initialized itself
                    (setting it as a class variable didn't work)
+                max_workers denotes how many files are synced in parallel
+                rate_limit denotes how many transfers can start per second
         """
         creator_info = self.providers.get(provider)
         if not creator_info:
@@ -112,7 +145,13 @@ factory = ProviderFactory()
 # there is implementing 'GDriveHandler' class
 # 7 denotes number of files that could be synced in single loop - learned by
 # trial and error
-factory.register_provider(GDriveHandler.CODE, GDriveHandler, 7)
+# gdrive has quota 1000 queries per 100 seconds, one file needs multiple
+# queries so transfers are also rate limited
+factory.register_provider(
+    GDriveHandler.CODE, GDriveHandler, 7, max_workers=2, rate_limit=2.0
+)
 factory.register_provider(DropboxHandler.CODE, DropboxHandler, 10)
-factory.register_provider(LocalDriveHandler.CODE, LocalDriveHandler, 50)
+factory.register_provider(
+    LocalDriveHandler.CODE, LocalDriveHandler, 50, max_workers=4
+)
 factory.register_provider(SFTPHandler.CODE, SFTPHandler, 20)
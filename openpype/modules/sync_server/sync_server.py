@@ -1,8 +1,12 @@
 """Python 3 only implementation."""
 import os
+import time
 import asyncio
+import functools
 import threading
+import collections
 import concurrent.futures
+from datetime import datetime
 from concurrent.futures._base import CancelledError
 
 from .providers import lib
@@ -10,9 +14,12 @@ from openpype.lib import Logger
 
 from .utils import SyncStatus, ResumableError
 
+# Maximum of work items waiting in queue of site worker pool
+DEFAULT_QUEUE_SIZE = 100
+
 
 async def upload(module, project_name, file, representation, provider_name,
-                 remote_site_name, tree=None, preset=None):
+                 remote_site_name, tree=None, preset=None, executor=None):
     """
         Upload single 'file' of a 'representation' to 'provider'.
         Source url is taken from 'file' portion, where {root} placeholder
@@ -36,6 +43,8 @@ async def upload(module, project_name, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        executor (ThreadPoolExecutor): executor of site worker pool, default
+            executor of loop is used if not passed
 
     """
     # create ids sequentially, upload file in parallel later
@@ -64,7 +73,7 @@ async def upload(module, project_name, file, representation, provider_name,
             raise NotADirectoryError(err)
 
     loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
+    file_id = await loop.run_in_executor(executor,
                                          remote_handler.upload_file,
                                          local_file_path,
                                          remote_file_path,
@@ -84,7 +93,7 @@ async def upload(module, project_name, file, representation, provider_name,
 
 
 async def download(module, project_name, file, representation, provider_name,
-                   remote_site_name, tree=None, preset=None):
+                   remote_site_name, tree=None, preset=None, executor=None):
     """
         Downloads file to local folder denoted in representation.Context.
 
@@ -98,6 +107,8 @@ async def download(module, project_name, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        executor (ThreadPoolExecutor): executor of site worker pool, default
+            executor of loop is used if not passed
 
         Returns:
         (string) - 'name' of local file
@@ -120,7 +131,7 @@ async def download(module, project_name, file, representation, provider_name,
     local_site = module.get_active_site(project_name)
 
     loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
+    file_id = await loop.run_in_executor(executor,
                                          remote_handler.download_file,
                                          remote_file_path,
                                          local_file_path,
@@ -189,10 +200,184 @@ def _site_is_working(module, project_name, site_name, site_config):
     return handler.is_active()
 
 
+class SyncRateLimiter:
+    """Limits number of transfers started per second.
+
+    Args:
+        rate (float): Allowed transfers per second, 'None' or 0 means
+            unlimited.
+    """
+    def __init__(self, rate):
+        self.rate = rate
+        self._next_time = 0.0
+
+    async def acquire(self):
+        if not self.rate:
+            return
+
+        # Limiter is used only from event loop thread, no lock is needed
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start_time = max(now, self._next_time)
+        self._next_time = start_time + (1.0 / self.rate)
+        delay = start_time - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class SyncWorkItem:
+    """Single file transfer waiting in queue of site worker pool."""
+    def __init__(self, sync_func, args, project_name, file, representation,
+                 processed_site, future):
+        self.sync_func = sync_func
+        self.args = args
+        self.project_name = project_name
+        self.file = file
+        self.representation = representation
+        self.processed_site = processed_site
+        self.future = future
+
+
+class SiteWorkerPool:
+    """
+        Workers synchronizing files with one remote site.
+
+        Work items are streamed through bounded queue, producers are waiting
+        when queue is full (back-pressure) so memory is not filled with work
+        items of big projects. Each pool has own executor so slow provider
+        does not block transfers of other sites.
+
+    Args:
+        module (SyncServerModule): object to run SyncServerModule API
+        provider (str): provider of the site ('gdrive', 'sftp'...)
+        site_name (str): name of remote site
+        max_workers (int): number of files transferred in parallel
+        rate_limit (float): maximum of transfers started per second
+        queue_size (int): maximum of work items waiting in queue
+    """
+    # Time window in seconds used to calculate throughput
+    throughput_window = 60
+
+    def __init__(self, module, provider, site_name, max_workers,
+                 rate_limit, queue_size):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self.module = module
+        self.provider = provider
+        self.site_name = site_name
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="SyncServer-{}".format(site_name)
+        )
+        self.limiter = SyncRateLimiter(rate_limit)
+
+        self.in_progress = 0
+        self.processed = 0
+        self.failed = 0
+        self._finished_times = collections.deque(maxlen=10000)
+
+        self._workers = [
+            asyncio.ensure_future(self._worker())
+            for _ in range(max_workers)
+        ]
+
+    async def put(self, work_item):
+        """Add work item to queue, waits if queue is full."""
+        await self.queue.put(work_item)
+
+    async def shutdown(self):
+        """Cancel workers and wait until running transfers finish.
+
+        Workers are cancelled in event loop thread, only waiting for
+        executor is done in other thread.
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.executor.shutdown, wait=True)
+        )
+
+    async def _worker(self):
+        while True:
+            work_item = await self.queue.get()
+            try:
+                await self._process(work_item)
+            finally:
+                self.queue.task_done()
+
+    async def _process(self, work_item):
+        await self.limiter.acquire()
+
+        file_id = None
+        error = None
+        self.in_progress += 1
+        try:
+            file_id = await work_item.sync_func(
+                *work_item.args, executor=self.executor
+            )
+        except CancelledError:
+            raise
+        except Exception as exc:
+            error = str(exc)
+        finally:
+            self.in_progress -= 1
+
+        try:
+            self.module.update_db(work_item.project_name,
+                                  file_id,
+                                  work_item.file,
+                                  work_item.representation,
+                                  work_item.processed_site,
+                                  error)
+        except Exception:
+            self.log.warning(
+                "Failed to store result of sync to database", exc_info=True
+            )
+
+        if error is None:
+            self.processed += 1
+        else:
+            self.failed += 1
+        self._finished_times.append(time.time())
+
+        if not work_item.future.done():
+            work_item.future.set_result(error is None)
+
+    def get_metrics(self):
+        """Metrics of pool, can be called from other threads."""
+        now = time.time()
+        finished_in_window = len([
+            finished_time
+            for finished_time in tuple(self._finished_times)
+            if now - finished_time <= self.throughput_window
+        ])
+        return {
+            "provider": self.provider,
+            "site": self.site_name,
+            "max_workers": self.max_workers,
+            "rate_limit": self.rate_limit,
+            "queue_depth": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "in_progress": self.in_progress,
+            "processed": self.processed,
+            "failed": self.failed,
+            # files per second
+            "throughput": finished_in_window / float(self.throughput_window)
+        }
+
+
 class SyncServerThread(threading.Thread):
     """
         Separate thread running synchronization server with asyncio loop.
         Stopped when tray is closed.
+
+        Each enabled project is synchronized by separate task so slow
+        project doesn't block others. Files are transferred by worker pools
+        of remote sites ('SiteWorkerPool').
     """
     def __init__(self, module):
         self.log = Logger.get_logger(self.__class__.__name__)
@@ -201,9 +386,20 @@ class SyncServerThread(threading.Thread):
         self.module = module
         self.loop = None
         self.is_running = False
+        # Default executor used for database queries and long running tasks
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
         self.timer = None
 
+        self.queue_size = int(
+            os.environ.get("OPENPYPE_SYNC_SERVER_QUEUE_SIZE")
+            or DEFAULT_QUEUE_SIZE
+        )
+        self._pools = {}
+        self._closing_pools = set()
+        self._project_tasks = {}
+        self._loop_count = 0
+        self._last_project_durations = {}
+
     def run(self):
         self.is_running = True
 
@@ -215,6 +411,7 @@ class SyncServerThread(threading.Thread):
 
             asyncio.ensure_future(self.check_shutdown(), loop=self.loop)
             asyncio.ensure_future(self.sync_loop(), loop=self.loop)
+            asyncio.ensure_future(self.flush_db_updates(), loop=self.loop)
             self.log.info("Sync Server Started")
             self.loop.run_forever()
         except Exception:
@@ -228,138 +425,39 @@ class SyncServerThread(threading.Thread):
         """
             Runs permanently, each time:
                 - gets list of collections in DB
-                - gets list of active remote providers (has configuration,
-                    credentials)
-                - for each project_name it looks for representations that
-                  should be synced
-                - synchronize found collections
-                - update representations - fills error messages for exceptions
+                - starts synchronization task for each enabled project which
+                  doesn't have running task from previous loop
                 - waits X seconds and repeat
         Returns:
 
         """
         while self.is_running and not self.module.is_paused():
             try:
-                import time
-                start_time = time.time()
-                self.module.set_sync_project_settings()  # clean cache
-                project_name = None
+                # clean cache of site and project settings
+                self.module.reset_sync_system_settings()
+                self.module.set_sync_project_settings()
+                self._invalidate_pools()
                 enabled_projects = self.module.get_enabled_projects()
                 for project_name in enabled_projects:
-                    preset = self.module.sync_project_settings[project_name]
-
-                    local_site, remote_site = self._working_sites(project_name,
-                                                                  preset)
-                    if not all([local_site, remote_site]):
+                    task = self._project_tasks.get(project_name)
+                    if task is not None and not task.done():
+                        self.log.debug(
+                            "Previous sync of {} is still running".format(
+                                project_name
+                            )
+                        )
                         continue
-
-                    sync_repres = self.module.get_sync_representations(
-                        project_name,
-                        local_site,
-                        remote_site
+                    self._project_tasks[project_name] = asyncio.ensure_future(
+                        self.sync_project(project_name)
                     )
 
-                    task_files_to_process = []
-                    files_processed_info = []
-                    # process only unique file paths in one batch
-                    # multiple representation could have same file path
-                    # (textures),
-                    # upload process can find already uploaded file and
-                    # reuse same id
-                    processed_file_path = set()
-
-                    site_preset = preset.get('sites')[remote_site]
-                    remote_provider = \
-                        self.module.get_provider_for_site(site=remote_site)
-                    handler = lib.factory.get_provider(remote_provider,
-                                                       project_name,
-                                                       remote_site,
-                                                       presets=site_preset)
-                    limit = lib.factory.get_provider_batch_limit(
-                        remote_provider)
-                    # first call to get_provider could be expensive, its
-                    # building folder tree structure in memory
-                    # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
-                    for sync in sync_repres:
-                        if limit <= 0:
-                            continue
-                        files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
-                                    file,
-                                    local_site,
-                                    remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-
-                    self.log.debug("Sync tasks count {}".format(
-                        len(task_files_to_process)
-                    ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
-
-                duration = time.time() - start_time
-                self.log.debug("One loop took {:.2f}s".format(duration))
-
-                delay = self.module.get_loop_delay(project_name)
+                for project_name in tuple(self._project_tasks.keys()):
+                    task = self._project_tasks[project_name]
+                    if task.done() and project_name not in enabled_projects:
+                        self._project_tasks.pop(project_name)
+
+                self._loop_count += 1
+                delay = self._get_loop_delay(enabled_projects)
                 self.log.debug(
                     "Waiting for {} seconds to new loop".format(delay)
                 )
@@ -383,6 +481,299 @@ class SyncServerThread(threading.Thread):
                     "Unhandled except. in sync loop, stopping server",
                     exc_info=True)
 
+    async def sync_project(self, project_name):
+        """
+            Synchronize files of single project.
+
+            Looks for representations that should be synced, streams files
+            to worker pool of remote site and waits until all of them are
+            processed. Worker pool updates representations in database.
+        """
+        try:
+            start_time = time.time()
+            files_count = await self._sync_project(project_name)
+            duration = time.time() - start_time
+            self._last_project_durations[project_name] = duration
+            self.log.debug("Sync of {} files of {} took {:.2f}s".format(
+                files_count, project_name, duration
+            ))
+
+        except ConnectionResetError:
+            self.log.warning(
+                "ConnectionResetError in sync of {}, trying next loop".format(
+                    project_name
+                ),
+                exc_info=True)
+        except CancelledError:
+            # just stopping server
+            pass
+        except ResumableError:
+            self.log.warning(
+                "ResumableError in sync of {}, trying next loop".format(
+                    project_name
+                ),
+                exc_info=True)
+        except Exception:
+            self.stop()
+            self.log.warning(
+                "Unhandled except. in sync of {}, stopping server".format(
+                    project_name
+                ),
+                exc_info=True)
+
+    async def _sync_project(self, project_name):
+        preset = self.module.sync_project_settings[project_name]
+
+        loop = asyncio.get_running_loop()
+        local_site, remote_site = await loop.run_in_executor(
+            None, self._working_sites, project_name, preset
+        )
+        if not all([local_site, remote_site]):
+            return 0
+
+        scan_start = datetime.utcnow()
+        since = self.module.get_sync_scan_since(
+            project_name, local_site, remote_site
+        )
+        pending_ids = None
+        if since is not None:
+            pending_ids = self.module.get_sync_scan_pending(
+                project_name, local_site, remote_site
+            )
+        sync_repres = await loop.run_in_executor(
+            None, self._get_sync_representations,
+            project_name, local_site, remote_site, since, pending_ids
+        )
+
+        site_preset = preset.get('sites')[remote_site]
+        remote_provider = \
+            self.module.get_provider_for_site(site=remote_site)
+        pool = self._get_pool(remote_site, remote_provider)
+        # provider may connect to remote service on initialization
+        handler = await loop.run_in_executor(
+            None,
+            functools.partial(
+                lib.factory.get_provider,
+                remote_provider,
+                project_name,
+                remote_site,
+                presets=site_preset
+            )
+        )
+        limit = lib.factory.get_provider_batch_limit(remote_provider)
+
+        # process only unique file paths in one batch
+        # multiple representation could have same file path (textures),
+        # upload process can find already uploaded file and reuse same id
+        processed_file_path = set()
+        # representations not processed in this scan (over limit or with
+        #   duplicated path) are scanned again by next incremental scan
+        skipped_ids = set()
+        futures = []
+        tree = None
+        tree_loaded = False
+        for sync in sync_repres:
+            if limit <= 0:
+                skipped_ids.add(sync["_id"])
+                continue
+            for file in sync.get("files") or []:
+                # skip already processed files
+                file_path = file.get('path', '')
+                if file_path in processed_file_path:
+                    skipped_ids.add(sync["_id"])
+                    continue
+                status = self.module.check_status(
+                    file,
+                    local_site,
+                    remote_site,
+                    preset.get('config'))
+                if status == SyncStatus.DO_UPLOAD:
+                    sync_func = upload
+                    processed_site = remote_site
+                elif status == SyncStatus.DO_DOWNLOAD:
+                    sync_func = download
+                    processed_site = local_site
+                else:
+                    continue
+
+                # first call to get_tree could be expensive, its
+                # building folder tree structure in memory
+                # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+                # - it may call remote API so it does not run in loop thread
+                if not tree_loaded:
+                    tree = await loop.run_in_executor(None, handler.get_tree)
+                    tree_loaded = True
+                limit -= 1
+                future = loop.create_future()
+                await pool.put(SyncWorkItem(
+                    sync_func,
+                    (self.module,
+                     project_name,
+                     file,
+                     sync,
+                     remote_provider,
+                     remote_site,
+                     tree,
+                     site_preset),
+                    project_name,
+                    file,
+                    sync,
+                    processed_site,
+                    future
+                ))
+                futures.append(future)
+                processed_file_path.add(file_path)
+
+        self.log.debug("Sync tasks count {}".format(len(futures)))
+        if futures:
+            await asyncio.gather(*futures)
+            # next scan must see results of this one
+            await loop.run_in_executor(
+                None, self.module.flush_db_updates, project_name
+            )
+
+        self.module.set_sync_scan_finished(
+            project_name, local_site, remote_site, scan_start, since,
+            skipped_ids
+        )
+        return len(futures)
+
+    def _get_sync_representations(self, project_name, local_site,
+                                  remote_site, since, pending_ids):
+        return list(self.module.get_sync_representations(
+            project_name,
+            local_site,
+            remote_site,
+            since,
+            pending_ids
+        ))
+
+    def _get_pool_config(self, site_name, provider):
+        """
+            Provider, number of workers and rate limit of site pool.
+
+            Values are taken from system settings of site ('max_workers',
+            'rate_limit'), defaults of provider are used if not set.
+        """
+        site_config = (
+            self.module.sync_system_settings.get("sites", {})
+            .get(site_name)
+        ) or {}
+        max_workers = (
+            site_config.get("max_workers")
+            or lib.factory.get_provider_max_workers(provider)
+        )
+        rate_limit = (
+            site_config.get("rate_limit")
+            or lib.factory.get_provider_rate_limit(provider)
+        )
+        return provider, int(max_workers), rate_limit
+
+    def _get_pool(self, site_name, provider):
+        """
+            Worker pool of remote site.
+
+            Pool is created on first use and kept until server stops or
+            until configuration of the site changes.
+        """
+        pool = self._pools.get(site_name)
+        if pool is not None:
+            return pool
+
+        provider, max_workers, rate_limit = self._get_pool_config(
+            site_name, provider
+        )
+        pool = SiteWorkerPool(
+            self.module,
+            provider,
+            site_name,
+            max_workers,
+            rate_limit,
+            self.queue_size
+        )
+        self._pools[site_name] = pool
+        return pool
+
+    def _invalidate_pools(self):
+        """
+            Close pools of sites which configuration changed.
+
+            Called when settings are reloaded. Pool is closed after already
+            queued files are processed, new pool is created on next use.
+        """
+        for site_name, pool in tuple(self._pools.items()):
+            provider = self.module.get_provider_for_site(site=site_name)
+            config = self._get_pool_config(site_name, provider)
+            if config == (pool.provider, pool.max_workers, pool.rate_limit):
+                continue
+            self.log.debug(
+                "Configuration of site {} changed, closing pool".format(
+                    site_name
+                )
+            )
+            self._pools.pop(site_name)
+            self._closing_pools.add(pool)
+            asyncio.ensure_future(self._close_pool(pool))
+
+    async def _close_pool(self, pool):
+        await pool.queue.join()
+        self._closing_pools.discard(pool)
+        await pool.shutdown()
+
+    def _get_loop_delay(self, project_names):
+        delays = [
+            self.module.get_loop_delay(project_name)
+            for project_name in project_names
+        ]
+        if not delays:
+            return self.module.get_loop_delay(None)
+        return min(delays)
+
+    async def flush_db_updates(self):
+        """Write buffered database updates when size or time threshold is
+        reached.
+
+        Writes run in executor, updates are only queued by workers in loop.
+        """
+        loop = asyncio.get_running_loop()
+        while self.is_running:
+            db_writer = self.module.db_writer
+            if db_writer is not None and db_writer.is_flush_due():
+                try:
+                    await loop.run_in_executor(None, db_writer.flush_if_due)
+                except Exception:
+                    self.log.warning(
+                        "Failed to write sync updates", exc_info=True
+                    )
+            await asyncio.sleep(0.5)
+
+    def get_metrics(self):
+        """
+            Metrics of synchronization, can be called from other threads.
+
+        Returns:
+            (dict): state of projects and worker pools of sites
+        """
+        project_tasks = tuple(self._project_tasks.items())
+        return {
+            "is_running": self.is_running,
+            "loop_count": self._loop_count,
+            "projects_in_progress": sorted(
+                project_name
+                for project_name, task in project_tasks
+                if not task.done()
+            ),
+            "last_project_durations": dict(self._last_project_durations),
+            "db_updates": (
+                self.module.db_writer.get_metrics()
+                if self.module.db_writer is not None else {}
+            ),
+            "sites": {
+                site_name: pool.get_metrics()
+                for site_name, pool in tuple(self._pools.items())
+            }
+        }
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
@@ -407,6 +798,9 @@ class SyncServerThread(threading.Thread):
             f'Finished awaiting cancelled tasks, results: {results}...')
         await self.loop.shutdown_asyncgens()
         # to really make sure everything else has time to stop
+        for pool in tuple(self._pools.values()) + tuple(self._closing_pools):
+            await pool.shutdown()
+        self.module.flush_db_updates()
         self.executor.shutdown(wait=True)
         await asyncio.sleep(0.07)
         self.loop.stop()
@@ -1,7 +1,7 @@
 import os
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 import threading
 import copy
 import signal
@@ -9,6 +9,7 @@ from collections import deque, defaultdict
 
 import click
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from openpype.client import (
     get_projects,
@@ -21,6 +22,7 @@ from openpype.settings import (
     get_system_settings,
 )
 from openpype.lib import Logger, get_local_site_id
+from openpype.lib.file_hashing import get_file_hasher
 from openpype.pipeline import AvalonMongoDB, Anatomy
 from openpype.settings.lib import (
     get_default_anatomy_settings,
@@ -103,6 +105,17 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
     LOCAL_SITE = 'local'
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
+    # incremental scan of representations, only representations with sites
+    # changed since previous scan are queried
+    INCREMENTAL_SCAN = (
+        os.environ.get("OPENPYPE_SYNC_SERVER_INCREMENTAL") == "1"
+    )
+    # seconds subtracted from high-water mark to cover clock differences
+    INCREMENTAL_OVERLAP_SEC = 60
+    # how often is full scan done even in incremental mode
+    FULL_SCAN_INTERVAL_SEC = int(
+        os.environ.get("OPENPYPE_SYNC_SERVER_FULL_SCAN_INTERVAL") or 900
+    )
 
     name = "sync_server"
     label = "Sync Queue"
@@ -123,6 +136,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         # settings for all enabled projects for sync
         self._sync_project_settings = None
         self.sync_server_thread = None  # asyncio requires new thread
+        # buffer of database updates used when server is running
+        self.db_writer = None
 
         self.action_show_widget = None
         self._paused = False
@@ -135,6 +150,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         self.long_running_tasks = deque()
         # projects that long tasks are running on
         self.projects_processed = set()
+        # high-water marks of incremental scans by (project, local, remote)
+        self._scan_states = {}
 
     """ Start of Public API """
     def add_site(self, project_name, representation_id, site_name=None,
@@ -229,7 +246,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             """Create sync site metadata for site with `name`"""
             metadata = {"name": name}
             if created:
-                metadata["created_dt"] = datetime.now()
+                metadata["created_dt"] = datetime.utcnow()
             return metadata
 
         if (
@@ -415,8 +432,10 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         sites_added = 0
         sites_reset = 0
+        hasher = get_file_hasher()
         for repre in representations:
             repre_id = repre["_id"]
+            files_to_add = []
             for repre_file in repre.get("files", []):
                 try:
                     is_on_site = site_name in [site["name"]
@@ -436,19 +455,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                                os.path.exists(local_file_path))
                 if not is_on_site:
                     if file_exists:
-                        self.log.debug(
-                            "Adding site {} for {}".format(site_name,
-                                                           repre_id))
-
-                        created_dt = datetime.fromtimestamp(
-                            os.path.getmtime(local_file_path))
-                        elem = {"name": site_name,
-                                "created_dt": created_dt}
-                        self._add_site(project_name, repre, elem,
-                                       site_name=site_name,
-                                       file_id=repre_file["_id"],
-                                       force=True)
-                        sites_added += 1
+                        files_to_add.append((repre_file, local_file_path))
                 else:
                     if not file_exists and reset_missing:
                         self.log.debug("Resetting site {} for {}".
@@ -458,6 +465,47 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                             file_id=repre_file["_id"])
                         sites_reset += 1
 
+            # Files with stored checksum are added only if content matches
+            checksum_paths = [
+                local_file_path
+                for repre_file, local_file_path in files_to_add
+                if repre_file.get("checksum")
+            ]
+            hash_infos = {}
+            if checksum_paths:
+                try:
+                    hash_infos = hasher.hash_files(checksum_paths)
+                except OSError:
+                    self.log.warning(
+                        "Failed to hash files of {}".format(repre_id),
+                        exc_info=True
+                    )
+
+            for repre_file, local_file_path in files_to_add:
+                checksum = repre_file.get("checksum")
+                if checksum:
+                    hash_info = hash_infos.get(local_file_path)
+                    if not hash_info or hash_info["hash"] != checksum:
+                        self.log.warning(
+                            "Content of {} doesn't match checksum".format(
+                                local_file_path)
+                        )
+                        continue
+
+                self.log.debug(
+                    "Adding site {} for {}".format(site_name, repre_id))
+
+                created_dt = datetime.utcfromtimestamp(
+                    os.path.getmtime(local_file_path))
+                elem = {"name": site_name,
+                        "created_dt": created_dt,
+                        "modified_dt": datetime.utcnow()}
+                self._add_site(project_name, repre, elem,
+                               site_name=site_name,
+                               file_id=repre_file["_id"],
+                               force=True)
+                sites_added += 1
+
         if sites_added % 100 == 0:
             self.log.debug("Sites added {}".format(sites_added))
 
@@ -1044,6 +1092,20 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         else:
             self.sync_server_thread.reset_timer()
 
+    def get_sync_metrics(self):
+        """
+            Metrics of running synchronization.
+
+            Contains queue depth, workers and throughput of worker pool of
+            each remote site and projects which are being synchronized.
+
+        Returns:
+            (dict): empty if server is not running in this process
+        """
+        if not self.enabled or self.sync_server_thread is None:
+            return {}
+        return self.sync_server_thread.get_metrics()
+
     def is_representation_on_site(
         self, project_name, representation_id, site_name
     ):
@@ -1160,7 +1222,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         for alt_site in alternate_sites:
             elem = {"name": alt_site,
-                    "created_dt": datetime.now(),
+                    "created_dt": datetime.utcnow(),
                     "id": synced_file_id}
 
             self.log.debug("Adding alternate {} to {}".format(
@@ -1307,9 +1369,14 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             return
 
         from .sync_server import SyncServerThread
+        from .db_writer import SyncDbWriter
 
         self.lock = threading.Lock()
 
+        self.db_writer = SyncDbWriter(
+            lambda project_name: self.connection.database[project_name]
+        )
+
         self.sync_server_thread = SyncServerThread(self)
 
     def tray_start(self):
@@ -1401,6 +1468,10 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         return self._sync_system_settings
 
+    def reset_sync_system_settings(self):
+        """Reload system settings of sites on next access."""
+        self._sync_system_settings = None
+
     @property
     def sync_project_settings(self):
         if self._sync_project_settings is None:
@@ -1576,7 +1647,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         return sites.get(site, 'N/A')
 
     @time_function
-    def get_sync_representations(self, project_name, active_site, remote_site):
+    def get_sync_representations(self, project_name, active_site, remote_site,
+                                 since=None, pending_ids=None):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1592,14 +1664,52 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            since (datetime): query only representations with sites changed
+                after this time (UTC), all representations are queried if
+                None
+            pending_ids (list): ids of representations queried even if
+                their sites did not change since 'since'
 
         Returns:
             (list) of dictionaries
         """
         self.log.debug("Check representations for : {}".format(project_name))
-        self.connection.Session["AVALON_PROJECT"] = project_name
         # retry_cnt - number of attempts to sync specific file before giving up
         retries_arr = self._get_retries_arr(project_name)
+        aggr = self.get_sync_representations_pipeline(
+            active_site, remote_site, retries_arr, since, pending_ids
+        )
+        self.log.debug("active_site:{} - remote_site:{}".format(
+            active_site, remote_site
+        ))
+        self.log.debug("query: {}".format(aggr))
+        # Use project collection directly, projects are processed
+        #   concurrently so 'Session' of connection can't be changed
+        representations = self.connection.database[project_name].aggregate(
+            aggr
+        )
+
+        return representations
+
+    @classmethod
+    def get_sync_representations_pipeline(cls, active_site, remote_site,
+                                          retries_arr, since=None,
+                                          pending_ids=None):
+        """
+            Aggregation pipeline used by 'get_sync_representations'.
+
+        Args:
+            active_site (string): identifier of current active site
+            remote_site (string): identifier of remote site
+            retries_arr (list): allowed values of 'tries' on sites
+            since (datetime): match only representations with sites changed
+                after this time (UTC)
+            pending_ids (list): ids of representations matched even if
+                their sites did not change
+
+        Returns:
+            (list) of aggregation stages
+        """
         match = {
             "type": "representation",
             "$or": [
@@ -1640,8 +1750,18 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                 ]}
             ]
         }
+        if since is not None:
+            # site is changed when synced, failed or reset (new skeleton)
+            changed_filters = [
+                {"files.sites.created_dt": {"$gte": since}},
+                {"files.sites.last_failed_dt": {"$gte": since}},
+                {"files.sites.modified_dt": {"$gte": since}},
+            ]
+            if pending_ids:
+                changed_filters.append({"_id": {"$in": list(pending_ids)}})
+            match["$and"] = [{"$or": changed_filters}]
 
-        aggr = [
+        return [
             {"$match": match},
             {'$unwind': '$files'},
             {'$addFields': {
@@ -1662,7 +1782,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                         {'$cond': [
                             {'$size': '$order_remote.priority'},
                             {'$first': '$order_remote.priority'},
-                            self.DEFAULT_PRIORITY]}
+                            cls.DEFAULT_PRIORITY]}
                     ]
                 },
             }},
@@ -1677,13 +1797,84 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             }},
             {"$sort": {'priority': -1, '_id': 1}},
         ]
-        self.log.debug("active_site:{} - remote_site:{}".format(
-            active_site, remote_site
-        ))
-        self.log.debug("query: {}".format(aggr))
-        representations = self.connection.aggregate(aggr)
 
-        return representations
+    def get_sync_scan_since(self, project_name, active_site, remote_site):
+        """
+            Time from which should be representations scanned.
+
+            Returns None (full scan) if incremental scan is disabled, there
+            was no previous scan or full scan should be done to reconcile
+            changes made without sites timestamps (e.g. by older versions).
+
+        Args:
+            project_name (string):
+            active_site (string): identifier of current active site
+            remote_site (string): identifier of remote site
+
+        Returns:
+            (datetime) or None
+        """
+        if not self.INCREMENTAL_SCAN:
+            return None
+
+        state = self._scan_states.get(
+            (project_name, active_site, remote_site)
+        )
+        if not state:
+            return None
+
+        last_full_scan, high_water_mark, _ = state
+        full_scan_delta = datetime.utcnow() - last_full_scan
+        if full_scan_delta.total_seconds() > self.FULL_SCAN_INTERVAL_SEC:
+            return None
+        return high_water_mark - timedelta(
+            seconds=self.INCREMENTAL_OVERLAP_SEC
+        )
+
+    def get_sync_scan_pending(self, project_name, active_site, remote_site):
+        """
+            Representations skipped by previous scan.
+
+            Skipped representations (e.g. over batch limit of provider) are
+            queried by next incremental scan even if their sites didn't
+            change.
+
+        Args:
+            project_name (string):
+            active_site (string): identifier of current active site
+            remote_site (string): identifier of remote site
+
+        Returns:
+            (list) of representation ids
+        """
+        state = self._scan_states.get(
+            (project_name, active_site, remote_site)
+        )
+        if not state:
+            return []
+        return list(state[2])
+
+    def set_sync_scan_finished(self, project_name, active_site, remote_site,
+                               scan_start, since=None, skipped_ids=None):
+        """
+            Store high-water mark after scanned files were processed.
+
+        Args:
+            project_name (string):
+            active_site (string): identifier of current active site
+            remote_site (string): identifier of remote site
+            scan_start (datetime): UTC time when scan started
+            since (datetime): value used for scan, None for full scan
+            skipped_ids (Iterable[ObjectId]): ids of representations which
+                were not processed and must be scanned again
+        """
+        key = (project_name, active_site, remote_site)
+        last_full_scan = scan_start
+        if since is not None and key in self._scan_states:
+            last_full_scan = self._scan_states[key][0]
+        self._scan_states[key] = (
+            last_full_scan, scan_start, set(skipped_ids or [])
+        )
 
     def check_status(self, file, local_site, remote_site, config_preset):
         """
@@ -1747,6 +1938,10 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             Update 'provider' portion of records in DB with success (file_id)
             or error (exception)
 
+            Results and progress are buffered and written in batches when
+            server is running in this process ('flush_db_updates' writes
+            them immediately). Priority changed by user is written directly.
+
         Args:
             project_name (string): name of project - force to db connection as
               each file might come from different collection
@@ -1791,12 +1986,23 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
+        if self.db_writer is not None and priority is None:
+            self.db_writer.add(
+                project_name,
+                UpdateOne(
+                    query,
+                    update,
+                    upsert=True,
+                    array_filters=arr_filter
+                )
+            )
+        else:
+            self.connection.database[project_name].update_one(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            )
 
         if progress is not None or priority is not None:
             return
@@ -1819,6 +2025,16 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             )
         )
 
+    def flush_db_updates(self, project_name=None):
+        """
+            Write buffered results of synchronization to database.
+
+        Args:
+            project_name (string): write only updates of project
+        """
+        if self.db_writer is not None:
+            self.db_writer.flush(project_name)
+
     def _get_file_info(self, files, _id):
         """
             Return record from list of records which name matches to 'provider'
@@ -1911,7 +2127,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             else:
                 site_name = remote_site
 
-        elem = {"name": site_name}
+        elem = {"name": site_name, "modified_dt": datetime.utcnow()}
 
         # Add priority
         if priority:
@@ -2032,6 +2248,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         else:
             if site.get('paused'):
                 site.pop('paused')
+        site["modified_dt"] = datetime.utcnow()
 
         update = {
             "$set": {"files.$[].sites.$[s]": site}
@@ -2204,7 +2421,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             (dictionary)
         """
         val = {"files.$[f].sites.$[s].id": new_file_id,
-               "files.$[f].sites.$[s].created_dt": datetime.now()}
+               "files.$[f].sites.$[s].created_dt": datetime.utcnow()}
         return val
 
     def _get_error_dict(self, error="", tries="", progress=""):
@@ -2217,7 +2434,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         Returns:
             (dictionary)
         """
-        val = {"files.$[f].sites.$[s].last_failed_dt": datetime.now(),
+        val = {"files.$[f].sites.$[s].last_failed_dt": datetime.utcnow(),
                "files.$[f].sites.$[s].error": error,
                "files.$[f].sites.$[s].tries": tries,
                "files.$[f].sites.$[s].progress": progress
@@ -2270,10 +2487,13 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             (dictionary)
         """
         if file_id:
-            str_key = "files.$[f].sites.$[s].priority"
+            str_key = "files.$[f].sites.$[s].{}"
         else:
-            str_key = "files.$[].sites.$[s].priority"
-        return {str_key: int(priority)}
+            str_key = "files.$[].sites.$[s].{}"
+        return {
+            str_key.format("priority"): int(priority),
+            str_key.format("modified_dt"): datetime.utcnow()
+        }
 
     def _get_retries_arr(self, project_name):
         """
@@ -417,13 +417,18 @@ class _SyncRepresentationModel(QtCore.QAbstractTableModel):
         """Converts 'date_value' to string.
 
         Value of date_value might contain date in the future, used for nicely
-        sort queued items next to last downloaded.
+        sort queued items next to last downloaded. Dates are stored in UTC,
+        output is in local time.
         """
         try:
             converted_date = None
             # ignore date in the future - for sorting only
             if date_value and date_value < current_date:
-                converted_date = date_value.strftime("%Y%m%dT%H%M%SZ")
+                local_date = (
+                    date_value.replace(tzinfo=datetime.timezone.utc)
+                    .astimezone()
+                )
+                converted_date = local_date.strftime("%Y%m%dT%H%M%SZ")
         except (AttributeError, TypeError):
             # ignore unparseable values
             pass
@@ -577,7 +582,7 @@ class SyncRepresentationSummaryModel(_SyncRepresentationModel):
         remote_provider = lib.translate_provider_for_icon(self.sync_server,
                                                           self.project,
                                                           remote_site)
-        current_date = datetime.datetime.now()
+        current_date = datetime.datetime.utcnow()
         for repre in result.get("paginatedResults"):
             files = repre.get("files", [])
             if isinstance(files, dict):  # aggregate returns dictionary
@@ -1053,7 +1058,7 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
                                                           self.project,
                                                           remote_site)
 
-        current_date = datetime.datetime.now()
+        current_date = datetime.datetime.utcnow()
         for repre in result.get("paginatedResults"):
             # log.info("!!! repre:: {}".format(repre))
             files = repre.get("files", [])
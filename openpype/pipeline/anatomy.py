@@ -18,7 +18,9 @@ from openpype.settings.constants import (
 from openpype.client import get_project
 from openpype.lib.path_templates import (
     TemplateUnsolved,
+    TemplateMissingKey,
     TemplateResult,
+    StringTemplate,
     TemplatesDict,
     FormatObject,
 )
@@ -117,6 +119,10 @@ class BaseAnatomy(object):
         """Wrap `format_all` method of Anatomy's `templates_obj`."""
         return self._templates_obj.format_all(*args, **kwargs)
 
+    def format_many(self, *args, **kwargs):
+        """Wrap `format_many` method of Anatomy's `templates_obj`."""
+        return self._templates_obj.format_many(*args, **kwargs)
+
     @property
     def roots(self):
         """Wrap `roots` property of Anatomy's `roots_obj`."""
@@ -969,6 +975,55 @@ class AnatomyTemplates(TemplatesDict):
         """
         return self.format(in_data, strict=False)
 
+    def format_many(self, template_keys, data_list, strict=True):
+        """Fill single template with each item of passed data.
+
+        Only the requested template is filled and data are not deep copied
+        which is much faster than calling 'format' for each item when the
+        same template is filled many times (e.g. for each frame).
+
+        Args:
+            template_keys (Iterable[str]): Keys leading to template
+                e.g. '["publish", "path"]'.
+            data_list (Iterable[dict]): Data used to fill the template.
+            strict (bool): Raise exception if a template is not solved.
+
+        Returns:
+            List[AnatomyTemplateResult]: Results in order of passed data.
+
+        Raises:
+            TemplateMissingKey: Template under passed keys does not exist.
+            AnatomyTemplateUnsolved: Template was not solved and 'strict'
+                is enabled.
+        """
+
+        template_keys = list(template_keys)
+        template = self.objected_templates
+        for idx, key in enumerate(template_keys):
+            if not isinstance(template, dict) or key not in template:
+                raise TemplateMissingKey(template_keys[:idx + 1])
+            template = template[key]
+
+        if not isinstance(template, StringTemplate):
+            raise TypeError("Keys {} do not lead to template.".format(
+                str(template_keys)
+            ))
+
+        roots = self.roots
+        output = []
+        for data in data_list:
+            fill_data = dict(data)
+            if roots:
+                fill_data["root"] = roots
+            result = template.format(fill_data)
+            result = AnatomyTemplateResult(
+                result, self._rootless_path(result, fill_data)
+            )
+            if strict:
+                result.validate()
+            output.append(result)
+        return output
+
 
 class RootItem(FormatObject):
     """Represents one item or roots.
@@ -12,16 +12,16 @@ from openpype.client import (
     get_project,
     get_assets,
     get_subsets,
-    get_versions,
     get_version_by_id,
     get_last_version_by_subset_id,
     get_hero_version_by_subset_id,
     get_version_by_name,
     get_last_versions,
-    get_representations,
     get_representation_by_id,
     get_representation_by_name,
-    get_representation_parents
+    get_representation_parents,
+    get_representations_with_parents,
+    get_versions_with_parents,
 )
 from openpype.lib import (
     StringTemplate,
@@ -100,9 +100,19 @@ def get_repres_contexts(representation_ids, dbcon=None):
         return {}
 
     project_name = dbcon.active_project()
-    repre_docs = get_representations(project_name, representation_ids)
+    parents_by_repre_id = get_representations_with_parents(
+        project_name, representation_ids
+    )
+    if not parents_by_repre_id:
+        return {}
 
-    return get_contexts_for_repre_docs(project_name, repre_docs)
+    project_doc = get_project(project_name)
+    contexts = {}
+    for repre_id, parents in parents_by_repre_id.items():
+        context = _create_repre_context(project_doc, parents)
+        if context is not None:
+            contexts[repre_id] = context
+    return contexts
 
 
 def get_contexts_for_repre_docs(project_name, repre_docs):
@@ -116,66 +126,61 @@ def get_contexts_for_repre_docs(project_name, repre_docs):
         version_ids.add(repre_doc["parent"])
         repre_docs_by_id[repre_doc["_id"]] = repre_doc
 
-    version_docs = get_versions(
-        project_name, version_ids, hero=True
+    parents_by_version_id = get_versions_with_parents(
+        project_name, version_ids
     )
 
-    version_docs_by_id = {}
-    hero_version_docs = []
-    versions_for_hero = set()
-    subset_ids = set()
-    for version_doc in version_docs:
-        if version_doc["type"] == "hero_version":
-            hero_version_docs.append(version_doc)
-            versions_for_hero.add(version_doc["version_id"])
-        version_docs_by_id[version_doc["_id"]] = version_doc
-        subset_ids.add(version_doc["parent"])
-
-    if versions_for_hero:
-        _version_docs = get_versions(project_name, versions_for_hero)
-        _version_data_by_id = {
-            version_doc["_id"]: version_doc["data"]
-            for version_doc in _version_docs
-        }
+    project_doc = get_project(project_name)
 
-        for hero_version_doc in hero_version_docs:
-            hero_version_id = hero_version_doc["_id"]
-            version_id = hero_version_doc["version_id"]
-            version_data = copy.deepcopy(_version_data_by_id[version_id])
-            version_docs_by_id[hero_version_id]["data"] = version_data
+    for repre_id, repre_doc in repre_docs_by_id.items():
+        parents = dict(parents_by_version_id.get(repre_doc["parent"]) or {})
+        parents["representation"] = repre_doc
+        context = _create_repre_context(project_doc, parents)
+        if context is not None:
+            contexts[repre_id] = context
 
-    subset_docs = get_subsets(project_name, subset_ids)
-    subset_docs_by_id = {}
-    asset_ids = set()
-    for subset_doc in subset_docs:
-        subset_docs_by_id[subset_doc["_id"]] = subset_doc
-        asset_ids.add(subset_doc["parent"])
+    return contexts
 
-    asset_docs = get_assets(project_name, asset_ids)
-    asset_docs_by_id = {
-        asset_doc["_id"]: asset_doc
-        for asset_doc in asset_docs
-    }
 
-    project_doc = get_project(project_name)
+def _create_repre_context(project_doc, parents):
+    """Create representation context from documents.
 
-    for repre_id, repre_doc in repre_docs_by_id.items():
-        version_doc = version_docs_by_id[repre_doc["parent"]]
-        subset_doc = subset_docs_by_id[version_doc["parent"]]
-        asset_doc = asset_docs_by_id[subset_doc["parent"]]
-        context = {
-            "project": {
-                "name": project_doc["name"],
-                "code": project_doc["data"].get("code")
-            },
-            "asset": asset_doc,
-            "subset": subset_doc,
-            "version": version_doc,
-            "representation": repre_doc,
-        }
-        contexts[repre_id] = context
+    Args:
+        project_doc (dict): Project document.
+        parents (dict): Representation, version, subset, asset and source
+            version (of hero version) documents.
 
-    return contexts
+    Returns:
+        Union[dict, None]: Representation context or None if a parent
+            is missing.
+    """
+
+    repre_doc = parents["representation"]
+    for key in ("version", "subset", "asset"):
+        if not parents.get(key):
+            log.warning((
+                "Representation \"{}\" has missing {} in the database."
+            ).format(repre_doc["_id"], key))
+            return None
+
+    version_doc = parents["version"]
+    if version_doc["type"] == "hero_version":
+        # Hero version use data of version from which was created
+        source_version = parents.get("source_version")
+        if source_version:
+            version_doc = copy.deepcopy(version_doc)
+            version_doc["data"] = copy.deepcopy(source_version["data"])
+
+    return {
+        "project": {
+            "name": project_doc["name"],
+            "code": project_doc["data"].get("code")
+        },
+        "asset": parents["asset"],
+        "subset": parents["subset"],
+        "version": version_doc,
+        "representation": repre_doc,
+    }
 
 
 def get_subset_contexts(subset_ids, dbcon=None):
@@ -848,34 +853,26 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_docs = get_representations(
-        project_name,
-        representation_ids=repre_ids,
-        fields=["_id", "parent"]
-    )
-    # Store representations by stringified representation id
-    repre_docs_by_str_id = {}
-    repre_docs_by_version_id = collections.defaultdict(list)
-    for repre_doc in repre_docs:
-        repre_id = str(repre_doc["_id"])
-        version_id = repre_doc["parent"]
-        repre_docs_by_str_id[repre_id] = repre_doc
-        repre_docs_by_version_id[version_id].append(repre_doc)
-
-    # Query version docs to get it's subset ids
+    # Query representations with their versions at once
     # - also query hero version to be able identify if representation
     #   belongs to existing version
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True,
-        fields=["_id", "parent", "type"]
+    parents_by_repre_id = get_representations_with_parents(
+        project_name, repre_ids, fields=["_id", "name", "parent"]
     )
+    # Store representations by stringified representation id
+    repre_docs_by_str_id = {}
     verisons_by_id = {}
     versions_by_subset_id = collections.defaultdict(list)
     hero_version_ids = set()
-    for version_doc in version_docs:
+    for repre_id, parents in parents_by_repre_id.items():
+        repre_docs_by_str_id[str(repre_id)] = parents["representation"]
+        version_doc = parents["version"]
+        if not version_doc:
+            continue
+
         version_id = version_doc["_id"]
+        if version_id in verisons_by_id:
+            continue
         # Store versions by their ids
         verisons_by_id[version_id] = version_doc
         # There's no need to query subsets for hero versions
@@ -1,9 +1,14 @@
 import os
+import sys
+import json
 import inspect
 import traceback
 
-from openpype.lib import Logger
+import appdirs
+
+from openpype.lib import Logger, replace_file
 from openpype.lib.python_module_tools import (
+    import_filepath,
     modules_from_path,
     classes_from_module,
 )
@@ -11,6 +16,240 @@ from openpype.lib.python_module_tools import (
 log = Logger.get_logger(__name__)
 
 
+def is_plugin_discover_cache_enabled():
+    """Reuse imported plugin modules between discover calls.
+
+    Enabled with environment variable 'OPENPYPE_PLUGIN_DISCOVER_CACHE'
+    set to '1'.
+    """
+
+    return os.environ.get("OPENPYPE_PLUGIN_DISCOVER_CACHE") == "1"
+
+
+def is_plugin_lazy_discover_enabled():
+    """Skip import of plugin files based on manifest of their classes.
+
+    Enabled with environment variable 'OPENPYPE_PLUGIN_LAZY_DISCOVER'
+    set to '1'. Works only with enabled discover cache.
+    """
+
+    return (
+        is_plugin_discover_cache_enabled()
+        and os.environ.get("OPENPYPE_PLUGIN_LAZY_DISCOVER") == "1"
+    )
+
+
+class PluginModulesCache(object):
+    """Cache of imported plugin files validated by their stat.
+
+    Imported module is reused while modification time and size of its file
+    are the same so discover calls don't execute plugin files again. Files
+    which failed to import are not cached so the error is reported on each
+    discover.
+
+    Cache also holds manifest with information about classes defined in
+    plugin files (e.g. hosts of pyblish plugins). Manifest is stored on disk
+    so other processes can decide if a file has to be imported at all
+    without importing it.
+
+    Note:
+        Cached modules return the same class objects on each discover.
+        Changes of class attributes (e.g. applied settings) are kept between
+        discover calls.
+
+    Args:
+        manifest_path (Optional[str]): Path to json file with manifest.
+    """
+
+    def __init__(self, manifest_path=None):
+        if manifest_path is None:
+            manifest_path = os.path.join(
+                appdirs.user_data_dir("openpype", "pypeclub"),
+                "plugin_manifest.json"
+            )
+        self._manifest_path = manifest_path
+        self._modules = {}
+        self._manifest = None
+        self._manifest_changed = False
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_file_stamp(filepath):
+        stat = os.stat(filepath)
+        return [stat.st_mtime, stat.st_size]
+
+    @staticmethod
+    def get_python_filepaths(folder_path):
+        """Python files in folder which should be imported as plugins.
+
+        Returns:
+            List[Tuple[str, str]]: Full path and module name of files.
+        """
+
+        output = []
+        if not folder_path:
+            return output
+
+        # Do not allow relative imports
+        if folder_path.startswith("."):
+            log.warning((
+                "BUG: Relative paths are not allowed for security reasons. {}"
+            ).format(folder_path))
+            return output
+
+        folder_path = os.path.normpath(folder_path)
+        if not os.path.isdir(folder_path):
+            log.warning("Not a directory path: {}".format(folder_path))
+            return output
+
+        for filename in os.listdir(folder_path):
+            # Ignore files which start with underscore
+            if filename.startswith("_"):
+                continue
+
+            mod_name, mod_ext = os.path.splitext(filename)
+            if mod_ext != ".py":
+                continue
+
+            full_path = os.path.join(folder_path, filename)
+            if os.path.isfile(full_path):
+                output.append((full_path, mod_name))
+        return output
+
+    def import_filepath(self, filepath, module_name=None, stamp=None):
+        """Import file or return already imported module if did not change.
+
+        Args:
+            filepath (str): Path to python file.
+            module_name (Optional[str]): Name of module.
+            stamp (Optional[List]): Stamp of file if was already calculated.
+
+        Returns:
+            types.ModuleType: Imported module.
+        """
+
+        if stamp is None:
+            stamp = self.get_file_stamp(filepath)
+
+        item = self._modules.get(filepath)
+        if item is not None and item[0] == stamp:
+            self.hits += 1
+            return item[1]
+
+        self.misses += 1
+        module = import_filepath(filepath, module_name)
+        self._modules[filepath] = (stamp, module)
+        return module
+
+    def modules_from_path(self, folder_path):
+        """Cached variant of 'modules_from_path'.
+
+        Returns:
+            tuple<list, list>: First list contains successfully imported
+                modules and second list contains tuples of path and
+                exception.
+        """
+
+        modules = []
+        crashed = []
+        for full_path, mod_name in self.get_python_filepaths(folder_path):
+            try:
+                module = self.import_filepath(full_path, mod_name)
+                modules.append((full_path, module))
+
+            except Exception:
+                crashed.append((full_path, sys.exc_info()))
+                log.warning(
+                    "Failed to load path: \"{0}\"".format(full_path),
+                    exc_info=True
+                )
+        return modules, crashed
+
+    def _get_manifest(self):
+        if self._manifest is None:
+            manifest = {}
+            if os.path.exists(self._manifest_path):
+                try:
+                    with open(self._manifest_path, "r") as stream:
+                        manifest = json.load(stream)
+                except Exception:
+                    log.debug(
+                        "Failed to read plugins manifest \"{}\"".format(
+                            self._manifest_path
+                        ),
+                        exc_info=True
+                    )
+            self._manifest = manifest
+        return self._manifest
+
+    def get_manifest_item(self, filepath, stamp):
+        """Manifest data of file if file did not change.
+
+        Args:
+            filepath (str): Path to python file.
+            stamp (List): Current stamp of file.
+
+        Returns:
+            Union[Dict[str, Any], None]: Data stored for file or None.
+        """
+
+        item = self._get_manifest().get(filepath)
+        if item is None or item["stamp"] != stamp:
+            return None
+        return item["data"]
+
+    def set_manifest_item(self, filepath, stamp, data):
+        """Store information about file to manifest.
+
+        Args:
+            filepath (str): Path to python file.
+            stamp (List): Stamp of file.
+            data (Dict[str, Any]): Json serializable data.
+        """
+
+        manifest = self._get_manifest()
+        item = {"stamp": stamp, "data": data}
+        if manifest.get(filepath) != item:
+            manifest[filepath] = item
+            self._manifest_changed = True
+
+    def save_manifest(self):
+        """Write manifest to disk if it changed."""
+
+        if not self._manifest_changed:
+            return
+
+        tmp_path = "{}.{}.tmp".format(self._manifest_path, os.getpid())
+        try:
+            dirpath = os.path.dirname(self._manifest_path)
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+            with open(tmp_path, "w") as stream:
+                json.dump(self._manifest, stream)
+            # Atomic replace so other processes never see missing manifest
+            replace_file(tmp_path, self._manifest_path)
+            self._manifest_changed = False
+
+        except Exception:
+            log.warning(
+                "Failed to store plugins manifest \"{}\"".format(
+                    self._manifest_path
+                ),
+                exc_info=True
+            )
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self):
+        """Forget imported modules and loaded manifest."""
+
+        self._modules = {}
+        self._manifest = None
+        self._manifest_changed = False
+
+
 class DiscoverResult:
     """Result of Plug-ins discovery of a single superclass type.
 
@@ -101,7 +340,9 @@ class PluginDiscoverContext(object):
 
     Keeps in memory all registered types and their paths. Paths are dynamically
     loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    class objects even if were loaded from same file. Unchanged files are
+    not loaded again when plugin discover cache is enabled (see
+    'is_plugin_discover_cache_enabled').
     """
 
     def __init__(self):
@@ -166,9 +407,16 @@ class PluginDiscoverContext(object):
             plugin_names.add(class_name)
             result.plugins.append(cls)
 
+        modules_cache = None
+        if is_plugin_discover_cache_enabled():
+            modules_cache = get_plugin_modules_cache()
+
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            if modules_cache is None:
+                modules, crashed = modules_from_path(path)
+            else:
+                modules, crashed = modules_cache.modules_from_path(path)
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
@@ -261,6 +509,7 @@ class _GlobalDiscover:
     """
 
     _context = None
+    _modules_cache = None
 
     @classmethod
     def get_context(cls):
@@ -268,6 +517,22 @@ class _GlobalDiscover:
             cls._context = PluginDiscoverContext()
         return cls._context
 
+    @classmethod
+    def get_modules_cache(cls):
+        if cls._modules_cache is None:
+            cls._modules_cache = PluginModulesCache()
+        return cls._modules_cache
+
+
+def get_plugin_modules_cache():
+    """Global cache of imported plugin modules.
+
+    Returns:
+        PluginModulesCache: Cache shared by all plugin discover calls.
+    """
+
+    return _GlobalDiscover.get_modules_cache()
+
 
 def discover(
     superclass,
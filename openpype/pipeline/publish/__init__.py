@@ -38,6 +38,14 @@ from .lib import (
     get_publish_repre_path,
 )
 
+from .profiling import (
+    PublishProfiler,
+    get_profile_summary,
+    format_profile_summary,
+    get_publish_result_log_items,
+    create_publish_report,
+)
+
 from .abstract_expected_files import ExpectedFiles
 from .abstract_collect_render import (
     RenderInstance,
@@ -80,6 +88,12 @@ __all__ = (
     "get_instance_staging_dir",
     "get_publish_repre_path",
 
+    "PublishProfiler",
+    "get_profile_summary",
+    "format_profile_summary",
+    "get_publish_result_log_items",
+    "create_publish_report",
+
     "ExpectedFiles",
 
     "RenderInstance",
@@ -22,7 +22,12 @@ from openpype.settings import (
 from openpype.pipeline import (
     tempdir
 )
-from openpype.pipeline.plugin_discover import DiscoverResult
+from openpype.pipeline.plugin_discover import (
+    DiscoverResult,
+    get_plugin_modules_cache,
+    is_plugin_discover_cache_enabled,
+    is_plugin_lazy_discover_enabled,
+)
 
 from .contants import (
     DEFAULT_PUBLISH_TEMPLATE,
@@ -258,12 +263,50 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
+def _get_pyblish_module_manifest(module):
+    """Information about pyblish plugins in module stored to manifest."""
+
+    plugins = []
+    for name in dir(module):
+        obj = getattr(module, name)
+        if (
+            inspect.isclass(obj)
+            and issubclass(obj, pyblish.api.Plugin)
+            and obj is not pyblish.api.Plugin
+        ):
+            plugins.append({
+                "name": obj.__name__,
+                "hosts": list(getattr(obj, "hosts", None) or [])
+            })
+    return {"plugins": plugins}
+
+
+def _is_manifest_host_compatible(manifest_item, hosts):
+    """Module contains at least one plugin compatible with registered hosts.
+
+    Same logic as 'pyblish.plugin.host_is_compatible'.
+    """
+
+    for plugin_data in manifest_item["plugins"]:
+        plugin_hosts = plugin_data["hosts"]
+        if "*" in plugin_hosts:
+            return True
+        if any(host in plugin_hosts for host in hosts):
+            return True
+    return False
+
+
 def publish_plugins_discover(paths=None):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able collect crashed files
     and reason of their crash.
 
+    Unchanged plugin files are not executed again when plugin discover cache
+    is enabled. With enabled lazy discover are skipped files which, based
+    on manifest from previous import, don't contain any plugin compatible
+    with registered hosts.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
@@ -279,6 +322,14 @@ def publish_plugins_discover(paths=None):
     allow_duplicates = pyblish.plugin.ALLOW_DUPLICATES
     log = pyblish.plugin.log
 
+    modules_cache = None
+    lazy_discover = False
+    registered_hosts = []
+    if is_plugin_discover_cache_enabled():
+        modules_cache = get_plugin_modules_cache()
+        lazy_discover = is_plugin_lazy_discover_enabled()
+        registered_hosts = pyblish.plugin.registered_hosts()
+
     # Include plug-ins from registered paths
     if not paths:
         paths = pyblish.plugin.plugin_paths()
@@ -302,8 +353,27 @@ def publish_plugins_discover(paths=None):
             if not mod_ext == ".py":
                 continue
 
+            stamp = None
+            if lazy_discover:
+                stamp = modules_cache.get_file_stamp(abspath)
+                manifest_item = modules_cache.get_manifest_item(
+                    abspath, stamp
+                )
+                if (
+                    manifest_item is not None
+                    and not _is_manifest_host_compatible(
+                        manifest_item, registered_hosts
+                    )
+                ):
+                    continue
+
             try:
-                module = import_filepath(abspath, mod_name)
+                if modules_cache is None:
+                    module = import_filepath(abspath, mod_name)
+                else:
+                    module = modules_cache.import_filepath(
+                        abspath, mod_name, stamp
+                    )
 
                 # Store reference to original module, to avoid
                 # garbage collection from collecting it's global
@@ -316,6 +386,11 @@ def publish_plugins_discover(paths=None):
                 log.debug("Skipped: \"%s\" (%s)", mod_name, err)
                 continue
 
+            if lazy_discover:
+                modules_cache.set_manifest_item(
+                    abspath, stamp, _get_pyblish_module_manifest(module)
+                )
+
             for plugin in pyblish.plugin.plugins_from_module(module):
                 if not allow_duplicates and plugin.__name__ in plugin_names:
                     result.duplicated_plugins.append(plugin)
@@ -328,6 +403,9 @@ def publish_plugins_discover(paths=None):
                 key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
                 plugins[key] = plugin
 
+    if lazy_discover:
+        modules_cache.save_manifest()
+
     # Include plug-ins from registration.
     # Directly registered plug-ins take precedence.
     for plugin in pyblish.plugin.registered_plugins():
@@ -0,0 +1,370 @@
+"""Profiling of publish plugins.
+
+Profiler measures each processing of plugin (with instance) and stores
+wall time, CPU time of publishing thread, count of database commands and
+bytes copied by file transactions. Database commands and copied bytes are
+counted for whole process, they are attributed to plugin which was processed
+at that time.
+
+Profile data are stored in publish report under 'profile' key and can be
+visualized in publish report viewer.
+"""
+
+import time
+import uuid
+import traceback
+import contextlib
+
+from openpype.client.mongo import get_mongo_commands_count
+from openpype.lib.file_transaction import FileTransaction
+
+# Bump when structure of profile data changes
+PROFILE_VERSION = 1
+
+_wall_time = getattr(time, "perf_counter", time.time)
+# Prefer CPU time of current thread (Python 3.7+)
+_cpu_time = (
+    getattr(time, "thread_time", None)
+    or getattr(time, "process_time", None)
+    or time.clock
+)
+
+
+class PublishProfiler(object):
+    """Collect timings and resources used by publish plugins.
+
+    Example:
+        >>> profiler = PublishProfiler()
+        >>> with profiler.profile(plugin, instance) as record_data:
+        ...     result = pyblish.plugin.process(plugin, context, instance)
+        ...     record_data["success"] = result["success"]
+        >>> profile_data = profiler.to_data()
+    """
+
+    def __init__(self):
+        self._records = []
+        self._started = None
+        self._start_wall = None
+        self.reset()
+
+    def reset(self):
+        """Remove all records and restart time measurement."""
+
+        self._records = []
+        self._started = time.time()
+        self._start_wall = _wall_time()
+
+    @property
+    def records(self):
+        return list(self._records)
+
+    def _get_counters(self):
+        return (
+            _wall_time(),
+            _cpu_time(),
+            get_mongo_commands_count(),
+            FileTransaction.get_copied_bytes_total()
+        )
+
+    def _add_record(self, plugin, instance, start_counters, success):
+        wall, cpu, db_queries, copied_bytes = self._get_counters()
+        start_wall, start_cpu, start_queries, start_bytes = start_counters
+
+        instance_id = None
+        instance_label = None
+        if instance is not None:
+            instance_id = instance.id
+            instance_label = (
+                instance.data.get("label") or instance.data.get("name")
+            )
+
+        record = {
+            "plugin": plugin.__name__,
+            "label": getattr(plugin, "label", None) or plugin.__name__,
+            "order": plugin.order,
+            "instance_id": instance_id,
+            "instance_label": instance_label,
+            "start": start_wall - self._start_wall,
+            "wall_time": wall - start_wall,
+            "cpu_time": cpu - start_cpu,
+            "db_queries": db_queries - start_queries,
+            "bytes_copied": copied_bytes - start_bytes,
+            "success": success
+        }
+        self._records.append(record)
+        return record
+
+    @contextlib.contextmanager
+    def profile(self, plugin, instance=None):
+        """Measure code block processing plugin.
+
+        Yielded dictionary can be used to set 'success' of processing when
+        exceptions are not propagated (e.g. 'pyblish.plugin.process').
+
+        Args:
+            plugin (pyblish.api.Plugin): Processed plugin.
+            instance (Optional[pyblish.api.Instance]): Processed instance.
+
+        Yields:
+            Dict[str, Any]: Data of record filled by caller.
+        """
+
+        record_data = {}
+        start_counters = self._get_counters()
+        success = False
+        try:
+            yield record_data
+            success = True
+        finally:
+            self._add_record(
+                plugin,
+                instance,
+                start_counters,
+                record_data.get("success", success)
+            )
+
+    def profile_results(self, results):
+        """Profile iterator of publish results.
+
+        Each result of 'pyblish.util.publish_iter' is yielded when plugin
+        finished processing so time between results is time of plugin.
+
+        Args:
+            results (Iterable[Dict[str, Any]]): Pyblish results.
+
+        Yields:
+            Dict[str, Any]: Passed results.
+        """
+
+        iterator = iter(results)
+        while True:
+            start_counters = self._get_counters()
+            try:
+                result = next(iterator)
+            except StopIteration:
+                return
+            self._add_record(
+                result["plugin"],
+                result["instance"],
+                start_counters,
+                result["success"]
+            )
+            yield result
+
+    def to_data(self):
+        """Serializable profile data.
+
+        Returns:
+            Dict[str, Any]: Profile data with records.
+        """
+
+        return {
+            "version": PROFILE_VERSION,
+            "started": self._started,
+            "wall_time": _wall_time() - self._start_wall,
+            "records": [dict(record) for record in self._records]
+        }
+
+
+def get_profile_summary(profile_data, sort_by="wall_time"):
+    """Sum profile records by plugin.
+
+    Args:
+        profile_data (Dict[str, Any]): Output of 'PublishProfiler.to_data'.
+        sort_by (str): Key used for descending sorting.
+
+    Returns:
+        List[Dict[str, Any]]: Summary for each plugin.
+    """
+
+    summary_by_plugin = {}
+    for record in profile_data.get("records") or []:
+        plugin_name = record["plugin"]
+        summary = summary_by_plugin.get(plugin_name)
+        if summary is None:
+            summary = {
+                "plugin": plugin_name,
+                "label": record["label"],
+                "order": record["order"],
+                "count": 0,
+                "wall_time": 0.0,
+                "cpu_time": 0.0,
+                "db_queries": 0,
+                "bytes_copied": 0
+            }
+            summary_by_plugin[plugin_name] = summary
+
+        summary["count"] += 1
+        for key in ("wall_time", "cpu_time", "db_queries", "bytes_copied"):
+            summary[key] += record[key]
+
+    return sorted(
+        summary_by_plugin.values(),
+        key=lambda item: item[sort_by],
+        reverse=True
+    )
+
+
+def format_profile_summary(profile_data, limit=None):
+    """Text table of plugins sorted by wall time.
+
+    Args:
+        profile_data (Dict[str, Any]): Output of 'PublishProfiler.to_data'.
+        limit (Optional[int]): Show only slowest plugins.
+
+    Returns:
+        str: Formatted table.
+    """
+
+    summary = get_profile_summary(profile_data)
+    if limit:
+        summary = summary[:limit]
+
+    row_template = "{:<40} {:>5} {:>10} {:>10} {:>8} {:>12}"
+    lines = [
+        row_template.format(
+            "Plugin", "Count", "Wall (s)", "CPU (s)", "DB", "Copied (MB)"
+        )
+    ]
+    for item in summary:
+        lines.append(row_template.format(
+            item["label"][:40],
+            item["count"],
+            "{:.3f}".format(item["wall_time"]),
+            "{:.3f}".format(item["cpu_time"]),
+            item["db_queries"],
+            "{:.1f}".format(item["bytes_copied"] / (1024.0 * 1024.0))
+        ))
+    lines.append("Total wall time: {:.3f}s".format(
+        profile_data.get("wall_time") or 0.0
+    ))
+    return "\n".join(lines)
+
+
+def get_publish_result_log_items(result):
+    """Serializable log items of pyblish result.
+
+    Items are used in publish report and contain log records captured during
+    processing and error of the result.
+
+    Args:
+        result (Dict[str, Any]): Pyblish result.
+
+    Returns:
+        List[Dict[str, Any]]: Log items.
+    """
+
+    output = []
+    records = result.get("records") or []
+    for record in records:
+        record_exc_info = record.exc_info
+        if record_exc_info is not None:
+            record_exc_info = "".join(
+                traceback.format_exception(*record_exc_info)
+            )
+
+        try:
+            msg = record.getMessage()
+        except Exception:
+            msg = str(record.msg)
+
+        output.append({
+            "type": "record",
+            "msg": msg,
+            "name": record.name,
+            "lineno": record.lineno,
+            "levelno": record.levelno,
+            "levelname": record.levelname,
+            "threadName": record.threadName,
+            "filename": record.filename,
+            "pathname": record.pathname,
+            "msecs": record.msecs,
+            "exc_info": record_exc_info
+        })
+
+    exception = result.get("error")
+    if exception:
+        fname, line_no, func, exc = exception.traceback
+        output.append({
+            "type": "error",
+            "msg": str(exception),
+            "filename": str(fname),
+            "lineno": str(line_no),
+            "func": str(func),
+            "traceback": exception.formatted_traceback
+        })
+
+    return output
+
+
+def create_publish_report(context, results, profile_data=None):
+    """Create publish report from results of headless publishing.
+
+    Report has same structure as report of publisher tool so it can be
+    loaded into publish report viewer.
+
+    Args:
+        context (pyblish.api.Context): Published context.
+        results (List[Dict[str, Any]]): Pyblish results.
+        profile_data (Optional[Dict[str, Any]]): Profile data.
+
+    Returns:
+        Dict[str, Any]: Publish report data.
+    """
+
+    plugins_data = []
+    plugin_data_by_plugin = {}
+    instances = {}
+    for result in results:
+        plugin = result["plugin"]
+        plugin_data = plugin_data_by_plugin.get(plugin)
+        if plugin_data is None:
+            plugin_data = {
+                "name": plugin.__name__,
+                "label": getattr(plugin, "label", None),
+                "order": plugin.order,
+                "targets": list(plugin.targets),
+                "instances_data": [],
+                "actions_data": [],
+                "skipped": False,
+                "passed": True
+            }
+            plugin_data_by_plugin[plugin] = plugin_data
+            plugins_data.append(plugin_data)
+
+        instance = result["instance"]
+        instance_id = None
+        if instance is not None:
+            instance_id = instance.id
+            instances[instance_id] = {
+                "name": instance.data.get("name"),
+                "label": instance.data.get("label"),
+                "family": instance.data.get("family"),
+                "families": instance.data.get("families") or [],
+                "exists": True
+            }
+
+        # Plugin did not pass if processing of any instance failed
+        if result.get("error"):
+            plugin_data["passed"] = False
+
+        log_items = get_publish_result_log_items(result)
+        for log_item in log_items:
+            log_item["instance_id"] = instance_id
+        plugin_data["instances_data"].append({
+            "id": instance_id,
+            "logs": log_items,
+            "process_time": result["duration"]
+        })
+
+    report = {
+        "plugins_data": plugins_data,
+        "instances": instances,
+        "context": {"label": context.data.get("label") or "Context"},
+        "crashed_file_paths": {},
+        "id": str(uuid.uuid4()),
+        "report_version": "1.0.0"
+    }
+    if profile_data is not None:
+        report["profile"] = profile_data
+    return report
@@ -17,10 +17,12 @@ from openpype.lib import (
     get_transcode_temp_directory,
     convert_input_paths_for_ffmpeg,
     should_convert_for_ffmpeg,
+    is_oiio_supported,
 
     CREATE_NO_WINDOW
 )
 from openpype.lib.profiles_filtering import filter_profiles
+from openpype.lib.transcoding import probe_inputs
 
 
 class ExtractBurnin(publish.Extractor):
@@ -193,6 +195,9 @@ class ExtractBurnin(publish.Extractor):
         burnins_per_repres = self._get_burnins_per_representations(
             instance, burnin_defs
         )
+        self._probe_representations(
+            [repre for repre, _ in burnins_per_repres]
+        )
         for repre, repre_burnin_defs in burnins_per_repres:
             # Create copy of `_burnin_data` and `_temp_data` for repre.
             burnin_data = copy.deepcopy(_burnin_data)
@@ -424,6 +429,39 @@ class ExtractBurnin(publish.Extractor):
 
         return burnin_options
 
+    def _probe_representations(self, repres):
+        """Probe exr inputs of representations with oiiotool concurrently.
+
+        Results are cached so checks if representation requires conversion
+        don't probe files one by one. Other inputs are probed by burnin
+        script in separate process.
+
+        Args:
+            repres (List[Dict[str, Any]]): Representations to process.
+        """
+
+        if not is_oiio_supported():
+            return
+
+        filepaths = []
+        for repre in repres:
+            files = repre["files"]
+            if isinstance(files, (list, tuple)):
+                if not files:
+                    continue
+                files = files[0]
+            if os.path.splitext(files)[-1].lower() == ".exr":
+                filepaths.append(os.path.join(repre["stagingDir"], files))
+
+        if not filepaths:
+            return
+
+        # Errors are reported by processing of representation
+        try:
+            probe_inputs(filepaths, "oiio", self.log)
+        except Exception:
+            self.log.debug("Probing of inputs failed.", exc_info=True)
+
     def prepare_basic_data(self, instance):
         """Pick data from instance for processing and for burnin strings.
 
@@ -10,8 +10,11 @@ from openpype.lib import (
 )
 
 from openpype.lib.transcoding import (
+    TranscodeScheduler,
     convert_colorspace,
     get_transcode_temp_directory,
+    get_oiio_sequence_path,
+    split_frames_to_chunks,
 )
 
 from openpype.lib.profiles_filtering import filter_profiles
@@ -141,25 +144,35 @@ class ExtractOIIOTranscode(publish.Extractor):
                 additional_command_args = (output_def["oiiotool_args"]
                                            ["additional_command_args"])
 
-                files_to_convert = self._translate_to_sequence(
-                    files_to_convert)
-                for file_name in files_to_convert:
+                # Chunks of sequence are converted concurrently
+                scheduler = TranscodeScheduler(logger=self.log)
+                for file_name, frames_count in self._split_to_chunks(
+                    files_to_convert
+                ):
                     input_path = os.path.join(original_staging_dir,
                                               file_name)
                     output_path = self._get_output_file_path(input_path,
                                                              new_staging_dir,
                                                              output_extension)
-                    convert_colorspace(
-                        input_path,
-                        output_path,
-                        config_path,
-                        source_colorspace,
-                        target_colorspace,
-                        view,
-                        display,
-                        additional_command_args,
-                        self.log
+                    scheduler.add_task(
+                        convert_colorspace,
+                        args=(
+                            input_path,
+                            output_path,
+                            config_path,
+                            source_colorspace,
+                            target_colorspace,
+                            view,
+                            display,
+                            additional_command_args,
+                            self.log
+                        ),
+                        label=file_name,
+                        frames=frames_count
                     )
+                scheduler.run()
+                self.log.debug("Transcoding timing:\n{}".format(
+                    scheduler.format_timings()))
 
                 # cleanup temporary transcoded files
                 for file_name in new_repre["files"]:
@@ -252,38 +265,37 @@ class ExtractOIIOTranscode(publish.Extractor):
             renamed_files.append(file_name)
         new_repre["files"] = renamed_files
 
-    def _translate_to_sequence(self, files_to_convert):
-        """Returns original list or list with filename formatted in single
-        sequence format.
+    def _split_to_chunks(self, files_to_convert):
+        """Split files to chunks converted by one oiiotool process.
 
-        Uses clique to find frame sequence, in this case it merges all frames
-        into sequence format (FRAMESTART-FRAMEEND#) and returns it.
-        If sequence not found, it returns original list
+        Uses clique to find frame sequences and splits each sequence into
+        chunks of consecutive frames in sequence format
+        (FRAMESTART-FRAMEEND#). Files which are not part of sequence are
+        returned as they are.
 
         Args:
             files_to_convert (list): list of file names
         Returns:
-            (list) of [file.1001-1010#.exr] or [fileA.exr, fileB.exr]
+            (list) of tuples with file name and number of frames, e.g.
+                [("file.1001-1010#.exr", 10), ("fileA.exr", 1)]
         """
         pattern = [clique.PATTERNS["frames"]]
         collections, remainder = clique.assemble(
             files_to_convert, patterns=pattern,
             assume_padded_when_ambiguous=True)
 
-        if collections:
-            if len(collections) > 1:
-                raise ValueError(
-                    "Too many collections {}".format(collections))
-
-            collection = collections[0]
-            frames = list(collection.indexes)
-            frame_str = "{}-{}#".format(frames[0], frames[-1])
-            file_name = "{}{}{}".format(collection.head, frame_str,
-                                        collection.tail)
-
-            files_to_convert = [file_name]
-
-        return files_to_convert
+        output = []
+        for collection in collections:
+            for chunk in split_frames_to_chunks(collection.indexes):
+                file_name = get_oiio_sequence_path(
+                    collection.head, collection.tail, collection.padding,
+                    chunk[0], chunk[-1]
+                )
+                output.append((file_name, len(chunk)))
+
+        for file_name in remainder:
+            output.append((file_name, 1))
+        return output
 
     def _get_output_file_path(self, input_path, output_dir,
                               output_extension):
@@ -12,6 +12,7 @@ import pyblish.api
 
 from openpype.lib import (
     get_ffmpeg_tool_path,
+    is_oiio_supported,
 
     path_to_subprocess_arg,
     run_subprocess,
@@ -19,6 +20,7 @@ from openpype.lib import (
 from openpype.lib.transcoding import (
     IMAGE_EXTENSIONS,
     get_ffprobe_streams,
+    probe_inputs,
     should_convert_for_ffmpeg,
     convert_input_paths_for_ffmpeg,
     get_transcode_temp_directory,
@@ -69,6 +71,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Render outputs with same input from single decode of the input
+    single_pass_outputs = False
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -215,6 +219,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
         outputs_per_repres = self._get_outputs_per_representations(
             instance, profile_outputs
         )
+        self._probe_representations(
+            [repre for repre, _ in outputs_per_repres]
+        )
         for repre, output_defs in outputs_per_repres:
             # Check if input should be preconverted before processing
             # Store original staging dir (it's value may change)
@@ -295,10 +302,53 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     if os.path.exists(new_staging_dir):
                         shutil.rmtree(new_staging_dir)
 
+    def _probe_representations(self, repres):
+        """Probe first input file of representations concurrently.
+
+        Results are cached so conversion checks and ffprobe calls during
+        processing of representations don't probe files one by one.
+        Exr files are probed with oiiotool (used to check if conversion is
+        needed), other files with ffprobe.
+
+        Args:
+            repres (List[Dict[str, Any]]): Representations to process.
+        """
+
+        oiio_paths = []
+        ffprobe_paths = []
+        for repre in repres:
+            files = repre["files"]
+            if isinstance(files, (list, tuple)):
+                if not files:
+                    continue
+                files = files[0]
+            filepath = os.path.join(repre["stagingDir"], files)
+            if os.path.splitext(filepath)[-1].lower() != ".exr":
+                ffprobe_paths.append(filepath)
+            elif is_oiio_supported():
+                oiio_paths.append(filepath)
+
+        # Errors are reported by processing of representation
+        for probe_type, filepaths in (
+            ("oiio", oiio_paths),
+            ("ffprobe", ffprobe_paths),
+        ):
+            if not filepaths:
+                continue
+            try:
+                probe_inputs(filepaths, probe_type, self.log)
+            except Exception:
+                self.log.debug(
+                    "Probing of inputs failed.", exc_info=True
+                )
+
     def _render_output_definitions(
         self, instance, repre, src_repre_staging_dir, output_defs
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
+        jobs = []
+        files_to_clean = []
+        filled_ranges = set()
         for _output_def in output_defs:
             output_def = copy.deepcopy(_output_def)
             # Make sure output definition has "tags" key
@@ -341,14 +391,20 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
             temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
+            # Gaps are filled once per frame range and files are removed
+            #   after all outputs are rendered
+            gaps_range = (temp_data["frame_start"], temp_data["frame_end"])
+            if (
+                temp_data["input_is_sequence"]
+                and gaps_range not in filled_ranges
+            ):
                 self.log.info("Filling gaps in sequence.")
-                files_to_clean = self.fill_sequence_gaps(
+                filled_ranges.add(gaps_range)
+                files_to_clean.extend(self.fill_sequence_gaps(
                     temp_data["origin_repre"]["files"],
                     new_repre["stagingDir"],
                     temp_data["frame_start"],
-                    temp_data["frame_end"])
+                    temp_data["frame_end"]))
 
             # create or update outputName
             output_name = new_repre.get("outputName", "")
@@ -366,7 +422,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             })
 
             try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
+                ffmpeg_parts = self._ffmpeg_arguments_parts(
                     output_def, instance, new_repre, temp_data, fill_data
                 )
             except ZeroDivisionError:
@@ -380,29 +436,42 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    break
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
-
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
-
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            ffmpeg_args = self.ffmpeg_full_args(*ffmpeg_parts)
+            jobs.append({
+                "new_repre": new_repre,
+                "output_def": output_def,
+                "output_name": output_name,
+                "output_ext": output_ext,
+                "temp_data": temp_data,
+                "ffmpeg_parts": ffmpeg_parts,
+                "ffmpeg_cmd": " ".join(ffmpeg_args)
+            })
 
+        try:
+            self._run_ffmpeg_jobs(jobs)
+        finally:
             # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
+            for filepath in files_to_clean:
+                if os.path.exists(filepath):
+                    os.unlink(filepath)
+
+        for job in jobs:
+            new_repre = job["new_repre"]
+            temp_data = job["temp_data"]
+            output_name = job["output_name"]
             new_repre.update({
                 "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
+                "name": "{}_{}".format(output_name, job["output_ext"]),
                 "outputName": output_name,
-                "outputDef": output_def,
+                "outputDef": job["output_def"],
                 "frameStartFtrack": temp_data["output_frame_start"],
                 "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
+                # Command of single output is stored even if output was
+                #   rendered in single pass with other outputs
+                "ffmpeg_cmd": job["ffmpeg_cmd"]
             })
 
             # Force to pop these key if are in new repre
@@ -417,6 +486,128 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
             instance.data["representations"].append(new_repre)
 
+    def _run_ffmpeg_jobs(self, jobs):
+        """Run ffmpeg for prepared outputs.
+
+        Outputs with same input arguments are rendered by single ffmpeg
+        process when 'single_pass_outputs' is enabled. Input is decoded
+        once and split to all outputs in filter graph.
+        """
+
+        job_groups = [[job] for job in jobs]
+        if self.single_pass_outputs:
+            job_groups = self._group_single_pass_jobs(jobs)
+
+        for job_group in job_groups:
+            if len(job_group) == 1:
+                subprcs_cmd = job_group[0]["ffmpeg_cmd"]
+            else:
+                self.log.info(
+                    "Rendering {} outputs in single pass: {}".format(
+                        len(job_group),
+                        ", ".join(job["output_name"] for job in job_group)
+                    )
+                )
+                subprcs_cmd = " ".join(
+                    self._single_pass_ffmpeg_args(job_group)
+                )
+
+            # run subprocess
+            self.log.debug("Executing: {}".format(subprcs_cmd))
+
+            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+
+    def _is_single_pass_compatible(self, job):
+        input_args, video_filters, audio_filters, output_args = (
+            job["ffmpeg_parts"]
+        )
+        # Audio and other additional inputs require custom mapping
+        inputs_count = len([
+            arg
+            for arg in input_args
+            if arg == "-i" or arg.startswith("-i ")
+        ])
+        if inputs_count != 1 or audio_filters:
+            return False
+
+        # Labeled filters can't be chained after split
+        for video_filter in video_filters:
+            if "[" in video_filter or ";" in video_filter:
+                return False
+
+        for arg in output_args:
+            if arg.startswith(("-map", "-filter_complex", "-lavfi")):
+                return False
+        return True
+
+    def _group_single_pass_jobs(self, jobs):
+        """Group jobs which can be rendered from single decode of input.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Groups of jobs in order of first job
+                of each group.
+        """
+
+        job_groups = []
+        groups_by_input = {}
+        for job in jobs:
+            if not self._is_single_pass_compatible(job):
+                job_groups.append([job])
+                continue
+
+            key = tuple(job["ffmpeg_parts"][0])
+            job_group = groups_by_input.get(key)
+            if job_group is None:
+                job_group = []
+                groups_by_input[key] = job_group
+                job_groups.append(job_group)
+            job_group.append(job)
+        return job_groups
+
+    def _single_pass_ffmpeg_args(self, jobs):
+        """Arguments of ffmpeg rendering multiple outputs in single pass.
+
+        Decoded input is split in filter graph to a branch for each output
+        with video filters of the output.
+
+        Args:
+            jobs (List[Dict[str, Any]]): Jobs with same input arguments.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+
+        input_args = jobs[0]["ffmpeg_parts"][0]
+        split_labels = [
+            "[s{}]".format(idx)
+            for idx in range(len(jobs))
+        ]
+        filter_chains = [
+            "[0:v]split={}{}".format(len(jobs), "".join(split_labels))
+        ]
+        output_args = []
+        for idx, job in enumerate(jobs):
+            _, video_filters, _, job_output_args = job["ffmpeg_parts"]
+            map_label = split_labels[idx]
+            if video_filters:
+                map_label = "[o{}]".format(idx)
+                filter_chains.append("{}{}{}".format(
+                    split_labels[idx], ",".join(video_filters), map_label
+                ))
+
+            output_args.extend(["-map", "\"{}\"".format(map_label)])
+            # Keep audio of video input which would be used without mapping
+            if not job["temp_data"]["output_ext_is_image"]:
+                output_args.extend(["-map", "\"0:a?\""])
+            output_args.extend(job_output_args)
+
+        all_args = [path_to_subprocess_arg(self.ffmpeg_path)]
+        all_args.extend(input_args)
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(filter_chains)))
+        all_args.extend(output_args)
+        return all_args
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -542,6 +733,23 @@ class ExtractReview(pyblish.api.InstancePlugin):
             temp_data (dict): Base data for successful process.
         """
 
+        return self.ffmpeg_full_args(*self._ffmpeg_arguments_parts(
+            output_def, instance, new_repre, temp_data, fill_data
+        ))
+
+    def _ffmpeg_arguments_parts(
+        self, output_def, instance, new_repre, temp_data, fill_data
+    ):
+        """Prepares ffmpeg arguments split by their purpose.
+
+        Video and audio filters defined in output arguments are moved to
+        filters.
+
+        Returns:
+            Tuple[list, list, list, list]: Input arguments, video filters,
+                audio filters and output arguments with output filepath.
+        """
+
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
 
@@ -716,7 +924,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        ffmpeg_output_args = self._move_filters_from_output_args(
+            ffmpeg_video_filters, ffmpeg_audio_filters, ffmpeg_output_args
+        )
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -764,6 +975,34 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self._move_filters_from_output_args(
+            video_filters, audio_filters, output_args
+        )
+
+        all_args = []
+        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def _move_filters_from_output_args(
+        self, video_filters, audio_filters, output_args
+    ):
+        """Move filters found in output arguments to filters.
+
+        Returns:
+            list: Output arguments without filters.
+        """
+
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -780,21 +1019,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     output_args.remove(arg)
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
-
-        all_args = []
-        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
-
-        all_args.extend(output_args)
-
-        return all_args
+        return output_args
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
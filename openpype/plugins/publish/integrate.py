@@ -2,6 +2,7 @@ import os
 import logging
 import sys
 import copy
+import threading
 import clique
 import six
 
@@ -23,7 +24,9 @@ from openpype.client import (
     get_subset_by_name,
     get_version_by_name,
 )
+from openpype.client.representation_files import create_sequence_file_info
 from openpype.lib import source_hash
+from openpype.lib.file_hashing import get_file_hasher
 from openpype.lib.file_transaction import FileTransaction
 from openpype.pipeline.publish import (
     KnownPublishError,
@@ -144,6 +147,19 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "family", "hierarchy", "username", "user", "output"
     ]
     skip_host_families = []
+    # Store sequences as single compact item in representation 'files'
+    # - not used when site sync is enabled for project
+    compact_sequence_files = False
+    compact_sequence_min_frames = 100
+    # Store sha256 of file content as 'checksum' of each file
+    store_file_checksums = False
+    # Skip copy of files already existing in destination with same size
+    #   and modification time (e.g. republish of same version)
+    skip_identical_files = False
+    # Compare also content hash of files when 'skip_identical_files' is set
+    compare_file_hashes = False
+    # Log progress of file transfers
+    log_transfer_progress = False
 
     def process(self, instance):
         if self._temp_skip_instance_by_settings(instance):
@@ -168,7 +184,16 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log)
+        progress_callback = None
+        if self.log_transfer_progress:
+            progress_callback = self._create_progress_callback()
+
+        file_transactions = FileTransaction(
+            log=self.log,
+            skip_identical=self.skip_identical_files,
+            compare_hash=self.compare_file_hashes,
+            progress_callback=progress_callback
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except Exception:
@@ -182,6 +207,28 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # the try, except.
         file_transactions.finalize()
 
+    def _create_progress_callback(self):
+        """Callback logging progress of file transfers by 10 percent."""
+
+        logged_steps = set()
+        # Callback is called from threads of file transaction
+        lock = threading.Lock()
+
+        def _callback(transferred_bytes, total_bytes):
+            if not total_bytes:
+                return
+            step = min(int(transferred_bytes * 10 / total_bytes), 10)
+            with lock:
+                if step in logged_steps:
+                    return
+                logged_steps.add(step)
+            self.log.info("Transferred {}% ({:.1f}/{:.1f} MB)".format(
+                step * 10,
+                transferred_bytes / (1024.0 * 1024.0),
+                total_bytes / (1024.0 * 1024.0)
+            ))
+        return _callback
+
     def _temp_skip_instance_by_settings(self, instance):
         """Decide if instance will be processed with new or legacy integrator.
 
@@ -335,6 +382,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "Backed up existing files: {}".format(file_transactions.backups))
         self.log.debug(
             "Transferred files: {}".format(file_transactions.transferred))
+        if file_transactions.skipped:
+            self.log.debug("Skipped identical files: {}".format(
+                file_transactions.skipped))
         self.log.debug("Retrieving Representation Site Sync information ...")
 
         # Get the accessible sites for Site Sync
@@ -345,6 +395,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         )
         self.log.debug("Sync Server Sites: {}".format(sites))
 
+        compact_sequences = (
+            self.compact_sequence_files
+            and not sync_server_module.is_project_enabled(
+                project_name, single=True
+            )
+        )
+
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can re-use those file infos per representation
@@ -360,9 +417,16 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             repre_update_data = prepared["repre_doc_update_data"]
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
-            repre_doc["files"] = self.get_files_info(
-                destinations, sites=sites, anatomy=anatomy
-            )
+            files_info = None
+            if compact_sequences:
+                files_info = self.get_compact_files_info(
+                    destinations, sites=sites, anatomy=anatomy
+                )
+            if files_info is None:
+                files_info = self.get_files_info(
+                    destinations, sites=sites, anatomy=anatomy
+                )
+            repre_doc["files"] = files_info
 
             # Add the version resource file infos to each representation
             repre_doc["files"] += resource_file_infos
@@ -740,21 +804,25 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
+            index_key = "udim" if is_udim else "frame"
+            template_data_list = []
             for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                anatomy_filled = anatomy.format(template_data)
-                template_filled = anatomy_filled[template_name]["path"]
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+                index_template_data = dict(template_data)
+                index_template_data[index_key] = index
+                template_data_list.append(index_template_data)
+
+            # Fill all templates only for first index (used for 'publishDir')
+            template_data[index_key] = destination_indexes[0]
+            anatomy_filled = anatomy.format(template_data)
+            # Fill only path template for all indexes
+            dst_filepaths = anatomy.format_many(
+                [template_name, "path"], template_data_list
+            )
+            template_filled = dst_filepaths[0]
+            self.log.debug(
+                "Template filled: {}".format(str(template_filled))
+            )
+            repre_context = template_filled.used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -974,12 +1042,68 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             in representation
         """
 
+        hash_infos = {}
+        if self.store_file_checksums:
+            hash_infos = get_file_hasher().hash_files(destinations)
+
         file_infos = []
         for file_path in destinations:
             file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+            hash_info = hash_infos.get(file_path)
+            if hash_info:
+                file_info["checksum"] = hash_info["hash"]
             file_infos.append(file_info)
         return file_infos
 
+    def get_compact_files_info(self, destinations, sites, anatomy):
+        """Prepare compact 'files' info for sequence of files.
+
+        Whole sequence is stored as one item with frame ranges instead of
+        item per frame. Readers in 'openpype.client' expand the item back.
+
+        Arguments:
+            destinations (list): List of transferred file destinations
+            sites (list): array of published locations
+            anatomy: anatomy part from instance
+        Returns:
+            Union[list, None]: List with one compact item or None if
+                destinations are not a sequence long enough.
+        """
+
+        if len(destinations) < self.compact_sequence_min_frames:
+            return None
+
+        collections, remainders = clique.assemble(destinations)
+        if remainders or len(collections) != 1:
+            return None
+
+        collection = collections[0]
+        frames = sorted(collection.indexes)
+        path_template = collection.format("{head}{padding}{tail}")
+        paths = [path_template % frame for frame in frames]
+        hasher = get_file_hasher()
+        stats_by_path = hasher.stat_files(paths)
+        sizes = [stats_by_path[path].st_size for path in paths]
+        mtimes = [stats_by_path[path].st_mtime for path in paths]
+        checksums = None
+        if self.store_file_checksums:
+            hash_infos = hasher.hash_files(paths, stats_by_path)
+            checksums = [hash_infos[path]["hash"] for path in paths]
+
+        head = self.get_rootless_path(anatomy, collection.head)
+        return [
+            create_sequence_file_info(
+                head,
+                collection.tail,
+                collection.padding,
+                frames,
+                sizes,
+                mtimes,
+                sites,
+                checksums=checksums
+            )
+        ]
+
     def prepare_file_info(self, path, anatomy, sites):
         """ Prepare information for one file (asset or resource)
 
@@ -11,6 +11,7 @@ from openpype.client import (
     get_hero_version_by_subset_id,
     get_archived_representations,
     get_representations,
+    expand_representation_files,
 )
 from openpype.client.operations import (
     OperationsSession,
@@ -318,6 +319,8 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
                 # Prepare new repre
                 repre = copy.deepcopy(repre_info["representation"])
+                # Hero files have different paths and hashes per file
+                expand_representation_files(repre)
                 repre["parent"] = new_hero_version["_id"]
                 repre["context"] = repre_context
                 repre["data"] = repre_data
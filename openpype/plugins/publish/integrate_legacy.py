@@ -23,6 +23,7 @@ from openpype.client import (
     get_version_by_name,
     get_representations,
     get_archived_representations,
+    update_last_versions,
 )
 from openpype.lib import (
     prepare_template_data,
@@ -315,6 +316,8 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         if existing_version is None:
             version_id = legacy_io.insert_one(version).inserted_id
+            # Keep last version projection of subset up to date
+            update_last_versions(project_name, [subset["_id"]])
         else:
             # Check if instance have set `append` mode which cause that
             # only replicated representations are set to archive
@@ -1135,7 +1138,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                     get("always_accessible_on", [])
 
             already_attached_sites = {}
-            meta = {"name": local_site, "created_dt": datetime.now()}
+            meta = {"name": local_site, "created_dt": datetime.utcnow()}
             rec["sites"] = [meta]
             already_attached_sites[meta["name"]] = meta["created_dt"]
 
@@ -72,7 +72,7 @@ class PypeCommands:
         traypublisher.main()
 
     @staticmethod
-    def publish(paths, targets=None, gui=False):
+    def publish(paths, targets=None, gui=False, profile_path=None):
         """Start headless publishing.
 
         Publish use json from passed paths argument.
@@ -82,6 +82,8 @@ class PypeCommands:
             targets (string): What module should be targeted
                 (to choose validator for example)
             gui (bool): Show publish UI.
+            profile_path (str): Path to json file where publish report with
+                profile of plugins is stored. Summary of profile is logged.
 
         Raises:
             RuntimeError: When there is no path to process.
@@ -148,14 +150,63 @@ class PypeCommands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
-                if result["error"]:
-                    log.error(error_format.format(**result))
-                    # uninstall()
-                    sys.exit(1)
+            if not profile_path:
+                for result in pyblish.util.publish_iter():
+                    if result["error"]:
+                        log.error(error_format.format(**result))
+                        # uninstall()
+                        sys.exit(1)
+
+            else:
+                PypeCommands._profiled_publish(profile_path, error_format)
 
         log.info("Publish finished.")
 
+    @staticmethod
+    def _profiled_publish(profile_path, error_format):
+        """Publish with profiling and store publish report with profile."""
+
+        import pyblish.api
+        import pyblish.util
+
+        from openpype.lib import Logger
+        from openpype.pipeline.publish import (
+            PublishProfiler,
+            format_profile_summary,
+            create_publish_report,
+        )
+
+        log = Logger.get_logger("CLI-publish")
+
+        context = pyblish.api.Context()
+        profiler = PublishProfiler()
+        results = []
+        failed_result = None
+        for result in profiler.profile_results(
+            pyblish.util.publish_iter(context)
+        ):
+            results.append(result)
+            if result["error"]:
+                failed_result = result
+                break
+
+        profile_data = profiler.to_data()
+        report = create_publish_report(context, results, profile_data)
+        profile_dir = os.path.dirname(os.path.abspath(profile_path))
+        if not os.path.exists(profile_dir):
+            os.makedirs(profile_dir)
+        with open(profile_path, "w") as stream:
+            json.dump(report, stream, indent=4)
+
+        log.info("Publish profile:\n{}".format(
+            format_profile_summary(profile_data, limit=20)
+        ))
+        log.info("Publish report stored to \"{}\"".format(profile_path))
+
+        if failed_result is not None:
+            log.error(error_format.format(**failed_result))
+            sys.exit(1)
+
     @staticmethod
     def remotepublishfromapp(project_name, batch_path, host_name,
                              user_email, targets=None):
@@ -350,12 +401,90 @@ class PypeCommands:
         version_packer = VersionRepacker(directory)
         version_packer.process()
 
-    def pack_project(self, project_name, dirpath):
+    def pack_project(
+        self,
+        project_name,
+        dirpath,
+        workers=None,
+        store_only=False,
+        resume=False,
+        base_package=None
+    ):
         from openpype.lib.project_backpack import pack_project
 
-        pack_project(project_name, dirpath)
+        pack_project(
+            project_name,
+            dirpath,
+            workers=workers,
+            store_only=store_only,
+            resume=resume,
+            base_package=base_package
+        )
 
-    def unpack_project(self, zip_filepath, new_root):
+    def unpack_project(self, zip_filepath, new_root, workers=None):
         from openpype.lib.project_backpack import unpack_project
 
-        unpack_project(zip_filepath, new_root)
+        unpack_project(zip_filepath, new_root, workers=workers)
+
+    def migrate_database(self, project_name, last_versions):
+        from openpype.client.migrations import migrate_project_database
+
+        migrate_project_database(project_name, last_versions)
+
+    def settings_cache(self, action, project_names, all_versions):
+        """Warm, inspect or clear on-disk snapshots of settings.
+
+        Args:
+            action (str): One of 'warm', 'info' or 'clear'.
+            project_names (List[str]): Limit action to projects. All
+                active projects are warmed if not passed.
+            all_versions (bool): Clear snapshots of all OpenPype versions.
+        """
+
+        # Snapshots are created only when are enabled
+        os.environ["OPENPYPE_SETTINGS_CACHE"] = "1"
+
+        from openpype.settings.lib import (
+            get_settings_snapshot_cache,
+            get_system_settings,
+            get_project_settings,
+        )
+
+        snapshot_cache = get_settings_snapshot_cache()
+        if action == "info":
+            print("Settings cache directory: {}".format(
+                snapshot_cache.cache_dir
+            ))
+            for info in snapshot_cache.get_snapshots_info():
+                if project_names and info["project_name"] not in project_names:
+                    continue
+                print((
+                    "{openpype_version} {settings_type}"
+                    " {project_name} {size}B valid: {valid}"
+                ).format(**info))
+            return
+
+        if action == "clear":
+            if not project_names:
+                count = snapshot_cache.clear(all_versions=all_versions)
+            else:
+                count = 0
+                for project_name in project_names:
+                    count += snapshot_cache.clear(project_name, all_versions)
+            print("Removed {} settings snapshots".format(count))
+            return
+
+        if not project_names:
+            from openpype.client import get_projects
+
+            project_names = [
+                project_doc["name"]
+                for project_doc in get_projects(fields=["name"])
+            ]
+
+        get_system_settings()
+        for project_name in project_names:
+            get_project_settings(project_name)
+        print("Settings snapshots are up to date for {} projects".format(
+            len(project_names)
+        ))
@@ -787,7 +787,7 @@ class SyncServerProviders(DictConditionalEntity):
         provider_code_to_label = {}
         providers = lib_providers.factory.providers
         for provider_code, provider_info in providers.items():
-            provider, _ = provider_info
+            provider = provider_info[0]
             provider_code_to_label[provider_code] = provider.LABEL
 
         system_settings_schema = (
@@ -809,6 +809,26 @@ class SyncServerProviders(DictConditionalEntity):
                     "object_type": "text"
                 }
             )
+            # limits of file transfers of the site, '0' uses default of
+            #   the provider
+            configurables.extend([
+                {
+                    "type": "number",
+                    "key": "max_workers",
+                    "label": "Parallel transfers (0 for default)",
+                    "minimum": 0,
+                    "maximum": 100,
+                    "default": 0
+                },
+                {
+                    "type": "number",
+                    "key": "rate_limit",
+                    "label": "Started transfers per second (0 for default)",
+                    "minimum": 0,
+                    "decimal": 2,
+                    "default": 0
+                }
+            ])
             label = provider_code_to_label.get(provider_code) or provider_code
 
             enum_children.append({
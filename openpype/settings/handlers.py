@@ -1,6 +1,7 @@
 import os
 import json
 import copy
+import hashlib
 import collections
 import datetime
 from abc import ABCMeta, abstractmethod
@@ -479,6 +480,34 @@ class SettingsHandler(object):
 
         pass
 
+    @abstractmethod
+    def get_system_settings_stamp(self):
+        """Stamp changed on any change of studio system settings overrides.
+
+        Stamp must be cheap to calculate as it is used to validate on-disk
+        snapshots of settings.
+
+        Returns:
+            str: Stamp of system settings overrides.
+        """
+
+        pass
+
+    @abstractmethod
+    def get_project_settings_stamp(self, project_name):
+        """Stamp changed on any change of project settings overrides.
+
+        Args:
+            project_name (Union[None, str]): Project name for which stamp
+                should be returned. Stamp of studio project settings
+                overrides is returned if 'None' is passed.
+
+        Returns:
+            str: Stamp of project settings overrides.
+        """
+
+        pass
+
     # UI related calls
     @abstractmethod
     def get_last_opened_info(self):
@@ -1432,6 +1461,53 @@ class MongoSettingsHandler(SettingsHandler):
 
         return self.project_settings_cache[project_name].last_saved_info.copy()
 
+    def _get_documents_stamp(self, query_filter, projection=None):
+        if projection is None:
+            projection = {
+                "_id": True,
+                "type": True,
+                "version": True,
+                "last_saved_info.timestamp": True,
+                self._all_versions_keys: True
+            }
+        items = sorted(
+            json.dumps(doc, sort_keys=True, default=str)
+            for doc in self.collection.find(query_filter, projection)
+        )
+        content = "\n".join(items).encode("utf-8")
+        return hashlib.sha256(content).hexdigest()
+
+    def get_system_settings_stamp(self):
+        # Closest version is used if current version does not have
+        #   overrides so all versions and their order must be in the stamp
+        stamp = self._get_documents_stamp({
+            "type": {"$in": [
+                self._system_settings_key,
+                SYSTEM_SETTINGS_KEY,
+                self._version_order_key
+            ]}
+        })
+        # Global settings document does not have last saved info but
+        #   it's data are small
+        globals_stamp = self._get_documents_stamp(
+            {"type": GLOBAL_SETTINGS_KEY},
+            {"_id": False}
+        )
+        return "{}{}".format(stamp, globals_stamp)
+
+    def get_project_settings_stamp(self, project_name):
+        settings_types = [self._project_settings_key, PROJECT_SETTINGS_KEY]
+        filters = [
+            {"type": self._version_order_key},
+            {"type": {"$in": settings_types}, "is_default": True}
+        ]
+        if project_name is not None:
+            filters.append({
+                "type": {"$in": settings_types},
+                "project_name": project_name
+            })
+        return self._get_documents_stamp({"$or": filters})
+
     def get_studio_project_settings_overrides(self, return_version):
         """Studio overrides of default project settings."""
         return self._get_project_settings_overrides(None, return_version)
@@ -39,6 +39,9 @@ _SETTINGS_HANDLER = None
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# On-disk snapshots of merged settings
+_SETTINGS_SNAPSHOT_CACHE = None
+
 
 def require_handler(func):
     @functools.wraps(func)
@@ -101,6 +104,16 @@ def get_project_last_saved_info(project_name):
     return _SETTINGS_HANDLER.get_project_last_saved_info(project_name)
 
 
+@require_handler
+def get_system_settings_stamp():
+    return _SETTINGS_HANDLER.get_system_settings_stamp()
+
+
+@require_handler
+def get_project_settings_stamp(project_name):
+    return _SETTINGS_HANDLER.get_project_settings_stamp(project_name)
+
+
 @require_handler
 def get_last_opened_info():
     return _SETTINGS_HANDLER.get_last_opened_info()
@@ -161,6 +174,7 @@ def save_studio_settings(data):
 
     _SETTINGS_HANDLER.save_change_log(None, changes, "system")
     _SETTINGS_HANDLER.save_studio_settings(data)
+    _reset_settings_stamps()
     if warnings:
         raise SaveWarningExc(warnings)
 
@@ -221,6 +235,7 @@ def save_project_settings(project_name, overrides):
                 warnings.extend(exc.warnings)
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "project")
     _SETTINGS_HANDLER.save_project_settings(project_name, overrides)
+    _reset_settings_stamps()
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -890,11 +905,82 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
-def get_system_settings(clear_metadata=True, exclude_locals=None):
-    """System settings with applied studio overrides."""
+def get_settings_snapshot_cache():
+    """Cache of settings snapshots on disk.
+
+    Returns:
+        Union[SettingsSnapshotCache, None]: Cache object or 'None' if
+            snapshots are disabled.
+    """
+    global _SETTINGS_SNAPSHOT_CACHE
+
+    from .snapshots import SettingsSnapshotCache, is_settings_cache_enabled
+
+    if not is_settings_cache_enabled():
+        return None
+
+    if _SETTINGS_SNAPSHOT_CACHE is None:
+        _SETTINGS_SNAPSHOT_CACHE = SettingsSnapshotCache()
+    return _SETTINGS_SNAPSHOT_CACHE
+
+
+def _reset_settings_stamps():
+    if _SETTINGS_SNAPSHOT_CACHE is not None:
+        _SETTINGS_SNAPSHOT_CACHE.reset_stamps()
+
+
+def _get_settings_from_snapshot(settings_type, project_name, func):
+    """Merged settings from on-disk snapshot or from 'func'.
+
+    Snapshot is validated with stamp of settings documents in database.
+    Result of 'func' is stored as new snapshot when snapshot is not valid.
+
+    Args:
+        settings_type (str): Type of settings.
+        project_name (Union[str, None]): Name of project.
+        func (Callable[[], dict]): Function creating merged settings.
+
+    Returns:
+        dict: Merged settings with metadata and without local settings.
+    """
+
+    snapshot_cache = get_settings_snapshot_cache()
+    if snapshot_cache is None:
+        return func()
+
+    if settings_type == SYSTEM_SETTINGS_KEY:
+        get_stamp = get_system_settings_stamp
+    else:
+        get_stamp = functools.partial(
+            get_project_settings_stamp, project_name
+        )
+
+    try:
+        stamp = snapshot_cache.get_stamp(
+            settings_type, project_name, get_stamp
+        )
+    except Exception:
+        log.warning("Failed to get settings stamp", exc_info=True)
+        return func()
+
+    data = snapshot_cache.get(settings_type, project_name, stamp)
+    if data is None:
+        data = func()
+        snapshot_cache.store(settings_type, project_name, stamp, data)
+    return data
+
+
+def _get_system_settings_data():
     default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
     studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+    return apply_overrides(default_values, studio_values)
+
+
+def get_system_settings(clear_metadata=True, exclude_locals=None):
+    """System settings with applied studio overrides."""
+    result = _get_settings_from_snapshot(
+        SYSTEM_SETTINGS_KEY, None, _get_system_settings_data
+    )
 
     # Clear overrides metadata from settings
     if clear_metadata:
@@ -913,11 +999,17 @@ def get_system_settings(clear_metadata=True, exclude_locals=None):
     return result
 
 
-def get_default_project_settings(clear_metadata=True, exclude_locals=None):
-    """Project settings with applied studio's default project overrides."""
+def _get_default_project_settings_data():
     default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
     studio_values = get_studio_project_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+    return apply_overrides(default_values, studio_values)
+
+
+def get_default_project_settings(clear_metadata=True, exclude_locals=None):
+    """Project settings with applied studio's default project overrides."""
+    result = _get_settings_from_snapshot(
+        PROJECT_SETTINGS_KEY, None, _get_default_project_settings_data
+    )
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
@@ -992,6 +1084,14 @@ def get_anatomy_settings(
     return result
 
 
+def _get_project_settings_data(project_name):
+    studio_overrides = get_default_project_settings(False)
+    project_overrides = get_project_settings_overrides(
+        project_name
+    )
+    return apply_overrides(studio_overrides, project_overrides)
+
+
 def get_project_settings(
     project_name, clear_metadata=True, exclude_locals=None
 ):
@@ -1002,13 +1102,12 @@ def get_project_settings(
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
-    project_overrides = get_project_settings_overrides(
-        project_name
+    result = _get_settings_from_snapshot(
+        PROJECT_SETTINGS_KEY,
+        project_name,
+        lambda: _get_project_settings_data(project_name)
     )
 
-    result = apply_overrides(studio_overrides, project_overrides)
-
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
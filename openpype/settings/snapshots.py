@@ -0,0 +1,329 @@
+"""Persistent on-disk snapshots of merged settings.
+
+Loading of system or project settings requires to load default settings
+from json files, query studio (and project) overrides from database and merge
+them. Snapshots store the merged result (with metadata and without local
+settings) on disk so other processes can reuse it.
+
+Snapshots are stored per OpenPype version and validated with a stamp of
+settings documents in database. Stamp is calculated from ids, versions and
+last saved timestamps of relevant documents which is a cheap query compared
+to loading of whole documents. Snapshot is also invalidated when default
+settings files of OpenPype change. Defaults added by addons are covered only
+by OpenPype version, cache should be cleared with
+'openpype_console settings-cache clear' after addons update.
+
+Snapshots are disabled by default, they can be enabled with environment
+variable 'OPENPYPE_SETTINGS_CACHE' set to '1'. Directory where snapshots are
+stored can be changed with 'OPENPYPE_SETTINGS_CACHE_DIR'.
+"""
+
+import os
+import copy
+import json
+import time
+import uuid
+import shutil
+import hashlib
+import logging
+
+import appdirs
+
+import openpype.version
+from openpype.lib.path_tools import replace_file
+
+from .constants import SYSTEM_SETTINGS_KEY
+
+# Bump when structure of snapshot file changes
+SNAPSHOT_SCHEMA_VERSION = 1
+
+log = logging.getLogger(__name__)
+
+
+def is_settings_cache_enabled():
+    return os.environ.get("OPENPYPE_SETTINGS_CACHE") == "1"
+
+
+def get_settings_cache_dir():
+    """Root directory of settings snapshots."""
+
+    cache_dir = os.environ.get("OPENPYPE_SETTINGS_CACHE_DIR")
+    if not cache_dir:
+        cache_dir = os.path.join(
+            appdirs.user_data_dir("openpype", "pypeclub"),
+            "settings_cache"
+        )
+    return os.path.normpath(cache_dir)
+
+
+def get_content_hash(data):
+    content = json.dumps(data, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+class SettingsSnapshotCache(object):
+    """Access to settings snapshots of single OpenPype version.
+
+    Args:
+        cache_dir (Optional[str]): Root directory of snapshots. Output of
+            'get_settings_cache_dir' is used if not passed.
+        openpype_version (Optional[str]): OpenPype version of snapshots.
+            Current version is used if not passed.
+    """
+
+    # Time in seconds for which is stamp reused in current process
+    stamp_lifetime = 10
+
+    def __init__(self, cache_dir=None, openpype_version=None):
+        if cache_dir is None:
+            cache_dir = get_settings_cache_dir()
+
+        if openpype_version is None:
+            openpype_version = openpype.version.__version__
+
+        self._cache_dir = cache_dir
+        self._openpype_version = openpype_version
+        self._defaults_fingerprint = None
+        # Snapshots loaded in current process by path
+        self._loaded = {}
+        self._stamps = {}
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    @property
+    def version_dir(self):
+        return os.path.join(self._cache_dir, self._openpype_version)
+
+    @property
+    def defaults_fingerprint(self):
+        """Fingerprint of OpenPype default settings files.
+
+        Fingerprint is based on relative paths, sizes and modification times
+        of files so defaults don't have to be loaded to validate snapshot.
+        """
+
+        if self._defaults_fingerprint is None:
+            from .lib import DEFAULTS_DIR
+
+            items = []
+            base_len = len(DEFAULTS_DIR) + 1
+            for root, _, filenames in os.walk(DEFAULTS_DIR):
+                for filename in filenames:
+                    if not filename.endswith(".json"):
+                        continue
+                    path = os.path.join(root, filename)
+                    stat = os.stat(path)
+                    items.append((
+                        path[base_len:].replace("\\", "/"),
+                        stat.st_size,
+                        int(stat.st_mtime)
+                    ))
+            self._defaults_fingerprint = get_content_hash(sorted(items))
+        return self._defaults_fingerprint
+
+    def get_stamp(self, settings_type, project_name, func):
+        """Stamp of settings documents reused for 'stamp_lifetime' seconds.
+
+        Args:
+            settings_type (str): Type of settings.
+            project_name (Union[str, None]): Name of project.
+            func (Callable[[], str]): Function querying stamp from database.
+
+        Returns:
+            str: Stamp of settings documents.
+        """
+
+        key = (settings_type, project_name)
+        item = self._stamps.get(key)
+        if item is not None and time.time() - item[0] < self.stamp_lifetime:
+            return item[1]
+        stamp = func()
+        self._stamps[key] = (time.time(), stamp)
+        return stamp
+
+    def reset_stamps(self):
+        """Force query of stamps e.g. after settings were saved."""
+
+        self._stamps = {}
+
+    def get_snapshot_path(self, settings_type, project_name=None):
+        filename = settings_type
+        if settings_type != SYSTEM_SETTINGS_KEY:
+            # Studio defaults of project settings
+            filename = "{}__{}".format(
+                settings_type, project_name or "__default__"
+            )
+        return os.path.join(self.version_dir, filename + ".json")
+
+    def _read_snapshot(self, path):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as stream:
+                return json.load(stream)
+        except Exception:
+            log.debug(
+                "Failed to read settings snapshot \"{}\"".format(path),
+                exc_info=True
+            )
+        return None
+
+    def get(self, settings_type, project_name, stamp):
+        """Load settings from snapshot if it is valid.
+
+        Args:
+            settings_type (str): Type of settings.
+            project_name (Union[str, None]): Name of project.
+            stamp (str): Current stamp of settings documents in database.
+
+        Returns:
+            Union[dict, None]: Settings data or 'None' when snapshot is not
+                available or is outdated.
+        """
+
+        path = self.get_snapshot_path(settings_type, project_name)
+        loaded = self._loaded.get(path)
+        if loaded is not None and loaded[0] == stamp:
+            return copy.deepcopy(loaded[1])
+
+        snapshot = self._read_snapshot(path)
+        if (
+            not snapshot
+            or snapshot.get("schema") != SNAPSHOT_SCHEMA_VERSION
+            or snapshot.get("stamp") != stamp
+            or snapshot.get("defaults") != self.defaults_fingerprint
+        ):
+            return None
+
+        data = snapshot.get("data")
+        # Validate content to not use partially written or modified file
+        if data is None or get_content_hash(data) != snapshot.get("hash"):
+            return None
+        self._loaded[path] = (stamp, copy.deepcopy(data))
+        return data
+
+    def store(self, settings_type, project_name, stamp, data):
+        """Store settings snapshot.
+
+        Snapshot is written to temporary file which then replaces previous
+        snapshot so other processes never read partially written file.
+        Failures are only logged, snapshots are just an optimization.
+        """
+
+        path = self.get_snapshot_path(settings_type, project_name)
+        self._loaded[path] = (stamp, copy.deepcopy(data))
+        snapshot = {
+            "schema": SNAPSHOT_SCHEMA_VERSION,
+            "openpype_version": self._openpype_version,
+            "settings_type": settings_type,
+            "project_name": project_name,
+            "stamp": stamp,
+            "defaults": self.defaults_fingerprint,
+            "hash": get_content_hash(data),
+            "created": time.time(),
+            "data": data
+        }
+        tmp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+        try:
+            if not os.path.exists(self.version_dir):
+                try:
+                    os.makedirs(self.version_dir)
+                except OSError:
+                    # Directory may be created by other process in meantime
+                    if not os.path.isdir(self.version_dir):
+                        raise
+
+            with open(tmp_path, "w") as stream:
+                json.dump(snapshot, stream)
+            replace_file(tmp_path, path)
+
+        except Exception:
+            log.warning(
+                "Failed to store settings snapshot \"{}\"".format(path),
+                exc_info=True
+            )
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get_snapshots_info(self):
+        """Information about stored snapshots of all OpenPype versions.
+
+        Returns:
+            List[Dict[str, Any]]: Information about snapshots without data.
+        """
+
+        output = []
+        if not os.path.isdir(self._cache_dir):
+            return output
+
+        for version in sorted(os.listdir(self._cache_dir)):
+            version_dir = os.path.join(self._cache_dir, version)
+            if not os.path.isdir(version_dir):
+                continue
+
+            for filename in sorted(os.listdir(version_dir)):
+                if not filename.endswith(".json"):
+                    continue
+                path = os.path.join(version_dir, filename)
+                snapshot = self._read_snapshot(path) or {}
+                output.append({
+                    "path": path,
+                    "size": os.path.getsize(path),
+                    "openpype_version": snapshot.get(
+                        "openpype_version", version
+                    ),
+                    "settings_type": snapshot.get("settings_type"),
+                    "project_name": snapshot.get("project_name"),
+                    "stamp": snapshot.get("stamp"),
+                    "created": snapshot.get("created"),
+                    "valid": (
+                        snapshot.get("schema") == SNAPSHOT_SCHEMA_VERSION
+                        and snapshot.get("hash") == get_content_hash(
+                            snapshot.get("data")
+                        )
+                    )
+                })
+        return output
+
+    def clear(self, project_name=None, all_versions=False):
+        """Remove snapshots.
+
+        Args:
+            project_name (Optional[str]): Remove only snapshots of project.
+            all_versions (bool): Remove snapshots of all OpenPype versions.
+                Only current version is cleared by default.
+
+        Returns:
+            int: Number of removed snapshots.
+        """
+
+        self._loaded = {}
+        if all_versions:
+            root_dir = self._cache_dir
+        else:
+            root_dir = self.version_dir
+
+        if not os.path.isdir(root_dir):
+            return 0
+
+        if project_name is None:
+            count = 0
+            for _, _, filenames in os.walk(root_dir):
+                count += len([
+                    filename
+                    for filename in filenames
+                    if filename.endswith(".json")
+                ])
+            shutil.rmtree(root_dir)
+            return count
+
+        suffix = "__{}.json".format(project_name)
+        count = 0
+        for root, _, filenames in os.walk(root_dir):
+            for filename in filenames:
+                if filename.endswith(suffix):
+                    os.remove(os.path.join(root, filename))
+                    count += 1
+        return count
@@ -29,6 +29,10 @@ from openpype.pipeline import (
     legacy_io,
     get_process_id,
 )
+from openpype.pipeline.publish import (
+    PublishProfiler,
+    get_publish_result_log_items,
+)
 from openpype.pipeline.create import (
     CreateContext,
     AutoCreator,
@@ -180,6 +184,13 @@ class PublishReport:
         self._current_plugin_data = []
         self._all_instances_by_id = {}
         self._current_context = None
+        self._profiler = PublishProfiler()
+
+    @property
+    def profiler(self):
+        """Profiler measuring processing of plugins."""
+
+        return self._profiler
 
     def reset(self, context, create_context):
         """Reset report and clear all data."""
@@ -194,6 +205,7 @@ class PublishReport:
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
         self._current_context = context
+        self._profiler.reset()
 
         for plugin in create_context.publish_plugins_mismatch_targets:
             plugin_data = self._add_plugin_data_item(plugin)
@@ -323,6 +335,7 @@ class PublishReport:
             "instances": instances_details,
             "context": self._extract_context_data(self._current_context),
             "crashed_file_paths": crashed_file_paths,
+            "profile": self._profiler.to_data(),
             "id": str(uuid.uuid4()),
             "report_version": "1.0.0"
         }
@@ -356,47 +369,7 @@ class PublishReport:
         return log_items
 
     def _extract_log_items(self, result):
-        output = []
-        records = result.get("records") or []
-        for record in records:
-            record_exc_info = record.exc_info
-            if record_exc_info is not None:
-                record_exc_info = "".join(
-                    traceback.format_exception(*record_exc_info)
-                )
-
-            try:
-                msg = record.getMessage()
-            except Exception:
-                msg = str(record.msg)
-
-            output.append({
-                "type": "record",
-                "msg": msg,
-                "name": record.name,
-                "lineno": record.lineno,
-                "levelno": record.levelno,
-                "levelname": record.levelname,
-                "threadName": record.threadName,
-                "filename": record.filename,
-                "pathname": record.pathname,
-                "msecs": record.msecs,
-                "exc_info": record_exc_info
-            })
-
-        exception = result.get("error")
-        if exception:
-            fname, line_no, func, exc = exception.traceback
-            output.append({
-                "type": "error",
-                "msg": str(exception),
-                "filename": str(fname),
-                "lineno": str(line_no),
-                "func": str(func),
-                "traceback": exception.formatted_traceback
-            })
-
-        return output
+        return get_publish_result_log_items(result)
 
 
 class PublishPluginsProxy:
@@ -2318,9 +2291,12 @@ class PublisherController(BasePublisherController):
         )
 
     def _process_and_continue(self, plugin, instance):
-        result = pyblish.plugin.process(
-            plugin, self._publish_context, instance
-        )
+        profiler = self._publish_report.profiler
+        with profiler.profile(plugin, instance) as record_data:
+            result = pyblish.plugin.process(
+                plugin, self._publish_context, instance
+            )
+            record_data["success"] = result["success"]
 
         self._publish_report.add_result(result)
 
@@ -204,3 +204,56 @@ class PluginProxyModel(QtCore.QSortFilterProxyModel):
         if self._ignore_skipped and source_index.data(PLUGIN_SKIPPED_ROLE):
             return False
         return True
+
+
+class ProfileModel(QtGui.QStandardItemModel):
+    """Profile records of plugins in table."""
+
+    column_labels = (
+        "Plugin",
+        "Instance",
+        "Wall (s)",
+        "CPU (s)",
+        "DB commands",
+        "Copied (MB)"
+    )
+
+    def __init__(self, *args, **kwargs):
+        super(ProfileModel, self).__init__(*args, **kwargs)
+        self.setHorizontalHeaderLabels(self.column_labels)
+
+    def set_report(self, report_item):
+        self.removeRows(0, self.rowCount())
+        if not report_item or not report_item.profile:
+            return
+
+        root_item = self.invisibleRootItem()
+        rows = []
+        for record in report_item.profile["records"]:
+            instance_label = record["instance_label"] or "Context"
+            values = (
+                record["label"],
+                instance_label,
+                round(record["wall_time"], 3),
+                round(record["cpu_time"], 3),
+                record["db_queries"],
+                round(record["bytes_copied"] / (1024.0 * 1024.0), 1)
+            )
+            row = []
+            for value in values:
+                item = QtGui.QStandardItem()
+                # Numeric values are sorted as numbers
+                item.setData(value, QtCore.Qt.DisplayRole)
+                item.setFlags(
+                    QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+                )
+                if not record["success"]:
+                    item.setData(
+                        QtGui.QColor(QtCore.Qt.red),
+                        QtCore.Qt.ForegroundRole
+                    )
+                row.append(item)
+            rows.append(row)
+
+        for row in rows:
+            root_item.appendRow(row)
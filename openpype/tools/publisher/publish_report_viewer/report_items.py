@@ -130,3 +130,6 @@ class PublishReport:
         self.logs = logs
 
         self.crashed_plugin_paths = report_data["crashed_file_paths"]
+
+        # Profile is available only in newer reports
+        self.profile = data.get("profile")
@@ -13,7 +13,8 @@ from .model import (
     InstancesModel,
     InstanceProxyModel,
     PluginsModel,
-    PluginProxyModel
+    PluginProxyModel,
+    ProfileModel
 )
 from .report_items import PublishReport
 
@@ -290,6 +291,209 @@ class DetailsWidget(QtWidgets.QWidget):
         self._output_widget.setPlainText(text)
 
 
+class ProfileChartWidget(QtWidgets.QWidget):
+    """Flame chart of plugins processing in time.
+
+    Each processed plugin has own row with bar for each processing (of
+    context or instance). Bar position and width are defined by start and
+    wall time of processing.
+    """
+
+    row_height = 18
+    label_width = 220
+
+    def __init__(self, parent):
+        super(ProfileChartWidget, self).__init__(parent)
+        self.setMouseTracking(True)
+
+        self._rows = []
+        self._bars = []
+        self._total_time = 0.0
+
+    def set_report(self, report):
+        rows = []
+        row_idx_by_plugin = {}
+        bars = []
+        total_time = 0.0
+        profile = None
+        if report is not None:
+            profile = report.profile
+
+        if profile:
+            for record in profile["records"]:
+                plugin_name = record["plugin"]
+                row_idx = row_idx_by_plugin.get(plugin_name)
+                if row_idx is None:
+                    row_idx = len(rows)
+                    row_idx_by_plugin[plugin_name] = row_idx
+                    rows.append(record["label"])
+                bars.append((row_idx, record))
+                total_time = max(
+                    total_time, record["start"] + record["wall_time"]
+                )
+
+        self._rows = rows
+        self._bars = bars
+        self._total_time = total_time
+        self.setMinimumHeight(len(rows) * self.row_height)
+        self.updateGeometry()
+        self.update()
+
+    def sizeHint(self):
+        return QtCore.QSize(600, len(self._rows) * self.row_height)
+
+    def _get_bar_rect(self, row_idx, record):
+        chart_width = max(self.width() - self.label_width, 1)
+        scale = chart_width / (self._total_time or 1.0)
+        return QtCore.QRectF(
+            self.label_width + record["start"] * scale,
+            row_idx * self.row_height + 1,
+            max(record["wall_time"] * scale, 1.0),
+            self.row_height - 2
+        )
+
+    def _get_record_at(self, pos):
+        for row_idx, record in self._bars:
+            rect = self._get_bar_rect(row_idx, record)
+            if rect.adjusted(-1, 0, 1, 0).contains(pos):
+                return record
+        return None
+
+    def event(self, event):
+        if event.type() == QtCore.QEvent.ToolTip:
+            record = self._get_record_at(QtCore.QPointF(event.pos()))
+            if record is None:
+                QtWidgets.QToolTip.hideText()
+            else:
+                QtWidgets.QToolTip.showText(
+                    event.globalPos(),
+                    (
+                        "{label} ({instance})\n"
+                        "Wall time: {wall:.3f}s\n"
+                        "CPU time: {cpu:.3f}s\n"
+                        "DB commands: {db}\n"
+                        "Copied: {copied:.1f} MB"
+                    ).format(
+                        label=record["label"],
+                        instance=record["instance_label"] or "Context",
+                        wall=record["wall_time"],
+                        cpu=record["cpu_time"],
+                        db=record["db_queries"],
+                        copied=record["bytes_copied"] / (1024.0 * 1024.0)
+                    ),
+                    self
+                )
+            return True
+        return super(ProfileChartWidget, self).event(event)
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+
+        text_color = self.palette().color(QtGui.QPalette.Text)
+        painter.setPen(text_color)
+        for row_idx, label in enumerate(self._rows):
+            rect = QtCore.QRectF(
+                4, row_idx * self.row_height,
+                self.label_width - 8, self.row_height
+            )
+            painter.drawText(
+                rect,
+                QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft,
+                painter.fontMetrics().elidedText(
+                    label, QtCore.Qt.ElideRight, int(rect.width())
+                )
+            )
+
+        ok_color = QtGui.QColor(90, 160, 220)
+        failed_color = QtGui.QColor(220, 90, 90)
+        painter.setPen(QtCore.Qt.NoPen)
+        for row_idx, record in self._bars:
+            if record["success"]:
+                painter.setBrush(ok_color)
+            else:
+                painter.setBrush(failed_color)
+            painter.drawRect(self._get_bar_rect(row_idx, record))
+        painter.end()
+
+
+class ProfileWidget(QtWidgets.QWidget):
+    """Profile of plugins as sortable table or flame chart."""
+
+    def __init__(self, parent):
+        super(ProfileWidget, self).__init__(parent)
+
+        mode_combobox = QtWidgets.QComboBox(self)
+        mode_combobox.addItem("Table")
+        mode_combobox.addItem("Flame chart")
+        summary_label = QtWidgets.QLabel(self)
+
+        header_layout = QtWidgets.QHBoxLayout()
+        header_layout.setContentsMargins(0, 0, 0, 0)
+        header_layout.addWidget(mode_combobox, 0)
+        header_layout.addWidget(summary_label, 1)
+
+        stack_widget = QtWidgets.QStackedWidget(self)
+
+        model = ProfileModel()
+        view = QtWidgets.QTreeView(stack_widget)
+        view.setRootIsDecorated(False)
+        view.setAlternatingRowColors(True)
+        view.setSortingEnabled(True)
+        view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        view.setModel(model)
+
+        chart_scroll = QtWidgets.QScrollArea(stack_widget)
+        chart_scroll.setWidgetResizable(True)
+        chart_widget = ProfileChartWidget(chart_scroll)
+        chart_scroll.setWidget(chart_widget)
+
+        stack_widget.addWidget(view)
+        stack_widget.addWidget(chart_scroll)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(header_layout, 0)
+        layout.addWidget(stack_widget, 1)
+
+        mode_combobox.currentIndexChanged.connect(
+            stack_widget.setCurrentIndex
+        )
+
+        self._summary_label = summary_label
+        self._view = view
+        self._model = model
+        self._chart_widget = chart_widget
+
+    def set_report(self, report):
+        self._model.set_report(report)
+        self._chart_widget.set_report(report)
+        # Slowest plugins first
+        self._view.sortByColumn(2, QtCore.Qt.DescendingOrder)
+        self._view.resizeColumnToContents(0)
+
+        profile = None
+        if report is not None:
+            profile = report.profile
+
+        if not profile:
+            self._summary_label.setText("Report does not contain profile")
+            return
+
+        records = profile["records"]
+        self._summary_label.setText((
+            "Total: {:.3f}s, CPU: {:.3f}s, DB commands: {},"
+            " Copied: {:.1f} MB"
+        ).format(
+            profile["wall_time"],
+            sum(record["cpu_time"] for record in records),
+            sum(record["db_queries"] for record in records),
+            sum(
+                record["bytes_copied"] for record in records
+            ) / (1024.0 * 1024.0)
+        ))
+
+
 class DeselectableTreeView(QtWidgets.QTreeView):
     """A tree view that deselects on clicking on an empty area in the view"""
 
@@ -417,9 +621,11 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
 
         logs_text_widget = DetailsWidget(details_tab_widget)
         plugin_load_report_widget = PluginLoadReportWidget(details_tab_widget)
+        profile_widget = ProfileWidget(details_tab_widget)
 
         details_tab_widget.addTab(logs_text_widget, "Logs")
         details_tab_widget.addTab(plugin_load_report_widget, "Crashed plugins")
+        details_tab_widget.addTab(profile_widget, "Profile")
 
         middle_widget = QtWidgets.QWidget(self)
         middle_layout = QtWidgets.QGridLayout(middle_widget)
@@ -458,6 +664,7 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
         self._report_item = None
         self._logs_text_widget = logs_text_widget
         self._plugin_load_report_widget = plugin_load_report_widget
+        self._profile_widget = profile_widget
 
         self._removed_instances_check = removed_instances_check
         self._instances_view = instances_view
@@ -507,6 +714,7 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
         self._plugins_model.set_report(report)
         self._logs_text_widget.set_report(report)
         self._plugin_load_report_widget.set_report(report)
+        self._profile_widget.set_report(report)
 
         self._ignore_selection_changes = False
 
@@ -1108,7 +1108,7 @@ class ProjectPushItemProcess:
         if sync_server_module is None or not sync_server_module.enabled:
             sites = [{
                 "name": "studio",
-                "created_dt": datetime.datetime.now()
+                "created_dt": datetime.datetime.utcnow()
             }]
         else:
             sites = sync_server_module.compute_resource_sync_sites(
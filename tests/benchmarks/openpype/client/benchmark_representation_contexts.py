@@ -0,0 +1,151 @@
+"""Compare resolving of representation parents for many containers.
+
+Creates temporary project with synthetic hierarchy and resolves parents
+of all representations using:
+- one 'get_representation_parents' call per container
+- batched queries per entity type (previous 'get_representations_parents')
+- single '$lookup' aggregation ('get_representations_with_parents')
+
+Requires 'OPENPYPE_MONGO' unless '--mongomock' is used. Temporary project
+collection is removed at the end.
+
+Example:
+    python benchmark_representation_contexts.py --containers 10000
+"""
+
+import time
+import uuid
+import argparse
+
+from bson.objectid import ObjectId
+
+from openpype.client import entities
+from openpype.client.mongo import get_project_database
+
+
+def create_project(collection, containers, repres_per_version):
+    asset_docs = []
+    subset_docs = []
+    version_docs = []
+    repre_docs = []
+    versions_count = max(containers // repres_per_version, 1)
+    subsets_count = max(versions_count // 4, 1)
+    assets_count = max(subsets_count // 5, 1)
+    for idx in range(assets_count):
+        asset_docs.append({
+            "_id": ObjectId(),
+            "type": "asset",
+            "name": "asset_{}".format(idx),
+            "data": {}
+        })
+
+    for idx in range(subsets_count):
+        subset_docs.append({
+            "_id": ObjectId(),
+            "type": "subset",
+            "name": "subset_{}".format(idx),
+            "parent": asset_docs[idx % assets_count]["_id"],
+            "data": {"families": ["render"]}
+        })
+
+    for idx in range(versions_count):
+        version_docs.append({
+            "_id": ObjectId(),
+            "type": "version",
+            "name": idx // subsets_count + 1,
+            "parent": subset_docs[idx % subsets_count]["_id"],
+            "data": {}
+        })
+
+    for idx in range(containers):
+        repre_docs.append({
+            "_id": ObjectId(),
+            "type": "representation",
+            "name": "repre_{}".format(idx % repres_per_version),
+            "parent": version_docs[idx % versions_count]["_id"],
+            "context": {},
+            "data": {}
+        })
+
+    collection.insert_one({
+        "_id": ObjectId(),
+        "type": "project",
+        "name": collection.name,
+        "data": {"code": "bench"}
+    })
+    for docs in (asset_docs, subset_docs, version_docs, repre_docs):
+        collection.insert_many(docs)
+    return repre_docs
+
+
+def _batched_queries(project_name, repre_ids):
+    # Previous implementation of parents resolving
+    repre_docs = list(entities.get_representations(project_name, repre_ids))
+    version_ids = {repre_doc["parent"] for repre_doc in repre_docs}
+    version_docs = list(
+        entities.get_versions(project_name, version_ids, hero=True)
+    )
+    subset_ids = {version_doc["parent"] for version_doc in version_docs}
+    subset_docs = list(entities.get_subsets(project_name, subset_ids))
+    asset_ids = {subset_doc["parent"] for subset_doc in subset_docs}
+    list(entities.get_assets(project_name, asset_ids))
+    entities.get_project(project_name)
+
+
+def _per_container(project_name, repre_ids):
+    for repre_id in repre_ids:
+        repre_doc = entities.get_representation_by_id(project_name, repre_id)
+        entities.get_representation_parents(project_name, repre_doc)
+
+
+def _aggregation(project_name, repre_ids):
+    entities.get_representations_with_parents(project_name, repre_ids)
+    entities.get_project(project_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--containers", type=int, default=10000)
+    parser.add_argument("--repres-per-version", type=int, default=5)
+    parser.add_argument(
+        "--skip-per-container",
+        action="store_true",
+        help="Skip slowest variant with queries per container."
+    )
+    parser.add_argument("--mongomock", action="store_true")
+    args = parser.parse_args()
+
+    if args.mongomock:
+        import mongomock
+
+        database = mongomock.MongoClient()["avalon"]
+        entities.get_project_connection = lambda name: database[name]
+    else:
+        database = get_project_database()
+
+    project_name = "benchmark_{}".format(uuid.uuid4().hex[:8])
+    collection = database[project_name]
+    try:
+        repre_docs = create_project(
+            collection, args.containers, args.repres_per_version
+        )
+        repre_ids = [repre_doc["_id"] for repre_doc in repre_docs]
+
+        variants = [
+            ("batched queries", _batched_queries),
+            ("single aggregation", _aggregation),
+        ]
+        if not args.skip_per_container:
+            variants.insert(0, ("query per container", _per_container))
+
+        print("{} containers".format(args.containers))
+        for label, func in variants:
+            start = time.time()
+            func(project_name, repre_ids)
+            print("{:<25} {:>8.3f}s".format(label, time.time() - start))
+    finally:
+        collection.drop()
+
+
+if __name__ == "__main__":
+    main()
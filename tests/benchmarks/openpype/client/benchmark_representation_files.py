@@ -0,0 +1,140 @@
+"""Compare per-frame and compact 'files' of sequence representation.
+
+Benchmark creates sequence of empty files in temp directory and measures
+time of preparing 'files' info the same way as 'IntegrateAsset' does (item
+per frame) and with compact sequence item. It also measures BSON size of
+representation document and time of expanding compact item by readers.
+
+Example:
+    python benchmark_representation_files.py --frames 10000
+"""
+
+import os
+import time
+import shutil
+import datetime
+import argparse
+import tempfile
+
+import bson
+from bson.objectid import ObjectId
+
+from openpype.lib import source_hash
+from openpype.client.representation_files import (
+    create_sequence_file_info,
+    get_representation_files,
+)
+
+ROOT = "{root[work]}"
+
+
+def create_sequence(dirpath, frames, start_frame):
+    paths = []
+    for frame in range(start_frame, start_frame + frames):
+        path = os.path.join(dirpath, "render.{:04d}.exr".format(frame))
+        with open(path, "wb") as stream:
+            stream.write(b"0" * 128)
+        paths.append(path)
+    return paths
+
+
+def rootless(dirpath, path):
+    return path.replace(dirpath, ROOT, 1)
+
+
+def per_frame_files(dirpath, paths, sites):
+    return [
+        {
+            "_id": ObjectId(),
+            "path": rootless(dirpath, path),
+            "size": os.path.getsize(path),
+            "hash": source_hash(path),
+            "sites": sites
+        }
+        for path in paths
+    ]
+
+
+def compact_files(dirpath, paths, start_frame, sites):
+    sizes = []
+    mtimes = []
+    for path in paths:
+        stat = os.stat(path)
+        sizes.append(stat.st_size)
+        mtimes.append(stat.st_mtime)
+    head = rootless(dirpath, os.path.join(dirpath, "render."))
+    frames = list(range(start_frame, start_frame + len(paths)))
+    return [
+        create_sequence_file_info(
+            head, ".exr", 4, frames, sizes, mtimes, sites
+        )
+    ]
+
+
+def repre_doc(files):
+    return {
+        "_id": ObjectId(),
+        "schema": "openpype:representation-2.0",
+        "type": "representation",
+        "parent": ObjectId(),
+        "name": "exr",
+        "data": {},
+        "context": {},
+        "files": files
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--start-frame", type=int, default=1001)
+    args = parser.parse_args()
+
+    sites = [{"name": "studio", "created_dt": datetime.datetime.now()}]
+    dirpath = tempfile.mkdtemp(prefix="openpype_bench_")
+    try:
+        paths = create_sequence(dirpath, args.frames, args.start_frame)
+
+        start = time.time()
+        frame_files = per_frame_files(dirpath, paths, sites)
+        frame_time = time.time() - start
+
+        start = time.time()
+        sequence_files = compact_files(
+            dirpath, paths, args.start_frame, sites
+        )
+        compact_time = time.time() - start
+    finally:
+        shutil.rmtree(dirpath)
+
+    frame_doc = repre_doc(frame_files)
+    compact_doc = repre_doc(sequence_files)
+
+    start = time.time()
+    expanded = get_representation_files(compact_doc)
+    expand_time = time.time() - start
+
+    assert [item["path"] for item in expanded] == [
+        item["path"] for item in frame_files
+    ]
+    assert [item["hash"] for item in expanded] == [
+        item["hash"] for item in frame_files
+    ]
+
+    print("Frames: {}".format(args.frames))
+    row_template = "{:<10} {:>14} {:>16}"
+    print(row_template.format("Files", "Doc size (KB)", "Prepare (s)"))
+    for label, doc, duration in (
+        ("per-frame", frame_doc, frame_time),
+        ("compact", compact_doc, compact_time),
+    ):
+        print(row_template.format(
+            label,
+            "{:.1f}".format(len(bson.BSON.encode(doc)) / 1024.0),
+            "{:.3f}".format(duration)
+        ))
+    print("Expand compact files: {:.3f} s".format(expand_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare serial hashing of files with 'FileHasher'.
+
+Benchmark creates files in temp directory and hashes them serially with
+small read buffer (as was done before), with 'FileHasher' without cache
+(first run) and with 'FileHasher' using cache filled by previous run.
+
+Example:
+    python benchmark_file_hashing.py --files 200 --size-mb 8 --workers 4
+"""
+
+import os
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+
+from openpype.lib.file_hashing import FileHasher, FileHashCache
+
+
+def serial_hash(paths):
+    output = {}
+    for path in paths:
+        hasher = hashlib.sha256()
+        with open(path, "rb") as stream:
+            for chunk in iter(lambda: stream.read(128 * 1024), b""):
+                hasher.update(chunk)
+        output[path] = hasher.hexdigest()
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--size-mb", type=float, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    dirpath = tempfile.mkdtemp(prefix="openpype_bench_")
+    try:
+        size = int(args.size_mb * 1024 * 1024)
+        paths = []
+        for idx in range(args.files):
+            path = os.path.join(dirpath, "file.{:04d}.bin".format(idx))
+            with open(path, "wb") as stream:
+                stream.write(os.urandom(size))
+            paths.append(path)
+
+        cache = FileHashCache(os.path.join(dirpath, "hashes.db"))
+        hasher = FileHasher(max_workers=args.workers, cache=cache)
+
+        results = []
+        start = time.time()
+        expected = serial_hash(paths)
+        results.append(("serial", time.time() - start))
+
+        start = time.time()
+        cold = hasher.hash_files(paths)
+        results.append(("parallel", time.time() - start))
+
+        start = time.time()
+        warm = hasher.hash_files(paths)
+        results.append(("cached", time.time() - start))
+        cache.close()
+
+        for hash_infos in (cold, warm):
+            assert {
+                path: info["hash"]
+                for path, info in hash_infos.items()
+            } == expected
+    finally:
+        shutil.rmtree(dirpath)
+
+    total_mb = args.files * args.size_mb
+    print("Files: {} Total: {:.0f} MB".format(args.files, total_mb))
+    for label, duration in results:
+        print("{:<10} {:>8.3f} s {:>10.1f} MB/s".format(
+            label, duration, total_mb / max(duration, 0.000001)
+        ))
+    print(hasher.get_metrics())
+
+
+if __name__ == "__main__":
+    main()
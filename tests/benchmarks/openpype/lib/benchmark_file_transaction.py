@@ -0,0 +1,90 @@
+"""Compare sequential and parallel processing of 'FileTransaction'.
+
+Creates synthetic image sequence in temp directory (or in '--root') and
+transfers it with sequential settings ('max_workers=1') and with parallel
+settings. Root on network storage gives more realistic results.
+
+Example:
+    python benchmark_file_transaction.py --frames 2000 --size 2
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+from openpype.lib.file_transaction import FileTransaction
+
+
+def create_sequence(dirpath, frames, size_mb):
+    os.makedirs(dirpath)
+    content = os.urandom(int(size_mb * 1024 * 1024))
+    filepaths = []
+    for frame in range(1001, 1001 + frames):
+        filepath = os.path.join(dirpath, "render.{:04d}.exr".format(frame))
+        with open(filepath, "wb") as stream:
+            stream.write(content)
+        filepaths.append(filepath)
+    return filepaths
+
+
+def run_transaction(src_paths, dst_dir, **kwargs):
+    transaction = FileTransaction(**kwargs)
+    for src_path in src_paths:
+        dst_path = os.path.join(dst_dir, os.path.basename(src_path))
+        transaction.add(src_path, dst_path)
+
+    start = time.time()
+    transaction.process()
+    transaction.finalize()
+    return time.time() - start, transaction
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--size", type=float, default=1.0, help="MB per file")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--volume-workers", type=int, default=4)
+    parser.add_argument("--root", help="Root directory for files")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(dir=args.root)
+    try:
+        src_paths = create_sequence(
+            os.path.join(root, "src"), args.frames, args.size
+        )
+        total_mb = args.frames * args.size
+
+        results = []
+        for label, kwargs in (
+            ("sequential", {"max_workers": 1}),
+            ("parallel", {
+                "max_workers": args.workers,
+                "max_volume_workers": args.volume_workers
+            }),
+            ("parallel (identical skipped)", {
+                "max_workers": args.workers,
+                "max_volume_workers": args.volume_workers,
+                "skip_identical": True
+            }),
+        ):
+            dst_dir = os.path.join(root, "dst_{}".format(len(results)))
+            duration, _ = run_transaction(src_paths, dst_dir, **kwargs)
+            if kwargs.get("skip_identical"):
+                # Second run should skip all files
+                duration, _ = run_transaction(src_paths, dst_dir, **kwargs)
+            results.append((label, duration))
+
+        print("{} files, {:.1f} MB".format(args.frames, total_mb))
+        for label, duration in results:
+            print("{:<30} {:>8.3f}s {:>10.1f} MB/s".format(
+                label, duration, total_mb / max(duration, 0.0001)
+            ))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
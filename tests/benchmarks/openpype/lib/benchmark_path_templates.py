@@ -0,0 +1,82 @@
+"""Measure per path cost of filling 'StringTemplate' for frames of sequence.
+
+Compares creation of template object for each frame without compiled
+template cache (behavior before the cache was added), with the cache and
+bulk 'format_many'.
+
+Example:
+    python benchmark_path_templates.py --frames 10000
+"""
+
+import time
+import argparse
+
+from openpype.lib.path_templates import StringTemplate
+
+TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{asset}/publish/{family}"
+    "/{subset}/v{version:0>3}/{project[code]}_{asset}_{subset}"
+    "_v{version:0>3}<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+)
+DATA = {
+    "root": {"work": "/mnt/projects"},
+    "project": {"name": "demo_project", "code": "demo"},
+    "hierarchy": "shots/sq01",
+    "asset": "sh010",
+    "family": "render",
+    "subset": "renderMain",
+    "version": 12,
+    "ext": "exr",
+}
+
+
+def _without_cache(data_list):
+    output = []
+    for data in data_list:
+        StringTemplate.clear_compiled_cache()
+        output.append(StringTemplate(TEMPLATE).format(data))
+    return output
+
+
+def _with_cache(data_list):
+    return [
+        StringTemplate(TEMPLATE).format(data)
+        for data in data_list
+    ]
+
+
+def _format_many(data_list):
+    return StringTemplate(TEMPLATE).format_many(data_list)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data_list = []
+    for frame in range(1001, 1001 + args.frames):
+        data = dict(DATA)
+        data["frame"] = frame
+        data_list.append(data)
+
+    for label, func in (
+        ("template per path, no cache", _without_cache),
+        ("template per path, cached", _with_cache),
+        ("format_many", _format_many),
+    ):
+        best = None
+        for _ in range(args.repeat):
+            start = time.time()
+            func(data_list)
+            duration = time.time() - start
+            if best is None or duration < best:
+                best = duration
+        print("{:<30} {:>8.2f} us/path".format(
+            label, (best / args.frames) * 1000000
+        ))
+
+
+if __name__ == "__main__":
+    main()
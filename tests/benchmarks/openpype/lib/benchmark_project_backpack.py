@@ -0,0 +1,99 @@
+"""Compare single zip packing of project files with parallel volumes.
+
+Benchmark creates project tree with compressible workfiles and random
+(already compressed) media files. Files are packed to single deflated zip
+(as was done before) and to volumes written in parallel where media are
+stored without compression. Database documents are not part of benchmark.
+
+Example:
+    python benchmark_project_backpack.py --files 200 --size-mb 4 --workers 4
+"""
+
+import os
+import time
+import shutil
+import zipfile
+import argparse
+import tempfile
+
+from openpype.lib.thread_tools import run_in_threads
+from openpype.lib.project_backpack import (
+    PROJECT_FILES_DIR,
+    _collect_project_files,
+    _split_to_volumes,
+    _write_volume,
+)
+
+
+def create_project(root_path, files_count, size):
+    project_path = os.path.join(root_path, "bench_project", "shots")
+    os.makedirs(project_path)
+    for idx in range(files_count):
+        if idx % 4 == 0:
+            filename = "workfile_v{:03d}.ma".format(idx)
+            content = b"createNode transform -n \"node\";\n" * (size // 32)
+        else:
+            filename = "render.{:04d}.exr".format(idx)
+            content = os.urandom(size)
+        with open(os.path.join(project_path, filename), "wb") as stream:
+            stream.write(content)
+    return os.path.join(root_path, "bench_project")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--size-mb", type=float, default=4)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--volume-size-mb", type=float, default=64)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="openpype_bench_")
+    try:
+        root_path = os.path.join(tmp_dir, "root")
+        output_dir = os.path.join(tmp_dir, "output")
+        os.makedirs(output_dir)
+        project_path = create_project(
+            root_path, args.files, int(args.size_mb * 1024 * 1024)
+        )
+
+        start = time.time()
+        zip_path = os.path.join(output_dir, "single.zip")
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as stream:
+            for root, _, filenames in os.walk(project_path):
+                for filename in filenames:
+                    filepath = os.path.join(root, filename)
+                    stream.write(filepath, os.path.join(
+                        PROJECT_FILES_DIR,
+                        os.path.relpath(filepath, root_path)
+                    ))
+        single_time = time.time() - start
+
+        start = time.time()
+        file_items = _collect_project_files(project_path, root_path)
+        volumes = _split_to_volumes(
+            file_items, int(args.volume_size_mb * 1024 * 1024)
+        )
+        run_in_threads(
+            lambda item: _write_volume(
+                os.path.join(output_dir, "vol{:04d}.zip".format(item[0])),
+                item[1],
+                root_path,
+                False
+            ),
+            enumerate(volumes),
+            args.workers
+        )
+        volumes_time = time.time() - start
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    print("Files: {} Total: {:.0f} MB Volumes: {} Workers: {}".format(
+        args.files, args.files * args.size_mb, len(volumes), args.workers
+    ))
+    print("Single zip:       {:.3f} s".format(single_time))
+    print("Parallel volumes: {:.3f} s".format(volumes_time))
+
+
+if __name__ == "__main__":
+    main()
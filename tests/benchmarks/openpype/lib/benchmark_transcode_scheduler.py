@@ -0,0 +1,72 @@
+"""Compare sequential per-frame conversion with chunked 'TranscodeScheduler'.
+
+Benchmark does not require oiiotool. Conversion is simulated by python
+subprocess which sleeps for given time per frame so both startup cost of
+process and conversion time are included.
+
+Example:
+    python benchmark_transcode_scheduler.py --frames 200 --frame-time 0.01
+"""
+
+import sys
+import time
+import logging
+import argparse
+
+from openpype.lib.execute import run_subprocess
+from openpype.lib.transcoding import (
+    TranscodeScheduler,
+    get_transcode_workers,
+    split_frames_to_chunks,
+)
+
+
+def fake_convert_args(frames_count, frame_time):
+    return [
+        sys.executable,
+        "-c",
+        "import time; time.sleep({})".format(frames_count * frame_time)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--frame-time", type=float, default=0.01)
+    parser.add_argument("--chunk-size", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    log = logging.getLogger("benchmark")
+    frames = list(range(1001, 1001 + args.frames))
+
+    start = time.time()
+    for _ in frames:
+        run_subprocess(fake_convert_args(1, args.frame_time), logger=log)
+    sequential_time = time.time() - start
+
+    workers = args.workers or get_transcode_workers()
+    scheduler = TranscodeScheduler(workers, logger=log)
+    for chunk in split_frames_to_chunks(frames, args.chunk_size):
+        scheduler.add_subprocess(
+            fake_convert_args(len(chunk), args.frame_time),
+            label="{}-{}".format(chunk[0], chunk[-1]),
+            frames=len(chunk)
+        )
+    start = time.time()
+    scheduler.run()
+    chunked_time = time.time() - start
+
+    durations = [timing["duration"] for timing in scheduler.get_timings()]
+    print("Frames: {} Workers: {} Chunk size: {}".format(
+        args.frames, workers, args.chunk_size
+    ))
+    print("Sequential per frame: {:.3f} s".format(sequential_time))
+    print("Chunked scheduler:    {:.3f} s".format(chunked_time))
+    print("Chunk time min/avg/max: {:.3f}/{:.3f}/{:.3f} s".format(
+        min(durations), sum(durations) / len(durations), max(durations)
+    ))
+
+
+if __name__ == "__main__":
+    main()
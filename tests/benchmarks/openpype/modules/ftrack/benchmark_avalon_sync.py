@@ -0,0 +1,276 @@
+"""Compare full and incremental query of ftrack entities in avalon sync.
+
+Benchmark runs 'SyncEntitiesFactory.launch_setup' against fake ftrack
+session with generated project hierarchy (sequences > shots > tasks).
+Fake session simulates server latency per received page of entities. Full
+synchronization queries all entities of project, incremental
+synchronization queries only entities affected by changed entities.
+
+Example:
+    python benchmark_avalon_sync.py --sequences 50 --shots 200 --tasks 4 \
+        --changed 20 --page-latency 0.05
+"""
+
+import re
+import time
+import uuid
+import random
+import logging
+import datetime
+import argparse
+import tracemalloc
+
+from openpype.modules.ftrack.lib.avalon_sync import SyncEntitiesFactory
+from openpype.modules.ftrack.lib.constants import CUST_ATTR_ID_KEY
+
+IDS_REGEX = re.compile(r"in \(([^)]*)\)")
+
+
+class FakeEntity(dict):
+    def __init__(self, entity_type, data):
+        super(FakeEntity, self).__init__(data)
+        self.entity_type = entity_type
+
+
+class FakeQueryResult(object):
+    def __init__(self, session, entities, page_size):
+        self._session = session
+        self._entities = entities
+        self._page_size = page_size
+
+    def __iter__(self):
+        for idx, entity in enumerate(self._entities):
+            if idx % self._page_size == 0:
+                self._session.add_page()
+            yield entity
+
+    def all(self):
+        return list(self)
+
+    def one(self):
+        return self.all()[0]
+
+
+class FakeSession(object):
+    """Ftrack session answering queries used by avalon sync."""
+
+    server_url = "https://fake.ftrackapp.com"
+    api_key = "fake"
+    api_user = "fake"
+
+    def __init__(self, sequences, shots, tasks, page_latency):
+        self.page_latency = page_latency
+        self.queries = 0
+        self.pages = 0
+        self.received = 0
+
+        self.task_types = [
+            FakeEntity("Type", {"id": str(uuid.uuid4()), "name": name})
+            for name in ("Animation", "Lighting", "Compositing", "FX")
+        ]
+        project_id = str(uuid.uuid4())
+        self.project = FakeEntity("Project", {
+            "id": project_id,
+            "name": "bench",
+            "full_name": "benchmark_project",
+            "custom_attributes": {CUST_ATTR_ID_KEY: ""}
+        })
+        project_link = {"id": project_id, "name": "benchmark_project"}
+
+        self.entities = []
+        for seq_idx in range(sequences):
+            seq = self._add_entity(
+                "Sequence", "sq{:03d}".format(seq_idx), project_id,
+                [project_link]
+            )
+            seq_link = {"id": seq["id"], "name": seq["name"]}
+            for shot_idx in range(shots):
+                shot = self._add_entity(
+                    "Shot", "sq{:03d}sh{:04d}".format(seq_idx, shot_idx),
+                    seq["id"], [project_link, seq_link]
+                )
+                shot_link = {"id": shot["id"], "name": shot["name"]}
+                for task_idx in range(tasks):
+                    task_type = self.task_types[
+                        task_idx % len(self.task_types)
+                    ]
+                    self._add_entity(
+                        "Task", task_type["name"].lower(), shot["id"],
+                        [project_link, seq_link, shot_link],
+                        type_id=task_type["id"]
+                    )
+        self.entities_by_id = {
+            entity["id"]: entity
+            for entity in self.entities
+        }
+
+    def _add_entity(self, entity_type, name, parent_id, links, type_id=None):
+        entity_id = str(uuid.uuid4())
+        link = list(links)
+        link.append({"id": entity_id, "name": name})
+        entity = FakeEntity(entity_type, {
+            "id": entity_id,
+            "name": name,
+            "type_id": type_id,
+            "parent_id": parent_id,
+            "link": link,
+            "description": ""
+        })
+        self.entities.append(entity)
+        return entity
+
+    def add_page(self):
+        self.pages += 1
+        if self.page_latency:
+            time.sleep(self.page_latency)
+
+    def _filter_entities(self, expression):
+        match = IDS_REGEX.search(expression)
+        values = set()
+        if match:
+            values = {
+                value.strip().strip("\"")
+                for value in match.group(1).split(",")
+            }
+
+        if "from Task" in expression:
+            return [
+                entity
+                for entity in self.entities
+                if entity.entity_type == "Task"
+                and entity["parent_id"] in values
+            ]
+
+        if "ancestors any" in expression:
+            return [
+                entity
+                for entity in self.entities
+                if any(link["id"] in values for link in entity["link"][:-1])
+            ]
+
+        if "name in" in expression:
+            return [
+                entity
+                for entity in self.entities
+                if entity.entity_type != "Task" and entity["name"] in values
+            ]
+
+        if "id in" in expression:
+            return [
+                self.entities_by_id[entity_id]
+                for entity_id in values
+                if entity_id in self.entities_by_id
+            ]
+        return self.entities
+
+    def query(self, expression, page_size=500):
+        self.queries += 1
+        if "from Project" in expression:
+            entities = [self.project]
+        elif expression.endswith("from Type"):
+            entities = self.task_types
+        else:
+            entities = self._filter_entities(expression)
+        self.received += len(entities)
+        return FakeQueryResult(self, entities, page_size)
+
+    def reset_counters(self):
+        self.queries = 0
+        self.pages = 0
+        self.received = 0
+
+    def close(self):
+        pass
+
+
+class BenchmarkSyncEntitiesFactory(SyncEntitiesFactory):
+    """Factory using fake session and changes without database."""
+
+    def __init__(self, session, changed_ids):
+        super(BenchmarkSyncEntitiesFactory, self).__init__(
+            logging.getLogger("benchmark"), session
+        )
+        self._fake_session = session
+        self._changed_ids = changed_ids
+
+    def _create_session(self):
+        return self._fake_session
+
+    def get_sync_watermark(self, project_name):
+        return datetime.datetime.utcnow() - datetime.timedelta(hours=1)
+
+    def are_changes_stored(self, since):
+        return True
+
+    def get_changed_ftrack_ids(self, ft_project_id, since):
+        return set(self._changed_ids), set()
+
+
+def run(session, changed_ids, incremental):
+    session.reset_counters()
+    factory = BenchmarkSyncEntitiesFactory(session, changed_ids)
+    tracemalloc.start()
+    start = time.time()
+    factory.launch_setup("benchmark_project", incremental=incremental)
+    duration = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mode": "incremental" if factory.incremental else "full",
+        "time": duration,
+        "peak_mb": peak / (1024.0 * 1024.0),
+        "queries": session.queries,
+        "pages": session.pages,
+        "received": session.received,
+        "synced": len(factory.entities_dict)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sequences", type=int, default=20)
+    parser.add_argument("--shots", type=int, default=100)
+    parser.add_argument("--tasks", type=int, default=4)
+    parser.add_argument("--changed", type=int, default=20,
+                        help="Count of changed tasks and shots")
+    parser.add_argument("--page-latency", type=float, default=0.02,
+                        help="Simulated latency of one page in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    session = FakeSession(
+        args.sequences, args.shots, args.tasks, args.page_latency
+    )
+    rand = random.Random(args.seed)
+    changed_ids = [
+        entity["id"]
+        for entity in rand.sample(
+            [
+                entity
+                for entity in session.entities
+                if entity.entity_type in ("Shot", "Task")
+            ],
+            args.changed
+        )
+    ]
+    print("Project entities: {}".format(len(session.entities)))
+    row_template = "{:<12} {:>9} {:>10} {:>8} {:>6} {:>9} {:>8}"
+    print(row_template.format(
+        "Mode", "Time (s)", "Peak (MB)", "Queries", "Pages", "Received",
+        "Synced"
+    ))
+    for incremental in (False, True):
+        result = run(session, changed_ids, incremental)
+        print(row_template.format(
+            result["mode"],
+            "{:.3f}".format(result["time"]),
+            "{:.1f}".format(result["peak_mb"]),
+            result["queries"],
+            result["pages"],
+            result["received"],
+            result["synced"]
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Replay stream of ftrack events with sequential and parallel handlers.
+
+Events are loaded from json file which can contain list of events or one
+event per line (e.g. output of 'mongoexport' of ftrack events collection).
+Synthetic stream is generated when file is not passed. Handlers are
+simulated by sleep with duration per handler name.
+
+Events are dispatched the same way as event processor does it with
+'OPENPYPE_FTRACK_EVENT_WORKERS' (one task per handler, tasks of one
+handler are processed in order by one worker).
+
+Example:
+    python benchmark_event_dispatch.py --events events.json --workers 8 \
+        --handler SyncToAvalonEvent=0.5 --handler ThumbnailEvents=0.02
+"""
+
+import json
+import time
+import random
+import argparse
+
+from openpype.modules.ftrack.ftrack_server.event_dispatcher import (
+    EventHandlerDispatcher,
+)
+
+DEFAULT_HANDLERS = (
+    "SyncToAvalonEvent=0.2",
+    "ThumbnailEvents=0.01",
+    "VersionToTaskStatus=0.02",
+    "TaskStatusToParent=0.02",
+)
+
+
+def load_events(filepath):
+    with open(filepath, "r") as stream:
+        content = stream.read().strip()
+
+    if content.startswith("["):
+        return json.loads(content)
+
+    return [
+        json.loads(line)
+        for line in content.splitlines()
+        if line.strip()
+    ]
+
+
+def generate_events(count, projects, seed=0):
+    rand = random.Random(seed)
+    events = []
+    for idx in range(count):
+        project_id = "project_{}".format(rand.randrange(projects))
+        events.append({
+            "id": "event_{}".format(idx),
+            "topic": "ftrack.update",
+            "data": {
+                "entities": [{
+                    "entityId": "entity_{}".format(rand.randrange(1000)),
+                    "entityType": "task",
+                    "parents": [
+                        {"entityId": project_id, "entityType": "show"}
+                    ]
+                }]
+            }
+        })
+    return events
+
+
+def replay(events, handlers, workers):
+    dispatcher = EventHandlerDispatcher(workers)
+    dispatcher.start()
+    latencies = []
+
+    def create_task(delay):
+        return lambda: time.sleep(delay)
+
+    def create_callback(dispatched):
+        def callback(_success):
+            latencies.append(time.time() - dispatched)
+        return callback
+
+    start = time.time()
+    for event in events:
+        dispatched = time.time()
+        for name, delay in handlers:
+            dispatcher.dispatch_handler(
+                name,
+                create_task(delay),
+                create_callback(dispatched)
+            )
+    dispatcher.join()
+    duration = time.time() - start
+    dispatcher.stop()
+    return duration, latencies, dispatcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", help="Json file with recorded events")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--projects", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument(
+        "--handler", action="append", dest="handlers",
+        help="Simulated handler 'name=seconds'"
+    )
+    parser.add_argument("--metrics", action="store_true")
+    args = parser.parse_args()
+
+    if args.events:
+        events = load_events(args.events)
+    else:
+        events = generate_events(args.count, args.projects)
+
+    handlers = []
+    for item in args.handlers or DEFAULT_HANDLERS:
+        name, delay = item.split("=")
+        handlers.append((name, float(delay)))
+
+    print("Events: {}, handlers: {}".format(len(events), len(handlers)))
+    for workers in (1, args.workers):
+        duration, latencies, dispatcher = replay(events, handlers, workers)
+        latencies.sort()
+        print((
+            "workers {:>3}: total {:.2f}s, {:.1f} events/s,"
+            " handler latency p50 {:.2f}s p95 {:.2f}s"
+        ).format(
+            workers,
+            duration,
+            len(events) / duration,
+            latencies[len(latencies) // 2],
+            latencies[int(len(latencies) * 0.95)]
+        ))
+        if args.metrics:
+            print(dispatcher.format_metrics())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Compare full and incremental scan of representations for sync server.
+
+Creates temporary project with synthetic representations where all files
+are synchronized except a small fraction which was published or reset
+recently. Then measures query used by 'get_sync_representations' with full
+scan and with incremental scan (only sites changed since last scan).
+
+Requires running MongoDB ('OPENPYPE_MONGO'). Temporary project collection
+is removed at the end.
+
+Example:
+    python benchmark_sync_representations.py --representations 500000
+"""
+
+import time
+import uuid
+import argparse
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import get_project_database
+from openpype.client.migrations import PROJECT_INDEXES
+from openpype.modules.sync_server.sync_server_module import SyncServerModule
+
+ACTIVE_SITE = "studio"
+REMOTE_SITE = "gdrive"
+RETRIES_ARR = [0, 1, 2, None]
+
+
+def create_representations(collection, count, files, changed, batch_size):
+    synced_dt = datetime.now() - timedelta(days=30)
+    changed_dt = datetime.now()
+    changed_step = max(int(1 / changed), 1) if changed else 0
+    changed_count = 0
+    docs = []
+    for idx in range(count):
+        is_changed = bool(changed_step) and idx % changed_step == 0
+        remote_site = {"name": REMOTE_SITE, "created_dt": synced_dt}
+        if is_changed:
+            changed_count += 1
+            remote_site = {"name": REMOTE_SITE, "modified_dt": changed_dt}
+
+        docs.append({
+            "_id": ObjectId(),
+            "type": "representation",
+            "name": "exr",
+            "parent": ObjectId(),
+            "context": {"ext": "exr"},
+            "data": {},
+            "files": [
+                {
+                    "_id": ObjectId(),
+                    "path": "{{root[work]}}/render_{}.{:04}.exr".format(
+                        idx, frame
+                    ),
+                    "size": 1024,
+                    "hash": "hash_{}_{}".format(idx, frame),
+                    "sites": [
+                        {"name": ACTIVE_SITE, "created_dt": synced_dt},
+                        dict(remote_site)
+                    ]
+                }
+                for frame in range(files)
+            ]
+        })
+        if len(docs) >= batch_size:
+            collection.insert_many(docs)
+            docs = []
+    if docs:
+        collection.insert_many(docs)
+    return changed_count
+
+
+def run_scan(collection, since):
+    pipeline = SyncServerModule.get_sync_representations_pipeline(
+        ACTIVE_SITE, REMOTE_SITE, RETRIES_ARR, since
+    )
+    start = time.time()
+    repre_docs = list(collection.aggregate(pipeline, allowDiskUse=True))
+    return time.time() - start, len(repre_docs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--representations", type=int, default=500000)
+    parser.add_argument("--files", type=int, default=2,
+                        help="Files per representation")
+    parser.add_argument("--changed", type=float, default=0.001,
+                        help="Fraction of representations to sync")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    database = get_project_database()
+    project_name = "benchmark_{}".format(uuid.uuid4().hex[:8])
+    collection = database[project_name]
+    try:
+        start = time.time()
+        changed_count = create_representations(
+            collection,
+            args.representations,
+            args.files,
+            args.changed,
+            args.batch_size
+        )
+        for index_keys in PROJECT_INDEXES:
+            collection.create_index(index_keys)
+        print("Created {} representations ({} to sync) in {:.1f}s".format(
+            args.representations, changed_count, time.time() - start
+        ))
+
+        since = datetime.now() - timedelta(
+            seconds=SyncServerModule.INCREMENTAL_OVERLAP_SEC
+        )
+        for label, scan_since in (
+            ("full scan", None),
+            ("incremental scan", since),
+        ):
+            duration, found = run_scan(collection, scan_since)
+            print("{:<20} {:>8.3f}s {:>8} representations".format(
+                label, duration, found
+            ))
+    finally:
+        collection.drop()
+
+
+if __name__ == "__main__":
+    main()
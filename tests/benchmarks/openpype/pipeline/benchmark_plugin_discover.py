@@ -0,0 +1,118 @@
+"""Measure repeated plugin discover calls with and without modules cache.
+
+Generates folder with plugin files and discovers them multiple times with
+'PluginDiscoverContext'. First discover call imports all files in both
+cases, following calls reuse imported modules when cache is enabled.
+
+Example:
+    python benchmark_plugin_discover.py --files 200 --calls 10
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+from openpype.pipeline.plugin_discover import (
+    PluginDiscoverContext,
+    get_plugin_modules_cache,
+)
+
+BASE_MODULE_NAME = "_benchmark_plugin_base"
+BASE_CONTENT = """
+class BenchmarkPlugin(object):
+    pass
+"""
+PLUGIN_TEMPLATE = """
+import os
+import json
+import collections
+
+from {base} import BenchmarkPlugin
+
+
+class Plugin{index}(BenchmarkPlugin):
+    label = "Plugin {index}"
+    families = ["render", "review"]
+
+{methods}
+"""
+METHOD_TEMPLATE = """
+    def method_{index}(self, data):
+        output = collections.OrderedDict()
+        for key, value in data.items():
+            output[key] = json.dumps(value) + os.sep + str({index})
+        return output
+"""
+
+
+def _create_plugins(dirpath, files_count, methods_count):
+    with open(os.path.join(dirpath, BASE_MODULE_NAME + ".py"), "w") as f:
+        f.write(BASE_CONTENT)
+
+    methods = "".join(
+        METHOD_TEMPLATE.format(index=index)
+        for index in range(methods_count)
+    )
+    for index in range(files_count):
+        filepath = os.path.join(dirpath, "plugin_{}.py".format(index))
+        with open(filepath, "w") as stream:
+            stream.write(PLUGIN_TEMPLATE.format(
+                base=BASE_MODULE_NAME, index=index, methods=methods
+            ))
+
+
+def _measure(superclass, dirpath, calls):
+    context = PluginDiscoverContext()
+    context.register_plugin_path(superclass, dirpath)
+    durations = []
+    for _ in range(calls):
+        start = time.time()
+        plugins = context.discover(superclass)
+        durations.append(time.time() - start)
+    return durations, len(plugins)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--methods", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=10)
+    args = parser.parse_args()
+
+    dirpath = tempfile.mkdtemp(prefix="plugin_discover_benchmark_")
+    try:
+        _create_plugins(dirpath, args.files, args.methods)
+        sys.path.insert(0, dirpath)
+        superclass = __import__(BASE_MODULE_NAME).BenchmarkPlugin
+
+        for label, env_value in (
+            ("without cache", "0"),
+            ("with cache", "1"),
+        ):
+            os.environ["OPENPYPE_PLUGIN_DISCOVER_CACHE"] = env_value
+            get_plugin_modules_cache().clear()
+            durations, plugins_count = _measure(
+                superclass, dirpath, args.calls
+            )
+            print((
+                "{:<14} plugins: {}, first call: {:.3f}s,"
+                " next calls avg: {:.3f}s"
+            ).format(
+                label,
+                plugins_count,
+                durations[0],
+                sum(durations[1:]) / max(len(durations) - 1, 1)
+            ))
+
+    finally:
+        os.environ.pop("OPENPYPE_PLUGIN_DISCOVER_CACHE", None)
+        if dirpath in sys.path:
+            sys.path.remove(dirpath)
+        shutil.rmtree(dirpath)
+
+
+if __name__ == "__main__":
+    main()
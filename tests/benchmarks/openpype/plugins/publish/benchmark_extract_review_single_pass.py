@@ -0,0 +1,155 @@
+"""Compare per-output ffmpeg runs with single pass multi-output encoding.
+
+Benchmark generates png test sequence with ffmpeg 'testsrc' and renders
+review outputs (h264 full resolution, h264 half resolution, prores) the way
+'ExtractReview' does. First each output is rendered by separate ffmpeg
+process, then all outputs are rendered by one process which decodes the
+sequence once and splits it in filter graph ('single_pass_outputs').
+
+Requires ffmpeg available in OpenPype or in PATH.
+
+Example:
+    python benchmark_extract_review_single_pass.py --frames 100 \
+        --width 1920 --height 1080
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+OUTPUTS = [
+    {
+        "name": "h264",
+        "filters": [],
+        "args": ["-codec:v", "libx264", "-crf", "18", "-pix_fmt", "yuv420p"],
+        "ext": "mp4"
+    },
+    {
+        "name": "h264_half",
+        "filters": ["scale=iw/2:-2"],
+        "args": ["-codec:v", "libx264", "-crf", "23", "-pix_fmt", "yuv420p"],
+        "ext": "mp4"
+    },
+    {
+        "name": "prores",
+        "filters": [],
+        "args": ["-codec:v", "prores_ks", "-profile:v", "2"],
+        "ext": "mov"
+    },
+]
+
+
+def get_ffmpeg_path():
+    try:
+        from openpype.lib import get_ffmpeg_tool_path
+
+        return get_ffmpeg_tool_path("ffmpeg")
+    except Exception:
+        return "ffmpeg"
+
+
+def generate_sequence(ffmpeg_path, dirpath, frames, width, height):
+    subprocess.check_call([
+        ffmpeg_path, "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi",
+        "-i", "testsrc=size={}x{}:rate=25".format(width, height),
+        "-frames:v", str(frames),
+        "-start_number", "1001",
+        os.path.join(dirpath, "render.%04d.png")
+    ])
+
+
+def input_args(dirpath, frames):
+    return [
+        "-start_number", "1001",
+        "-framerate", "25",
+        "-to", "{:0.10f}".format(frames / 25.0),
+        "-i", os.path.join(dirpath, "render.%04d.png")
+    ]
+
+
+def output_path(dirpath, output, suffix):
+    return os.path.join(
+        dirpath, "{}_{}.{}".format(output["name"], suffix, output["ext"])
+    )
+
+
+def per_output_commands(ffmpeg_path, dirpath, frames):
+    commands = []
+    for output in OUTPUTS:
+        args = [ffmpeg_path, "-hide_banner", "-loglevel", "error"]
+        args.extend(input_args(dirpath, frames))
+        if output["filters"]:
+            args.extend(["-filter:v", ",".join(output["filters"])])
+        args.extend(output["args"])
+        args.extend(["-y", output_path(dirpath, output, "single")])
+        commands.append(args)
+    return commands
+
+
+def single_pass_command(ffmpeg_path, dirpath, frames):
+    split_labels = [
+        "[s{}]".format(idx)
+        for idx in range(len(OUTPUTS))
+    ]
+    filter_chains = [
+        "[0:v]split={}{}".format(len(OUTPUTS), "".join(split_labels))
+    ]
+    output_args = []
+    for idx, output in enumerate(OUTPUTS):
+        map_label = split_labels[idx]
+        if output["filters"]:
+            map_label = "[o{}]".format(idx)
+            filter_chains.append("{}{}{}".format(
+                split_labels[idx], ",".join(output["filters"]), map_label
+            ))
+        output_args.extend(["-map", map_label, "-map", "0:a?"])
+        output_args.extend(output["args"])
+        output_args.extend(["-y", output_path(dirpath, output, "pass")])
+
+    args = [ffmpeg_path, "-hide_banner", "-loglevel", "error"]
+    args.extend(input_args(dirpath, frames))
+    args.extend(["-filter_complex", ";".join(filter_chains)])
+    args.extend(output_args)
+    return args
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    ffmpeg_path = get_ffmpeg_path()
+    dirpath = tempfile.mkdtemp(prefix="openpype_bench_")
+    try:
+        generate_sequence(
+            ffmpeg_path, dirpath, args.frames, args.width, args.height
+        )
+
+        start = time.time()
+        for command in per_output_commands(ffmpeg_path, dirpath, args.frames):
+            subprocess.check_call(command)
+        per_output_time = time.time() - start
+
+        start = time.time()
+        subprocess.check_call(
+            single_pass_command(ffmpeg_path, dirpath, args.frames)
+        )
+        single_pass_time = time.time() - start
+    finally:
+        shutil.rmtree(dirpath)
+
+    print("Frames: {} Resolution: {}x{} Outputs: {}".format(
+        args.frames, args.width, args.height, len(OUTPUTS)
+    ))
+    print("Per output runs: {:.3f} s".format(per_output_time))
+    print("Single pass:     {:.3f} s".format(single_pass_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Test suite for queries of entities with their parents."""
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client import entities
+
+mongomock = pytest.importorskip("mongomock")
+
+PROJECT_NAME = "test_project"
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    conn = mongomock.MongoClient().db[PROJECT_NAME]
+    monkeypatch.setattr(
+        entities, "get_project_connection", lambda *args, **kwargs: conn
+    )
+    return conn
+
+
+def _create_representation(collection):
+    asset_id, subset_id, version_id, repre_id = (
+        ObjectId() for _ in range(4)
+    )
+    data = {"frameStart": 1001}
+    collection.insert_many([
+        {"_id": asset_id, "type": "asset", "name": "a", "data": data},
+        {
+            "_id": subset_id,
+            "type": "subset",
+            "name": "s",
+            "parent": asset_id,
+            "data": data
+        },
+        {
+            "_id": version_id,
+            "type": "version",
+            "name": 1,
+            "parent": subset_id,
+            "data": data
+        },
+        {
+            "_id": repre_id,
+            "type": "representation",
+            "name": "exr",
+            "parent": version_id,
+            "data": data
+        },
+    ])
+    return repre_id
+
+
+def test_representation_parents_are_resolved(collection):
+    repre_id = _create_representation(collection)
+
+    parents = entities.get_representations_with_parents(
+        PROJECT_NAME, [repre_id]
+    )[repre_id]
+
+    for key in ("representation", "version", "subset", "asset"):
+        assert parents[key]["data"] == {"frameStart": 1001}
+    assert parents["source_version"] is None
+
+
+def test_fields_are_projected_for_parents(collection):
+    repre_id = _create_representation(collection)
+
+    parents = entities.get_representations_with_parents(
+        PROJECT_NAME, [repre_id], fields=["_id", "name", "parent"]
+    )[repre_id]
+
+    for key in ("representation", "version", "subset", "asset"):
+        assert "data" not in parents[key]
+        assert "name" in parents[key]
+    assert parents["asset"]["_id"] == parents["subset"]["parent"]
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Test suite for last version projection of subsets."""
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client import entities, migrations, operations
+
+mongomock = pytest.importorskip("mongomock")
+
+PROJECT_NAME = "test_project"
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    conn = mongomock.MongoClient().db[PROJECT_NAME]
+    for module in (entities, migrations, operations):
+        monkeypatch.setattr(
+            module, "get_project_connection", lambda *args, **kwargs: conn
+        )
+    monkeypatch.setenv("OPENPYPE_LAST_VERSION_INDEX", "1")
+    return conn
+
+
+def _create_subset(collection):
+    subset_id = ObjectId()
+    collection.insert_one({"_id": subset_id, "type": "subset"})
+    return subset_id
+
+
+def _create_version(collection, subset_id, name):
+    version_id = ObjectId()
+    collection.insert_one({
+        "_id": version_id,
+        "type": "version",
+        "parent": subset_id,
+        "name": name
+    })
+    return version_id
+
+
+def test_projection_is_used(collection):
+    subset_id = _create_subset(collection)
+    _create_version(collection, subset_id, 1)
+    version_id = _create_version(collection, subset_id, 2)
+    migrations.update_last_versions(PROJECT_NAME, [subset_id])
+
+    subset_doc = collection.find_one({"_id": subset_id})
+    assert subset_doc["last_version"] == {"_id": version_id, "name": 2}
+
+    last_versions = entities.get_last_versions(PROJECT_NAME, [subset_id])
+    assert last_versions[subset_id]["_id"] == version_id
+
+
+def test_subset_without_projection_uses_aggregation(collection):
+    indexed_subset_id = _create_subset(collection)
+    indexed_version_id = _create_version(collection, indexed_subset_id, 1)
+    migrations.update_last_versions(PROJECT_NAME, [indexed_subset_id])
+
+    subset_id = _create_subset(collection)
+    _create_version(collection, subset_id, 1)
+    version_id = _create_version(collection, subset_id, 2)
+
+    last_versions = entities.get_last_versions(
+        PROJECT_NAME, [indexed_subset_id, subset_id], fields=["_id", "name"]
+    )
+    assert last_versions[indexed_subset_id]["_id"] == indexed_version_id
+    assert last_versions[subset_id]["_id"] == version_id
+    assert last_versions[subset_id]["name"] == 2
+
+
+def test_failed_commit_raises_original_error(collection, monkeypatch):
+    class WriteError(Exception):
+        pass
+
+    def bulk_write(*args, **kwargs):
+        raise WriteError()
+
+    def update_last_versions(*args, **kwargs):
+        raise RuntimeError()
+
+    monkeypatch.setattr(collection, "bulk_write", bulk_write)
+    monkeypatch.setattr(
+        operations, "update_last_versions", update_last_versions
+    )
+
+    session = operations.OperationsSession()
+    session.create_entity(PROJECT_NAME, "version", {
+        "type": "version",
+        "parent": ObjectId(),
+        "name": 1
+    })
+    with pytest.raises(WriteError):
+        session.commit()
+
+
+def test_cache_invalidated_when_projection_update_fails(
+    collection, monkeypatch
+):
+    invalidated = []
+
+    def update_last_versions(*args, **kwargs):
+        raise RuntimeError()
+
+    monkeypatch.setattr(
+        operations, "update_last_versions", update_last_versions
+    )
+    monkeypatch.setattr(
+        operations, "invalidate_entity_cache", invalidated.append
+    )
+
+    session = operations.OperationsSession()
+    session.create_entity(PROJECT_NAME, "version", {
+        "type": "version",
+        "parent": ObjectId(),
+        "name": 1
+    })
+    with pytest.raises(RuntimeError):
+        session.commit()
+    assert invalidated == [PROJECT_NAME]
+
+
+def test_commit_without_versions_skips_projection(collection, monkeypatch):
+    def update_last_versions(*args, **kwargs):
+        raise AssertionError("Projection should not be updated")
+
+    monkeypatch.setattr(
+        operations, "update_last_versions", update_last_versions
+    )
+
+    session = operations.OperationsSession()
+    session.create_entity(PROJECT_NAME, "subset", {
+        "type": "subset",
+        "parent": ObjectId(),
+        "name": "modelMain"
+    })
+    session.commit()
+    assert collection.find_one({"type": "subset"})["name"] == "modelMain"
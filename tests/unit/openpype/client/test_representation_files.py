@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Test suite for compact sequence items in representation files."""
+from bson.objectid import ObjectId
+
+from openpype.client.representation_files import (
+    create_sequence_file_info,
+    expand_file_info,
+    expand_representation_files,
+    frames_to_ranges,
+    ExpandedRepresentationsCursor,
+)
+
+HEAD = "{root[work]}/project/shot/render."
+TAIL = ".exr"
+SITES = [{"name": "studio", "created_dt": None}]
+
+
+def _frame_path(frame):
+    return "{}{:04d}{}".format(HEAD, frame, TAIL)
+
+
+def test_round_trip_same_size_and_mtime():
+    frames = list(range(1001, 1011))
+    file_info = create_sequence_file_info(
+        HEAD, TAIL, 4, frames, [100] * 10, [1690000000.0] * 10, SITES
+    )
+    sequence = file_info["sequence"]
+    assert sequence["ranges"] == [[1001, 1010]]
+    assert sequence["size"] == 100
+    assert "sizes" not in sequence
+    assert "mtimes" not in sequence
+    assert file_info["size"] == 1000
+    assert file_info["path"] == _frame_path(1001)
+
+    items = expand_file_info(file_info)
+    assert [item["path"] for item in items] == [
+        _frame_path(frame) for frame in frames
+    ]
+    assert all(item["size"] == 100 for item in items)
+    assert all(item["_id"] == file_info["_id"] for item in items)
+    assert all(item["sites"] == SITES for item in items)
+    # Sites are not shared between expanded items
+    items[0]["sites"].append({"name": "remote"})
+    assert items[1]["sites"] == SITES
+
+
+def test_round_trip_with_gaps():
+    frames = [1001, 1002, 1003, 1010, 1020, 1021]
+    assert frames_to_ranges(frames) == [
+        [1001, 1003], [1010, 1010], [1020, 1021]
+    ]
+    file_info = create_sequence_file_info(
+        HEAD, TAIL, 4, frames, [10] * 6, [1.0] * 6, SITES
+    )
+    items = expand_file_info(file_info)
+    assert [item["path"] for item in items] == [
+        _frame_path(frame) for frame in frames
+    ]
+
+
+def test_round_trip_per_frame_sizes_and_mtimes():
+    frames = [1, 2, 3]
+    sizes = [10, 20, 30]
+    mtimes = [1.5, 2.5, 3.5]
+    checksums = ["a", "b", "c"]
+    file_info = create_sequence_file_info(
+        HEAD, TAIL, 4, frames, sizes, mtimes, SITES, checksums=checksums
+    )
+    sequence = file_info["sequence"]
+    assert sequence["sizes"] == sizes
+    assert sequence["mtimes"] == mtimes
+    assert file_info["size"] == 60
+    assert file_info["checksum"] == "a"
+
+    items = expand_file_info(file_info)
+    assert [item["size"] for item in items] == sizes
+    assert [item["checksum"] for item in items] == checksums
+    assert [item["hash"] for item in items] == [
+        "render,0001,exr|1,5|10",
+        "render,0002,exr|2,5|20",
+        "render,0003,exr|3,5|30",
+    ]
+    # Hash of compact item is hash of first frame
+    assert file_info["hash"] == items[0]["hash"]
+
+
+def test_expand_keeps_regular_items():
+    file_info = {"_id": ObjectId(), "path": "file.ma", "size": 1}
+    assert expand_file_info(file_info) == [file_info]
+
+    repre_doc = {"files": [file_info]}
+    assert expand_representation_files(repre_doc)["files"] == [file_info]
+    assert expand_representation_files(None) is None
+
+
+class FakeCursor(object):
+    """Minimal stand-in of pymongo cursor with chained methods."""
+
+    def __init__(self, docs):
+        self._docs = list(docs)
+        self.sort_args = None
+
+    def sort(self, *args):
+        self.sort_args = args
+        return self
+
+    def limit(self, count):
+        self._docs = self._docs[:count]
+        return self
+
+    def __next__(self):
+        if not self._docs:
+            raise StopIteration
+        return self._docs.pop(0)
+
+    next = __next__
+
+    def __getitem__(self, index):
+        return self._docs[index]
+
+
+def _create_repre_doc(frames):
+    return {
+        "_id": ObjectId(),
+        "files": [create_sequence_file_info(
+            HEAD, TAIL, 4, frames, [1] * len(frames),
+            [1.0] * len(frames), SITES
+        )]
+    }
+
+
+def test_expanded_cursor_chaining():
+    repre_docs = [_create_repre_doc([1, 2]), _create_repre_doc([5, 6, 7])]
+    cursor = FakeCursor(repre_docs)
+    expanded = ExpandedRepresentationsCursor(cursor)
+
+    chained = expanded.sort("_id", 1).limit(1)
+    assert chained is expanded
+    assert cursor.sort_args == ("_id", 1)
+
+    docs = list(chained)
+    assert len(docs) == 1
+    assert [item["path"] for item in docs[0]["files"]] == [
+        _frame_path(1), _frame_path(2)
+    ]
+
+
+def test_expanded_cursor_getitem():
+    cursor = FakeCursor([_create_repre_doc([5, 6, 7])])
+    repre_doc = ExpandedRepresentationsCursor(cursor)[0]
+    assert len(repre_doc["files"]) == 3
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file hashing with local cache."""
+import os
+import time
+
+from openpype.lib.file_hashing import FileHashCache, FileHasher
+
+
+def _create_file(dirpath, filename, content):
+    path = os.path.join(str(dirpath), filename)
+    with open(path, "wb") as stream:
+        stream.write(content)
+    return path
+
+
+def _get_accessed(cache, path):
+    connection = cache._get_connection()
+    return connection.execute(
+        "SELECT accessed FROM hashes WHERE path = ?", (path, )
+    ).fetchone()[0]
+
+
+def test_cache_hit_refreshes_accessed(tmpdir):
+    cache = FileHashCache(os.path.join(str(tmpdir), "hashes.db"))
+    hasher = FileHasher(cache=cache)
+    path = _create_file(tmpdir, "file.txt", b"content")
+
+    hasher.hash_file(path)
+    stored_accessed = _get_accessed(cache, path)
+    time.sleep(0.01)
+    hasher.hash_file(path)
+
+    assert hasher.get_metrics()["cache_hits"] == 1
+    assert _get_accessed(cache, path) > stored_accessed
+    cache.close()
+
+
+def test_prune_keeps_used_hashes(tmpdir):
+    cache = FileHashCache(os.path.join(str(tmpdir), "hashes.db"))
+    hasher = FileHasher(cache=cache)
+    old_path = _create_file(tmpdir, "old.txt", b"old")
+    used_path = _create_file(tmpdir, "used.txt", b"used")
+    hasher.hash_files([old_path, used_path])
+
+    connection = cache._get_connection()
+    connection.execute(
+        "UPDATE hashes SET accessed = ?", (time.time() - 100, )
+    )
+    connection.commit()
+    # Hit of hash marks it as used
+    hasher.hash_file(used_path)
+
+    cache.prune(50)
+    paths = {
+        row[0]
+        for row in connection.execute("SELECT path FROM hashes")
+    }
+    assert paths == {used_path}
+    cache.close()
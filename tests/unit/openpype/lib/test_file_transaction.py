@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file transaction copies."""
+import os
+import errno
+
+import pytest
+
+from openpype.lib import file_transaction
+from openpype.lib.file_transaction import FileTransaction
+
+
+class _FakeFcntl(object):
+    def __init__(self, error_number):
+        self.error_number = error_number
+        self.calls = 0
+
+    def ioctl(self, *args):
+        self.calls += 1
+        raise OSError(self.error_number, os.strerror(self.error_number))
+
+
+def _transfer(tmpdir, count):
+    transaction = FileTransaction(max_workers=1)
+    for idx in range(count):
+        src = os.path.join(str(tmpdir), "src_{}.txt".format(idx))
+        with open(src, "w") as stream:
+            stream.write("content {}".format(idx))
+        transaction.add(
+            src, os.path.join(str(tmpdir), "dst", "dst_{}.txt".format(idx))
+        )
+    transaction.process()
+    transaction.finalize()
+    return transaction
+
+
+@pytest.mark.parametrize(
+    "error_number,expected_calls",
+    [
+        (errno.EOPNOTSUPP, 1),
+        (errno.EINVAL, 3),
+    ]
+)
+def test_clone_is_disabled_only_when_unsupported(
+    tmpdir, monkeypatch, error_number, expected_calls
+):
+    fake_fcntl = _FakeFcntl(error_number)
+    monkeypatch.setattr(file_transaction, "fcntl", fake_fcntl)
+
+    transaction = _transfer(tmpdir, 3)
+
+    assert fake_fcntl.calls == expected_calls
+    assert len(transaction.transferred) == 3
+    for idx in range(3):
+        dst = os.path.join(str(tmpdir), "dst", "dst_{}.txt".format(idx))
+        with open(dst, "r") as stream:
+            assert stream.read() == "content {}".format(idx)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""Test suite for buffered mongo log handler."""
+import os
+import logging
+
+from bson.json_util import dumps
+
+from openpype.lib import log
+from openpype.lib.log import BufferedMongoHandler
+
+
+class _FakeCollection(object):
+    def __init__(self, fail_calls=None):
+        self.documents = []
+        self.calls = 0
+        self.fail_calls = set(fail_calls or [])
+        self.available = True
+
+    def insert_many(self, documents, ordered=True):
+        self.calls += 1
+        if not self.available or self.calls in self.fail_calls:
+            raise IOError("Database is not available")
+        self.documents.extend(documents)
+
+    @property
+    def messages(self):
+        return [document["message"] for document in self.documents]
+
+
+class _DocumentFormatter(logging.Formatter):
+    def format(self, record):
+        return {"message": record.getMessage()}
+
+
+def _create_handler(collection, **kwargs):
+    handler = BufferedMongoHandler(lambda: collection, **kwargs)
+    handler.setFormatter(_DocumentFormatter())
+    return handler
+
+
+def _emit(handler, messages):
+    for message in messages:
+        handler.emit(logging.makeLogRecord({"msg": message}))
+
+
+def _write_spill_file(path, messages):
+    with open(path, "w") as stream:
+        for message in messages:
+            stream.write(dumps({"message": message}) + "\n")
+
+
+def test_documents_are_written_in_batches():
+    collection = _FakeCollection()
+    handler = _create_handler(collection, batch_size=2, flush_interval=60)
+
+    _emit(handler, ["a", "b", "c", "d"])
+    handler.flush()
+
+    assert collection.messages == ["a", "b", "c", "d"]
+    assert collection.calls == 2
+    handler.close()
+
+
+def test_buffered_documents_are_written_on_close():
+    collection = _FakeCollection()
+    handler = _create_handler(collection, batch_size=100, flush_interval=60)
+
+    _emit(handler, ["a", "b", "c"])
+    assert collection.messages == []
+    handler.close()
+
+    assert collection.messages == ["a", "b", "c"]
+    assert handler.get_metrics()["written"] == 3
+
+
+def test_documents_are_dropped_without_spill_dir():
+    collection = _FakeCollection()
+    handler = _create_handler(
+        collection, batch_size=100, flush_interval=60, buffer_limit=2
+    )
+
+    _emit(handler, ["a", "b", "c"])
+    handler.close()
+
+    assert collection.messages == ["a", "b"]
+    assert handler.get_metrics()["dropped"] == 1
+
+
+def test_spilled_documents_are_sent_after_successful_write(tmpdir):
+    collection = _FakeCollection()
+    collection.available = False
+    handler = _create_handler(
+        collection,
+        batch_size=2,
+        flush_interval=60,
+        buffer_limit=2,
+        spill_dir=str(tmpdir)
+    )
+
+    # Third document does not fit to buffer and first batch fails
+    _emit(handler, ["a", "b", "c"])
+    handler.flush()
+    assert handler.get_metrics()["spilled"] == 3
+
+    collection.available = True
+    _emit(handler, ["d", "e"])
+    handler.flush()
+    handler.close()
+
+    assert sorted(collection.messages) == ["a", "b", "c", "d", "e"]
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_resend_continues_after_sent_documents(tmpdir):
+    collection = _FakeCollection(fail_calls=[2])
+    handler = _create_handler(
+        collection, batch_size=2, flush_interval=60, spill_dir=str(tmpdir)
+    )
+    _write_spill_file(handler._spill_path, ["a", "b", "c", "d", "e"])
+
+    assert not handler._resend_spilled()
+    assert handler._resend_spilled()
+    handler.close()
+
+    assert collection.messages == ["a", "b", "c", "d", "e"]
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_claimed_spill_file_is_taken_over(tmpdir, monkeypatch):
+    monkeypatch.setattr(log, "_is_process_running", lambda pid: False)
+    # File claimed by process which failed to move its documents
+    claimed_path = os.path.join(
+        str(tmpdir), "openpype_logs_1.jsonl.sending.2.claimed"
+    )
+    _write_spill_file(claimed_path, ["a", "b", "c"])
+    # First document was sent before the process crashed
+    with open(claimed_path, "rb") as stream:
+        offset = len(stream.readline())
+    with open(
+        os.path.join(str(tmpdir), "openpype_logs_1.jsonl.sending.offset"), "w"
+    ) as stream:
+        stream.write(str(offset))
+
+    collection = _FakeCollection()
+    handler = _create_handler(
+        collection, batch_size=100, flush_interval=60, spill_dir=str(tmpdir)
+    )
+    _emit(handler, ["d"])
+    handler.flush()
+    handler.close()
+
+    assert sorted(collection.messages) == ["b", "c", "d"]
+    assert os.listdir(str(tmpdir)) == []
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""Test suite for running functions on pool of threads."""
+import time
+
+import pytest
+
+from openpype.lib.thread_tools import run_in_threads
+
+
+def test_results_keep_order_of_items():
+    results = run_in_threads(lambda item: item * 2, range(20), 4)
+    assert results == [item * 2 for item in range(20)]
+
+
+def test_first_error_is_raised_and_pending_items_are_cancelled():
+    processed = []
+
+    def _process(item):
+        if item == 0:
+            raise ValueError(item)
+        time.sleep(0.001)
+        processed.append(item)
+
+    with pytest.raises(ValueError):
+        run_in_threads(_process, range(1000), 2)
+    assert len(processed) < 999
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Test suite for parallel processing of ftrack event handlers."""
+import time
+import threading
+
+from openpype.modules.ftrack.ftrack_server.event_dispatcher import (
+    EventHandlerDispatcher,
+)
+
+
+class StatefulHandler(object):
+    """Handler storing processed project on instance like server handlers.
+
+    Handler records project it sees after processing and how many events
+    are processed concurrently.
+    """
+
+    def __init__(self):
+        self._cur_project = None
+        self.processed = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def launch(self, event):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        project_id = event["project_id"]
+        self._cur_project = project_id
+        # Give other workers time to change state if they would run
+        time.sleep(0.01)
+        self.processed.append((project_id, self._cur_project))
+        self._cur_project = None
+
+        with self._lock:
+            self.active -= 1
+
+
+def _create_events(project_ids, count):
+    return [
+        {"project_id": project_ids[idx % len(project_ids)], "idx": idx}
+        for idx in range(count)
+    ]
+
+
+def test_handler_does_not_process_projects_concurrently():
+    handler = StatefulHandler()
+    events = _create_events(["project_a", "project_b"], 20)
+
+    dispatcher = EventHandlerDispatcher(4)
+    dispatcher.start()
+    try:
+        for event in events:
+            dispatcher.dispatch_handler(
+                "StatefulHandler",
+                lambda event=event: handler.launch(event)
+            )
+        assert dispatcher.join(10), "Events were not processed"
+    finally:
+        dispatcher.stop()
+
+    assert handler.max_active == 1, "Handler ran on more workers at once"
+    for project_id, cur_project in handler.processed:
+        assert project_id == cur_project, "Project of handler was changed"
+
+    # Events are processed in order in which were dispatched
+    assert [item[0] for item in handler.processed] == [
+        event["project_id"] for event in events
+    ]
+
+
+def test_different_handlers_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    results = []
+
+    def task(name):
+        # Both handlers must be running at the same time to pass barrier
+        barrier.wait()
+        results.append(name)
+
+    dispatcher = EventHandlerDispatcher(4)
+    dispatcher.start()
+    try:
+        # Names are chosen so they're mapped to different workers
+        names = []
+        idx = 0
+        workers = set()
+        while len(names) < 2:
+            name = "Handler{}".format(idx)
+            idx += 1
+            worker_idx = dispatcher.get_worker_index(name)
+            if worker_idx not in workers:
+                workers.add(worker_idx)
+                names.append(name)
+
+        for name in names:
+            dispatcher.dispatch_handler(name, lambda name=name: task(name))
+        assert dispatcher.join(10), "Events were not processed"
+    finally:
+        dispatcher.stop()
+
+    assert sorted(results) == sorted(names)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Test suite for sync server providers settings entity."""
+import pytest
+
+from openpype.client import mongo
+
+mongomock = pytest.importorskip("mongomock")
+# Sync server module requires 'click' which may not be available
+pytest.importorskip("click")
+
+
+@pytest.fixture
+def system_settings(monkeypatch):
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(
+        mongo.OpenPypeMongoConnection,
+        "create_connection",
+        classmethod(lambda cls, *args, **kwargs: client)
+    )
+    monkeypatch.setattr(mongo.OpenPypeMongoConnection, "mongo_clients", {})
+
+    from openpype.settings.entities import SystemSettings
+
+    return SystemSettings(set_studio_state=False)
+
+
+def test_sync_server_sites_entity(system_settings):
+    from openpype_modules.sync_server.providers import lib as lib_providers
+
+    sites_entity = system_settings["modules"]["sync_server"]["sites"]
+    site_entity = sites_entity.add_key("test_site")
+
+    enum_keys = {item["key"] for item in site_entity.enum_children}
+    assert set(lib_providers.factory.providers.keys()) <= enum_keys
+
+    for item in site_entity.enum_children:
+        child_keys = {child["key"] for child in item["children"]}
+        assert {"max_workers", "rate_limit"} <= child_keys